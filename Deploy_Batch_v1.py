@@ -0,0 +1,312 @@
+# This is a script to deploy many sites in one run with Deploy_Site_v42.py
+#
+# The sites are read from a CSV or YAML manifest, one site per row/entry with the fields:
+#   name, serials, template, subnet, address, tags, guest, mode
+#  name, serials, template and subnet are mandatory. serials and tags are separated by spaces
+#  (or given as lists in YAML). guest set to Guest/yes/true/1 tags the AP's for Guest WiFi, mode
+#  set to ignore_error does not stop on an existing network.
+#
+# Organization, template and network lookups are resolved once for the whole batch, then the
+#  sites are deployed concurrently in this process, so all of them share the pooled connections
+#  and the Dashboard rate limit budget of merakiclient.py.
+#  The output of each site is written to <report folder>/<site name>.log and a summary of every
+#  site is written to <report folder>/report.csv
+#  With --trace the Dashboard calls of each site are also written to <report folder>/<site name>.trace
+#  (JSON lines, see merakitrace.py) and their summary per phase is added to the site log.
+#  With --events the progress of each site is written as JSON events (see merakievents.py) to
+#  <report folder>/<site name>.events, ending with the summary of the site.
+#  With --resume every site continues from the journal of its interrupted deploy, if it has one (see
+#  merakijournal.py), so a batch can simply be run again after a failure.
+#
+# To run the script, enter:
+#  python Deploy_Batch_v1.py -k <Meraki Dashboard API key> -f <manifest.csv|manifest.yaml> [-p <sites deployed at the same time> -r <report folder> -g <Google API key> --refresh-cache --trace --events --resume]
+#
+# YAML manifests need the PyYAML module (pip install pyyaml)
+#
+# v1.0 - Initial version
+# v1.1 - Optional trace of the Dashboard calls of each site (--trace)
+# v1.1 - Optional JSON progress events of each site (--events)
+# v1.1 - Interrupted site deploys can be resumed (--resume)
+
+import sys, os, getopt, csv, time, contextvars
+from concurrent.futures import ThreadPoolExecutor
+import merakicache, merakinetworks, merakitrace, merakievents
+import Deploy_Site_v42
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+MANIFEST_FIELDS = ['name', 'serials', 'template', 'subnet', 'address', 'tags', 'guest', 'mode']
+REPORT_FIELDS = ['name', 'status', 'exitcode', 'networkId', 'duration', 'log']
+
+
+def printusertext(p_message):
+    #prints a line of text that is meant for the user to read
+    #do not process these lines when chaining scripts
+    print('@ %s' % p_message)
+
+def printhelp():
+    #prints help text
+
+    printusertext('This is a script to deploy many sites listed in a CSV or YAML manifest with Deploy_Site_v42.py')
+    printusertext('')
+    printusertext('To run the script, enter:')
+    printusertext('python Deploy_Batch_v1.py -k <Meraki Dashboard API key> -f <manifest> [-p <parallel sites> -r <report folder> -g <Google API key> --refresh-cache --trace --events --resume]')
+    printusertext('')
+    printusertext('Mandatory parameters:')
+    printusertext(' -k <key>: Your Meraki Dashboard API key')
+    printusertext(' -f <file>: Manifest of the sites, .csv or .yaml/.yml. Fields: ' + ', '.join(MANIFEST_FIELDS))
+    printusertext('')
+    printusertext('Optional parameters:')
+    printusertext(' -p <count>: Number of sites deployed at the same time (default 4)')
+    printusertext(' -r <folder>: Folder for the per-site logs and report.csv (default <manifest>_report)')
+    printusertext(' -g <gkey>: Google API key, used to set the time zone of sites with an address')
+    printusertext(' --refresh-cache: Ignore the cached organization, template and network IDs and fetch them again')
+    printusertext(' --trace: Write the Dashboard calls of each site to <report folder>/<site name>.trace (JSON lines)')
+    printusertext(' --events: Write the progress of each site to <report folder>/<site name>.events (JSON lines)')
+    printusertext(' --resume: Continue the interrupted deploys of the sites, skipping the steps already done')
+    printusertext('')
+    printusertext('Example:')
+    printusertext(' python Deploy_Batch_v1.py -k 1234 -f rollout.csv -p 4')
+
+
+class SiteOutput(object):
+    #stdout replacement sending the output of each site to its own log file
+    #the log follows the site into the worker threads of merakiclient.parallelmap,
+    #output outside of a site goes to the original stdout
+
+    def __init__(self, p_stream):
+        self.stream = p_stream
+        self.log = contextvars.ContextVar('log', default=None)
+
+    def setlog(self, p_log):
+        self.log.set(p_log)
+
+    def write(self, p_text):
+        log = self.log.get()
+        if log is not None:
+            return log.write(p_text)
+        return self.stream.write(p_text)
+
+    def flush(self):
+        log = self.log.get()
+        if log is not None:
+            log.flush()
+        self.stream.flush()
+
+
+def readmanifest(p_filename):
+    #returns the list of sites of a CSV or YAML manifest, as dicts of strings
+    if p_filename.endswith('.yaml') or p_filename.endswith('.yml'):
+        if yaml is None:
+            printusertext('ERROR 01: The PyYAML module is needed to read YAML manifests')
+            sys.exit(2)
+        with open(p_filename) as manifestfile:
+            records = yaml.safe_load(manifestfile) or []
+        if isinstance(records, dict):
+            records = records.get('sites', [])
+    else:
+        with open(p_filename, newline='') as manifestfile:
+            records = list(csv.DictReader(manifestfile))
+
+    sites = []
+    for record in records:
+        site = {}
+        for field in MANIFEST_FIELDS:
+            value = record.get(field)
+            if value is None:
+                value = ''
+            elif isinstance(value, (list, tuple)):
+                value = ' '.join(str(item) for item in value)
+            elif isinstance(value, bool):
+                value = 'Guest' if value else ''
+            site[field] = str(value).strip()
+        sites.append(site)
+    return(sites)
+
+
+def siteorgname(p_site):
+    #CN sites are deployed in the China dashboard, as in Deploy_Site_v42.py
+    if Deploy_Site_v42.firstTwo(p_site['name']) == 'CN':
+        return('RISA CN', 'api.meraki.cn')
+    return('RISA', 'api.meraki.com')
+
+
+def siteargv(p_apikey, p_site, p_googlekey, p_tracefile='', p_eventsfile='', p_resume=False):
+    #builds the command line of Deploy_Site_v42.py for a manifest site
+    orgname, shardurl = siteorgname(p_site)
+    argv = ['-k', p_apikey, '-o', orgname, '-s', p_site['serials'], '-n', p_site['name'], '-c', p_site['template'], '-w', p_site['subnet']]
+    if p_site['tags'].strip() != '':
+        argv += ['-t', p_site['tags']]
+    if p_site['address'] != '':
+        argv += ['-a', p_site['address']]
+    if p_site['guest'].lower() in ('guest', 'yes', 'true', '1'):
+        argv += ['-x', 'Guest']
+    if p_site['mode'] != '':
+        argv += ['-m', p_site['mode']]
+    if p_googlekey != '':
+        argv += ['-g', p_googlekey]
+    if p_tracefile != '':
+        argv += ['--trace', p_tracefile]
+    if p_eventsfile != '':
+        argv += ['--events', p_eventsfile]
+    if p_resume:
+        argv += ['--resume']
+    return(argv)
+
+
+def resolvelookups(p_apikey, p_sites):
+    #resolves the organization, template and network lookups shared by the sites once
+    #the site deploys then find them in the local cache and the in-memory network index
+    done = set()
+    for site in p_sites:
+        orgname, shardurl = siteorgname(site)
+        if orgname == 'RISA CN':
+            orgid = Deploy_Site_v42.getorgidcn(p_apikey, orgname)
+        else:
+            orgid = Deploy_Site_v42.getorgid(p_apikey, orgname)
+        if orgid == 'null':
+            continue
+        if (shardurl, orgid) not in done:
+            merakinetworks.getnetworkindex(p_apikey, shardurl, orgid).load()
+            done.add((shardurl, orgid))
+        if (shardurl, orgid, site['template']) not in done:
+            Deploy_Site_v42.gettemplateid(p_apikey, shardurl, orgid, site['template'])
+            done.add((shardurl, orgid, site['template']))
+
+
+def deploysite(p_apikey, p_site, p_googlekey, p_reportdir, p_output, p_trace=False, p_events=False, p_resume=False):
+    #deploys one site, returns its report record
+    logname = os.path.join(p_reportdir, '%s.log' % p_site['name'])
+    tracefile = ''
+    if p_trace:
+        tracefile = os.path.join(p_reportdir, '%s.trace' % p_site['name'])
+    eventsfile = ''
+    if p_events:
+        eventsfile = os.path.join(p_reportdir, '%s.events' % p_site['name'])
+    status = 'ok'
+    exitcode = 0
+    start = time.time()
+    with open(logname, 'w') as log:
+        p_output.setlog(log)
+        try:
+            Deploy_Site_v42.main(siteargv(p_apikey, p_site, p_googlekey, tracefile, eventsfile, p_resume))
+        except SystemExit as e:
+            #Deploy_Site_v42.py only exits when it stops before the end of the deploy
+            exitcode = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            status = 'failed'
+        except Exception as e:
+            print('Unexpected error: %r' % e)
+            status = 'failed'
+            exitcode = 1
+        finally:
+            #the trace summary goes to the site log
+            merakitrace.stop()
+            merakievents.stop(status, exitcode)
+            p_output.setlog(None)
+    duration = time.time() - start
+
+    orgname, shardurl = siteorgname(p_site)
+    orgid = Deploy_Site_v42.getorgidcn(p_apikey, orgname) if orgname == 'RISA CN' else Deploy_Site_v42.getorgid(p_apikey, orgname)
+    nwid = 'null'
+    if orgid != 'null':
+        status_code, nwid = merakinetworks.getnetworkindex(p_apikey, shardurl, orgid).lookup(p_site['name'])
+    printusertext('%s: %s (%.1f s)' % (p_site['name'], status, duration))
+    return {'name': p_site['name'], 'status': status, 'exitcode': exitcode, 'networkId': nwid, 'duration': '%.1f' % duration, 'log': logname}
+
+
+def writereport(p_filename, p_records):
+    with open(p_filename, 'w', newline='') as reportfile:
+        writer = csv.DictWriter(reportfile, fieldnames=REPORT_FIELDS)
+        writer.writeheader()
+        for record in p_records:
+            writer.writerow(record)
+
+
+def main(argv):
+    #set default values for command line arguments
+    arg_apikey = 'null'
+    arg_manifest = 'null'
+    arg_parallel = 4
+    arg_reportdir = 'null'
+    arg_googlekey = ''
+    arg_trace = False
+    arg_events = False
+    arg_resume = False
+
+    #get command line arguments
+    try:
+        opts, args = getopt.getopt(argv, 'hk:f:p:r:g:', ['refresh-cache', 'trace', 'events', 'resume'])
+    except getopt.GetoptError:
+        printhelp()
+        sys.exit(2)
+
+    refreshcache = False
+    for opt, arg in opts:
+        if opt == '-h':
+            printhelp()
+            sys.exit()
+        elif opt == '-k':
+            arg_apikey = arg
+        elif opt == '-f':
+            arg_manifest = arg
+        elif opt == '-p':
+            arg_parallel = max(1, int(arg))
+        elif opt == '-r':
+            arg_reportdir = arg
+        elif opt == '-g':
+            arg_googlekey = arg
+        elif opt == '--refresh-cache':
+            refreshcache = True
+        elif opt == '--trace':
+            arg_trace = True
+        elif opt == '--events':
+            arg_events = True
+        elif opt == '--resume':
+            arg_resume = True
+
+    if arg_apikey == 'null' or arg_manifest == 'null':
+        printhelp()
+        sys.exit(2)
+
+    if arg_reportdir == 'null':
+        arg_reportdir = os.path.splitext(arg_manifest)[0] + '_report'
+    os.makedirs(arg_reportdir, exist_ok=True)
+
+    sites = readmanifest(arg_manifest)
+    for site in sites:
+        if site['name'] == '' or site['serials'] == '' or site['template'] == '' or site['subnet'] == '':
+            printusertext('ERROR 02: Site "%s" is missing one of name, serials, template, subnet' % site['name'])
+            sys.exit(2)
+    names = [site['name'] for site in sites]
+    for name in set(names):
+        if names.count(name) > 1:
+            printusertext('ERROR 03: Site "%s" is listed more than once in the manifest' % name)
+            sys.exit(2)
+    printusertext('Deploying %d sites, %d at a time' % (len(sites), arg_parallel))
+
+    #shared lookups: fetched fresh once when asked to, the sites then use the refreshed cache
+    merakicache.setrefresh(refreshcache)
+    resolvelookups(arg_apikey, sites)
+    merakicache.setrefresh(False)
+
+    output = SiteOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=arg_parallel) as executor:
+            records = list(executor.map(lambda site: deploysite(arg_apikey, site, arg_googlekey, arg_reportdir, output, arg_trace, arg_events, arg_resume), sites))
+    finally:
+        sys.stdout = output.stream
+
+    reportname = os.path.join(arg_reportdir, 'report.csv')
+    writereport(reportname, records)
+    failed = [record['name'] for record in records if record['status'] != 'ok']
+    printusertext('%d sites deployed, %d failed. Report written to %s' % (len(records) - len(failed), len(failed), reportname))
+    if len(failed) > 0:
+        printusertext('Failed sites: ' + ' '.join(failed))
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
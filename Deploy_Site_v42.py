@@ -16,6 +16,8 @@
 #
 # To make script chaining easier, all lines containing informational messages to the user
 #  start with the character @
+#  Orchestrators can use --events instead, see merakievents.py: one JSON event per step, device
+#  and VLAN, and a final summary. With --events - the events go to stdout and the text to stderr.
 #
 # This file was last modified on 
 #
@@ -61,8 +63,31 @@
 # v4.1.1 - Fixed access to China Dashboard when getting organization networks.
 # v4.1.1 - Replaced ICS with GT on team banner
 # v4.2 - Added support for new Checkpoint Office Template and Git
-
-import sys, getopt, requests, json, time, re, meraki
+# v4.3 - All Dashboard calls go through the pooled session layer in merakiclient.py
+# v4.3 - Serials are claimed into the organization with a single batch call
+# v4.3 - Device models are read from the org inventory with a single lookup
+# v4.3 - Device hostnames and addresses are updated concurrently
+# v4.3 - Hostname, tags and address of a device are sent in one update
+# v4.3 - Network IDs are looked up in a cached org network index
+# v4.3 - The new network ID is taken from the create network response
+# v4.3 - Organization and template IDs are cached locally (--refresh-cache to ignore the cache)
+# v4.3 - VLAN subnets are computed from the VLAN plans of merakivlans.py
+# v4.3 - VLAN subnets are updated concurrently
+# v4.3 - Only the VLAN settings that differ from the plan are written
+# v4.3 - Optional action batch backend for the device, VLAN and time zone updates (--action-batches)
+# v4.3 - GOOGLE_MAPS_BASE_URL overrides the Google Maps API server (benchmarks)
+# v4.3 - Optional JSON-lines trace of the Dashboard calls with a summary per phase (--trace)
+# v4.3 - Optional JSON-lines progress events per step, device and VLAN with a final summary (--events)
+# v4.3 - Completed steps are recorded in a journal per site, --resume continues an interrupted deploy
+# v4.3 - Dropped connections, timeouts and 5xx answers are retried with backoff, claims, create and bind are guarded
+# v4.3 - The models of the claimed devices are read with one network device listing instead of one call per device
+# v4.3 - The deploy steps run as a dependency graph, independent steps (template lookup, network check, claims, Google lookups) overlap
+# v4.3 - The time zone is looked up at the start and set when the network is created, no separate update afterwards
+# v4.3 - Google Maps locations are cached per address, the coordinates also place the device map markers
+# v4.3 - Time zones are resolved offline from the country code of the site name and the zone boundaries, Google Maps is only asked for addresses outside them
+
+import sys, os, getopt, requests, json, time, re
+import merakiclient, merakicache, merakiinventory, merakidevices, merakinetworks, merakivlans, merakibatches, merakitrace, merakievents, merakijournal, merakisteps, merakigeo, merakitz
 
 def printteam():
     print('___________________________________________________________________________')
@@ -86,6 +111,7 @@ def printusertext(p_message):
     #prints a line of text that is meant for the user to read
     #do not process these lines when chaining scripts
     print('@ %s' % p_message)
+    merakievents.message(p_message)
 
 def printhelp():
     #prints help text
@@ -108,8 +134,14 @@ def printhelp():
     printusertext('Optional parameters:')
     printusertext(' -t <tag>: If defined, network will be tagged with the given tags (separate by space)')
     printusertext(' -a <addr>: If defined, devices will be moved to given street address')
-    printusertext(' -g <gkey>: Google API key. If defined, time zone will be set to match street address')
+    printusertext(' -g <gkey>: Google API key. If defined, time zone will be set to match street address,')
+    printusertext('            otherwise it is taken from the country code that starts the network name')
     printusertext(' -m ignore_error: If defined, the script will not stop if network exists')
+    printusertext(' --refresh-cache: Ignore the cached organization, template and network IDs and fetch them again')
+    printusertext(' --action-batches: Send the device and VLAN updates as Dashboard action batches')
+    printusertext(' --trace <file>: Write every Dashboard call to <file> (JSON lines) and print a summary per phase')
+    printusertext(' --events <file>: Write the progress as JSON events to <file>, use - for stdout (text goes to stderr)')
+    printusertext(' --resume: Continue an interrupted deploy of the same site, skipping the steps already done')
     printusertext('')
     printusertext('Example:')
     printusertext(' python deploydevices.py -k 1234 -o MyCustomer -s XXXX-YYYY-ZZZZ -n "SF Branch" -c MyCfgTemplate')
@@ -117,79 +149,49 @@ def printhelp():
     printusertext('Use double quotes ("") in Windows to pass arguments containing spaces. Names are case-sensitive.')
     
 def getorgid(p_apikey, p_orgname):
-    #looks up org id for a specific org name
+    #looks up org id for a specific org name, using the local lookup cache
     #on failure returns 'null'
     
     try:
-        r = requests.get('https://api.meraki.com/api/v1/organizations', headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
+        status, orgid = merakicache.lookupid(p_apikey, 'api.meraki.com', 'organizations', p_orgname, lambda: merakiclient.getlist(p_apikey, 'api.meraki.com', '/organizations'))
     except:
         printusertext('ERROR 00: Unable to contact Meraki cloud')
         sys.exit(2)
     
-    if r.status_code != requests.codes.ok:
-        return 'null'
-    
-    rjson = r.json()
-    
-    for record in rjson:
-        if record['name'] == p_orgname:
-            return record['id']
-    return('null')
+    return(orgid)
 
 
 def getorgidcn(p_apikey, p_orgname):
-    #looks up org id for a specific org name
+    #looks up org id for a specific org name, using the local lookup cache
     #on failure returns 'null'
     
     try:
-        r = requests.get('https://api.meraki.cn/api/v1/organizations', headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
+        status, orgid = merakicache.lookupid(p_apikey, 'api.meraki.cn', 'organizations', p_orgname, lambda: merakiclient.getlist(p_apikey, 'api.meraki.cn', '/organizations'))
     except:
         printusertext('ERROR 00: Unable to contact Meraki China cloud')
         sys.exit(2)
     
-    if r.status_code != requests.codes.ok:
-        return 'null'
-    
-    rjson = r.json()
-    
-    for record in rjson:
-        if record['name'] == p_orgname:
-            return record['id']
-    return('null')
+    return(orgid)
 
     
 def getnwid(p_apikey, shardurl, p_orgid, p_nwname):
-    #looks up network id for a network name
+    #looks up network id for a network name in the org network index
+    #the org networks are listed once per run (or read from the local cache, a network found
+    #there is confirmed with the API as it may have been deleted since)
     #on failure returns 'null'
     
     print("Searching for network ID for ",p_nwname)
     
-    dashboard = meraki.DashboardAPI(
-        p_apikey,
-        base_url='https://'+shardurl+'/api/v1',
-        output_log=False,
-        print_console=False
-    )
-    organization_id = p_orgid
-    response = dashboard.organizations.getOrganizationNetworks(organization_id, total_pages='all')
-    
-    """
     try:
-        r = requests.get('https://%s/api/v1/organizations/%s/networks' % (p_shardurl, p_orgid), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
+        status, nwid = merakinetworks.getnetworkindex(p_apikey, shardurl, p_orgid).lookup(p_nwname)
     except:
         printusertext('ERROR 02: Unable to contact Meraki cloud')
         sys.exit(2)
-
-    if r.status_code != requests.codes.ok:
-        print (r.status_code)
-        print (r.text)
-        return 'null'
-    """
     
-    for record in response:
-        if record['name'] == p_nwname:
-            return record['id']
-    return('null') 
+    if status != requests.codes.ok:
+        print (status)
+    
+    return(nwid) 
     """
     
     print(p_nwname)
@@ -216,6 +218,7 @@ def getnwid(p_apikey, shardurl, p_orgid, p_nwname):
     
 def createnw(p_apikey, p_shardurl, p_dstorg, p_nwdata):
     #creates network if one does not already exist with the same name
+    #returns the new network as returned by the API, on failure returns 'null'
     printusertext('Creating new Site...')
     
     #Creating list of tags to use in API call
@@ -239,7 +242,8 @@ def createnw(p_apikey, p_shardurl, p_dstorg, p_nwdata):
     
     if nwtype != 'systems manager':
         try:
-            r = requests.post('https://%s/api/v1/organizations/%s/networks' % (p_shardurl, p_dstorg), data=json.dumps({'timeZone': p_nwdata['timeZone'], 'tags': nwtags, 'name': p_nwdata['name'], 'organizationId': p_dstorg, 'productTypes': nwtype}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
+            r = merakiclient.post(p_apikey, p_shardurl, '/organizations/%s/networks' % p_dstorg, {'timeZone': p_nwdata['timeZone'], 'tags': nwtags, 'name': p_nwdata['name'], 'organizationId': p_dstorg, 'productTypes': nwtype},
+                                  merakinetworks.createguard(p_apikey, p_shardurl, p_dstorg, p_nwdata['name']))
             #Debug
             print (r.status_code)
             print (r.text)
@@ -251,15 +255,27 @@ def createnw(p_apikey, p_shardurl, p_dstorg, p_nwdata):
     else:
         printusertext('WARNING: Skipping network "%s" (Cannot create SM networks)' % p_nwdata['name'])
         return('null')
+    
+    #keep the network index in step with the new network, or drop it if it missed a network
+    nwindex = merakinetworks.getnetworkindex(p_apikey, p_shardurl, p_dstorg)
+    if r.status_code not in (requests.codes.ok, requests.codes.created):
+        nwindex.invalidate()
+        return('null')
+    
+    network = r.json()
+    nwindex.add(network)
         
-    return('ok')
+    return(network)
     
-def updatenw(p_apikey, p_shardhost, p_nwid, p_field, p_value):
+def updatenw(p_apikey, p_shardhost, p_nwid, p_field, p_value, p_actions=None):
     #updates network data    
+    #with p_actions, the update is added to that list of action batch actions instead of being sent
+    if p_actions is not None:
+        p_actions.append(merakibatches.action('/networks/%s' % p_nwid, 'update', {p_field: p_value}))
+        return('ok')
         
-    #time.sleep(API_EXEC_DELAY)
     try:
-        r = requests.put('https://%s/api/v1/networks/%s' % (p_shardhost, p_nwid), data=json.dumps({p_field: p_value}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
+        r = merakiclient.put(p_apikey, p_shardhost, '/networks/%s' % p_nwid, {p_field: p_value})
     except:
         printusertext('ERROR 21: Unable to contact Meraki cloud')
         sys.exit(2)
@@ -270,52 +286,26 @@ def updatenw(p_apikey, p_shardhost, p_nwid, p_field, p_value):
     return('ok')
     
 def gettemplateid(p_apikey, p_shardurl, p_orgid, p_tname):
-    #looks up config template id for a config template name
+    #looks up config template id for a config template name, using the local lookup cache
     #on failure returns 'null'
-    notratelimit = False
+    #rate limiting (429 + Retry-After) is handled by merakiclient
     
-    """
-    
-    while not notratelimit:
-        try:
-            r = requests.get('https://%s/api/v1/organizations/%s/configTemplates' % (p_shardurl, p_orgid), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-        except:
-            printusertext('ERROR 04: Unable to contact Meraki cloud')
-            sys.exit(2)
-            
-        # 392
-        if r.status_code == 429:
-            print("Rate limit response received, waiting to retry\n")
-            time.sleep(int(response.headers["Retry-After"]))
-            print("Retrying...")
-
-        elif r.status_code != requests.codes.ok:
-            return 'null'
-            notratelimit == True
-        else:
-            print("Done get templates")
-            notratelimit == True
-    """
     try:
-        r = requests.get('https://%s/api/v1/organizations/%s/configTemplates' % (p_shardurl, p_orgid), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
+        status, templateid = merakicache.lookupid(p_apikey, p_shardurl, 'configTemplates_%s' % p_orgid, p_tname, lambda: merakiclient.getlist(p_apikey, p_shardurl, '/organizations/%s/configTemplates' % p_orgid))
     except:
         printusertext('ERROR 04: Unable to contact Meraki cloud')
         sys.exit(2)
 
-    if r.status_code != requests.codes.ok:
+    if status != requests.codes.ok:
         return 'null'
     else:
         print("Done get templates")
 
-    rjson = r.json()
-    
-    for record in rjson:
-        if record['name'] == p_tname:
-            return record['id']
-    return('null') 
+    return(templateid) 
     
 def bindnw(p_apikey, p_shardurl, p_nwid, p_templateid, p_autobind):
     #binds a network to a template
+    #returns the network as returned by the bind call, on failure returns 'null'
     printusertext('Binding devices to template...')
     autobindvalue = 'true'
     """    
@@ -325,7 +315,7 @@ def bindnw(p_apikey, p_shardurl, p_nwid, p_templateid, p_autobind):
         autobindvalue = 'false'
     """
     try:
-        r = requests.post('https://%s/api/v1/networks/%s/bind' % (p_shardurl, p_nwid), data=json.dumps({'configTemplateId': p_templateid, 'autoBind': autobindvalue}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
+        r = merakiclient.post(p_apikey, p_shardurl, '/networks/%s/bind' % p_nwid, {'configTemplateId': p_templateid, 'autoBind': autobindvalue}, merakinetworks.bindguard(p_apikey, p_shardurl, p_nwid, p_templateid))
     except:
         printusertext('ERROR 05: Unable to contact Meraki cloud')
         sys.exit(2)
@@ -340,7 +330,7 @@ def bindnw(p_apikey, p_shardurl, p_nwid, p_templateid, p_autobind):
         printusertext("Warning 19: Trying again without autobinding the switches")
         
         try:
-            r = requests.post('https://%s/api/v1/networks/%s/bind' % (p_shardurl, p_nwid), data=json.dumps({'configTemplateId': p_templateid, 'autoBind': autobindvalue}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
+            r = merakiclient.post(p_apikey, p_shardurl, '/networks/%s/bind' % p_nwid, {'configTemplateId': p_templateid, 'autoBind': autobindvalue}, merakinetworks.bindguard(p_apikey, p_shardurl, p_nwid, p_templateid))
         except:
             printusertext('ERROR 05: Unable to contact Meraki cloud')
             sys.exit(2)
@@ -351,38 +341,44 @@ def bindnw(p_apikey, p_shardurl, p_nwid, p_templateid, p_autobind):
             print(r.content)
             return 'null'
         
-    return('ok')
+    return(r.json())
     
 def claimdeviceorg(p_apikey, p_shardurl, p_orgid, p_devserial):
-    #claims a device into an org without adding to a network
-    time.sleep(0.5)
+    #claims a list of devices into an org without adding to a network
+    #all serials are sent in one call, serials rejected by it are claimed one at a time
+    #returns the list of serials that could not be claimed
+    print('Claiming devices to RISA\n')
     try:
-        r = requests.post('https://%s/api/v1/organizations/%s/inventory/claim' % (p_shardurl, p_orgid), data=json.dumps({'serials': p_devserial}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-        print('Claiming device to RISA\n')
-        
-        if r.status_code == 429:
-            while r.status_code == 429:
-                print('Got status code 429 for rate limit')
-                time.sleep(1.5)
-                print('Retrying...')
-                r = requests.post('https://%s/api/v1/organizations/%s/inventory/claim' % (p_shardurl, p_orgid), data=json.dumps({'serials': p_devserial}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-                print('Claiming device to RISA\n')
-        
-        if r.status_code != requests.codes.ok:
-            print(r.status_code)
-            print(r.content)
-        
+        failed = merakiinventory.claimdevicesorg(p_apikey, p_shardurl, p_orgid, p_devserial)
     except:
         printusertext('ERROR 06: Unable to contact Meraki cloud')
         sys.exit(2)
     
-    return(0)
+    return(failed)
     
+def runactionbatches(p_apikey, p_shardurl, p_orgid, p_actions):
+    #sends the collected actions as action batches and waits for them
+    #returns 'ok' when every batch completed, 'null' otherwise
+    printusertext('Sending %d updates in action batches...' % len(p_actions))
+    try:
+        results = merakibatches.runactions(p_apikey, p_shardurl, p_orgid, p_actions)
+    except:
+        printusertext('ERROR 23: Unable to contact Meraki cloud')
+        sys.exit(2)
+    
+    returnvalue = 'ok'
+    for result in results:
+        print ('Action batch %s (%d actions) ->> %s' % (result['id'], result['actions'], result['status']))
+        if result['status'] != 'completed':
+            print (result['errors']) #Print error message
+            returnvalue = 'null'
+    return(returnvalue)
+
 def claimlicenseorg(p_apikey, p_shardurl, p_orgid, p_licensekey):
     #claims a license key into an org
     
     try:
-        r = requests.post('https://%s/api/v1/organizations/%s/inventory/claim' % (p_shardurl, p_orgid), data=json.dumps({'licenses': p_licensekey, 'mode': 'addDevices'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
+        r = merakiclient.post(p_apikey, p_shardurl, '/organizations/%s/inventory/claim' % p_orgid, {'licenses': p_licensekey, 'mode': 'addDevices'})
     except:
         printusertext('ERROR 07: Unable to contact Meraki cloud')
         sys.exit(2)
@@ -393,7 +389,7 @@ def claimdevice(p_apikey, p_shardurl, p_nwid, p_devserial):
     #claims a device into a network
     print('Claiming device S/N '+str(p_devserial)+' to the new site')
     try:
-        r = requests.post('https://%s/api/v1/networks/%s/devices/claim' % (p_shardurl, p_nwid), data=json.dumps({'serials': p_devserial}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
+        r = merakiclient.post(p_apikey, p_shardurl, '/networks/%s/devices/claim' % p_nwid, {'serials': p_devserial}, merakiinventory.networkclaimguard(p_apikey, p_shardurl, p_nwid, p_devserial))
     except:
         printusertext('ERROR 08: Unable to contact Meraki cloud')
         sys.exit(2)
@@ -405,42 +401,36 @@ def claimdevice(p_apikey, p_shardurl, p_nwid, p_devserial):
     
     return(0)
     
-def getdeviceinfo(p_apikey, p_shardurl, p_nwid, p_serial):
-    #returns info for a single device
-    #on failure returns lone device record, with serial number 'null'
+def getnetworkdevices(p_apikey, p_shardurl, p_nwid):
+    #returns the devices of a network in one call, as a dict serial -> device record
+    #on failure returns 'null'
     try:
-        r = requests.get('https://%s/api/v1/devices/%s' % (p_shardurl, p_serial), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Accept': 'application/json'})
+        r = merakiclient.get(p_apikey, p_shardurl, '/networks/%s/devices' % p_nwid)
     except:
         printusertext('ERROR 09: Unable to contact Meraki cloud')
         sys.exit(2)
     
-    returnvalue = []
     if r.status_code != requests.codes.ok:
         print(r.status_code)
         print(r.content)
-        returnvalue = {'serial':'null', 'model':'null'}
-        return(returnvalue)
+        return('null')
     
-    rjson = r.json()
+    devices = {}
+    for device in r.json():
+        devices[device['serial']] = device
     
-    return(rjson) 
+    return(devices)
     
-def setdevicedata(p_apikey, p_shardurl, p_nwid, p_devserial, p_field, p_value, p_nwtags, p_movemarker):
-    #modifies value of device record. Returns the new value
-    #on failure returns one device record, with all values 'null'
-    #p_movemarker is boolean: True/False
+def setdevicedata(p_apikey, p_shardurl, p_nwid, p_devserial, p_fields):
+    #modifies a device record with one call. p_fields is built by merakidevices.builddeviceupdate
+    #on failure returns 'null'
     
     print("Serial is: "+p_devserial)
-    print("Tags are: ")
-    print(p_nwtags)
-    
-    movevalue = "false"
-    if p_movemarker:
-        movevalue = "true"
+    print("Fields are: ")
+    print(p_fields)
     
     try:
-        #r = requests.put('https://%s/api/v1/networks/%s/devices/%s' % (p_shardurl, p_nwid, p_devserial), data=json.dumps({p_field: p_value, 'moveMapMarker': movevalue, 'tags': p_nwtags}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-        r = requests.put('https://%s/api/v1/devices/%s' % (p_shardurl, p_devserial), data=json.dumps({p_field: p_value, 'moveMapMarker': movevalue, 'tags': p_nwtags}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
+        r = merakidevices.updatedevice(p_apikey, p_shardurl, p_devserial, p_fields)
     except:
         printusertext('ERROR 10: Unable to contact Meraki cloud')
         sys.exit(2)
@@ -452,25 +442,47 @@ def setdevicedata(p_apikey, p_shardurl, p_nwid, p_devserial, p_field, p_value, p
     
     return('ok')
 
-def getorgdeviceinfo(p_apikey, p_shardurl, p_orgid, p_devserial):
-    #gets basic device info from org inventory. device does not need to be part of a network
-    time.sleep(0.2)
+def updatedevice(p_apikey, p_shardurl, p_nwid, p_devserial, p_hostname, p_address, p_tags, p_actions=None, p_location='null'):
+    #sets hostname, tags and, when one is given, the street address of a device in a single update
+    #with p_actions, the update is added to that list of action batch actions instead of being sent
+    #p_location, the coordinates of the address when known, places the map marker of the device
+    address = None
+    lat = None
+    lng = None
+    if p_address != 'null':
+        printusertext('Setting device location...')
+        address = p_address
+        if p_location != 'null':
+            lat = p_location['lat']
+            lng = p_location['lng']
+    fields = merakidevices.builddeviceupdate(p_name=p_hostname, p_tags=p_tags, p_address=address, p_lat=lat, p_lng=lng)
+    if p_actions is not None:
+        p_actions.append(merakibatches.action('/devices/%s' % p_devserial, 'update', fields))
+        merakievents.emit('device', 'queued', serial=p_devserial, hostname=p_hostname)
+        return('ok')
+    
+    start = time.time()
+    status = setdevicedata(p_apikey, p_shardurl, p_nwid, p_devserial, fields)
+    merakievents.emit('device', 'ok' if status == 'ok' else 'failed', serial=p_devserial, hostname=p_hostname, duration=time.time() - start)
+    return(status)
+
+def getorgdevicesinfo(p_apikey, p_shardurl, p_orgid, p_devserials):
+    #gets basic device info from org inventory for a list of serials with one paginated call
+    #devices do not need to be part of a network
+    #returns serial -> {'mac', 'serial', 'networkId', 'model', 'claimedAt'}, serials not found
+    #in the inventory are returned with serial and model 'null'
     try:
-        r = requests.get('https://%s/api/v1/organizations/%s/inventory/devices/%s' % (p_shardurl, p_orgid, p_devserial), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
+        status, inventory = merakiinventory.getinventory(p_apikey, p_shardurl, p_orgid, p_devserials)
     except:
         printusertext('ERROR 11: Unable to contact Meraki cloud')
         sys.exit(2)
     
-    returnvalue = {}
-    if r.status_code != requests.codes.ok:
-        print(r.status_code)
-        returnvalue = {'serial':'null', 'model':'null'}
-        return(returnvalue)
+    if status != requests.codes.ok:
+        print(status)
     
-    record = r.json()
-    #print(record)
-    
-    returnvalue = {'mac': record['mac'], 'serial': record['serial'], 'networkId': record['networkId'], 'model': record['model'], 'claimedAt': record['claimedAt']}
+    returnvalue = {}
+    for serial in p_devserials:
+        returnvalue[serial] = inventory.get(serial, {'serial':'null', 'model':'null'})
                 
     return(returnvalue) 
 
@@ -478,7 +490,7 @@ def getorgdeviceinfo(p_apikey, p_shardurl, p_orgid, p_devserial):
 
 def checkdhcp(p_apikey, p_shardurl, p_nwid):
     try:
-        r = requests.get('https://%s/api/v1/networks/%s/appliance/vlans' % (p_shardurl, p_nwid), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
+        r = merakiclient.get(p_apikey, p_shardurl, '/networks/%s/appliance/vlans' % p_nwid)
     except:
         printusertext('ERROR XX: Unable to contact Meraki cloud')
         sys.exit(2)
@@ -495,945 +507,90 @@ def checkdhcp(p_apikey, p_shardurl, p_nwid):
 
 ### Update VLAN Starts ###    
 
-def updatevlanbtq(p_apikey, p_shardurl, nwid, p_subnet):
-    #updates vlans subnets for new network
-    printusertext('-== BTQ ==-')
+def sendvlan(p_apikey, p_shardurl, p_nwid, p_vlanid, p_body):
+    #writes one VLAN and reports it in the progress events, returns the response
+    start = time.time()
+    r = merakivlans.updatevlan(p_apikey, p_shardurl, p_nwid, p_vlanid, p_body)
+    merakievents.emit('vlan', 'ok' if r.status_code == requests.codes.ok else 'failed', vlan=p_vlanid, code=r.status_code, duration=time.time() - start)
+    return r
+
+def updatevlans(p_apikey, p_shardurl, nwid, p_subnet, p_plan, p_actions=None):
+    #updates vlans subnets for new network following VLAN plan p_plan of merakivlans.py
+    #with p_actions, the VLAN updates are added to that list of action batch actions instead of being sent
+    printusertext('-== %s ==-' % merakivlans.VLAN_PLANS[p_plan]['title'])
     printusertext('Updating VLAN subnets...')
-    dhcpsettings = checkdhcp(p_apikey, p_shardurl, nwid)
-    # DHCP relay message
-    relay = 'Relay DHCP to another server'
-    
-#    try:
-    printusertext('Please check if all Responses are 200 (OK)')
-    
-    for vlan in dhcpsettings:
-        time.sleep(0.5)
-        if vlan['id'] == 10 and vlan['dhcpHandling'] == relay:
-            r1 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/10' % (p_shardurl, nwid), data=json.dumps({'name': '10-Voice', 'applianceIp': str(p_subnet)+'65', 'subnet': str(p_subnet)+'64/27','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r1.status_code)) #Remove comment for troubleshooting
-            if r1.status_code != 200:
-                print (r1.content) #Print error message
-        elif vlan['id'] == 10 and vlan['dhcpHandling'] != relay:
-            r1 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/10' % (p_shardurl, nwid), data=json.dumps({'name': '10-Voice', 'applianceIp': str(p_subnet)+'65', 'subnet': str(p_subnet)+'64/27'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r1.status_code)) #Remove comment for troubleshooting
-            if r1.status_code != 200:
-                print (r1.content) #Print error message
-
-        elif vlan['id'] == 20 and vlan['dhcpHandling'] == relay:
-            r2 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/20' % (p_shardurl, nwid), data=json.dumps({'name': '20-POS-HUB', 'applianceIp': str(p_subnet)+'97', 'subnet': str(p_subnet)+'96/27','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r2.status_code)) #Remove comment for troubleshooting
-            if r2.status_code != 200:
-                print (r2.content)
-        elif vlan['id'] == 20 and vlan['dhcpHandling'] != relay:
-            r2 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/20' % (p_shardurl, nwid), data=json.dumps({'name': '20-POS-HUB', 'applianceIp': str(p_subnet)+'97', 'subnet': str(p_subnet)+'96/27'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r2.status_code)) #Remove comment for troubleshooting
-            if r2.status_code != 200:
-                print (r2.content) #Print error message
-        
-        elif vlan['id'] == 30 and vlan['dhcpHandling'] == relay:
-            r3 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/30' % (p_shardurl, nwid), data=json.dumps({'name': '30-CC_Terms', 'applianceIp': str(p_subnet)+'129', 'subnet': str(p_subnet)+'128/27','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r3.status_code)) #Remove comment for troubleshooting
-            if r3.status_code != 200:
-                print (r3.content)
-        elif vlan['id'] == 30 and vlan['dhcpHandling'] != relay:    
-            r3 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/30' % (p_shardurl, nwid), data=json.dumps({'name': '30-CC_Terms', 'applianceIp': str(p_subnet)+'129', 'subnet': str(p_subnet)+'128/27'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->> ' + str(r3.status_code)) #Remove comment for troubleshooting
-            if r3.status_code != 200:
-                print (r3.content) #Print error message
-                
-        elif vlan['id'] == 50 and vlan['dhcpHandling'] == relay:        
-            r4 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/50' % (p_shardurl, nwid), data=json.dumps({'name': '50-PCs-Printers', 'applianceIp': str(p_subnet)+'1', 'subnet': str(p_subnet)+'0/26','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r4.status_code)) #Remove comment for troubleshooting
-            if r4.status_code != 200:
-                print (r4.content)
-        elif vlan['id'] == 50 and vlan['dhcpHandling'] != relay:
-            r4 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/50' % (p_shardurl, nwid), data=json.dumps({'name': '50-PCs-Printers', 'applianceIp': str(p_subnet)+'1', 'subnet': str(p_subnet)+'0/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->> ' + str(r4.status_code)) #Remove comment for troubleshooting
-            if r4.status_code != 200:
-                print (r4.content) #Print error message
-        
-        # Vlan 55 is only used in BUC BTQ's
-        
-        elif vlan['id'] == 55 and vlan['dhcpHandling'] == relay:
-            r6 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/55' % (p_shardurl, nwid), data=json.dumps({'name': '55-Printers', 'applianceIp': str(p_subnet)+'209', 'subnet': str(p_subnet)+'208/28','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('BUC/DLV/VHE Response >>> ' + str(r6.status_code)) #Remove comment for troubleshooting
-            if r6.status_code != 200:
-                print (r6.content)
-        elif vlan['id'] == 55 and vlan['dhcpHandling'] != relay:
-            r6 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/55' % (p_shardurl, nwid), data=json.dumps({'name': '55-Printers', 'applianceIp': str(p_subnet)+'209', 'subnet': str(p_subnet)+'208/28'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('BUC/DLV/VHE Response ->> ' + str(r6.status_code)) #Remove comment for troubleshooting
-            if r6.status_code != 200:
-                print (r6.content)
-        
-        
-        elif vlan['id'] == 60 and vlan['dhcpHandling'] == relay:
-            r5 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/60' % (p_shardurl, nwid), data=json.dumps({'name': '60-NonIT', 'applianceIp': str(p_subnet)+'225', 'subnet': str(p_subnet)+'224/27','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r5.status_code)) #Remove comment for troubleshooting
-            if r5.status_code != 200:
-                print (r5.content)
-        elif vlan['id'] == 60 and vlan['dhcpHandling'] != relay:
-            r5 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/60' % (p_shardurl, nwid), data=json.dumps({'name': '60-NonIT', 'applianceIp': str(p_subnet)+'225', 'subnet': str(p_subnet)+'224/27'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->> ' + str(r5.status_code)) #Remove comment for troubleshooting
-            if r5.status_code != 200:
-                print (r5.content)
-                
-        elif vlan['id'] == 80 and vlan['dhcpHandling'] == relay:
-            r6 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/80' % (p_shardurl, nwid), data=json.dumps({'name': '80-Reserved', 'applianceIp': str(p_subnet)+'209', 'subnet': str(p_subnet)+'208/28','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>-> ' + str(r6.status_code)) #Remove comment for troubleshooting
-            if r6.status_code != 200:
-                print (r6.content)
-        elif vlan['id'] == 80 and vlan['dhcpHandling'] != relay:
-            r6 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/80' % (p_shardurl, nwid), data=json.dumps({'name': '80-Reserved', 'applianceIp': str(p_subnet)+'209', 'subnet': str(p_subnet)+'208/28'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->-> ' + str(r6.status_code)) #Remove comment for troubleshooting
-            if r6.status_code != 200:
-                print (r6.content)
-         
-        elif vlan['id'] == 100 and vlan['dhcpHandling'] == relay:
-            r7 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/100' % (p_shardurl, nwid), data=json.dumps({'name': '100-Reserved', 'applianceIp': str(p_subnet)+'161', 'subnet': str(p_subnet)+'160/27','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r7.status_code)) #Remove comment for troubleshooting
-            if r7.status_code != 200:
-                print (r7.content)
-        elif vlan['id'] == 100 and vlan['dhcpHandling'] != relay:
-            r7 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/100' % (p_shardurl, nwid), data=json.dumps({'name': '100-Reserved', 'applianceIp': str(p_subnet)+'161', 'subnet': str(p_subnet)+'160/27'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->> ' + str(r7.status_code)) #Remove comment for troubleshooting
-            if r7.status_code != 200:
-                print (r7.content)
-        
-        elif vlan['id'] == 400:
-            r8 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/400' % (p_shardurl, nwid), data=json.dumps({'name': 'Management', 'applianceIp': str(p_subnet)+'193', 'subnet': str(p_subnet)+'192/28'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response --> ' + str(r8.status_code)) #Remove comment for troubleshooting
-            if r8.status_code != 200:
-                print (r8.content)
-                printusertext('Vlan 400 has local DHCP enabled??')
-    """        
-    except:
-        printusertext('ERROR 12: Unable to contact Meraki cloud')
-        sys.exit(2)
-        """
     try:
-        if r1.status_code == r2.status_code == r3.status_code == r4.status_code == r5.status_code == r6.status_code == r7.status_code == r8.status_code != requests.codes.ok:
-            printusertext('Please confirm Vlan subnets are OK')
-            return ('null')
-        printusertext('Finished updating VLANs')   
-        return('ok')
-    except:
-        print()
-        printusertext("WARNING!")
-        printusertext("Something wrong with subnet confituration, please check on Dashboard")
-        print()
-
-def updatevlanlargebtq(p_apikey, p_shardurl, nwid, p_subnet):
-    #updates vlans subnets for new network
-    
-    dhcpsettings = checkdhcp(p_apikey, p_shardurl, nwid)
-    # DHCP relay message
-    relay = 'Relay DHCP to another server'
-    print (p_subnet)
-    octets = re.split(r'\.|/', p_subnet)
-    #print(Octets)
-    octet3=int(octets[2])+1
-    #print (Octet3)
-    subnet2=(str(octets[0])+"."+str(octets[1])+"."+str(octet3)+".")
-    print (subnet2)
-    printusertext('-== Large BTQ ==-')
-    printusertext('Updating VLAN subnets...')
-
-    printusertext('Please check if all Responses are 200 (OK)')
-    
-    for vlan in dhcpsettings:
-        time.sleep(0.5)
-        if vlan['id'] == 10 and vlan['dhcpHandling'] == relay:
-            r1 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/10' % (p_shardurl, nwid), data=json.dumps({'name': '10-Voice', 'applianceIp': str(p_subnet)+'1',
-                                                                                                              'subnet': str(p_subnet)+'0/26','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r1.status_code)) #Remove comment for troubleshooting
-            if r1.status_code != 200:
-                print (r1.content) #Print error message
-        elif vlan['id'] == 10 and vlan['dhcpHandling'] != relay:
-            r1 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/10' % (p_shardurl, nwid), data=json.dumps({'name': '10-Voice', 'applianceIp': str(p_subnet)+'1',
-                                                                                                              'subnet': str(p_subnet)+'0/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r1.status_code)) #Remove comment for troubleshooting
-            if r1.status_code != 200:
-                print (r1.content) #Print error message
-
-        elif vlan['id'] == 20 and vlan['dhcpHandling'] == relay:
-            r2 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/20' % (p_shardurl, nwid), data=json.dumps({'name': '20-POS-HUB', 'applianceIp': str(p_subnet)+'65',
-                                                                                                              'subnet': str(p_subnet)+'64/26','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r2.status_code)) #Remove comment for troubleshooting
-            if r2.status_code != 200:
-                print (r2.content)
-        elif vlan['id'] == 20 and vlan['dhcpHandling'] != relay:
-            r2 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/20' % (p_shardurl, nwid), data=json.dumps({'name': '20-POS-HUB', 'applianceIp': str(p_subnet)+'65',
-                                                                                                              'subnet': str(p_subnet)+'64/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r2.status_code)) #Remove comment for troubleshooting
-            if r2.status_code != 200:
-                print (r2.content) #Print error message
-        
-        elif vlan['id'] == 30 and vlan['dhcpHandling'] == relay:
-            r3 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/30' % (p_shardurl, nwid), data=json.dumps({'name': '30-CC_Terms', 'applianceIp': str(p_subnet)+'129',
-                                                                                                              'subnet': str(p_subnet)+'128/26','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r3.status_code)) #Remove comment for troubleshooting
-            if r3.status_code != 200:
-                print (r3.content)
-        elif vlan['id'] == 30 and vlan['dhcpHandling'] != relay:    
-            r3 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/30' % (p_shardurl, nwid), data=json.dumps({'name': '30-CC_Terms', 'applianceIp': str(p_subnet)+'129',
-                                                                                                              'subnet': str(p_subnet)+'128/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->> ' + str(r3.status_code)) #Remove comment for troubleshooting
-            if r3.status_code != 200:
-                print (r3.content) #Print error message
-                print ('Vlan 30 subnet is: '+str(p_subnet)+'128/26')
-                
-        elif vlan['id'] == 50 and vlan['dhcpHandling'] == relay:        
-            r4 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/50' % (p_shardurl, nwid), data=json.dumps({'name': '50-PCs-Printers', 'applianceIp': subnet2+'1',
-                                                                                                              'subnet': subnet2+'0/25','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r4.status_code)) #Remove comment for troubleshooting
-            if r4.status_code != 200:
-                print (r4.content)
-        elif vlan['id'] == 50 and vlan['dhcpHandling'] != relay:
-            r4 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/50' % (p_shardurl, nwid), data=json.dumps({'name': '50-PCs-Printers', 'applianceIp': subnet2+'1',
-                                                                                                              'subnet': subnet2+'0/25'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->> ' + str(r4.status_code)) #Remove comment for troubleshooting
-            if r4.status_code != 200:
-                print (r4.content) #Print error message    
-        
-        elif vlan['id'] == 60 and vlan['dhcpHandling'] == relay:
-            r5 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/60' % (p_shardurl, nwid), data=json.dumps({'name': '60-NonIT', 'applianceIp': subnet2+'129',
-                                                                                                              'subnet': subnet2+'128/27','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r5.status_code)) #Remove comment for troubleshooting
-            if r5.status_code != 200:
-                print (r5.content)
-        elif vlan['id'] == 60 and vlan['dhcpHandling'] != relay:
-            r5 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/60' % (p_shardurl, nwid), data=json.dumps({'name': '60-NonIT', 'applianceIp': subnet2+'129',
-                                                                                                              'subnet': subnet2+'128/27'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->> ' + str(r5.status_code)) #Remove comment for troubleshooting
-            if r5.status_code != 200:
-                print (r5.content)
-
-        elif vlan['id'] == 100 and vlan['dhcpHandling'] == relay:
-            r7 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/100' % (p_shardurl, nwid), data=json.dumps({'name': '100-CCTV', 'applianceIp': subnet2+'193',
-                                                                                                               'subnet': subnet2+'192/26','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r7.status_code)) #Remove comment for troubleshooting
-            if r7.status_code != 200:
-                print (r7.content)
-        elif vlan['id'] == 100 and vlan['dhcpHandling'] != relay:
-            r7 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/100' % (p_shardurl, nwid), data=json.dumps({'name': '100-CCTV', 'applianceIp': subnet2+'193',
-                                                                                                               'subnet': subnet2+'192/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->> ' + str(r7.status_code)) #Remove comment for troubleshooting
-            if r7.status_code != 200:
-                print (r7.content)
-        
-        elif vlan['id'] == 400:
-            r8 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/400' % (p_shardurl, nwid), data=json.dumps({'name': 'Management', 'applianceIp': str(p_subnet)+'193',
-                                                                                                               'subnet': str(p_subnet)+'192/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response --> ' + str(r8.status_code)) #Remove comment for troubleshooting
-            if r8.status_code != 200:
-                print (r8.content)
-                printusertext('Vlan 400 has local DHCP enabled??')
-    """        
-    except:
-        printusertext('ERROR 12: Unable to contact Meraki cloud')
-        sys.exit(2)
-        """
-    
-    if r1.status_code == r2.status_code == r3.status_code == r4.status_code == r5.status_code == r7.status_code == r8.status_code != requests.codes.ok:
-        return ('null')
-    printusertext('Finished updating VLANs')   
-    return('ok')
-
-
-def updatevlanoff(p_apikey, p_shardurl, nwid, p_subnet):
-    #updates Simple Officevlans subnets for new network
-    print (p_subnet)
-    relay = 'Relay DHCP to another server'
-    octets = re.split(r'\.|/', p_subnet)
-    #print(Octets)
-    octet3=int(octets[2])+1
-    #print (Octet3)
-    subnet2=(str(octets[0])+"."+str(octets[1])+"."+str(octet3)+".")
-    print (subnet2)
-    printusertext('-== Simple Office ==-')
-    printusertext('Updating VLAN subnets...')
-        
-    dhcpsettings = checkdhcp(p_apikey, p_shardurl, nwid)
-    # DHCP relay message
-    relay = 'Relay DHCP to another server'
-    
-    printusertext('Please check if all Responses are 200 (OK)')
-    
-    for vlan in dhcpsettings:
-       
-        time.sleep(0.2)
-        if vlan['id'] == 100 and vlan['dhcpHandling'] == relay:
-            r1 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/100' % (p_shardurl, nwid), data=json.dumps({'name': '100-PCs-Printers', 'applianceIp': str(p_subnet)+'1', 'subnet': str(p_subnet)+'0/24','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r1.status_code)) #Remove comment for troubleshooting
-            if r1.status_code != 200:
-                print (r1.content) #Print error message
-        elif vlan['id'] == 100 and vlan['dhcpHandling'] != relay:
-            r1 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/100' % (p_shardurl, nwid), data=json.dumps({'name': '100-PCs-Printers', 'applianceIp': str(p_subnet)+'1', 'subnet': str(p_subnet)+'0/24'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r1.status_code)) #Remove comment for troubleshooting
-            if r1.status_code != 200:
-                print (r1.content) #Print error message
-
-        elif vlan['id'] == 300 and vlan['dhcpHandling'] == relay:
-            r2 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/300' % (p_shardurl, nwid), data=json.dumps({'name': '300-Voice-VideoConf', 'applianceIp': subnet2+'1', 'subnet': subnet2+'0/26','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r2.status_code)) #Remove comment for troubleshooting
-            if r2.status_code != 200:
-                print (r2.content)
-        elif vlan['id'] == 300 and vlan['dhcpHandling'] != relay:
-            r2 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/300' % (p_shardurl, nwid), data=json.dumps({'name': '300-Voice-VideoConf', 'applianceIp': subnet2+'1', 'subnet': subnet2+'0/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r2.status_code)) #Remove comment for troubleshooting
-            if r2.status_code != 200:
-                print (r2.content) #Print error message
-        
-        elif vlan['id'] == 600 and vlan['dhcpHandling'] == relay:
-            r3 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/600' % (p_shardurl, nwid), data=json.dumps({'name': '600-Non-IT-CCTV', 'applianceIp': subnet2+'129', 'subnet': subnet2+'128/27','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r3.status_code)) #Remove comment for troubleshooting
-            if r3.status_code != 200:
-                print (r3.content)
-        elif vlan['id'] == 600 and vlan['dhcpHandling'] != relay:    
-            r3 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/600' % (p_shardurl, nwid), data=json.dumps({'name': '600-Non-IT-CCTV', 'applianceIp': subnet2+'129', 'subnet': subnet2+'128/27'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->> ' + str(r3.status_code)) #Remove comment for troubleshooting
-            if r3.status_code != 200:
-                print (r3.content) #Print error message
-                
-        elif vlan['id'] == 999:        
-            r4 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/999' % (p_shardurl, nwid), data=json.dumps({'name': 'Management', 'applianceIp': subnet2+'193', 'subnet': subnet2+'192/27'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response --> ' + str(r4.status_code)) #Remove comment for troubleshooting
-            if r4.status_code != 200:
-                print (r4.content)
-                printusertext('Vlan 999 has local DHCP enabled??')
-        """
-        elif vlan['id'] == 999 and vlan['dhcpHandling'] != relay:
-            r4 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/999' % (p_shardurl, nwid), data=json.dumps({'name': 'Management', 'applianceIp': subnet2+'193', 'subnet': subnet2+'192/27'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response --> ' + str(r4.status_code)) #Remove comment for troubleshooting
-            if r4.status_code != 200:
-                print (r4.content) #Print error message
-        """
-        """
-    except:
-        printusertext('ERROR 12: Uho... something went wrong!')
-        sys.exit(2)
-        """
-    if r1.status_code == r2.status_code == r3.status_code == r4.status_code != requests.codes.ok:
+        desired = merakivlans.computeplan(p_plan, p_subnet)
+    except ValueError as e:
+        printusertext('ERROR 22: Invalid site subnet %s (%s)' % (p_subnet, e))
         return ('null')
-    printusertext('Finished updating VLANs')   
-    return('ok')
-
 
-def updatevlanztoff(p_apikey, p_shardurl, nwid, p_subnet):
-    #updates Simple Officevlans subnets for new network
-    print (p_subnet)
-    relay = 'Relay DHCP to another server'
-    octets = re.split(r'\.|/', p_subnet)
-    #print(Octets)
-    octet3=int(octets[2])+1
-    #print (Octet3)
-    subnet2=(str(octets[0])+"."+str(octets[1])+"."+str(octet3)+".")
-    print (subnet2)
-    printusertext('-== ZTNA Office ==-')
-    printusertext('Updating VLAN subnets...')
-    
-        
     dhcpsettings = checkdhcp(p_apikey, p_shardurl, nwid)
-    # DHCP relay message
-    relay = 'Relay DHCP to another server'
+    changes, unchanged, missing = merakivlans.diffvlans(desired, dhcpsettings)
+    updates = merakivlans.vlanupdates(desired, dhcpsettings)
+    
+    #plan summary, only the VLANs that differ from the plan are written
+    printusertext('VLAN plan: %d to update, %d already correct, %d not in network' % (len(changes), len(unchanged), len(missing)))
+    for vlanid, fields in changes:
+        for field in sorted(fields):
+            print ('Vlan %s %s: %s -> %s' % (vlanid, field, fields[field][0], fields[field][1]))
+    for vlanid in unchanged:
+        merakievents.emit('vlan', 'unchanged', vlan=vlanid)
+    for vlanid in missing:
+        merakievents.emit('vlan', 'missing', vlan=vlanid)
+    if len(updates) == 0:
+        printusertext('Finished updating VLANs')
+        return('ok')
+    if p_actions is not None:
+        for vlanid, body in updates:
+            p_actions.append(merakibatches.action('/networks/%s/appliance/vlans/%s' % (nwid, vlanid), 'update', body))
+            merakievents.emit('vlan', 'queued', vlan=vlanid)
+        printusertext('VLAN updates added to the action batch')
+        return('ok')
     
     printusertext('Please check if all Responses are 200 (OK)')
     
-    for vlan in dhcpsettings:
-       
-        
-        if vlan['id'] == 200 and vlan['dhcpHandling'] == relay:
-            r1 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/200' % (p_shardurl, nwid), data=json.dumps({'name': '200-Printers', 'applianceIp': subnet2+'65', 'subnet': str(p_subnet)+'64/27','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r1.status_code)) #Remove comment for troubleshooting
-            if r1.status_code != 200:
-                print (r1.content) #Print error message
-        elif vlan['id'] == 200 and vlan['dhcpHandling'] != relay:
-            r1 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/200' % (p_shardurl, nwid), data=json.dumps({'name': '200-Printers', 'applianceIp': subnet2+'65', 'subnet': str(p_subnet)+'64/27'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r1.status_code)) #Remove comment for troubleshooting
-            if r1.status_code != 200:
-                print (r1.content) #Print error message
-
-        elif vlan['id'] == 300 and vlan['dhcpHandling'] == relay:
-            r2 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/300' % (p_shardurl, nwid), data=json.dumps({'name': '300-Voice-VideoConf', 'applianceIp': subnet2+'1', 'subnet': subnet2+'0/26','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r2.status_code)) #Remove comment for troubleshooting
-            if r2.status_code != 200:
-                print (r2.content)
-        elif vlan['id'] == 300 and vlan['dhcpHandling'] != relay:
-            r2 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/300' % (p_shardurl, nwid), data=json.dumps({'name': '300-Voice-VideoConf', 'applianceIp': subnet2+'1', 'subnet': subnet2+'0/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r2.status_code)) #Remove comment for troubleshooting
-            if r2.status_code != 200:
-                print (r2.content) #Print error message
-        
-        elif vlan['id'] == 600 and vlan['dhcpHandling'] == relay:
-            r3 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/600' % (p_shardurl, nwid), data=json.dumps({'name': '600-Non-IT-CCTV', 'applianceIp': subnet2+'129', 'subnet': subnet2+'128/27','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r3.status_code)) #Remove comment for troubleshooting
-            if r3.status_code != 200:
-                print (r3.content)
-        elif vlan['id'] == 600 and vlan['dhcpHandling'] != relay:    
-            r3 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/600' % (p_shardurl, nwid), data=json.dumps({'name': '600-Non-IT-CCTV', 'applianceIp': subnet2+'129', 'subnet': subnet2+'128/27'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->> ' + str(r3.status_code)) #Remove comment for troubleshooting
-            if r3.status_code != 200:
-                print (r3.content) #Print error message
-                
-        elif vlan['id'] == 999:        
-            r4 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/999' % (p_shardurl, nwid), data=json.dumps({'name': 'Management', 'applianceIp': subnet2+'193', 'subnet': subnet2+'192/27'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response --> ' + str(r4.status_code)) #Remove comment for troubleshooting
-            if r4.status_code != 200:
-                print (r4.content)
-                printusertext('Vlan 999 has local DHCP enabled??')
-        """
-        elif vlan['id'] == 999 and vlan['dhcpHandling'] != relay:
-            r4 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/999' % (p_shardurl, nwid), data=json.dumps({'name': 'Management', 'applianceIp': subnet2+'193', 'subnet': subnet2+'192/27'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response --> ' + str(r4.status_code)) #Remove comment for troubleshooting
-            if r4.status_code != 200:
-                print (r4.content) #Print error message
-        """
-        """
+    #the VLANs are independent, their PUTs are sent concurrently under the shared rate limiter
+    try:
+        responses = merakiclient.parallelmap(lambda update: sendvlan(p_apikey, p_shardurl, nwid, update[0], update[1]), updates)
     except:
-        printusertext('ERROR 12: Uho... something went wrong!')
+        printusertext('ERROR 12: Unable to contact Meraki cloud')
         sys.exit(2)
-        """
-    if r1.status_code == r2.status_code == r3.status_code == r4.status_code != requests.codes.ok:
-        return ('null')
-    printusertext('Finished updating VLANs')   
-    return('ok')
-
-
-
-def updatevlanztmanuf(p_apikey, p_shardurl, nwid, p_subnet):
-    #updates Simple Officevlans subnets for new network
-    print (p_subnet)
-    relay = 'Relay DHCP to another server'
-    octets = re.split(r'\.|/', p_subnet)
-    #print(Octets)
-    octet3=int(octets[2])+1
-    #print (Octet3)
-    subnet2=(str(octets[0])+"."+str(octets[1])+"."+str(octet3)+".")
-    print (subnet2)
-    printusertext('-== ZTNA Manufacture ==-')
-    printusertext('Updating VLAN subnets...')
-    
-        
-    dhcpsettings = checkdhcp(p_apikey, p_shardurl, nwid)
-    # DHCP relay message
-    relay = 'Relay DHCP to another server'
-    
-    printusertext('Please check if all Responses are 200 (OK)')
-    
-    for vlan in dhcpsettings:
-       
-        
-        if vlan['id'] == 200 and vlan['dhcpHandling'] == relay:
-            r1 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/200' % (p_shardurl, nwid), data=json.dumps({'name': '200-Printers', 'applianceIp': str(p_subnet)+'1', 'subnet': str(p_subnet)+'0/26','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r1.status_code)) #Remove comment for troubleshooting
-            if r1.status_code != 200:
-                print (r1.content) #Print error message
-        elif vlan['id'] == 200 and vlan['dhcpHandling'] != relay:
-            r1 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/200' % (p_shardurl, nwid), data=json.dumps({'name': '200-Printers', 'applianceIp': str(p_subnet)+'1', 'subnet': str(p_subnet)+'0/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r1.status_code)) #Remove comment for troubleshooting
-            if r1.status_code != 200:
-                print (r1.content) #Print error message
-        
-        if vlan['id'] == 731 and vlan['dhcpHandling'] == relay:
-            r2 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/731' % (p_shardurl, nwid), data=json.dumps({'name': '731-Non-IT', 'applianceIp': str(p_subnet)+'65', 'subnet': str(p_subnet)+'64/26','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r2.status_code)) #Remove comment for troubleshooting
-            if r2.status_code != 200:
-                print (r2.content) #Print error message
-        elif vlan['id'] == 731 and vlan['dhcpHandling'] != relay:
-            r2 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/731' % (p_shardurl, nwid), data=json.dumps({'name': '731-Non-IT', 'applianceIp': str(p_subnet)+'65', 'subnet': str(p_subnet)+'64/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r2.status_code)) #Remove comment for troubleshooting
-            if r2.status_code != 200:
-                print (r2.content) #Print error message
-        
-        if vlan['id'] == 732 and vlan['dhcpHandling'] == relay:
-            r3 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/732' % (p_shardurl, nwid), data=json.dumps({'name': '732-CCTV', 'applianceIp': str(p_subnet)+'129', 'subnet': str(p_subnet)+'128/26','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r3.status_code)) #Remove comment for troubleshooting
-            if r3.status_code != 200:
-                print (r3.content) #Print error message
-        elif vlan['id'] == 732 and vlan['dhcpHandling'] != relay:
-            r3 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/732' % (p_shardurl, nwid), data=json.dumps({'name': '732-CCTV', 'applianceIp': str(p_subnet)+'129', 'subnet': str(p_subnet)+'128/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r3.status_code)) #Remove comment for troubleshooting
-            if r3.status_code != 200:
-                print (r3.content) #Print error message
-
-        if vlan['id'] == 711 and vlan['dhcpHandling'] == relay:
-            r4 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/711' % (p_shardurl, nwid), data=json.dumps({'name': '711-TustedManuf', 'applianceIp': str(p_subnet)+'193', 'subnet': str(p_subnet)+'192/27','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r4.status_code)) #Remove comment for troubleshooting
-            if r4.status_code != 200:
-                print (r4.content) #Print error message
-        elif vlan['id'] == 711 and vlan['dhcpHandling'] != relay:
-            r4 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/711' % (p_shardurl, nwid), data=json.dumps({'name': '711-TustedManuf', 'applianceIp': str(p_subnet)+'193', 'subnet': str(p_subnet)+'192/27'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r4.status_code)) #Remove comment for troubleshooting
-            if r4.status_code != 200:
-                print (r4.content) #Print error message
-
-        if vlan['id'] == 811 and vlan['dhcpHandling'] == relay:
-            r5 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/811' % (p_shardurl, nwid), data=json.dumps({'name': '811-UntrustedManuf', 'applianceIp': str(p_subnet)+'225', 'subnet': str(p_subnet)+'224/27','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r5.status_code)) #Remove comment for troubleshooting
-            if r5.status_code != 200:
-                print (r5.content) #Print error message
-        elif vlan['id'] == 811 and vlan['dhcpHandling'] != relay:
-            r5 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/811' % (p_shardurl, nwid), data=json.dumps({'name': '811-UntrustedManuf', 'applianceIp': str(p_subnet)+'225', 'subnet': str(p_subnet)+'224/27'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r5.status_code)) #Remove comment for troubleshooting
-            if r5.status_code != 200:
-                print (r5.content) #Print error message
-
-        elif vlan['id'] == 300 and vlan['dhcpHandling'] == relay:
-            r6 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/300' % (p_shardurl, nwid), data=json.dumps({'name': '300-Voice-VideoConf', 'applianceIp': subnet2+'1', 'subnet': subnet2+'0/26','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r6.status_code)) #Remove comment for troubleshooting
-            if r6.status_code != 200:
-                print (r6.content)
-        elif vlan['id'] == 300 and vlan['dhcpHandling'] != relay:
-            r6 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/300' % (p_shardurl, nwid), data=json.dumps({'name': '300-Voice-VideoConf', 'applianceIp': subnet2+'1', 'subnet': subnet2+'0/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r6.status_code)) #Remove comment for troubleshooting
-            if r6.status_code != 200:
-                print (r6.content) #Print error message
-        
-        elif vlan['id'] == 152 and vlan['dhcpHandling'] == relay:
-            r7 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/152' % (p_shardurl, nwid), data=json.dumps({'name': '152-RCCWH', 'applianceIp': subnet2+'129', 'subnet': subnet2+'128/26','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r7.status_code)) #Remove comment for troubleshooting
-            if r7.status_code != 200:
-                print (r7.content)
-        elif vlan['id'] == 152 and vlan['dhcpHandling'] != relay:    
-            r7 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/152' % (p_shardurl, nwid), data=json.dumps({'name': '152-RCCWH', 'applianceIp': subnet2+'129', 'subnet': subnet2+'128/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->> ' + str(r7.status_code)) #Remove comment for troubleshooting
-            if r7.status_code != 200:
-                print (r7.content) #Print error message
-                
-        elif vlan['id'] == 999:        
-            r8 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/999' % (p_shardurl, nwid), data=json.dumps({'name': 'Management', 'applianceIp': subnet2+'193', 'subnet': subnet2+'192/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response --> ' + str(r8.status_code)) #Remove comment for troubleshooting
-            if r8.status_code != 200:
-                print (r8.content)
-                printusertext('Vlan 999 has local DHCP enabled??')
-
-    if r1.status_code == r2.status_code == r3.status_code == r4.status_code == r5.status_code == r6.status_code == r7.status_code == r8.status_code != requests.codes.ok:
-        return ('null')
-    printusertext('Finished updating VLANs')   
-    return('ok')
-
-
-def updatevlanmanuf(p_apikey, p_shardurl, nwid, p_subnet):
-    #updates Simple Officevlans subnets for new network
-    print (p_subnet)
-    relay = 'Relay DHCP to another server'
-    octets = re.split(r'\.|/', p_subnet)
-    #print(Octets)
-    octet3=int(octets[2])+1
-    #print (Octet3)
-    subnet2=(str(octets[0])+"."+str(octets[1])+"."+str(octet3)+".")
-    print (subnet2)
-    printusertext('-== Manufacture RIC ==-')
-    printusertext('Updating VLAN subnets...')
-    
-        
-    dhcpsettings = checkdhcp(p_apikey, p_shardurl, nwid)
-    # DHCP relay message
-    relay = 'Relay DHCP to another server'
-    
-    printusertext('Please check if all Responses are 200 (OK)')
-    
-    for vlan in dhcpsettings:
-       
-        
-        if vlan['id'] == 300 and vlan['dhcpHandling'] == relay:
-            r1 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/300' % (p_shardurl, nwid), data=json.dumps({'name': '300-Voice-VideoConf', 'applianceIp': str(p_subnet)+'1', 'subnet': str(p_subnet)+'0/26','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r1.status_code)) #Remove comment for troubleshooting
-            if r1.status_code != 200:
-                print (r1.content) #Print error message
-        elif vlan['id'] == 300 and vlan['dhcpHandling'] != relay:
-            r1 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/300' % (p_shardurl, nwid), data=json.dumps({'name': '300-Voice-VideoConf', 'applianceIp': str(p_subnet)+'1', 'subnet': str(p_subnet)+'0/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r1.status_code)) #Remove comment for troubleshooting
-            if r1.status_code != 200:
-                print (r1.content) #Print error message
-        
-        if vlan['id'] == 731 and vlan['dhcpHandling'] == relay:
-            r2 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/731' % (p_shardurl, nwid), data=json.dumps({'name': '731-Non-IT', 'applianceIp': str(p_subnet)+'65', 'subnet': str(p_subnet)+'64/26','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r2.status_code)) #Remove comment for troubleshooting
-            if r2.status_code != 200:
-                print (r2.content) #Print error message
-        elif vlan['id'] == 731 and vlan['dhcpHandling'] != relay:
-            r2 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/731' % (p_shardurl, nwid), data=json.dumps({'name': '731-Non-IT', 'applianceIp': str(p_subnet)+'65', 'subnet': str(p_subnet)+'64/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r2.status_code)) #Remove comment for troubleshooting
-            if r2.status_code != 200:
-                print (r2.content) #Print error message
-        
-        if vlan['id'] == 732 and vlan['dhcpHandling'] == relay:
-            r3 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/732' % (p_shardurl, nwid), data=json.dumps({'name': '732-CCTV', 'applianceIp': str(p_subnet)+'129', 'subnet': str(p_subnet)+'128/26','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r3.status_code)) #Remove comment for troubleshooting
-            if r3.status_code != 200:
-                print (r3.content) #Print error message
-        elif vlan['id'] == 732 and vlan['dhcpHandling'] != relay:
-            r3 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/732' % (p_shardurl, nwid), data=json.dumps({'name': '732-CCTV', 'applianceIp': str(p_subnet)+'129', 'subnet': str(p_subnet)+'128/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r3.status_code)) #Remove comment for troubleshooting
-            if r3.status_code != 200:
-                print (r3.content) #Print error message
-
-        if vlan['id'] == 711 and vlan['dhcpHandling'] == relay:
-            r4 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/711' % (p_shardurl, nwid), data=json.dumps({'name': '711-TustedManuf', 'applianceIp': str(p_subnet)+'193', 'subnet': str(p_subnet)+'192/27','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r4.status_code)) #Remove comment for troubleshooting
-            if r4.status_code != 200:
-                print (r4.content) #Print error message
-        elif vlan['id'] == 711 and vlan['dhcpHandling'] != relay:
-            r4 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/711' % (p_shardurl, nwid), data=json.dumps({'name': '711-TustedManuf', 'applianceIp': str(p_subnet)+'193', 'subnet': str(p_subnet)+'192/27'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r4.status_code)) #Remove comment for troubleshooting
-            if r4.status_code != 200:
-                print (r4.content) #Print error message
-
-        if vlan['id'] == 811 and vlan['dhcpHandling'] == relay:
-            r5 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/811' % (p_shardurl, nwid), data=json.dumps({'name': '811-UntrustedManuf', 'applianceIp': str(p_subnet)+'225', 'subnet': str(p_subnet)+'224/27','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r5.status_code)) #Remove comment for troubleshooting
-            if r5.status_code != 200:
-                print (r5.content) #Print error message
-        elif vlan['id'] == 811 and vlan['dhcpHandling'] != relay:
-            r5 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/811' % (p_shardurl, nwid), data=json.dumps({'name': '811-UntrustedManuf', 'applianceIp': str(p_subnet)+'225', 'subnet': str(p_subnet)+'224/27'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r5.status_code)) #Remove comment for troubleshooting
-            if r5.status_code != 200:
-                print (r5.content) #Print error message
-
-        elif vlan['id'] == 100 and vlan['dhcpHandling'] == relay:
-            r6 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/100' % (p_shardurl, nwid), data=json.dumps({'name': '100-PCs-Printers', 'applianceIp': subnet2+'1', 'subnet': subnet2+'0/25','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r6.status_code)) #Remove comment for troubleshooting
-            if r6.status_code != 200:
-                print (r6.content)
-        elif vlan['id'] == 100 and vlan['dhcpHandling'] != relay:
-            r6 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/100' % (p_shardurl, nwid), data=json.dumps({'name': '100-PCs-Printers', 'applianceIp': subnet2+'1', 'subnet': subnet2+'0/25'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r6.status_code)) #Remove comment for troubleshooting
-            if r6.status_code != 200:
-                print (r6.content) #Print error message
-        
-        elif vlan['id'] == 152 and vlan['dhcpHandling'] == relay:
-            r7 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/152' % (p_shardurl, nwid), data=json.dumps({'name': '152-RCCWH', 'applianceIp': subnet2+'129', 'subnet': subnet2+'128/26','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r7.status_code)) #Remove comment for troubleshooting
-            if r7.status_code != 200:
-                print (r7.content)
-        elif vlan['id'] == 152 and vlan['dhcpHandling'] != relay:    
-            r7 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/152' % (p_shardurl, nwid), data=json.dumps({'name': '152-RCCWH', 'applianceIp': subnet2+'129', 'subnet': subnet2+'128/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->> ' + str(r7.status_code)) #Remove comment for troubleshooting
-            if r7.status_code != 200:
-                print (r7.content) #Print error message
-                
-        elif vlan['id'] == 999:        
-            r8 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/999' % (p_shardurl, nwid), data=json.dumps({'name': 'Management', 'applianceIp': subnet2+'193', 'subnet': subnet2+'192/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response --> ' + str(r8.status_code)) #Remove comment for troubleshooting
-            if r8.status_code != 200:
-                print (r8.content)
-                printusertext('Vlan 999 has local DHCP enabled??')
-
-    if r1.status_code == r2.status_code == r3.status_code == r4.status_code == r5.status_code == r6.status_code == r7.status_code == r8.status_code != requests.codes.ok:
-        return ('null')
-    printusertext('Finished updating VLANs')   
-    return('ok')
-
-
-#VCA France Templates
-
-def updatevlanvcamanuf(p_apikey, p_shardurl, nwid, p_subnet):
-    #updates Simple Officevlans subnets for new network
-    print (p_subnet)
-    relay = 'Relay DHCP to another server'
-    octets = re.split(r'\.|/', p_subnet)
-    #print(Octets)
-    octet3=int(octets[2])+1
-    #print (Octet3)
-    subnet2=(str(octets[0])+"."+str(octets[1])+"."+str(octet3)+".")
-    print (subnet2)
-    printusertext('-== VCA France Manufacture ==-')
-    printusertext('Updating VLAN subnets...')
-            
-    dhcpsettings = checkdhcp(p_apikey, p_shardurl, nwid)
-    # DHCP relay message
-    relay = 'Relay DHCP to another server'
-    
-    printusertext('Please check if all Responses are 200 (OK)')
-    
-    for vlan in dhcpsettings:
-       
-        
-        if vlan['id'] == 200 and vlan['dhcpHandling'] == relay:
-            r1 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/200' % (p_shardurl, nwid), data=json.dumps({'name': '200-Printers', 'applianceIp': str(p_subnet)+'193', 'subnet': str(p_subnet)+'192/26','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r1.status_code)) #Remove comment for troubleshooting
-            if r1.status_code != 200:
-                print (r1.content) #Print error message
-        elif vlan['id'] == 200 and vlan['dhcpHandling'] != relay:
-            r1 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/200' % (p_shardurl, nwid), data=json.dumps({'name': '200-Printers', 'applianceIp': str(p_subnet)+'193', 'subnet': str(p_subnet)+'192/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r1.status_code)) #Remove comment for troubleshooting
-            if r1.status_code != 200:
-                print (r1.content) #Print error message
-        
-        if vlan['id'] == 731 and vlan['dhcpHandling'] == relay:
-            r2 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/731' % (p_shardurl, nwid), data=json.dumps({'name': '731-Non-IT', 'applianceIp': str(p_subnet)+'65', 'subnet': str(p_subnet)+'64/26','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r2.status_code)) #Remove comment for troubleshooting
-            if r2.status_code != 200:
-                print (r2.content) #Print error message
-        elif vlan['id'] == 731 and vlan['dhcpHandling'] != relay:
-            r2 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/731' % (p_shardurl, nwid), data=json.dumps({'name': '731-Non-IT', 'applianceIp': str(p_subnet)+'65', 'subnet': str(p_subnet)+'64/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r2.status_code)) #Remove comment for troubleshooting
-            if r2.status_code != 200:
-                print (r2.content) #Print error message
-                
-        elif vlan['id'] == 152 and vlan['dhcpHandling'] == relay:
-            r3 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/152' % (p_shardurl, nwid), data=json.dumps({'name': '152-RCCWH', 'applianceIp': str(p_subnet)+'1', 'subnet': str(p_subnet)+'0/26','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r7.status_code)) #Remove comment for troubleshooting
-            if r3.status_code != 200:
-                print (r3.content)
-        elif vlan['id'] == 152 and vlan['dhcpHandling'] != relay:    
-            r3 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/152' % (p_shardurl, nwid), data=json.dumps({'name': '152-RCCWH', 'applianceIp': str(p_subnet)+'1', 'subnet': str(p_subnet)+'0/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->> ' + str(r7.status_code)) #Remove comment for troubleshooting
-            if r3.status_code != 200:
-                print (r3.content) #Print error message
-                
-        if vlan['id'] == 711 and vlan['dhcpHandling'] == relay:
-            r4 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/711' % (p_shardurl, nwid), data=json.dumps({'name': '711-TustedManuf', 'applianceIp': subnet2+'1', 'subnet': subnet2+'0/26','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r4.status_code)) #Remove comment for troubleshooting
-            if r4.status_code != 200:
-                print (r4.content) #Print error message
-        elif vlan['id'] == 711 and vlan['dhcpHandling'] != relay:
-            r4 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/711' % (p_shardurl, nwid), data=json.dumps({'name': '711-TustedManuf', 'applianceIp': subnet2+'1', 'subnet': subnet2+'0/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r4.status_code)) #Remove comment for troubleshooting
-            if r4.status_code != 200:
-                print (r4.content) #Print error message
-                
-        if vlan['id'] == 811 and vlan['dhcpHandling'] == relay:
-            r5 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/811' % (p_shardurl, nwid), data=json.dumps({'name': '811-UntrustedManuf', 'applianceIp': subnet2+'65', 'subnet': subnet2+'64/26','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r5.status_code)) #Remove comment for troubleshooting
-            if r5.status_code != 200:
-                print (r5.content) #Print error message
-        elif vlan['id'] == 811 and vlan['dhcpHandling'] != relay:
-            r5 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/811' % (p_shardurl, nwid), data=json.dumps({'name': '811-UntrustedManuf', 'applianceIp': subnet2+'65', 'subnet': subnet2+'64/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r5.status_code)) #Remove comment for troubleshooting
-            if r5.status_code != 200:
-                print (r5.content) #Print error message
-                
-        elif vlan['id'] == 300 and vlan['dhcpHandling'] == relay:
-            r6 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/300' % (p_shardurl, nwid), data=json.dumps({'name': '300-Voice-VideoConf', 'applianceIp': str(p_subnet)+'161', 'subnet': str(p_subnet)+'160/27','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r6.status_code)) #Remove comment for troubleshooting
-            if r6.status_code != 200:
-                print (r6.content)
-        elif vlan['id'] == 300 and vlan['dhcpHandling'] != relay:
-            r6 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/300' % (p_shardurl, nwid), data=json.dumps({'name': '300-Voice-VideoConf', 'applianceIp': str(p_subnet)+'161', 'subnet': str(p_subnet)+'160/27'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r6.status_code)) #Remove comment for troubleshooting
-            if r6.status_code != 200:
-                print (r6.content) #Print error message
-        
-        elif vlan['id'] == 910 and vlan['dhcpHandling'] == relay:
-            r7 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/910' % (p_shardurl, nwid), data=json.dumps({'name': '910-Cybervision', 'applianceIp': str(p_subnet)+'129', 'subnet': str(p_subnet)+'128/27','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r7.status_code)) #Remove comment for troubleshooting
-            if r7.status_code != 200:
-                print (r7.content)
-        elif vlan['id'] == 910 and vlan['dhcpHandling'] != relay:    
-            r7 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/910' % (p_shardurl, nwid), data=json.dumps({'name': '910-Cybervision', 'applianceIp': str(p_subnet)+'129', 'subnet': str(p_subnet)+'128/27'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->> ' + str(r7.status_code)) #Remove comment for troubleshooting
-            if r7.status_code != 200:
-                print (r7.content) #Print error message
-                
-        elif vlan['id'] == 999:        
-            r8 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/999' % (p_shardurl, nwid), data=json.dumps({'name': 'Management', 'applianceIp': subnet2+'129', 'subnet': subnet2+'128/25'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response --> ' + str(r8.status_code)) #Remove comment for troubleshooting
-            if r8.status_code != 200:
-                print (r8.content)
-                printusertext('Vlan 999 has local DHCP enabled??')
-
-    if r1.status_code == r2.status_code == r3.status_code == r4.status_code == r5.status_code == r6.status_code == r7.status_code == r8.status_code != requests.codes.ok:
-        return ('null')
-    printusertext('Finished updating VLANs')   
-    return('ok')
-
-
-
-def updatevlanvcaoffice(p_apikey, p_shardurl, nwid, p_subnet):
-    #updates Simple Officevlans subnets for new network
-    print (p_subnet)
-    relay = 'Relay DHCP to another server'
-    octets = re.split(r'\.|/', p_subnet)
-    #print(Octets)
-    octet3=int(octets[2])+1
-    #print (Octet3)
-    subnet2=(str(octets[0])+"."+str(octets[1])+"."+str(octet3)+".")
-    print (subnet2)
-    printusertext('-== VCA France Office ==-')
-    printusertext('Updating VLAN subnets...')
-    
-        
-    dhcpsettings = checkdhcp(p_apikey, p_shardurl, nwid)
-    # DHCP relay message
-    relay = 'Relay DHCP to another server'
     
-    printusertext('Please check if all Responses are 200 (OK)')
+    #status code of every updated VLAN
+    statuses = {}
+    for (vlanid, body), r in zip(updates, responses):
+        statuses[vlanid] = r.status_code
+        print ('Vlan %s Response ->> %s' % (vlanid, r.status_code))
+        if r.status_code != requests.codes.ok:
+            print (r.content) #Print error message
     
-    for vlan in dhcpsettings:
-       
-        
-        if vlan['id'] == 200 and vlan['dhcpHandling'] == relay:
-            r1 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/200' % (p_shardurl, nwid), data=json.dumps({'name': '200-Printers', 'applianceIp': str(p_subnet)+'1', 'subnet': str(p_subnet)+'0/26','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r1.status_code)) #Remove comment for troubleshooting
-            if r1.status_code != 200:
-                print (r1.content) #Print error message
-        elif vlan['id'] == 200 and vlan['dhcpHandling'] != relay:
-            r1 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/200' % (p_shardurl, nwid), data=json.dumps({'name': '200-Printers', 'applianceIp': str(p_subnet)+'1', 'subnet': str(p_subnet)+'0/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r1.status_code)) #Remove comment for troubleshooting
-            if r1.status_code != 200:
-                print (r1.content) #Print error message
-                        
-        elif vlan['id'] == 300 and vlan['dhcpHandling'] == relay:
-            r6 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/300' % (p_shardurl, nwid), data=json.dumps({'name': '300-Voice-VideoConf', 'applianceIp': str(p_subnet)+'65', 'subnet': str(p_subnet)+'64/26','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r6.status_code)) #Remove comment for troubleshooting
-            if r6.status_code != 200:
-                print (r6.content)
-        elif vlan['id'] == 300 and vlan['dhcpHandling'] != relay:
-            r6 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/300' % (p_shardurl, nwid), data=json.dumps({'name': '300-Voice-VideoConf', 'applianceIp': str(p_subnet)+'65', 'subnet': str(p_subnet)+'64/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r6.status_code)) #Remove comment for troubleshooting
-            if r6.status_code != 200:
-                print (r6.content) #Print error message
-        
-        elif vlan['id'] == 600 and vlan['dhcpHandling'] == relay:
-            r7 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/600' % (p_shardurl, nwid), data=json.dumps({'name': '600-CCTV', 'applianceIp': subnet2+'1', 'subnet': subnet2+'0/26','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r7.status_code)) #Remove comment for troubleshooting
-            if r7.status_code != 200:
-                print (r7.content)
-        elif vlan['id'] == 600 and vlan['dhcpHandling'] != relay:    
-            r7 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/600' % (p_shardurl, nwid), data=json.dumps({'name': '600-CCTV', 'applianceIp': subnet2+'1', 'subnet': subnet2+'0/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->> ' + str(r7.status_code)) #Remove comment for troubleshooting
-            if r7.status_code != 200:
-                print (r7.content) #Print error message
-                
-        elif vlan['id'] == 999:        
-            r8 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/999' % (p_shardurl, nwid), data=json.dumps({'name': 'Management', 'applianceIp': str(p_subnet)+'129', 'subnet': str(p_subnet)+'128/25'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response --> ' + str(r8.status_code)) #Remove comment for troubleshooting
-            if r8.status_code != 200:
-                print (r8.content)
-                printusertext('Vlan 999 has local DHCP enabled??')
-
-    if r1.status_code == r6.status_code == r7.status_code == r8.status_code != requests.codes.ok:
+    failed = [vlanid for vlanid in statuses if statuses[vlanid] != requests.codes.ok]
+    if len(statuses) > 0 and len(failed) == len(statuses):
+        printusertext('Please confirm Vlan subnets are OK')
         return ('null')
+    if len(failed) > 0:
+        print()
+        printusertext("WARNING!")
+        printusertext("Something wrong with subnet confituration, please check on Dashboard")
+        printusertext('Failed VLANs: ' + ' '.join(str(vlanid) for vlanid in failed))
+        print()
     printusertext('Finished updating VLANs')   
     return('ok')
 
-def updatevlancheckpointoff(p_apikey, p_shardurl, nwid, p_subnet):
-    #updates Checkpoint Office vlans subnets for new network
-    print (p_subnet)
-    relay = 'Relay DHCP to another server'
-    octets = re.split(r'\.|/', p_subnet)
-    #print(Octets)
-    octet3=int(octets[2])+1
-    #print (Octet3)
-    subnet2=(str(octets[0])+"."+str(octets[1])+"."+str(octet3)+".")
-    print (subnet2)
-    printusertext('-== Checkpoint Office ==-')
-    printusertext('Updating VLAN subnets...')
-        
-    dhcpsettings = checkdhcp(p_apikey, p_shardurl, nwid)
-    # DHCP relay message
-    relay = 'Relay DHCP to another server'
-    
-    printusertext('Please check if all Responses are 200 (OK)')
-    
-def updatevlancheckpointoff(p_apikey, p_shardurl, nwid, p_subnet):
-    #updates Checkpoint Office vlans subnets for new network
-    print (p_subnet)
-    relay = 'Relay DHCP to another server'
-    octets = re.split(r'\.|/', p_subnet)
-    #print(Octets)
-    octet3=int(octets[2])+1
-    #print (Octet3)
-    subnet2=(str(octets[0])+"."+str(octets[1])+"."+str(octet3)+".")
-    print (subnet2)
-    printusertext('-== EMEA - Checkpoint Office ==-')
-    printusertext('Updating VLAN subnets...')
-        
-    dhcpsettings = checkdhcp(p_apikey, p_shardurl, nwid)
-    # DHCP relay message
-    relay = 'Relay DHCP to another server'
-
-    printusertext('Please check if all Responses are 200 (OK)')
-
-    for vlan in dhcpsettings:
-
-        if vlan['id'] == 100 and vlan['dhcpHandling'] == relay:
-            r1 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/100' % (p_shardurl, nwid), data=json.dumps({'name': '100-Reserved', 'applianceIp': str(p_subnet)+'1', 'subnet': str(p_subnet)+'0/26','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r1.status_code)) #Remove comment for troubleshooting
-            if r1.status_code != 200:
-                print (r1.content)
-        elif vlan['id'] == 100 and vlan['dhcpHandling'] != relay:
-            r1 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/100' % (p_shardurl, nwid), data=json.dumps({'name': '100-Reserved', 'applianceIp': str(p_subnet)+'1', 'subnet': str(p_subnet)+'0/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r1.status_code)) #Remove comment for troubleshooting
-            if r1.status_code != 200:
-                print (r1.content) #Print error message
-        elif vlan['id'] == 200 and vlan['dhcpHandling'] == relay:
-            r2 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/200' % (p_shardurl, nwid), data=json.dumps({'name': '200-Printers', 'applianceIp': str(p_subnet)+'65', 'subnet': str(p_subnet)+'64/26','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r2.status_code)) #Remove comment for troubleshooting
-            if r2.status_code != 200:
-                print (r2.content)
-        elif vlan['id'] == 200 and vlan['dhcpHandling'] != relay:
-            r2 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/200' % (p_shardurl, nwid), data=json.dumps({'name': '200-Printers', 'applianceIp': str(p_subnet)+'65', 'subnet': str(p_subnet)+'64/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r2.status_code)) #Remove comment for troubleshooting
-            if r2.status_code != 200:
-                print (r2.content) #Print error message
-
-        elif vlan['id'] == 300 and vlan['dhcpHandling'] == relay:
-            r3 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/300' % (p_shardurl, nwid), data=json.dumps({'name': '300-Voice', 'applianceIp': str(p_subnet)+'129', 'subnet': str(p_subnet)+'128/26','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r3.status_code)) #Remove comment for troubleshooting
-            if r3.status_code != 200:
-                print (r3.content)
-        elif vlan['id'] == 300 and vlan['dhcpHandling'] != relay:
-            r3 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/300' % (p_shardurl, nwid), data=json.dumps({'name': '300-Voice', 'applianceIp': str(p_subnet)+'129', 'subnet': str(p_subnet)+'128/26'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r3.status_code)) #Remove comment for troubleshooting
-            if r3.status_code != 200:
-                print (r3.content) #Print error message
-
-        elif vlan['id'] == 707 and vlan['dhcpHandling'] == relay:
-            r4 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/707' % (p_shardurl, nwid), data=json.dumps({'name': '707-Dolce Vista', 'applianceIp': str(p_subnet)+'193', 'subnet': str(p_subnet)+'192/27','dhcpRelayServerIps': vlan['dhcpRelayServerIps']}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response >>> ' + str(r4.status_code)) #Remove comment for troubleshooting
-            if r4.status_code != 200:
-                print (r4.content)
-        elif vlan['id'] == 707 and vlan['dhcpHandling'] != relay:
-            r4 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/707' % (p_shardurl, nwid), data=json.dumps({'name': '707-Dolce Vista', 'applianceIp': str(p_subnet)+'193', 'subnet': str(p_subnet)+'192/27'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response ->>' + str(r4.status_code)) #Remove comment for troubleshooting
-            if r4.status_code != 200:
-                print (r4.content) #Print error message
-                
-        elif vlan['id'] == 999:        
-            r5 = requests.put('https://%s/api/v1/networks/%s/appliance/vlans/999' % (p_shardurl, nwid), data=json.dumps({'name': 'Management', 'applianceIp': str(p_subnet)+'225', 'subnet': str(p_subnet)+'224/25'}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-            print ('Response --> ' + str(r5.status_code)) #Remove comment for troubleshooting
-            if r5.status_code != 200:
-                print (r5.content)
-                printusertext('Vlan 999 has local DHCP enabled??')
-
-    if r1.status_code == r2.status_code == r3.status_code == r4.status_code == r5.status_code != requests.codes.ok:
-            return ('null')
-    printusertext('Finished updating VLANs')   
-    return('ok')    
-        
-
 ### Update VLAN ends ###
     
-def getgoogletimezone(p_googlekey, p_address):
-    #returns the timezone associated to a specified address by using Google Maps APIs
-    try:
-        r = requests.get('https://maps.googleapis.com/maps/api/geocode/json?address=%s&key=%s' % (p_address, p_googlekey) )
-    except:
-        printusertext('WARNING: Unable to contact Google cloud')
-        return('null')
-        
-    rjson = r.json()
-    if rjson['status'] != 'OK':
-        return('null')
-
-    glatitude  = rjson['results'][0]['geometry']['location']['lat']
-    glongitude = rjson['results'][0]['geometry']['location']['lng']
-    
+def getgooglelocation(p_googlekey, p_address, p_site):
+    #returns the coordinates and timezone of an address by using Google Maps APIs, as a dict
+    #{'lat', 'lng', 'timeZone'}. Addresses located before are read from the cache, see merakigeo.py
+    #on failure returns 'null'
     try:
-        s = requests.get('https://maps.googleapis.com/maps/api/timezone/json?location=%s,%s&timestamp=%f&key=%s' % (glatitude, glongitude, time.time(), p_googlekey) )
+        location = merakigeo.locate(p_googlekey, p_address, p_site)
     except:
         printusertext('WARNING: Unable to contact Google cloud')
         return('null')
-
-    sjson = s.json()
     
-    if sjson['status'] == 'OK':
-        return(sjson['timeZoneId'])
-
-    return('null')
+    return(location)
 
 
 def firstTwo(string):
@@ -1447,9 +604,6 @@ def main(argv):
     mv_count = 0
     mg_count = 0
     mrtags = []
-    # Print team logo
-    printteam()
-    printusertext('Merakifying...')
     #set default values for command line arguments
     arg_apikey = 'null'
     arg_orgname = 'null'
@@ -1459,9 +613,13 @@ def main(argv):
     arg_subnet = 'null'
     arg_modexisting = 'null'
     arg_address = 'null'
-    arg_nwtags = []
+    arg_nwtags = ''
     arg_guestwifi = 'null'
     arg_googlekey = ''
+    arg_actionbatches = False
+    arg_tracefile = 'null'
+    arg_eventsfile = 'null'
+    arg_resume = False
 
     
     # 2-Letter Maison code
@@ -1472,7 +630,7 @@ def main(argv):
 
     #get command line arguments
     try:
-        opts, args = getopt.getopt(argv, 'hk:o:s:n:c:w:m:a:x:g:t:')
+        opts, args = getopt.getopt(argv, 'hk:o:s:n:c:w:m:a:x:g:t:', ['refresh-cache', 'action-batches', 'trace=', 'events=', 'resume'])
     except getopt.GetoptError:
         printhelp()
         sys.exit(2)
@@ -1503,6 +661,24 @@ def main(argv):
             arg_guestwifi = arg
         elif opt == '-g':
             arg_googlekey = arg
+        elif opt == '--refresh-cache':
+            merakicache.setrefresh(True)
+        elif opt == '--action-batches':
+            arg_actionbatches = True
+        elif opt == '--trace':
+            arg_tracefile = arg
+        elif opt == '--events':
+            arg_eventsfile = arg
+        elif opt == '--resume':
+            arg_resume = True
+    
+    #with --events - stdout is kept for the events, the text output below goes to stderr
+    if arg_eventsfile != 'null':
+        merakievents.start(arg_eventsfile, arg_nwname if arg_nwname != 'null' else None)
+    
+    # Print team logo
+    printteam()
+    printusertext('Merakifying...')
     
     if firstTwo(arg_nwname) == 'CN':
         arg_orgname = 'RISA CN'
@@ -1519,6 +695,10 @@ def main(argv):
     
     printusertext('Template is ---> "' + arg_template + '"')
     
+    #the summary of the trace is printed when the script ends, see merakitrace.stop()
+    if arg_tracefile != 'null':
+        merakitrace.start(arg_tracefile)
+    
     #set optional flag to ignore error if network already exists
     stoponerror = True
     if arg_modexisting == 'ignore_error':
@@ -1530,133 +710,25 @@ def main(argv):
     if arg_orgname == 'RISA CN':
  #       dashboard = 'CN'
         print('--== RISA CN Dashboard ==--')
-        orgid = getorgidcn(arg_apikey, arg_orgname)
         shardurl = 'api.meraki.cn'
     else:
         print('--== RISA Dashboard ==--')
 #        dashboard = 'WW'
-        orgid = getorgid(arg_apikey, arg_orgname)
         shardurl = 'api.meraki.com'    
     
-       
-    if orgid == 'null':
-        print('Dashboard is ' + arg_orgname)
-        printusertext('ERROR 12: Fetching organization failed (wrong password?)')
-        sys.exit(2)
-    printusertext('Fetching organization OK')
-    
-    
-    #make sure that a network does not already exist with the same name    
-    nwid = getnwid(arg_apikey, shardurl, orgid, arg_nwname)
-    if nwid != 'null' and stoponerror:
-        printusertext('ERROR 14: Network with that name already exists')
-        sys.exit(2)    
-        
-    #get template ID for template name argument
-    templateid = gettemplateid(arg_apikey, shardurl, orgid, arg_template)
-    if templateid == 'null':
-        printusertext('ERROR 15: Unable to find template: ' + arg_template)
-        sys.exit(2)    
-        
-    #get serial numbers from parameter -s
-    devicelist = {}
-    devicelist['serial'] = arg_serial.split(" ")
-    devicelist['model'] = []
-    
-    for i in range (0, len(devicelist['serial']) ):
-        deviceserial = []
-        deviceserial = [devicelist['serial'][i]]
-        
-        #claimdeviceorg(arg_apikey, shardurl, orgid, devicelist['serial'][i])
-        claimdeviceorg(arg_apikey, shardurl, orgid, deviceserial)
-        
-        #check if device has been claimed successfully
-        #deviceinfo = getorgdeviceinfo(arg_apikey, shardurl, orgid, devicelist['serial'][i])
-        deviceinfo = getorgdeviceinfo(arg_apikey, shardurl, orgid, devicelist['serial'][i])
-        if deviceinfo['serial'] == 'null':
-            printusertext('INFO: Serial number %s is a license or unsupported device?' % devicelist['serial'][i])
-            printusertext('Exiting script, please review S/Ns')
-            exit()
-            claimlicenseorg(arg_apikey, shardurl, orgid, devicelist['serial'][i])
-        devicelist['model'].append(deviceinfo['model'])
-        
-    #compile list of different product types in order to create correct type of network
-    devicetypes = {'mx': False, 'ms': False, 'mr': False, 'mv': False, 'mg': False}
-    for record in devicelist['model']:
-        print('Device Type '+ record)
-        if record [:2] == 'MX' or record [:1] == 'Z':
-            devicetypes['mx'] = True
-        elif record [:2] == 'MS':
-            devicetypes['ms'] = True
-        elif record [:2] == 'MR' or record [:2] == 'CW':
-            devicetypes['mr'] = True
-        elif record [:2] == 'MV':
-            devicetypes['mv'] = True
-        elif record [:2] == 'MG':
-            devicetypes['mg'] = True
-            
-    #build network type string for network creation
-    nwtypestring = ""
-    if devicetypes['mx']:
-        if len(nwtypestring) > 0:
-            nwtypestring += ' appliance'
-        else:
-            nwtypestring = 'appliance'
-
-    if devicetypes['mr']:
-        if len(nwtypestring) > 0:
-            nwtypestring += ' wireless'
-        else:
-            nwtypestring = 'wireless'
-    
-    if devicetypes['ms']:
-        if len(nwtypestring) > 0:
-            nwtypestring += ' switch'
-        else:
-            nwtypestring = 'switch'
-    if devicetypes['mv']:
-        if len(nwtypestring) > 0:
-            nwtypestring += ' camera'
-        else:
-            nwtypestring = 'camera'
-    if devicetypes['mg']:
-        if len(nwtypestring) > 0:
-            nwtypestring += ' cellularGateway'
-        else:
-            nwtypestring = 'cellularGateway'
+    #checkpoint journal of the site, the steps done by an interrupted run are skipped with --resume
+    journalparams = {'serials': arg_serial, 'template': arg_template, 'subnet': arg_subnet, 'address': arg_address, 'tags': arg_nwtags, 'guest': arg_guestwifi}
     
-        
-    #Debug
-    print ("Network type string is: "+nwtypestring)
-                
     #compile parameters to create network
-    arg_nwtags = arg_nwtags.split(" ")
+    #no -t, or an empty one, means no tags
+    arg_nwtags = arg_nwtags.split()
     nwtags = []
     print(type(arg_nwtags))
     print(type(nwtags))
     if arg_nwtags != 'null':
-        nwtags = arg_nwtags
-    ### NOTE THAT TIMEZONE IS HARDCODED IN THIS SCRIPT. EDIT THE LINE BELOW TO MODIFY ###
-    nwparams = {'name': arg_nwname, 'timeZone': 'Europe/Helsinki', 'tags': nwtags, 'organizationId': orgid, 'type': nwtypestring}
-        
-    #create network and get its ID
-    if nwid == 'null':
-        createstatus = createnw(arg_apikey, shardurl, orgid, nwparams)
-        if createstatus == 'null':
-            printusertext('ERROR 16: Unable to create network')
-            sys.exit(2)
-        nwid = getnwid(arg_apikey, shardurl, orgid, arg_nwname)
-        if nwid == 'null':
-            printusertext('ERROR 17: Unable to get ID for new network')
-            sys.exit(2)    
+        #copied, the guest tag added to the AP tags below is not a network tag
+        nwtags = list(arg_nwtags)
     
-    #clean up serials list to filter out licenses
-    validserials = []
-    for i in range (0, len(devicelist['serial']) ):
-        if devicelist['model'][i][:2] == 'MR' or devicelist['model'][i][:2] == 'CW' or devicelist['model'][i][:2] == 'MS' or devicelist['model'][i][:2] == 'MX' or devicelist['model'][i][:2] == 'MV' or devicelist['model'][i][:2] == 'MG':
-            validserials.append(devicelist['serial'][i])
-            
-            
     # split sitecode and brand code
     splitcode = arg_nwname.split("_",1)
     print(splitcode)
@@ -1685,181 +757,376 @@ def main(argv):
     else:
         sitetype = 'B'
     
-    #Claim devices into newly created network
-    claimdevice(arg_apikey, shardurl, nwid, validserials)
-    
-    #critical stuff:
-    for devserial in validserials:
-        #Limit ammount of API calls per second
-        time.sleep(0.2)
-        #claim device into newly created network
-        #claimdevice(arg_apikey, shardurl, nwid, devserial)
-    
-        #check if device has been claimed successfully
-        deviceinfo = getdeviceinfo(arg_apikey, shardurl, nwid, devserial)
-        #Debug's
-        """
-        print('debugging...')
-        print(deviceinfo['model'])
-        print(deviceinfo['serial'])
-        """
-        #Set hostname NAI
-        if deviceinfo['serial'] == 'null':
-            printusertext('ERROR 18: Claiming or moving device unsuccessful')
+    #results of the steps below, each step only reads what the steps it needs have set
+    orgid = 'null'
+    journal = None
+    nwid = 'null'
+    templateid = 'null'
+    devicelist = {}
+    devicetypes = {'mx': False, 'ms': False, 'mr': False, 'mv': False, 'mg': False}
+    validserials = []
+    bindstatus = 'null'
+    gtimezone = 'null'
+    glocation = 'null'
+    nwtimezone = 'null'
+    #time zone of the networks whose time zone cannot be resolved
+    ### NOTE THAT THE DEFAULT TIMEZONE IS HARDCODED IN THIS SCRIPT. EDIT THE LINE BELOW TO MODIFY ###
+    defaulttimezone = 'Europe/Helsinki'
+    #with --action-batches the device and VLAN updates are collected and sent as action
+    #batches once the network is bound to its template. Their steps are journaled once the batches completed
+    actions = None
+    queued = []
+    if arg_actionbatches:
+        actions = []
+    
+    def lookuporg():
+        nonlocal orgid, journal
+        if arg_orgname == 'RISA CN':
+            orgid = getorgidcn(arg_apikey, arg_orgname)
+        else:
+            orgid = getorgid(arg_apikey, arg_orgname)
+        
+        if orgid == 'null':
+            print('Dashboard is ' + arg_orgname)
+            printusertext('ERROR 12: Fetching organization failed (wrong password?)')
             sys.exit(2)
-        elif deviceinfo['model'][:2] == 'MX':
-            mx_count = mx_count + 1
-            hostname = 'N' + splitcode[0] + maison + sitetype + 'SG0' + str(mx_count)
-            setdevicedata(arg_apikey, shardurl, nwid, devserial, 'name', hostname, arg_nwtags, False)
-            if arg_address != 'null':
-                printusertext('Setting device location...')
-                setdevicedata(arg_apikey, shardurl, nwid, devserial, 'address', arg_address, arg_nwtags, True)
+        printusertext('Fetching organization OK')
+        merakievents.update(organizationId=orgid)
+        
+        journalparams['organizationId'] = orgid
+        journal = merakijournal.Journal(merakijournal.journalpath(arg_apikey, shardurl, arg_nwname), journalparams)
+        #without --resume the journal of an earlier run is kept until the network check passed
+        if arg_resume and journal.load():
+            printusertext('Resuming deploy, steps already done: ' + ', '.join(journal.steps))
+        elif arg_resume:
+            printusertext('Nothing to resume for ' + arg_nwname + ', deploying from the beginning')
+        else:
+            journal.hold()
+    
+    def checknetwork():
+        #make sure that a network does not already exist with the same name    
+        nonlocal nwid
+        if journal.done('network create'):
+            nwid = journal.get('network create', 'networkId')
+            merakievents.update(status='skipped')
+        else:
+            nwid = getnwid(arg_apikey, shardurl, orgid, arg_nwname)
+            if nwid != 'null' and stoponerror:
+                printusertext('ERROR 14: Network with that name already exists')
+                sys.exit(2)    
+        journal.release()
+        
+    def lookuptemplate():
+        #get template ID for template name argument
+        nonlocal templateid
+        if journal.done('template lookup'):
+            templateid = journal.get('template lookup', 'configTemplateId')
+            merakievents.update(status='skipped')
+        else:
+            templateid = gettemplateid(arg_apikey, shardurl, orgid, arg_template)
+            if templateid == 'null':
+                printusertext('ERROR 15: Unable to find template: ' + arg_template)
+                sys.exit(2)    
+            journal.record('template lookup', configTemplateId=templateid)
+        merakievents.update(configTemplateId=templateid)
+        
+    def claimorg():
+        #get serial numbers from parameter -s
+        devicelist['serial'] = arg_serial.split(" ")
+        devicelist['model'] = []
+        
+        #claim all serials into the org with a single call
+        if journal.done('claim'):
+            models = journal.get('claim', 'models', {})
+            devicelist['model'] = [models[serial] for serial in devicelist['serial']]
+            merakievents.update(status='skipped')
+        else:
+            claimdeviceorg(arg_apikey, shardurl, orgid, devicelist['serial'])
+            
+            #check if devices have been claimed successfully, one inventory lookup for all serials
+            inventory = getorgdevicesinfo(arg_apikey, shardurl, orgid, devicelist['serial'])
+            for i in range (0, len(devicelist['serial']) ):
+                deviceinfo = inventory[devicelist['serial'][i]]
+                if deviceinfo['serial'] == 'null':
+                    printusertext('INFO: Serial number %s is a license or unsupported device?' % devicelist['serial'][i])
+                    printusertext('Exiting script, please review S/Ns')
+                    exit()
+                    claimlicenseorg(arg_apikey, shardurl, orgid, devicelist['serial'][i])
+                devicelist['model'].append(deviceinfo['model'])
+            journal.record('claim', models=dict(zip(devicelist['serial'], devicelist['model'])))
+            
+        #compile list of different product types in order to create correct type of network
+        for record in devicelist['model']:
+            print('Device Type '+ record)
+            if record [:2] == 'MX' or record [:1] == 'Z':
+                devicetypes['mx'] = True
+            elif record [:2] == 'MS':
+                devicetypes['ms'] = True
+            elif record [:2] == 'MR' or record [:2] == 'CW':
+                devicetypes['mr'] = True
+            elif record [:2] == 'MV':
+                devicetypes['mv'] = True
+            elif record [:2] == 'MG':
+                devicetypes['mg'] = True
+        
+        #clean up serials list to filter out licenses
+        for i in range (0, len(devicelist['serial']) ):
+            if devicelist['model'][i][:2] == 'MR' or devicelist['model'][i][:2] == 'CW' or devicelist['model'][i][:2] == 'MS' or devicelist['model'][i][:2] == 'MX' or devicelist['model'][i][:2] == 'MV' or devicelist['model'][i][:2] == 'MG':
+                validserials.append(devicelist['serial'][i])
                 
-        elif deviceinfo['model'][:2] == 'MS':
-            ms_count = ms_count + 1
-            if mr_count < 10:
-                hostname = 'N' + splitcode[0] + maison + sitetype + 'SW0' + str(ms_count)
+    def createnetwork():
+        nonlocal nwid, nwtimezone
+        #build network type string for network creation
+        nwtypestring = ""
+        if devicetypes['mx']:
+            if len(nwtypestring) > 0:
+                nwtypestring += ' appliance'
             else:
-                hostname = 'N' + splitcode[0] + maison  + sitetype + 'SW' + str(mr_count)
-                
-            setdevicedata(arg_apikey, shardurl, nwid, devserial, 'name', hostname, arg_nwtags, False)
-            if arg_address != 'null':
-                printusertext('Setting device location...')
-                setdevicedata(arg_apikey, shardurl, nwid, devserial, 'address', arg_address, arg_nwtags, True)
-                
-        elif deviceinfo['model'][:2] == 'MR' or deviceinfo['model'][:2] == 'CW':
-            mr_count = mr_count + 1
-            if mr_count < 10:
-                hostname = 'N' + splitcode[0] + maison  + sitetype + 'WA0' + str(mr_count)
+                nwtypestring = 'appliance'
+    
+        if devicetypes['mr']:
+            if len(nwtypestring) > 0:
+                nwtypestring += ' wireless'
             else:
-                hostname = 'N' + splitcode[0] + maison  + sitetype + 'WA' + str(mr_count)
-            print ("Setting AP tags are:")
-            print (mrtags)
-            setdevicedata(arg_apikey, shardurl, nwid, devserial, 'name', hostname, mrtags, False)
-            if arg_address != 'null':
-                printusertext('Setting device location...')
-                setdevicedata(arg_apikey, shardurl, nwid, devserial, 'address', arg_address, mrtags, True)
+                nwtypestring = 'wireless'
         
-        elif deviceinfo['model'][:2] == 'MV':
-            mv_count = mv_count + 1
-            hostname = 'N' + splitcode[0] + maison + sitetype + 'MV0' + str(mv_count)
-            setdevicedata(arg_apikey, shardurl, nwid, devserial, 'name', hostname, arg_nwtags, False)
-            if arg_address != 'null':
-                printusertext('Setting device location...')
-                setdevicedata(arg_apikey, shardurl, nwid, devserial, 'address', arg_address, arg_nwtags, True)
-                
-        elif deviceinfo['model'][:2] == 'MG':
-            mg_count = mg_count + 1
-            hostname = 'N' + splitcode[0] + maison + sitetype + 'MG0' + str(mg_count)
-            setdevicedata(arg_apikey, shardurl, nwid, devserial, 'name', hostname, arg_nwtags, False)
-            if arg_address != 'null':
-                printusertext('Setting device location...')
-                setdevicedata(arg_apikey, shardurl, nwid, devserial, 'address', arg_address, arg_nwtags, True)
-            
-        printusertext('Setting Hostname ' + hostname + ' for device ' + deviceinfo['model'])
+        if devicetypes['ms']:
+            if len(nwtypestring) > 0:
+                nwtypestring += ' switch'
+            else:
+                nwtypestring = 'switch'
+        if devicetypes['mv']:
+            if len(nwtypestring) > 0:
+                nwtypestring += ' camera'
+            else:
+                nwtypestring = 'camera'
+        if devicetypes['mg']:
+            if len(nwtypestring) > 0:
+                nwtypestring += ' cellularGateway'
+            else:
+                nwtypestring = 'cellularGateway'
         
-    #bind network to template. If switches in template, attempt to autobind them
-    bindstatus = bindnw(arg_apikey, shardurl, nwid, templateid, devicetypes['ms'])
-    if bindstatus == 'null' and stoponerror:
-        printusertext('Error 19: Unable to bind network to template')
-        print (bindstatus)
-
-
-    #Updates the device VLAN subnets
-    if (arg_template.find('ZTNA Office') != -1):
-        #Simple ZTNA Office VLAN's
-        updatevlanstatus = updatevlanztoff(arg_apikey, shardurl, nwid, arg_subnet)
-        if updatevlanstatus == 'null' and stoponerror:
-            printusertext('ERROR 20: Unable to update subnets')
-            sys.exit(2)
-    
-    elif (arg_template.find('EMEA - VCA France Office Template') != -1):
-        #Update VCA FR Office
-        updatevlanstatus = updatevlanvcaoffice(arg_apikey, shardurl, nwid, arg_subnet)
-        if updatevlanstatus == 'null' and stoponerror:
-            printusertext('ERROR 20: Unable to update subnets')
-            sys.exit(2)
-
-    elif (arg_template.find('Checkpoint Office') != -1):
-        #Checkpoint Office VLAN's
-        updatevlanstatus = updatevlancheckpointoff(arg_apikey, shardurl, nwid, arg_subnet)
-        if updatevlanstatus == 'null' and stoponerror:
-            printusertext('ERROR 20: Unable to update subnets')
-            sys.exit(2)
             
-    elif (arg_template.find('EMEA - VCA France Manufacture Template') != -1):
-        #Update VCA FR manufacture 
-        updatevlanstatus = updatevlanvcamanuf(arg_apikey, shardurl, nwid, arg_subnet)
-        if updatevlanstatus == 'null' and stoponerror:
-            printusertext('ERROR 20: Unable to update subnets')
-            sys.exit(2)
-    
-    elif (arg_template.find('ZTNA Manufacture') != -1):
-        #ZTNA Manufacture VLAN's
-        updatevlanstatus = updatevlanztmanuf(arg_apikey, shardurl, nwid, arg_subnet)
-        if updatevlanstatus == 'null' and stoponerror:
-            printusertext('ERROR 20: Unable to update subnets')
-            sys.exit(2)
+        #Debug
+        print ("Network type string is: "+nwtypestring)
+                    
+        #the network is created with the time zone of its address, found by the geocode step
+        nwtimezone = defaulttimezone
+        if gtimezone != 'null':
+            nwtimezone = gtimezone
+        nwparams = {'name': arg_nwname, 'timeZone': nwtimezone, 'tags': nwtags, 'organizationId': orgid, 'type': nwtypestring}
             
-    elif (arg_template.find('Manufacture RIC') != -1):
-        #RIC Manufacture VLAN's
-        updatevlanstatus = updatevlanmanuf(arg_apikey, shardurl, nwid, arg_subnet)
-        if updatevlanstatus == 'null' and stoponerror:
-            printusertext('ERROR 20: Unable to update subnets')
+        #create network and take its ID from the create response
+        if journal.done('network create'):
+            printusertext('Network created by the interrupted run: ' + nwid)
+            merakievents.update(status='skipped')
+        elif nwid == 'null':
+            network = createnw(arg_apikey, shardurl, orgid, nwparams)
+            if network == 'null':
+                printusertext('ERROR 16: Unable to create network')
+                sys.exit(2)
+            nwid = network.get('id', 'null')
+            if nwid == 'null':
+                printusertext('ERROR 17: Unable to get ID for new network')
+                sys.exit(2)    
+            merakievents.update(timeZone=nwtimezone)
+        journal.record('network create', networkId=nwid)
+        merakievents.update(networkId=nwid)
+        
+    def claimnetwork():
+        #Claim devices into newly created network
+        if journal.done('device claim'):
+            merakievents.update(status='skipped')
+        else:
+            claimdevice(arg_apikey, shardurl, nwid, validserials)
+            journal.record('device claim')
+        
+    def configdevices():
+        #critical stuff:
+        nonlocal mx_count, ms_count, mr_count, mv_count, mg_count
+        if journal.done('device config'):
+            merakievents.update(status='skipped')
+            return
+        #read the devices of the network once, then number the hostnames in the order of the serials
+        networkdevices = getnetworkdevices(arg_apikey, shardurl, nwid)
+        if networkdevices == 'null':
+            printusertext('ERROR 18: Claiming or moving device unsuccessful')
             sys.exit(2)
     
-    elif (arg_template.find('Office') != -1):
-        #Simple Office VLAN's
-        updatevlanstatus = updatevlanoff(arg_apikey, shardurl, nwid, arg_subnet)
-        if updatevlanstatus == 'null' and stoponerror:
-            printusertext('ERROR 20: Unable to update subnets')
-            sys.exit(2)
+        deviceupdates = []
+        for devserial in validserials:
+            deviceinfo = networkdevices.get(devserial, {'serial':'null', 'model':'null'})
+            #Set hostname NAI
+            if deviceinfo['serial'] == 'null':
+                printusertext('ERROR 18: Claiming or moving device unsuccessful')
+                sys.exit(2)
+            elif deviceinfo['model'][:2] == 'MX':
+                mx_count = mx_count + 1
+                hostname = 'N' + splitcode[0] + maison + sitetype + 'SG0' + str(mx_count)
+                devicetags = arg_nwtags
+                
+            elif deviceinfo['model'][:2] == 'MS':
+                ms_count = ms_count + 1
+                if mr_count < 10:
+                    hostname = 'N' + splitcode[0] + maison + sitetype + 'SW0' + str(ms_count)
+                else:
+                    hostname = 'N' + splitcode[0] + maison  + sitetype + 'SW' + str(mr_count)
+                devicetags = arg_nwtags
+                
+            elif deviceinfo['model'][:2] == 'MR' or deviceinfo['model'][:2] == 'CW':
+                mr_count = mr_count + 1
+                if mr_count < 10:
+                    hostname = 'N' + splitcode[0] + maison  + sitetype + 'WA0' + str(mr_count)
+                else:
+                    hostname = 'N' + splitcode[0] + maison  + sitetype + 'WA' + str(mr_count)
+                print ("Setting AP tags are:")
+                print (mrtags)
+                devicetags = mrtags
+        
+            elif deviceinfo['model'][:2] == 'MV':
+                mv_count = mv_count + 1
+                hostname = 'N' + splitcode[0] + maison + sitetype + 'MV0' + str(mv_count)
+                devicetags = arg_nwtags
+                
+            elif deviceinfo['model'][:2] == 'MG':
+                mg_count = mg_count + 1
+                hostname = 'N' + splitcode[0] + maison + sitetype + 'MG0' + str(mg_count)
+                devicetags = arg_nwtags
+        
+            deviceupdates.append((devserial, hostname, devicetags))
+            printusertext('Setting Hostname ' + hostname + ' for device ' + deviceinfo['model'])
     
-    elif (arg_template.find('Large') != -1):
-        #Simple Office VLAN's
-        updatevlanstatus = updatevlanlargebtq(arg_apikey, shardurl, nwid, arg_subnet)
-        if updatevlanstatus == 'null' and stoponerror:
-            printusertext('ERROR 20: Unable to update subnets')
-            sys.exit(2)
+        if actions is not None:
+            for devserial, hostname, devicetags in deviceupdates:
+                updatedevice(arg_apikey, shardurl, nwid, devserial, hostname, arg_address, devicetags, actions, glocation)
+            queued.append('device config')
+        else:
+            #send the hostname and address updates of all devices concurrently
+            devicestatuses = merakiclient.parallelmap(lambda update: updatedevice(arg_apikey, shardurl, nwid, update[0], update[1], arg_address, update[2], None, glocation), deviceupdates)
+            if 'null' not in devicestatuses:
+                journal.record('device config')
         
-    else:
-        #BTQ VLAN's
-        if devicetypes['mx']:
-            updatevlanstatus = updatevlanbtq(arg_apikey, shardurl, nwid, arg_subnet)
+    def bind():
+        #bind network to template. If switches in template, attempt to autobind them
+        nonlocal bindstatus
+        if journal.done('bind'):
+            bindstatus = 'ok'
+            merakievents.update(status='skipped')
+        else:
+            network = bindnw(arg_apikey, shardurl, nwid, templateid, devicetypes['ms'])
+            bindstatus = 'ok'
+            if network == 'null':
+                bindstatus = 'null'
+            elif gtimezone != 'null' and network.get('timeZone', nwtimezone) != nwtimezone:
+                #the template replaced the time zone the network was created with, set it again
+                printusertext('Time zone changed to %s by the template, setting %s' % (network.get('timeZone'), nwtimezone))
+                if updatenw(arg_apikey, shardurl, nwid, 'timeZone', nwtimezone, actions) != 'ok':
+                    printusertext('WARNING: Unable to set time zone ' + nwtimezone)
+            if bindstatus != 'null':
+                journal.record('bind')
+        if bindstatus == 'null':
+            #the cached template ID may be stale, fetch the templates again on the next run
+            merakicache.invalidate(merakicache.cachepath(arg_apikey, shardurl, 'configTemplates_%s' % orgid))
+            merakievents.update(status='failed')
+        if bindstatus == 'null' and stoponerror:
+            printusertext('Error 19: Unable to bind network to template')
+            print (bindstatus)
+    
+    def configvlans():
+        #Updates the device VLAN subnets
+        vlanplan = merakivlans.planfortemplate(arg_template)
+        if vlanplan == merakivlans.DEFAULT_PLAN and not devicetypes['mx']:
+            print('Guest WiFi only!!!')
+        elif journal.done('VLANs'):
+            merakievents.update(status='skipped')
+        else:
+            updatevlanstatus = updatevlans(arg_apikey, shardurl, nwid, arg_subnet, vlanplan, actions)
+            if updatevlanstatus == 'ok' and actions is not None:
+                queued.append('VLANs')
+            elif updatevlanstatus == 'ok':
+                journal.record('VLANs')
+            if updatevlanstatus == 'null':
+                merakievents.update(status='failed')
             if updatevlanstatus == 'null' and stoponerror:
                 printusertext('ERROR 20: Unable to update subnets')
                 sys.exit(2)
-        else:
-            print('Guest WiFi only!!!')
-
-    #best effort stuff, applies to all claimed devices
-    for devserial in validserials:
-        """
- #       #set device hostname
-  #      print(deviceinfo['model'])
-   #     hostname = deviceinfo['model'] + '_' + devserial
-    #    setdevicedata(arg_apikey, shardurl, nwid, devserial, 'name', hostname, arg_nwtags, False)
-    
-        #if street address is given as a parameter, set device location
-#        if arg_address != 'null':
- #           printusertext('Setting device location...')
-  #          setdevicedata(arg_apikey, shardurl, nwid, devserial, 'address', arg_address, arg_nwtags, True)
-    #attempt to override template timezone by fetching the right one from Google API
-    """
-    flag_unabletosettime = True
-    if arg_googlekey != '' and arg_address != 'null':
-        gtimezone = getgoogletimezone(arg_googlekey, arg_address)
-        if gtimezone != 'null':
-            udstatus = updatenw(arg_apikey, shardurl, nwid, 'timeZone', gtimezone)
-            if udstatus == 'ok':
-                flag_unabletosettime = False
-        if flag_unabletosettime:
-            printusertext('WARNING: Unable to set time zone using Google Maps API')
     
+    def lookuptimezone():
+        #the Google Maps lookups do not need the Dashboard, they run from the start of the deploy
+        #so the time zone is known when the network is created
+        #the coordinates also place the map markers of the devices
+        nonlocal gtimezone, glocation
+        if arg_googlekey != '' and arg_address != 'null':
+            glocation = getgooglelocation(arg_googlekey, arg_address, arg_nwname)
+        elif arg_address != 'null':
+            #addresses located by earlier runs are known without a Google key
+            glocation = merakigeo.cached(arg_address)
+        if glocation != 'null':
+            #the zone boundaries give the zone of a located address, Google's zone when they do not
+            gtimezone, exact = merakitz.resolve(arg_nwname, glocation['lat'], glocation['lng'])
+            if not exact and glocation['timeZone'] != 'null':
+                gtimezone = glocation['timeZone']
+                exact = True
+        else:
+            #without Google Maps the time zone comes from the country code of the site name
+            gtimezone, exact = merakitz.resolve(arg_nwname)
+        if gtimezone != 'null' and not exact and glocation != 'null':
+            printusertext('WARNING: Unable to get the time zone of the address from Google Maps, %s has several time zones, using %s' % (merakitz.country(arg_nwname), gtimezone))
+        elif gtimezone != 'null' and not exact:
+            printusertext('WARNING: %s has several time zones, using %s. Use -g and -a to find the right one' % (merakitz.country(arg_nwname), gtimezone))
+        if gtimezone == 'null':
+            printusertext('WARNING: Unable to resolve a time zone for %s, creating the network with %s' % (arg_nwname, defaulttimezone))
+            merakievents.update(status='failed')
+    
+    def sendactionbatches():
+        #send the updates collected for the action batches
+        if len(actions) == 0:
+            return
+        batchstatus = runactionbatches(arg_apikey, shardurl, orgid, actions)
+        if batchstatus == 'null':
+            merakievents.update(status='failed')
+        else:
+            for step in queued:
+                journal.record(step)
+        if batchstatus == 'null' and stoponerror:
+            printusertext('ERROR 24: Action batch failed, please check devices and VLANs on Dashboard')
+            sys.exit(2)
     
+    #each step starts as soon as the steps it needs are done, independent steps run at the same time
+    steps = merakisteps.StepGraph()
+    steps.add('org lookup', lookuporg)
+    steps.add('geocode', lookuptimezone)
+    steps.add('network check', checknetwork, ['org lookup'])
+    steps.add('template lookup', lookuptemplate, ['org lookup'])
+    steps.add('claim', claimorg, ['org lookup'])
+    steps.add('network create', createnetwork, ['network check', 'claim', 'geocode'])
+    steps.add('device claim', claimnetwork, ['network create'])
+    steps.add('device config', configdevices, ['device claim'])
+    steps.add('bind', bind, ['device claim', 'template lookup'])
+    steps.add('VLANs', configvlans, ['bind'])
+    if actions is not None:
+        steps.add('action batches', sendactionbatches, ['device config', 'VLANs'])
+    steps.run()
+    
+    journal.clear()
     printusertext('All done, have a nice day!!!')
             
 if __name__ == '__main__':
-    main(sys.argv[1:])
+    status = 'ok'
+    exitcode = 0
+    try:
+        main(sys.argv[1:])
+    except SystemExit as e:
+        #the script only exits when it stops before the end of the deploy
+        status = 'failed'
+        exitcode = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        raise
+    except:
+        status = 'failed'
+        exitcode = 1
+        raise
+    finally:
+        merakitrace.stop()
+        merakievents.stop(status, exitcode)
     
     
@@ -1,7 +1,11 @@
 #Script to Migrate a Network between templates
-import sys, getopt, requests, json, time, re, csv,meraki 
+import sys, os, getopt, requests, json, time, re, csv
 import json
 
+#shared Dashboard session layer lives in the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import merakiclient, merakicache, merakinetworks
+
 def printusertext(p_message):
     #prints a line of text that is meant for the user to read
     #do not process these lines when chaining scripts
@@ -14,6 +18,7 @@ def printhelp():
     print('')
     print('To run the script, enter:')
     print('python MigrateNetwork_v1.exe -k <Meraki Dashboard API key> -o <Organization Name> -n <Name of network to migrate> -t <name of destination configuration template>')
+    print('Add --refresh-cache to ignore the cached organization ID and fetch it again')
     new_func()
     print('')
     print('Use double quotes ("") in Windows to pass arguments containing spaces. Names are case-sensitive.')
@@ -26,24 +31,16 @@ def new_func():
 print("python MigrateNetwork_v1.exe -k 6a33a1785286a84f8fd37a378af75aaa10802cc9 -o 'RISA' -n 'GBTEST_MTB' -t 'EMEA - Template BTQ LTE #2'")
 
 def getorgid(p_apikey, p_orgname):
-    #looks up org id for a specific org name
+    #looks up org id for a specific org name, using the local lookup cache
     #on failure returns 'null'
     
     try:
-        r = requests.get('https://dashboard.meraki.com/api/v1/organizations', headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
+        status, orgid = merakicache.lookupid(p_apikey, 'api.meraki.com', 'organizations', p_orgname, lambda: merakiclient.getlist(p_apikey, 'api.meraki.com', '/organizations'))
     except:
         printusertext('ERROR 00: Unable to contact Meraki cloud')
         sys.exit(2)
     
-    if r.status_code != requests.codes.ok:
-        return 'null'
-    
-    rjson = r.json()
-    
-    for record in rjson:
-        if record['name'] == p_orgname:
-            return record['id']
-    return('null')
+    return(orgid)
 
 
 
@@ -51,7 +48,7 @@ def gettemplatelist(p_apikey, p_shardurl, p_orgid):
     #returns a list of all networks in an organization
     #on failure returns a single record with 'null' name and id
     try:
-        r = requests.get('https://%s/api/v1/organizations/%s/configTemplates' % (p_shardurl, p_orgid), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
+        r = merakiclient.get(p_apikey, p_shardurl, '/organizations/%s/configTemplates' % p_orgid)
     except:
         printusertext('ERROR 01: Unable to retrieve templates list')
         sys.exit(2)
@@ -67,7 +64,7 @@ def gettemplatelist(p_apikey, p_shardurl, p_orgid):
 def gettemplatenetworks(p_apikey, p_shardurl, p_orgid,p_templateid):
     #Description......
     try:
-        r = requests.get('https://%s/api/v1/organizations/%s/networks?configTemplateId=%s' % (p_shardurl, p_orgid,p_templateid), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
+        r = merakiclient.get(p_apikey, p_shardurl, '/organizations/%s/networks?configTemplateId=%s' % (p_orgid, p_templateid))
     except:
         printusertext('ERROR 02: Unable to retrieve template networks')
         sys.exit(2)
@@ -84,21 +81,57 @@ def gettemplatenetworks(p_apikey, p_shardurl, p_orgid,p_templateid):
 def getnwvlanips(p_apikey, p_shardurl, p_nwid):
     #returns MX VLANs for a network
     try:
-        r = requests.get('https://%s/api/v1/networks/%s/appliance/vlans' % (p_shardurl, p_nwid), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
+        r = merakiclient.get(p_apikey, p_shardurl, '/networks/%s/appliance/vlans' % p_nwid)
     except:
         printusertext('ERROR 03: Unable to retrieve network vlans ')
         sys.exit(2)
     
+    #rate limiting (429 + Retry-After) is handled by merakiclient
     returnvalue = []
     if r.status_code != requests.codes.ok:
         returnvalue.append({'id': 'null'})
         return(returnvalue)
-    #Rate limit mechanism
-    elif r.status_code == 429:
-        print ("Got response 429, chilling a bit...")
-        time.sleep(int(response.headers["Retry-After"])) # pyright: ignore[reportUndefinedVariable]
-    else:
-        return(r.json())
+    
+    return(r.json())
+
+
+def getnetworklist(p_apikey, p_shardurl, p_orgid):
+    #returns all networks of an organization, following pagination
+    try:
+        status, rjson = merakiclient.getall(p_apikey, p_shardurl, '/organizations/%s/networks' % p_orgid)
+    except:
+        printusertext('ERROR 04: Unable to retrieve networks list')
+        sys.exit(2)
+    
+    if status != requests.codes.ok:
+        return([])
+    
+    return(rjson)
+
+
+def unbindnw(p_apikey, p_shardurl, p_nwid):
+    #unbinds a network from its template keeping the local configuration
+    r = merakiclient.post(p_apikey, p_shardurl, '/networks/%s/unbind' % p_nwid, {'retainConfigs': True}, merakinetworks.unbindguard(p_apikey, p_shardurl, p_nwid))
+    print (r.status_code)
+    if r.status_code != requests.codes.ok:
+        print('Warning - Network is possibly not bound to a network')
+    return(r.json())
+
+
+def bindnw(p_apikey, p_shardurl, p_nwid, p_templateid):
+    #binds a network to a template without autobinding switches
+    r = merakiclient.post(p_apikey, p_shardurl, '/networks/%s/bind' % p_nwid, {'configTemplateId': p_templateid, 'autoBind': False}, merakinetworks.bindguard(p_apikey, p_shardurl, p_nwid, p_templateid))
+    print (r.status_code)
+    return(r.json())
+
+
+def updatevlan(p_apikey, p_shardurl, p_nwid, p_vlanid, p_vlandata):
+    #updates a MX VLAN, returns the API response
+    r = merakiclient.put(p_apikey, p_shardurl, '/networks/%s/appliance/vlans/%s' % (p_nwid, p_vlanid), p_vlandata)
+    print (r.status_code)
+    if r.status_code != requests.codes.ok:
+        print (r.content)
+    return(r.json())
 
 
 
@@ -116,7 +149,7 @@ def main(argv):
     
     #get command line arguments
     try:
-        opts, args = getopt.getopt(argv, 'hk:o:n:t:')
+        opts, args = getopt.getopt(argv, 'hk:o:n:t:', ['refresh-cache'])
     except getopt.GetoptError:
         printhelp()
         sys.exit(2)
@@ -133,6 +166,8 @@ def main(argv):
             arg_network = arg
         elif opt == '-t':
             arg_template = arg
+        elif opt == '--refresh-cache':
+            merakicache.setrefresh(True)
 
     #check if all parameters that are required parameters have been given
     if arg_apikey == 'null' or arg_org == 'null' or arg_network == 'null' or arg_template == 'null':
@@ -142,8 +177,6 @@ def main(argv):
 
 
     p_apikey = arg_apikey
-    dashboard = meraki.DashboardAPI(arg_apikey,output_log=False,print_console=True)
-    #dashboard = meraki.DashboardAPI(arg_apikey,output_log=False,print_console=False)
     p_shardurl = 'api.meraki.com'
     p_orgname = arg_org
     p_filepath = 'testing.csv'
@@ -163,7 +196,7 @@ def main(argv):
     
     #Get templates list
     print("Getting list of organization templates")
-    templatesList = dashboard.organizations.getOrganizationConfigTemplates(organization_id)
+    templatesList = gettemplatelist(p_apikey, p_shardurl, organization_id)
     
     print("Searching for template in templates list")
     for template in templatesList:
@@ -180,7 +213,7 @@ def main(argv):
     
     #Get NetworkID
     print("Getting Organization networks")
-    network_list = dashboard.organizations.getOrganizationNetworks(organization_id, total_pages='all')
+    network_list = getnetworklist(p_apikey, p_shardurl, organization_id)
     print("Searching for network...")
     for network in network_list:
         if targetNetwork in network['name']:
@@ -192,7 +225,7 @@ def main(argv):
 
     #Get Network VLAN information
     print("Getting network VLAN information from ",network_name)
-    network_vlans = dashboard.appliance.getNetworkApplianceVlans(network_id)
+    network_vlans = getnwvlanips(p_apikey, p_shardurl, network_id)
     #print(network_vlans)
     
 
@@ -237,7 +270,7 @@ def main(argv):
     #unbind network from current Template
     try:
         print("\nUnbinding network from template\n")
-        response = dashboard.networks.unbindNetwork(network_id, retainConfigs=True)
+        response = unbindnw(p_apikey, p_shardurl, network_id)
         print (response)
     except:
         print('Warning - Network is possibly not bound to a network')
@@ -251,7 +284,7 @@ def main(argv):
     
     #bind network to target template
     print("\nBinding network to target template\n")
-    response = dashboard.networks.bindNetwork(network_id, config_template_id, autoBind=False)
+    response = bindnw(p_apikey, p_shardurl, network_id, config_template_id)
     print (response)
 
     print("Restoring Network subnet configuration...")
@@ -261,26 +294,26 @@ def main(argv):
             
             if vlan['dhcpHandling'] == 'Do not respond to DHCP requests':
             
-                    response = dashboard.appliance.updateNetworkApplianceVlan(
-                        network_id, vlan['id'], 
-                        subnet=vlan['subnet'], 
-                        applianceIp=vlan['applianceIp'],
-                        cidr=vlan['subnet'],
-                        dhcpHandling=vlan['dhcpHandling']
-                    )
+                    response = updatevlan(
+                        p_apikey, p_shardurl, network_id, vlan['id'], {
+                        'subnet': vlan['subnet'],
+                        'applianceIp': vlan['applianceIp'],
+                        'cidr': vlan['subnet'],
+                        'dhcpHandling': vlan['dhcpHandling']
+                    })
                     
                     print (response)
                 
             elif vlan['dhcpHandling'] == 'Relay DHCP to another server':
 
-                response = dashboard.appliance.updateNetworkApplianceVlan(
-                    network_id, vlan['id'], 
-                    subnet=vlan['subnet'], 
-                    applianceIp=vlan['applianceIp'],
-                    cidr=vlan['subnet'],
-                    dhcpHandling=vlan['dhcpHandling'], 
-                    dhcpRelayServerIps=vlan['dhcpRelayServerIps']
-                )
+                response = updatevlan(
+                    p_apikey, p_shardurl, network_id, vlan['id'], {
+                    'subnet': vlan['subnet'],
+                    'applianceIp': vlan['applianceIp'],
+                    'cidr': vlan['subnet'],
+                    'dhcpHandling': vlan['dhcpHandling'],
+                    'dhcpRelayServerIps': vlan['dhcpRelayServerIps']
+                })
                 
                 print (response)
                 
@@ -288,32 +321,32 @@ def main(argv):
                 
             elif vlan['dhcpHandling'] == 'Run a DHCP server':
                 if vlan['id'] in sameSubnetVLANS:
-                    response = dashboard.appliance.updateNetworkApplianceVlan(
-                        network_id, vlan['id'], 
-                        dhcpHandling=vlan['dhcpHandling'],
-                        dhcpLeaseTime=vlan['dhcpLeaseTime'], 
-                        dhcpBootOptionsEnabled=vlan['dhcpBootOptionsEnabled'], 
-                        fixedIpAssignments=vlan['fixedIpAssignments'], 
-                        reservedIpRanges=vlan['reservedIpRanges'], 
-                        dnsNameservers=vlan['dnsNameservers'], 
-                        dhcpOptions=vlan['dhcpOptions'], 
-                    )
+                    response = updatevlan(
+                        p_apikey, p_shardurl, network_id, vlan['id'], {
+                        'dhcpHandling': vlan['dhcpHandling'],
+                        'dhcpLeaseTime': vlan['dhcpLeaseTime'],
+                        'dhcpBootOptionsEnabled': vlan['dhcpBootOptionsEnabled'],
+                        'fixedIpAssignments': vlan['fixedIpAssignments'],
+                        'reservedIpRanges': vlan['reservedIpRanges'],
+                        'dnsNameservers': vlan['dnsNameservers'],
+                        'dhcpOptions': vlan['dhcpOptions']
+                    })
                 
                 else:
 
-                    response = dashboard.appliance.updateNetworkApplianceVlan(
-                        network_id, vlan['id'], 
-                        subnet=vlan['subnet'], 
-                        applianceIp=vlan['applianceIp'],
-                        cidr=vlan['subnet'],
-                        dhcpHandling=vlan['dhcpHandling'],
-                        dhcpLeaseTime=vlan['dhcpLeaseTime'], 
-                        dhcpBootOptionsEnabled=vlan['dhcpBootOptionsEnabled'], 
-                        fixedIpAssignments=vlan['fixedIpAssignments'], 
-                        reservedIpRanges=vlan['reservedIpRanges'], 
-                        dnsNameservers=vlan['dnsNameservers'], 
-                        dhcpOptions=vlan['dhcpOptions'], 
-                    )
+                    response = updatevlan(
+                        p_apikey, p_shardurl, network_id, vlan['id'], {
+                        'subnet': vlan['subnet'],
+                        'applianceIp': vlan['applianceIp'],
+                        'cidr': vlan['subnet'],
+                        'dhcpHandling': vlan['dhcpHandling'],
+                        'dhcpLeaseTime': vlan['dhcpLeaseTime'],
+                        'dhcpBootOptionsEnabled': vlan['dhcpBootOptionsEnabled'],
+                        'fixedIpAssignments': vlan['fixedIpAssignments'],
+                        'reservedIpRanges': vlan['reservedIpRanges'],
+                        'dnsNameservers': vlan['dnsNameservers'],
+                        'dhcpOptions': vlan['dhcpOptions']
+                    })
                     
                     print (response)
                 
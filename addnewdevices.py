@@ -1,13 +1,22 @@
 #Import new devices to existing network
 import json
 import sys, getopt, requests, json, time, re
-import meraki
+import merakiclient, merakicache, merakiinventory, merakidevices, merakinetworks, merakitrace, merakievents
 
 
 # Changelog
 # Adjusted API's to work with v1
 # Added capability to recognize WW or CN dashboards
 # v1.1.1 - Bug Fixes for v1
+# v1.2 - All Dashboard calls go through the pooled session layer in merakiclient.py
+# v1.2 - Serials are claimed into the organization with a single batch call
+# v1.2 - Device models are read from the org inventory with a single lookup
+# v1.2 - Hostname, tags and address of a device are sent in one update
+# v1.2 - Network IDs are looked up in a cached org network index
+# v1.2 - Organization ID is cached locally (--refresh-cache to ignore the cache)
+# v1.2 - Optional JSON-lines trace of the Dashboard calls with a summary per phase (--trace)
+# v1.2 - Optional JSON-lines progress events per step and device with a final summary (--events)
+# v1.2 - Dropped connections, timeouts and 5xx answers are retried with backoff, claims are guarded
 
 def printteam():
     print('___________________________________________________________________________')
@@ -42,6 +51,11 @@ def printhelp():
     printusertext('       You can also enter a license key as a serial number to claim along with devices')
     printusertext(' -n <netw>: Name the new network will have')
     printusertext('')
+    printusertext('Optional parameters:')
+    printusertext(' --refresh-cache: Ignore the cached organization and network IDs and fetch them again')
+    printusertext(' --trace <file>: Write every Dashboard call to <file> (JSON lines) and print a summary per phase')
+    printusertext(' --events <file>: Write the progress as JSON events to <file>, use - for stdout (text goes to stderr)')
+    printusertext('')
     printusertext('Example:')
     printusertext(' python addnewdevices.py -k 1234 -o RISA -s "XXXX-YYYY-ZZZZ AAAA-BBBB-CCCC"-n "CHMEY89_LAB"')
     printusertext('')
@@ -51,65 +65,39 @@ def printusertext(p_message):
     #prints a line of text that is meant for the user to read
     #do not process these lines when chaining scripts
     print('@ %s' % p_message)
+    merakievents.message(p_message)
 
 
 def getorgid(p_apikey, p_orgname):
-    #looks up org id for a specific org name
+    #looks up org id for a specific org name, using the local lookup cache
     #on failure returns 'null'
     
     try:
-        r = requests.get('https://dashboard.meraki.com/api/v1/organizations', headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
+        status, orgid = merakicache.lookupid(p_apikey, 'api.meraki.com', 'organizations', p_orgname, lambda: merakiclient.getlist(p_apikey, 'api.meraki.com', '/organizations'))
     except:
         printusertext('ERROR 00: Unable to contact Meraki cloud')
         sys.exit(2)
     
-    if r.status_code != requests.codes.ok:
-        return 'null'
+    return(orgid)    
     
-    rjson = r.json()
-    
-    for record in rjson:
-        if record['name'] == p_orgname:
-            return record['id']
-    return('null')    
-    
-def getnwid2(p_apikey,p_orgid,p_nwname):
-    dashboard=meraki.DashboardAPI(p_apikey)
-    networks=dashboard.organizations.getOrganizationNetworks(organizationId=p_orgid)
-    for record in networks:
-        if record['name'] == p_nwname:
-            return record['id']
-    return('null')
-
 def getnwid(p_apikey, p_shardurl, p_orgid, p_nwname):
-    #looks up network id for a network name
+    #looks up network id for a network name in the org network index
     #on failure returns 'null'
 
     try:
-        r = requests.get('https://%s/api/v1/organizations/%s/networks' % (p_shardurl, p_orgid), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
+        status, nwid = merakinetworks.getnetworkindex(p_apikey, p_shardurl, p_orgid).lookup(p_nwname)
     except:
         printusertext('ERROR 02: Unable to contact Meraki cloud')
         sys.exit(2)
     
-    #debug
-    #print(r.json)
-    
-    if r.status_code != requests.codes.ok:
-        return 'null'
-    
-    rjson = r.json()
-    
-    for record in rjson:
-        if record['name'] == p_nwname:
-            return record['id']
-    return('null')
+    return(nwid)
 
 
 def getdevicelist(p_apikey, p_shardurl, p_nwid):
 
     #returns a list of all devices in a network
     
-    r = requests.get('https://%s/api/v1/networks/%s/devices' % (p_shardurl, p_nwid), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
+    r = merakiclient.get(p_apikey, p_shardurl, '/networks/%s/devices' % p_nwid)
         
     returnvalue = []
     if r.status_code != requests.codes.ok:
@@ -119,55 +107,44 @@ def getdevicelist(p_apikey, p_shardurl, p_nwid):
     return(r.json())
 
 
-def claimdeviceorg(p_apikey, p_shardurl, p_orgid, p_devserial):
-    #claims a device into an org without adding to a network
+def claimdeviceorg(p_apikey, p_shardurl, p_orgid, p_devserials):
+    #claims a list of devices into an org without adding to a network
+    #all serials are sent in one call, serials rejected by it are claimed one at a time
+    #returns the list of serials that could not be claimed
     
     try:
-        r = requests.post('https://%s/api/v1/organizations/%s/claim' % (p_shardurl, p_orgid), data=json.dumps({'serials':[ p_devserial ]}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
+        failed = merakiinventory.claimdevicesorg(p_apikey, p_shardurl, p_orgid, p_devserials)
     except:
         printusertext('ERROR 06: Unable to contact Meraki cloud')
         sys.exit(2)
     
-    return(0)
+    return(failed)
 
 
-def getorgdeviceinfo (p_apikey, p_shardurl, p_orgid, p_devserial):
-    #gets basic device info from org inventory. device does not need to be part of a network
+def getorgdevicesinfo(p_apikey, p_shardurl, p_orgid, p_devserials):
+    #gets basic device info from org inventory for a list of serials with one paginated call
+    #devices do not need to be part of a network
+    #returns serial -> {'mac', 'serial', 'networkId', 'model', 'claimedAt'}, serials not found
+    #in the inventory are returned with serial and model 'null'
     
     try:
-        r = requests.get('https://%s/api/v1/organizations/%s/inventory/devices/%s' % (p_shardurl, p_orgid,p_devserial), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
+        status, inventory = merakiinventory.getinventory(p_apikey, p_shardurl, p_orgid, p_devserials)
     except:
         printusertext('ERROR 11: Unable to contact Meraki cloud')
         sys.exit(2)
     
     returnvalue = {}
-    if r.status_code != requests.codes.ok:
-        returnvalue = {'serial':'null', 'model':'null'}
-        return(returnvalue)
-    
-    rjson = r.json()
-    
-
-    """
-    foundserial = False
-    for record in rjson:
-        if record['serial'] == p_devserial:
-            foundserial = True
-            returnvalue = {'mac': record['mac'], 'serial': record['serial'], 'networkId': record['networkId'], 'model': record['model'], 'claimedAt': record['claimedAt'], 'publicIp': record['publicIp']}
-                
-    if not foundserial:
-        returnvalue = {'serial':'null', 'model':'null'}
+    for serial in p_devserials:
+        returnvalue[serial] = inventory.get(serial, {'serial':'null', 'model':'null'})
     
-    """
-    
-    return(rjson) 
+    return(returnvalue) 
 
 
 def claimdevice(p_apikey, p_shardurl, p_nwid, p_devserial):
     #claims a device into a network
     print('Claiming device S/N '+str(p_devserial))
     try:
-        r = requests.post('https://%s/api/v1/networks/%s/devices/claim' % (p_shardurl, p_nwid), data=json.dumps({'serials': [p_devserial]}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
+        r = merakiclient.post(p_apikey, p_shardurl, '/networks/%s/devices/claim' % p_nwid, {'serials': [p_devserial]}, merakiinventory.networkclaimguard(p_apikey, p_shardurl, p_nwid, [p_devserial]))
         print(r.status_code)
         print(r.reason)
         if r.status_code != requests.codes.ok:
@@ -184,8 +161,8 @@ def getdeviceinfo(p_apikey, p_shardurl, p_nwid, p_serial):
     #on failure returns lone device record, with serial number 'null'
 
     try:
-        #r = requests.get('https://%s/api/v1/networks/%s/devices/%s' % (p_shardurl, p_nwid, p_serial), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
-        r = requests.get('https://%s/api/v1/devices/%s' % (p_shardurl, p_serial), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
+        #r = merakiclient.get(p_apikey, p_shardurl, '/networks/%s/devices/%s' % (p_nwid, p_serial))
+        r = merakiclient.get(p_apikey, p_shardurl, '/devices/%s' % p_serial)
     except:
         printusertext('ERROR 09: Unable to contact Meraki cloud')
         sys.exit(2)
@@ -202,17 +179,12 @@ def getdeviceinfo(p_apikey, p_shardurl, p_nwid, p_serial):
     return(rjson)
 
 
-def setdevicedata(p_apikey, p_shardurl, p_nwid, p_devserial, p_field, p_value, p_nwtags, p_movemarker):
-    #modifies value of device record. Returns the new value
-    #on failure returns one device record, with all values 'null'
-    #p_movemarker is boolean: True/False
-    
-    movevalue = "false"
-    if p_movemarker:
-        movevalue = "true"
+def setdevicedata(p_apikey, p_shardurl, p_nwid, p_devserial, p_fields):
+    #modifies a device record with one call. p_fields is built by merakidevices.builddeviceupdate
+    #on failure returns 'null'
     
     try:
-        r = requests.put('https://%s/api/v1/networks/%s/devices/%s' % (p_shardurl, p_nwid, p_devserial), data=json.dumps({p_field: p_value, 'moveMapMarker': movevalue, 'tags': p_nwtags}), headers={'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json'})
+        r = merakidevices.updatedevice(p_apikey, p_shardurl, p_devserial, p_fields)
     except:
         printusertext('ERROR 10: Unable to contact Meraki cloud')
         sys.exit(2)
@@ -224,17 +196,17 @@ def setdevicedata(p_apikey, p_shardurl, p_nwid, p_devserial, p_field, p_value, p
     
 def main(argv):
     
-    printteam()
-    
     #set default values for command line arguments
     arg_apikey = 'null'
     arg_orgname = 'null'
     arg_serials = 'null'
     arg_nwname = 'null'    
+    arg_tracefile = 'null'
+    arg_eventsfile = 'null'
     
     #get command line arguments    
     try:
-        opts, args = getopt.getopt(argv, 'hk:o:s:n:')
+        opts, args = getopt.getopt(argv, 'hk:o:s:n:', ['refresh-cache', 'trace=', 'events='])
     except getopt.GetoptError:
         printhelp()
         sys.exit(2)
@@ -251,7 +223,19 @@ def main(argv):
             arg_serials = arg
         elif opt == '-n':
             arg_nwname = arg
+        elif opt == '--refresh-cache':
+            merakicache.setrefresh(True)
+        elif opt == '--trace':
+            arg_tracefile = arg
+        elif opt == '--events':
+            arg_eventsfile = arg
 
+    #with --events - stdout is kept for the events, the text output below goes to stderr
+    if arg_eventsfile != 'null':
+        merakievents.start(arg_eventsfile, arg_nwname if arg_nwname != 'null' else None)
+    
+    printteam()
+    
     if arg_apikey == 'null' or arg_orgname == 'null' or arg_serials == 'null' or arg_nwname == 'null':
         print(arg_apikey+","+arg_orgname+","+arg_serials+","+arg_nwname)
         printhelp()
@@ -265,18 +249,24 @@ def main(argv):
         print('Error - Organization name not recognized')
         sys.exit(2)
     
+    #the summary of the trace is printed when the script ends, see merakitrace.stop()
+    if arg_tracefile != 'null':
+        merakitrace.start(arg_tracefile)
+    
+    merakievents.begin('org lookup')
     p_orgid = getorgid(arg_apikey, arg_orgname)
     
+    merakievents.begin('network check')
     p_nwid = getnwid(arg_apikey, p_shardurl, p_orgid, arg_nwname)
-    p_nwid2=getnwid2(arg_apikey, p_orgid, arg_nwname)
-    print(p_nwid2, arg_nwname)
     #Check if network exists
     if p_nwid == 'null':
         print('Network '+arg_nwname+' does not exist, please confirm the name on the Dashboard')
         sys.exit()
+    merakievents.update(networkId=p_nwid)
 
     print ('Reading device data of '+arg_nwname)
 
+    merakievents.begin('device list')
     devicelist = getdevicelist(arg_apikey, p_shardurl, p_nwid)
     ms_count = 0
     mr_count = 0
@@ -328,9 +318,10 @@ def main(argv):
     devicelist['serial'] = arg_serials.split(" ")
     devicelist['model'] = []
     
+    merakievents.begin('claim')
+    inventory = getorgdevicesinfo(arg_apikey, p_shardurl, p_orgid, devicelist['serial'])
     for i in range (0, len(devicelist['serial']) ):
-        #print('Debug#1 - '+devicelist['serial'][i])
-        deviceinfo = getorgdeviceinfo(arg_apikey, p_shardurl, p_orgid, devicelist['serial'][i])
+        deviceinfo = inventory[devicelist['serial'][i]]
         print (deviceinfo)
         try:
             if deviceinfo['networkId'] == None and deviceinfo['serial'] != 'null':
@@ -341,11 +332,14 @@ def main(argv):
         except:
             print('ERROR - Is device available from inventory?')
     
+    claimdeviceorg(arg_apikey, p_shardurl, p_orgid, devicelist['serial'])
+    
+    #check if devices have been claimed successfully, only serials missing from the first lookup are read again
+    missing = [serial for serial in devicelist['serial'] if inventory[serial]['serial'] == 'null']
+    if len(missing) > 0:
+        inventory.update(getorgdevicesinfo(arg_apikey, p_shardurl, p_orgid, missing))
     for i in range (0, len(devicelist['serial']) ):
-        claimdeviceorg(arg_apikey, p_shardurl, p_orgid, devicelist['serial'][i])
-        
-        #check if device has been claimed successfully
-        deviceinfo = getorgdeviceinfo (arg_apikey, p_shardurl, p_orgid, devicelist['serial'][i])
+        deviceinfo = inventory[devicelist['serial'][i]]
         if deviceinfo['serial'] == 'null':
             printusertext('INFO: Serial number %s is a license or unsupported device' % devicelist['serial'][i])
         devicelist['model'].append(deviceinfo['model'])
@@ -382,7 +376,9 @@ def main(argv):
             validserials.append(devicelist['serial'][i])
             
         #critical stuff:
+    merakievents.begin('device config')
     for devserial in validserials:
+        start = time.time()
         #claim device into newly created network
         claimdevice(arg_apikey, p_shardurl, p_nwid, devserial)
     
@@ -397,22 +393,36 @@ def main(argv):
         elif deviceinfo['model'][:2] == 'MS':
             ms_count = ms_count + 1
             hostname = p_hostname + 'SW0' + str(ms_count)
-            setdevicedata(arg_apikey, p_shardurl, p_nwid, devserial, 'name', hostname, p_mstags, False)
-            setdevicedata(arg_apikey, p_shardurl, p_nwid, devserial, 'address', p_address, p_mstags, True) 
+            status = setdevicedata(arg_apikey, p_shardurl, p_nwid, devserial, merakidevices.builddeviceupdate(p_name=hostname, p_tags=p_mstags, p_address=p_address))
         elif deviceinfo['model'][:2] == 'MR':
             mr_count = mr_count + 1
             if mr_count < 10:
                 hostname = p_hostname + 'WA0' + str(mr_count)
             else:
                 hostname = p_hostname + 'WA' + str(mr_count)
-            setdevicedata(arg_apikey, p_shardurl, p_nwid, devserial, 'name', hostname, p_mrtags, False)
-            setdevicedata(arg_apikey, p_shardurl, p_nwid, devserial, 'address', p_address, p_mrtags, True)   
+            status = setdevicedata(arg_apikey, p_shardurl, p_nwid, devserial, merakidevices.builddeviceupdate(p_name=hostname, p_tags=p_mrtags, p_address=p_address))
         
         printusertext('Setting Hostname, Address and tags ' + hostname + ' for device ' + deviceinfo['model'])
+        merakievents.emit('device', 'ok' if status == 'ok' else 'failed', serial=devserial, hostname=hostname, model=deviceinfo['model'], duration=time.time() - start)
  
     printusertext('')
     printusertext('All done, have a nice day!')
     printusertext('')
     
 if __name__ == '__main__':
-    main(sys.argv[1:])
\ No newline at end of file
+    status = 'ok'
+    exitcode = 0
+    try:
+        main(sys.argv[1:])
+    except SystemExit as e:
+        #the script only exits when it stops before the end
+        status = 'failed'
+        exitcode = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        raise
+    except:
+        status = 'failed'
+        exitcode = 1
+        raise
+    finally:
+        merakitrace.stop()
+        merakievents.stop(status, exitcode)
\ No newline at end of file
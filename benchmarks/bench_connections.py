@@ -0,0 +1,71 @@
+# Counts TCP connections, requests and wall time of a full Deploy_Site_v42.py site deploy
+#  against the local mock Dashboard API (benchmarks/mockdashboard.py).
+#
+# To run the benchmark, enter:
+#  python benchmarks/bench_connections.py
+#
+# With the pooled session layer (merakiclient.py) a deploy should open a handful of connections
+#  regardless of the number of requests it sends.
+
+import os, sys, io, time, tempfile, contextlib
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import merakiclient, merakinetworks
+import mockdashboard
+
+SITES = [
+    ('1 MX', {'MX68': 1}),
+    ('1 MX + 1 MS + 4 MR', {'MX68': 1, 'MS120-8': 1, 'MR36': 4}),
+    ('1 MX + 2 MS + 10 MR', {'MX68': 1, 'MS120-8': 2, 'MR36': 10}),
+]
+
+
+def makeinventory(p_models):
+    #returns serial -> model for a site made of the given model counts
+    inventory = {}
+    for model, count in p_models.items():
+        for i in range(count):
+            inventory['Q2%s-%04d-%04d' % (model[:2], len(inventory), i)] = model
+    return inventory
+
+
+def deploysite(p_label, p_models, p_index):
+    import Deploy_Site_v42
+    inventory = makeinventory(p_models)
+    mock = mockdashboard.MockDashboard(p_inventory=inventory).start()
+    os.environ['MERAKI_API_BASE_URL'] = mock.baseurl
+    #every run starts cold: fresh sessions and an empty lookup cache
+    cachedir = tempfile.TemporaryDirectory()
+    os.environ['MERAKI_CACHE_DIR'] = cachedir.name
+    merakiclient.closesessions()
+    merakinetworks.clearindexes()
+    argv = ['-k', 'benchkey', '-o', 'RISA', '-s', ' '.join(inventory), '-n', 'CHGVA%02d_CAR' % p_index,
+            '-c', 'EMEA - Template BTQ', '-w', '10.%d.0.' % p_index, '-t', 'BTQ CAR', '-a', 'Rue du Rhone 1, Geneva']
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            Deploy_Site_v42.main(argv)
+    except SystemExit:
+        pass
+    elapsed = time.perf_counter() - start
+    counters = mock.counters()
+    mock.stop()
+    merakiclient.closesessions()
+    del os.environ['MERAKI_API_BASE_URL']
+    del os.environ['MERAKI_CACHE_DIR']
+    cachedir.cleanup()
+    return (p_label, len(inventory), counters['requests'], counters['connections'], elapsed)
+
+
+def main():
+    print('%-24s %8s %9s %12s %10s' % ('Site', 'Devices', 'Requests', 'Connections', 'Time (s)'))
+    for index, (label, models) in enumerate(SITES, 1):
+        result = deploysite(label, models, index)
+        print('%-24s %8d %9d %12d %10.2f' % result)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,300 @@
+# End-to-end benchmark of the deploy scripts against the local mock Dashboard API
+#  (benchmarks/mockdashboard.py), with timings per phase.
+#
+# Runs full Deploy_Site_v42.py deploys, addnewdevices.py runs and MigrateNetwork_v1.py migrations
+#  for several site sizes and reports, for every phase of the run (org lookup, claim, network
+#  create, device config, bind, VLANs, timezone, action batches):
+#   requests   requests served by the mock, 429 answers and retries included
+#   sent       request body bytes sent by the script
+#   wall       seconds from the first request of the phase to the last response
+#   waiting    seconds the Dashboard calls of the phase spent in the rate limiter, summed over
+#              the calls, so concurrent calls can wait longer than the wall time of the phase
+#  The total line also gives the wall time of the run and every second the script slept,
+#  fixed sleeps (polling, waits after unbinding) included.
+#
+# To run the benchmark, enter:
+#  python benchmarks/bench_deploy.py [-l <latency s> -r <rate limit> -s <deploy|add|migrate> -b -j <results.json>]
+#
+#  -l  latency added by the mock to every request (default 0.05 s)
+#  -r  requests per second the mock accepts per API key before answering 429 (default no limit)
+#  -s  run only one kind of scenario
+#  -b  also run the deploys with --action-batches
+#  -j  write the results to a JSON file, to compare runs
+
+import os, sys, io, re, json, time, getopt, tempfile, threading, contextlib, importlib.util
+from urllib.parse import urlsplit
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import merakiclient, merakicache, merakinetworks, merakivlans
+import mockdashboard
+
+DEPLOY_SITES = [
+    ('1 MX', {'MX68': 1}),
+    ('1 MX + 1 MS + 4 MR', {'MX68': 1, 'MS120-8': 1, 'MR36': 4}),
+    ('1 MX + 2 MS + 10 MR', {'MX68': 1, 'MS120-8': 2, 'MR36': 10}),
+    ('1 MX + 4 MS + 40 MR + 4 MV', {'MX68': 1, 'MS120-8': 4, 'MR36': 40, 'MV12': 4}),
+]
+
+#devices added by addnewdevices.py to a site that has 1 MX + 1 MS + 2 MR
+ADD_DEVICES = [
+    ('+ 2 MR', {'MR36': 2}),
+    ('+ 1 MS + 10 MR', {'MS120-8': 1, 'MR36': 10}),
+    ('+ 4 MS + 40 MR', {'MS120-8': 4, 'MR36': 40}),
+]
+
+#template families migrated by MigrateNetwork_v1.py to a copy of their template
+MIGRATE_TEMPLATES = [
+    ('BTQ (9 VLANs)', 'EMEA - Template BTQ', 'btq'),
+    ('ZTNA Manufacture (8 VLANs)', 'EMEA - ZTNA Manufacture Template', 'ztnamanuf'),
+]
+
+PHASES = [
+    ('org lookup', [('GET', r'^/organizations$'), ('GET', r'^/organizations/[^/]+/networks$'), ('GET', r'^/organizations/[^/]+/configTemplates$')]),
+    ('claim', [('POST', r'^/organizations/[^/]+/(inventory/)?claim$'), ('GET', r'^/organizations/[^/]+/inventory/devices'), ('POST', r'^/networks/[^/]+/devices/claim$')]),
+    ('network create', [('POST', r'^/organizations/[^/]+/networks$')]),
+    ('device config', [(None, r'^/devices/'), (None, r'^/networks/[^/]+/devices')]),
+    ('bind', [('POST', r'^/networks/[^/]+/(un)?bind$')]),
+    ('VLANs', [(None, r'^/networks/[^/]+/appliance/vlans')]),
+    ('timezone', [('PUT', r'^/networks/[^/]+$'), ('GET', r'^/maps/api/')]),
+    ('action batches', [(None, r'^/organizations/[^/]+/actionBatches')]),
+]
+PHASE_PATTERNS = [(phase, [(method, re.compile(pattern)) for method, pattern in patterns]) for phase, patterns in PHASES]
+
+
+def phaseof(p_method, p_path):
+    #returns the phase a request belongs to
+    for phase, patterns in PHASE_PATTERNS:
+        for method, pattern in patterns:
+            if (method is None or method == p_method) and pattern.match(p_path):
+                return phase
+    return 'other'
+
+
+def apipath(p_url):
+    #path of a request URL relative to /api/v1
+    path = urlsplit(p_url).path
+    if path.startswith(merakiclient.API_PATH):
+        path = path[len(merakiclient.API_PATH):]
+    return path
+
+
+def makeinventory(p_models, p_prefix=''):
+    #returns serial -> model for the given model counts
+    inventory = {}
+    for model, count in p_models.items():
+        for i in range(count):
+            inventory['Q2%s%s-%04d-%04d' % (model[:2], p_prefix, len(inventory), i)] = model
+    return inventory
+
+
+class SleepCounter(object):
+    #counts the seconds passed to time.sleep by the script while installed
+    #the mock keeps its own reference to time.sleep, its latency is not counted
+
+    def __init__(self):
+        self.slept = 0.0
+        self.lock = threading.Lock()
+        self.sleep = time.sleep
+
+    def __call__(self, p_seconds):
+        with self.lock:
+            self.slept += p_seconds
+        self.sleep(p_seconds)
+
+    def __enter__(self):
+        time.sleep = self
+        return self
+
+    def __exit__(self, *args):
+        time.sleep = self.sleep
+
+
+def runscenario(p_mock, p_run):
+    #runs p_run() against a started mock with a cold client, returns the measurements
+    cachedir = tempfile.TemporaryDirectory()
+    os.environ['MERAKI_API_BASE_URL'] = p_mock.baseurl
+    os.environ['GOOGLE_MAPS_BASE_URL'] = p_mock.googleurl
+    os.environ['MERAKI_CACHE_DIR'] = cachedir.name
+    merakiclient.closesessions()
+    merakiclient.resetlimiters()
+    merakinetworks.clearindexes()
+    merakicache.setrefresh(False)
+    p_mock.resetcounters()
+
+    waits = {}
+    waitslock = threading.Lock()
+
+    def hook(p_record):
+        phase = phaseof(p_record['method'], apipath(p_record['url']))
+        with waitslock:
+            waits[phase] = waits.get(phase, 0.0) + p_record['waited']
+
+    merakiclient.addhook(hook)
+    exitcode = 0
+    start = time.perf_counter()
+    try:
+        with SleepCounter() as sleeps, contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            try:
+                p_run()
+            except SystemExit as e:
+                exitcode = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    finally:
+        wall = time.perf_counter() - start
+        merakiclient.removehook(hook)
+        merakiclient.closesessions()
+        for name in ('MERAKI_API_BASE_URL', 'GOOGLE_MAPS_BASE_URL', 'MERAKI_CACHE_DIR'):
+            del os.environ[name]
+        cachedir.cleanup()
+
+    phases = {}
+    for entry in p_mock.requestlog():
+        phase = phaseof(entry['method'], entry['path'])
+        stats = phases.setdefault(phase, {'requests': 0, 'sent': 0, 'start': entry['start'], 'end': entry['end'], 'waiting': 0.0})
+        stats['requests'] += 1
+        stats['sent'] += entry['bytesreceived']
+        stats['start'] = min(stats['start'], entry['start'])
+        stats['end'] = max(stats['end'], entry['end'])
+    for phase, stats in phases.items():
+        stats['wall'] = stats.pop('end') - stats.pop('start')
+        stats['waiting'] = waits.get(phase, 0.0)
+    counters = p_mock.counters()
+    return {'exitcode': exitcode, 'wall': wall, 'requests': counters['requests'], 'sent': counters['bytes'], 'throttled': counters['throttled'],
+            'slept': sleeps.slept, 'phases': phases}
+
+
+def mockoptions(p_options, p_inventory, p_templates=None):
+    return mockdashboard.MockDashboard(p_inventory=p_inventory, p_templates=p_templates, p_latency=p_options['latency'], p_ratelimit=p_options['ratelimit'])
+
+
+def benchdeploy(p_options, p_models, p_actionbatches):
+    import Deploy_Site_v42
+    inventory = makeinventory(p_models)
+    mock = mockoptions(p_options, inventory).start()
+    argv = ['-k', 'benchkey', '-o', 'RISA', '-s', ' '.join(inventory), '-n', 'CHGVA01_CAR', '-c', 'EMEA - Template BTQ',
+            '-w', '10.1.0.', '-t', 'BTQ CAR', '-a', 'Rue du Rhone 1, Geneva', '-g', 'benchgooglekey']
+    if p_actionbatches:
+        argv.append('--action-batches')
+    try:
+        return runscenario(mock, lambda: Deploy_Site_v42.main(argv))
+    finally:
+        mock.stop()
+
+
+def benchadd(p_options, p_models):
+    import addnewdevices
+    existing = makeinventory({'MX68': 1, 'MS120-8': 1, 'MR36': 2}, 'E')
+    new = makeinventory(p_models, 'N')
+    mock = mockoptions(p_options, dict(existing, **new)).start()
+    state = mock.state
+    network = state.newnetwork(mockdashboard.ORG_ID, {'name': 'CHGVA01_CAR', 'productTypes': ['appliance', 'switch', 'wireless']})
+    counts = {}
+    for serial, model in existing.items():
+        counts[model[:2]] = counts.get(model[:2], 0) + 1
+        kind = {'MX': 'SG', 'MS': 'SW', 'MR': 'WA'}[model[:2]]
+        state.devices[serial].update({'orgId': mockdashboard.ORG_ID, 'networkId': network['id'], 'claimedAt': '2024-01-01T00:00:00Z',
+                                      'name': 'NCHGVA01CAB%s%02d' % (kind, counts[model[:2]]), 'tags': ['BTQ', 'CAR'], 'address': 'Rue du Rhone 1, Geneva'})
+    argv = ['-k', 'benchkey', '-o', 'RISA', '-s', ' '.join(new), '-n', 'CHGVA01_CAR']
+    try:
+        return runscenario(mock, lambda: addnewdevices.main(argv))
+    finally:
+        mock.stop()
+
+
+def loadmigrate():
+    path = os.path.join(ROOT, 'MigrateNetwork_v1.py', 'MigrateNetwork_v1.py')
+    spec = importlib.util.spec_from_file_location('MigrateNetwork_v1', path)
+    module = importlib.util.module_from_spec(spec)
+    with contextlib.redirect_stdout(io.StringIO()):
+        spec.loader.exec_module(module)
+    return module
+
+
+def benchmigrate(p_options, p_template, p_plan):
+    migrate = loadmigrate()
+    target = p_template + ' #2'
+    templates = dict(mockdashboard.DEFAULT_TEMPLATES)
+    templates[target] = templates[p_template]
+    mock = mockoptions(p_options, {}, templates).start()
+    state = mock.state
+    network = state.newnetwork(mockdashboard.ORG_ID, {'name': 'CHGVA01_CAR', 'productTypes': ['appliance']})
+    state.bind(network['id'], [t['id'] for t in state.templates.values() if t['name'] == p_template][0])
+    for vlan in merakivlans.computeplan(p_plan, '10.1.0.'):
+        if vlan['id'] in state.vlans[network['id']]:
+            state.vlans[network['id']][vlan['id']].update(vlan)
+    argv = ['-k', 'benchkey', '-o', 'RISA', '-n', 'CHGVA01_CAR', '-t', target]
+
+    def run():
+        #MigrateNetwork asks for a confirmation before it starts
+        stdin = sys.stdin
+        sys.stdin = io.StringIO('\n')
+        try:
+            migrate.main(argv)
+        finally:
+            sys.stdin = stdin
+
+    try:
+        return runscenario(mock, run)
+    finally:
+        mock.stop()
+
+
+def printresult(p_label, p_result):
+    print()
+    status = '' if p_result['exitcode'] == 0 else '   (exit code %s)' % p_result['exitcode']
+    print('%s%s' % (p_label, status))
+    print('  %-16s %9s %10s %9s %11s' % ('Phase', 'Requests', 'Sent (B)', 'Wall (s)', 'Waiting (s)'))
+    for phase, patterns in PHASES + [('other', [])]:
+        stats = p_result['phases'].get(phase)
+        if stats is None:
+            continue
+        print('  %-16s %9d %10d %9.2f %11.2f' % (phase, stats['requests'], stats['sent'], stats['wall'], stats['waiting']))
+    print('  %-16s %9d %10d %9.2f %11.2f   throttled %d, slept %.2f s in total' % ('total', p_result['requests'], p_result['sent'], p_result['wall'],
+          sum(stats['waiting'] for stats in p_result['phases'].values()), p_result['throttled'], p_result['slept']))
+
+
+def main(argv):
+    options = {'latency': 0.05, 'ratelimit': 0}
+    only = None
+    actionbatches = False
+    jsonfile = None
+    opts, args = getopt.getopt(argv, 'l:r:s:bj:')
+    for opt, arg in opts:
+        if opt == '-l':
+            options['latency'] = float(arg)
+        elif opt == '-r':
+            options['ratelimit'] = int(arg)
+        elif opt == '-s':
+            only = arg
+        elif opt == '-b':
+            actionbatches = True
+        elif opt == '-j':
+            jsonfile = arg
+
+    print('Mock latency %.3f s, rate limit %s' % (options['latency'], options['ratelimit'] or 'none'))
+    results = {}
+    if only in (None, 'deploy'):
+        for label, models in DEPLOY_SITES:
+            results['Deploy_Site_v42 %s' % label] = benchdeploy(options, models, False)
+            printresult('Deploy_Site_v42 %s' % label, results['Deploy_Site_v42 %s' % label])
+            if actionbatches:
+                results['Deploy_Site_v42 --action-batches %s' % label] = benchdeploy(options, models, True)
+                printresult('Deploy_Site_v42 --action-batches %s' % label, results['Deploy_Site_v42 --action-batches %s' % label])
+    if only in (None, 'add'):
+        for label, models in ADD_DEVICES:
+            results['addnewdevices %s' % label] = benchadd(options, models)
+            printresult('addnewdevices %s' % label, results['addnewdevices %s' % label])
+    if only in (None, 'migrate'):
+        for label, template, plan in MIGRATE_TEMPLATES:
+            results['MigrateNetwork_v1 %s' % label] = benchmigrate(options, template, plan)
+            printresult('MigrateNetwork_v1 %s' % label, results['MigrateNetwork_v1 %s' % label])
+
+    if jsonfile is not None:
+        with open(jsonfile, 'w') as resultsfile:
+            json.dump({'options': options, 'results': results}, resultsfile, indent=1)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,502 @@
+# Minimal local stand-in for the Meraki Dashboard API v1, used by the benchmarks.
+#
+# Only the endpoints used by the deploy scripts are implemented, state is kept in memory. The
+#  Google Maps geocode and time zone endpoints are served too (GOOGLE_MAPS_BASE_URL).
+#  The server speaks HTTP/1.1 with keep-alive, and counts both the requests it serves and the
+#  TCP connections it accepts, so benchmarks can tell how well the client re-uses connections.
+#
+# Like the real API it can be made slow and strict:
+#  p_latency    seconds added to every response, or a (min, max) range picked at random
+#  p_ratelimit  requests per second allowed per API key, requests over the limit get a 429 with a
+#               Retry-After header (p_retryafter seconds, by default the time until a slot frees up)
+#  p_throttleevery  every Nth request gets a 429, for deterministic retry tests
+#  p_pagesize   maximum records per page of the paginated lists (organizations, organization
+#               networks, inventory devices), with perPage/startingAfter and Link: rel=next headers
+#  p_failevery  every Nth request gets a 503 without being processed
+#  p_dropevery  every Nth request is processed, then its connection is closed without an answer,
+#               like a flaky uplink losing the response
+#
+# Usage from a benchmark:
+#   server = MockDashboard(p_inventory={'Q2MX-0000-0001': 'MX68'}, p_latency=0.05, p_ratelimit=10)
+#   server.start()
+#   os.environ['MERAKI_API_BASE_URL'] = server.baseurl
+#   ...
+#   server.stop()
+#
+# Standalone:
+#   python benchmarks/mockdashboard.py [-l <latency> -r <rate limit> -e <throttle every> -s <page size> -f <fail every> -d <drop every>] [port]
+
+import json, re, copy, math, time, random, socket, threading, itertools, collections
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs, urlencode
+
+#bound at import, so benchmarks counting the client's calls to time.sleep do not count the mock latency
+_sleep = time.sleep
+
+ORG_ID = '100'
+ORG_ID_CN = '200'
+
+DEFAULT_TEMPLATES = {
+    'EMEA - Template BTQ': [10, 20, 30, 50, 55, 60, 80, 100, 400],
+    'EMEA - Template Large BTQ': [10, 20, 30, 50, 60, 100, 400],
+    'EMEA - Template Office': [100, 300, 600, 999],
+    'EMEA - ZTNA Office Template': [200, 300, 600, 999],
+    'EMEA - ZTNA Manufacture Template': [152, 200, 300, 711, 731, 732, 811, 999],
+    'EMEA - Manufacture RIC Template': [100, 152, 300, 711, 731, 732, 811, 999],
+    'EMEA - VCA France Manufacture Template': [152, 200, 300, 711, 731, 811, 910, 999],
+    'EMEA - VCA France Office Template': [200, 300, 600, 999],
+    'EMEA - Checkpoint Office Template': [100, 200, 300, 707, 999],
+}
+
+
+class MockState(object):
+    #in-memory Dashboard data: organizations, networks, templates, inventory and VLANs
+
+    def __init__(self, p_inventory, p_templates):
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+        self.orgs = [{'id': ORG_ID, 'name': 'RISA'}, {'id': ORG_ID_CN, 'name': 'RISA CN'}]
+        self.networks = {}
+        self.templates = {}
+        for name, vlanids in p_templates.items():
+            templateid = 'L_%d' % next(self.ids)
+            self.templates[templateid] = {'id': templateid, 'name': name, 'vlans': vlanids}
+        #serial -> device record. Devices are unclaimed until claimed into an org
+        self.devices = {}
+        for serial, model in p_inventory.items():
+            self.devices[serial] = {'serial': serial, 'model': model, 'mac': '00:18:0a:00:00:%02x' % (len(self.devices) % 256),
+                                    'networkId': None, 'claimedAt': None, 'orgId': None, 'name': None, 'tags': [], 'address': ''}
+        self.vlans = {}
+        self.batches = {}
+
+    def newnetwork(self, p_orgid, p_body):
+        nwid = 'N_%d' % next(self.ids)
+        network = {'id': nwid, 'organizationId': p_orgid, 'name': p_body.get('name'), 'productTypes': p_body.get('productTypes', []),
+                   'timeZone': p_body.get('timeZone'), 'tags': p_body.get('tags', []), 'configTemplateId': None, 'isBoundToConfigTemplate': False}
+        self.networks[nwid] = network
+        self.vlans[nwid] = {}
+        return network
+
+    def bind(self, p_nwid, p_templateid):
+        template = self.templates[p_templateid]
+        network = self.networks[p_nwid]
+        network['configTemplateId'] = p_templateid
+        network['isBoundToConfigTemplate'] = True
+        for vlanid in template['vlans']:
+            self.vlans[p_nwid].setdefault(vlanid, {'id': vlanid, 'networkId': p_nwid, 'name': 'VLAN %d' % vlanid,
+                                                   'subnet': '192.168.%d.0/24' % (vlanid % 256), 'applianceIp': '192.168.%d.1' % (vlanid % 256),
+                                                   'dhcpHandling': 'Run a DHCP server', 'dhcpRelayServerIps': [], 'dhcpLeaseTime': '1 day',
+                                                   'dhcpBootOptionsEnabled': False, 'dhcpOptions': [], 'fixedIpAssignments': {}, 'reservedIpRanges': [],
+                                                   'dnsNameservers': 'upstream_dns', 'mandatoryDhcp': {'enabled': False}})
+
+
+def _publicdevice(p_device):
+    return dict((k, v) for k, v in p_device.items() if k != 'orgId')
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        #called once per accepted TCP connection
+        BaseHTTPRequestHandler.setup(self)
+        with self.server.counterslock:
+            self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, p_status, p_body=None, p_headers=None):
+        payload = json.dumps(p_body if p_body is not None else {}).encode('utf-8')
+        self.send_response(p_status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (p_headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+        entry = dict(self._logentry, end=time.time(), status=p_status, bytessent=len(payload))
+        with self.server.counterslock:
+            self.server.bytessent += len(payload)
+            self.server.log.append(entry)
+
+    def _drop(self):
+        #closes the connection of a processed request without answering it
+        self.close_connection = True
+        try:
+            self.connection.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        entry = dict(self._logentry, end=time.time(), status=None, bytessent=0)
+        with self.server.counterslock:
+            self.server.dropped += 1
+            self.server.log.append(entry)
+
+    def _throttle(self, p_apikey, p_number):
+        #returns the Retry-After value when request number p_number must be refused with a 429, None otherwise
+        server = self.server
+        with server.counterslock:
+            if server.throttleevery and p_number % server.throttleevery == 0:
+                return server.retryafter or 1
+            if not server.ratelimit:
+                return None
+            now = time.time()
+            window = server.windows.setdefault(p_apikey, collections.deque())
+            while window and window[0] <= now - 1.0:
+                window.popleft()
+            if len(window) >= server.ratelimit:
+                return server.retryafter or max(1, math.ceil(window[0] + 1.0 - now))
+            window.append(now)
+            return None
+
+    def _paginate(self, p_path, p_query, p_records, p_key):
+        #returns (page of records, headers) for a paginated list
+        start = 0
+        if 'startingAfter' in p_query:
+            keys = [record[p_key] for record in p_records]
+            start = keys.index(p_query['startingAfter']) + 1 if p_query['startingAfter'] in keys else len(p_records)
+        perpage = int(p_query.get('perPage') or 1000)
+        if self.server.pagesize:
+            perpage = min(perpage, self.server.pagesize)
+        page = p_records[start:start + perpage]
+        headers = {}
+        if start + perpage < len(p_records):
+            query = dict(p_query, perPage=str(perpage), startingAfter=page[-1][p_key])
+            headers['Link'] = '<http://%s/api/v1%s?%s>; rel=next' % (self.headers.get('Host'), p_path, urlencode(query, doseq=True))
+        return (page, headers)
+
+    def _dispatch(self, p_method):
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length) if length else b''
+        url = urlsplit(self.path)
+        path = url.path
+        prefix = '/api/v1'
+        if path.startswith(prefix):
+            path = path[len(prefix):]
+        self._logentry = {'start': time.time(), 'method': p_method, 'path': path, 'bytesreceived': length}
+        with self.server.counterslock:
+            self.server.requests += 1
+            self.server.bytesreceived += length
+            number = self.server.requests
+        #the Google Maps endpoints have their own key and are not subject to the Dashboard budget
+        google = path.startswith('/maps/api/')
+        if not google and self.headers.get('X-Cisco-Meraki-API-Key') is None:
+            return self._reply(401, {'errors': ['Missing API key']})
+        latency = self.server.latency
+        if isinstance(latency, (tuple, list)):
+            latency = random.uniform(latency[0], latency[1])
+        if latency:
+            _sleep(latency)
+        retryafter = None if google else self._throttle(self.headers.get('X-Cisco-Meraki-API-Key'), number)
+        if retryafter is not None:
+            with self.server.counterslock:
+                self.server.throttled += 1
+            return self._reply(429, {'errors': ['API rate limit exceeded for organization']}, {'Retry-After': str(retryafter)})
+        if not google and self.server.failevery and number % self.server.failevery == 0:
+            return self._reply(503, {'errors': ['Service temporarily unavailable']})
+        try:
+            body = json.loads(raw.decode('utf-8')) if raw else {}
+        except ValueError:
+            return self._reply(400, {'errors': ['Invalid JSON']})
+        #array parameters (serials[]=...) keep all their values
+        query = dict((k, v if k.endswith('[]') else v[0]) for k, v in parse_qs(url.query).items())
+        handler, groups = _route(p_method, path)
+        if handler is not None:
+            with self.server.state.lock:
+                status, result = handler(self.server.state, body, query, *groups)
+            if not google and self.server.dropevery and number % self.server.dropevery == 0:
+                return self._drop()
+            if status == 200 and handler in PAGINATED:
+                result, headers = self._paginate(path, query, result, PAGINATED[handler])
+                return self._reply(status, result, headers)
+            return self._reply(status, result)
+        return self._reply(404, {'errors': ['Not found: %s %s' % (p_method, path)]})
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_PUT(self):
+        self._dispatch('PUT')
+
+    def do_DELETE(self):
+        self._dispatch('DELETE')
+
+
+### Endpoint handlers. Each returns (status code, JSON body) ###
+
+def _getorgs(state, body, query):
+    return (200, state.orgs)
+
+def _getnetworks(state, body, query, orgid):
+    networks = [n for n in state.networks.values() if n['organizationId'] == orgid]
+    if 'configTemplateId' in query:
+        networks = [n for n in networks if n['configTemplateId'] == query['configTemplateId']]
+    return (200, networks)
+
+def _createnetwork(state, body, query, orgid):
+    for network in state.networks.values():
+        if network['organizationId'] == orgid and network['name'] == body.get('name'):
+            return (400, {'errors': ['Name has already been taken']})
+    return (201, state.newnetwork(orgid, body))
+
+def _gettemplates(state, body, query, orgid):
+    return (200, [{'id': t['id'], 'name': t['name']} for t in state.templates.values()])
+
+def _claimorg(state, body, query, orgid):
+    for serial in body.get('serials', []):
+        device = state.devices.get(serial)
+        if device is None or (device['orgId'] not in (None, orgid)):
+            return (400, {'errors': ['Device with serial %s is already claimed or does not exist' % serial]})
+    for serial in body.get('serials', []):
+        device = state.devices[serial]
+        device['orgId'] = orgid
+        device['claimedAt'] = device['claimedAt'] or '2024-01-01T00:00:00Z'
+    return (200, {'serials': body.get('serials', []), 'licenses': body.get('licenses', []), 'orders': []})
+
+def _getinventorydevices(state, body, query, orgid):
+    devices = [d for d in state.devices.values() if d['orgId'] == orgid]
+    if 'serials[]' in query:
+        devices = [d for d in devices if d['serial'] in query['serials[]']]
+    return (200, [_publicdevice(d) for d in devices])
+
+def _getinventorydevice(state, body, query, orgid, serial):
+    device = state.devices.get(serial)
+    if device is None or device['orgId'] != orgid:
+        return (404, {'errors': ['Device not found']})
+    return (200, _publicdevice(device))
+
+def _claimnetwork(state, body, query, nwid):
+    network = state.networks.get(nwid)
+    if network is None:
+        return (404, {'errors': ['Network not found']})
+    for serial in body.get('serials', []):
+        device = state.devices.get(serial)
+        if device is None or device['networkId'] not in (None, nwid):
+            return (400, {'errors': ['Device %s cannot be claimed' % serial]})
+    for serial in body.get('serials', []):
+        device = state.devices[serial]
+        device['networkId'] = nwid
+        device['orgId'] = network['organizationId']
+        device['claimedAt'] = device['claimedAt'] or '2024-01-01T00:00:00Z'
+    return (200, {})
+
+def _getnetworkdevices(state, body, query, nwid):
+    return (200, [_publicdevice(d) for d in state.devices.values() if d['networkId'] == nwid])
+
+def _getdevice(state, body, query, serial):
+    device = state.devices.get(serial)
+    if device is None or device['networkId'] is None:
+        return (404, {'errors': ['Device not found']})
+    return (200, _publicdevice(device))
+
+def _updatedevice(state, body, query, serial, nwid=None):
+    device = state.devices.get(serial)
+    if device is None or device['networkId'] is None:
+        return (404, {'errors': ['Device not found']})
+    for field in ('name', 'tags', 'address', 'notes', 'lat', 'lng'):
+        if field in body:
+            device[field] = body[field]
+    return (200, _publicdevice(device))
+
+def _updatenetworkdevice(state, body, query, nwid, serial):
+    return _updatedevice(state, body, query, serial, nwid)
+
+def _getnetwork(state, body, query, nwid):
+    network = state.networks.get(nwid)
+    if network is None:
+        return (404, {'errors': ['Network not found']})
+    return (200, network)
+
+def _updatenetwork(state, body, query, nwid):
+    network = state.networks.get(nwid)
+    if network is None:
+        return (404, {'errors': ['Network not found']})
+    for field in ('name', 'timeZone', 'tags', 'notes'):
+        if field in body:
+            network[field] = body[field]
+    return (200, network)
+
+def _bind(state, body, query, nwid):
+    if nwid not in state.networks or body.get('configTemplateId') not in state.templates:
+        return (400, {'errors': ['Invalid network or template']})
+    state.bind(nwid, body['configTemplateId'])
+    return (200, state.networks[nwid])
+
+def _unbind(state, body, query, nwid):
+    network = state.networks.get(nwid)
+    if network is None or not network['isBoundToConfigTemplate']:
+        return (400, {'errors': ['Network is not bound to a template']})
+    network['configTemplateId'] = None
+    network['isBoundToConfigTemplate'] = False
+    return (200, network)
+
+def _getvlans(state, body, query, nwid):
+    if nwid not in state.vlans:
+        return (404, {'errors': ['Network not found']})
+    return (200, sorted(state.vlans[nwid].values(), key=lambda v: v['id']))
+
+def _updatevlan(state, body, query, nwid, vlanid):
+    vlan = state.vlans.get(nwid, {}).get(int(vlanid))
+    if vlan is None:
+        return (404, {'errors': ['VLAN not found']})
+    vlan.update(body)
+    return (200, vlan)
+
+def _createactionbatch(state, body, query, orgid):
+    #runs the actions at once, all or nothing. The batch is reported as running in the create
+    #response and as completed or failed when it is read back, like an asynchronous batch
+    actions = body.get('actions', [])
+    if len(actions) == 0 or len(actions) > 100:
+        return (400, {'errors': ['A batch needs between 1 and 100 actions']})
+    saved = copy.deepcopy((state.devices, state.networks, state.vlans))
+    errors = []
+    for action in actions:
+        method = ACTION_METHODS.get(action.get('operation'))
+        handler, groups = _route(method, action.get('resource', ''))
+        if handler is None:
+            errors.append('Unsupported action %s %s' % (action.get('operation'), action.get('resource')))
+            break
+        status, result = handler(state, action.get('body', {}), {}, *groups)
+        if status >= 400:
+            errors.extend(result.get('errors', [str(status)]))
+            break
+    if len(errors) > 0:
+        state.devices, state.networks, state.vlans = saved
+    batchid = str(next(state.ids))
+    state.batches[batchid] = {'id': batchid, 'organizationId': orgid, 'confirmed': True, 'synchronous': False, 'actions': actions,
+                              'status': {'completed': len(errors) == 0, 'failed': len(errors) > 0, 'errors': errors}}
+    return (201, dict(state.batches[batchid], status={'completed': False, 'failed': False, 'errors': []}))
+
+def _getactionbatch(state, body, query, orgid, batchid):
+    batch = state.batches.get(batchid)
+    if batch is None or batch['organizationId'] != orgid:
+        return (404, {'errors': ['Action batch not found']})
+    return (200, batch)
+
+def _geocode(state, body, query):
+    return (200, {'status': 'OK', 'results': [{'formatted_address': query.get('address', ''), 'geometry': {'location': {'lat': 46.2044, 'lng': 6.1432}}}]})
+
+def _timezone(state, body, query):
+    return (200, {'status': 'OK', 'timeZoneId': 'Europe/Zurich', 'timeZoneName': 'Central European Standard Time'})
+
+
+ACTION_METHODS = {'create': 'POST', 'update': 'PUT', 'destroy': 'DELETE'}
+
+ROUTES = [
+    ('GET', re.compile(r'^/organizations$'), _getorgs),
+    ('GET', re.compile(r'^/organizations/([^/]+)/networks$'), _getnetworks),
+    ('POST', re.compile(r'^/organizations/([^/]+)/networks$'), _createnetwork),
+    ('GET', re.compile(r'^/organizations/([^/]+)/configTemplates$'), _gettemplates),
+    ('POST', re.compile(r'^/organizations/([^/]+)/(?:inventory/)?claim$'), _claimorg),
+    ('GET', re.compile(r'^/organizations/([^/]+)/inventory/devices$'), _getinventorydevices),
+    ('GET', re.compile(r'^/organizations/([^/]+)/inventory/devices/([^/]+)$'), _getinventorydevice),
+    ('POST', re.compile(r'^/networks/([^/]+)/devices/claim$'), _claimnetwork),
+    ('GET', re.compile(r'^/networks/([^/]+)/devices$'), _getnetworkdevices),
+    ('PUT', re.compile(r'^/networks/([^/]+)/devices/([^/]+)$'), _updatenetworkdevice),
+    ('GET', re.compile(r'^/devices/([^/]+)$'), _getdevice),
+    ('PUT', re.compile(r'^/devices/([^/]+)$'), _updatedevice),
+    ('GET', re.compile(r'^/networks/([^/]+)$'), _getnetwork),
+    ('PUT', re.compile(r'^/networks/([^/]+)$'), _updatenetwork),
+    ('POST', re.compile(r'^/networks/([^/]+)/bind$'), _bind),
+    ('POST', re.compile(r'^/networks/([^/]+)/unbind$'), _unbind),
+    ('GET', re.compile(r'^/networks/([^/]+)/appliance/vlans$'), _getvlans),
+    ('PUT', re.compile(r'^/networks/([^/]+)/appliance/vlans/([0-9]+)$'), _updatevlan),
+    ('POST', re.compile(r'^/organizations/([^/]+)/actionBatches$'), _createactionbatch),
+    ('GET', re.compile(r'^/organizations/([^/]+)/actionBatches/([^/]+)$'), _getactionbatch),
+    ('GET', re.compile(r'^/maps/api/geocode/json$'), _geocode),
+    ('GET', re.compile(r'^/maps/api/timezone/json$'), _timezone),
+]
+
+#paginated list handlers -> field used by startingAfter
+PAGINATED = {_getorgs: 'id', _getnetworks: 'id', _getinventorydevices: 'serial'}
+
+
+def _route(p_method, p_path):
+    #returns (handler, URL groups) of the route matching a request, (None, None) if there is none
+    for method, pattern, handler in ROUTES:
+        if method != p_method:
+            continue
+        match = pattern.match(p_path)
+        if match:
+            return (handler, match.groups())
+    return (None, None)
+
+
+class MockDashboard(object):
+    #runs the mock API in a background thread on 127.0.0.1
+
+    def __init__(self, p_inventory=None, p_templates=None, p_port=0, p_latency=0, p_ratelimit=0, p_retryafter=None, p_throttleevery=0, p_pagesize=0,
+                 p_failevery=0, p_dropevery=0):
+        self.server = ThreadingHTTPServer(('127.0.0.1', p_port), MockHandler)
+        self.server.daemon_threads = True
+        self.server.state = MockState(p_inventory or {}, p_templates or DEFAULT_TEMPLATES)
+        self.server.counterslock = threading.Lock()
+        self.server.latency = p_latency
+        self.server.ratelimit = p_ratelimit
+        self.server.retryafter = p_retryafter
+        self.server.throttleevery = p_throttleevery
+        self.server.pagesize = p_pagesize
+        self.server.failevery = p_failevery
+        self.server.dropevery = p_dropevery
+        self.server.windows = {}
+        self.resetcounters()
+        self.thread = None
+
+    @property
+    def state(self):
+        return self.server.state
+
+    @property
+    def baseurl(self):
+        return 'http://127.0.0.1:%d/api/v1' % self.server.server_address[1]
+
+    @property
+    def googleurl(self):
+        #value for GOOGLE_MAPS_BASE_URL
+        return 'http://127.0.0.1:%d' % self.server.server_address[1]
+
+    def resetcounters(self):
+        with self.server.counterslock:
+            self.server.requests = 0
+            self.server.connections = 0
+            self.server.bytesreceived = 0
+            self.server.bytessent = 0
+            self.server.throttled = 0
+            self.server.dropped = 0
+            self.server.log = []
+
+    def counters(self):
+        #bytes is the request body bytes received from the client, bytessent the response bytes
+        with self.server.counterslock:
+            return {'requests': self.server.requests, 'connections': self.server.connections, 'bytes': self.server.bytesreceived,
+                    'bytessent': self.server.bytessent, 'throttled': self.server.throttled, 'dropped': self.server.dropped}
+
+    def requestlog(self):
+        #returns one record per request served: start, end, method, path (without /api/v1),
+        #status, bytesreceived and bytessent
+        with self.server.counterslock:
+            return list(self.server.log)
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+if __name__ == '__main__':
+    import sys, getopt
+    opts, args = getopt.getopt(sys.argv[1:], 'l:r:e:s:f:d:')
+    options = dict(opts)
+    port = int(args[0]) if len(args) > 0 else 8080
+    mock = MockDashboard(p_port=port, p_latency=float(options.get('-l', 0)), p_ratelimit=int(options.get('-r', 0)),
+                         p_throttleevery=int(options.get('-e', 0)), p_pagesize=int(options.get('-s', 0)),
+                         p_failevery=int(options.get('-f', 0)), p_dropevery=int(options.get('-d', 0)))
+    print('Mock Dashboard API listening on %s' % mock.baseurl)
+    mock.server.serve_forever()
@@ -0,0 +1,104 @@
+# Action batch backend shared by the deploy scripts.
+#
+# Instead of one REST call per change, the updates of a deploy can be collected as actions
+#  (resource, operation, body) and submitted to /organizations/{id}/actionBatches in chunks of
+#  up to MAX_ACTIONS. Dashboard runs each batch as a unit: either every action of the batch is
+#  applied or none is. Batches run asynchronously, runactions() polls them until they complete or
+#  fail. At most MAX_RUNNING batches of an organization are left running at the same time.
+#
+# Resources are the API paths without the /api/v1 prefix, for example '/devices/Q2XX-XXXX-XXXX'.
+
+import time, requests
+import merakiclient
+
+MAX_ACTIONS = 100
+MAX_RUNNING = 5
+POLL_INTERVAL = 0.5
+MAX_POLL_INTERVAL = 5.0
+POLL_TIMEOUT = 300
+
+
+def action(p_resource, p_operation, p_body):
+    #returns one action of a batch
+    return {'resource': p_resource, 'operation': p_operation, 'body': p_body}
+
+
+def chunks(p_actions, p_size=MAX_ACTIONS):
+    #splits a list of actions in lists of at most p_size actions, keeping their order
+    return [p_actions[i:i + p_size] for i in range(0, len(p_actions), p_size)]
+
+
+def submitbatch(p_apikey, p_shardurl, p_orgid, p_actions):
+    #submits one asynchronous, confirmed batch. Returns (status code, batch record or error body)
+    r = merakiclient.post(p_apikey, p_shardurl, '/organizations/%s/actionBatches' % p_orgid, {'confirmed': True, 'synchronous': False, 'actions': p_actions})
+    try:
+        body = r.json()
+    except ValueError:
+        body = {}
+    return (r.status_code, body)
+
+
+def getbatch(p_apikey, p_shardurl, p_orgid, p_batchid):
+    #returns (status code, batch record)
+    r = merakiclient.get(p_apikey, p_shardurl, '/organizations/%s/actionBatches/%s' % (p_orgid, p_batchid))
+    try:
+        body = r.json()
+    except ValueError:
+        body = {}
+    return (r.status_code, body)
+
+
+def waitbatches(p_apikey, p_shardurl, p_orgid, p_batches, p_timeout=POLL_TIMEOUT):
+    #polls the batches until all of them completed or failed, with a growing interval
+    #p_batches is a dict batch ID -> batch record, updated in place. Batches still running after
+    #p_timeout seconds are left as they are. Returns the time spent sleeping
+    deadline = time.time() + p_timeout
+    interval = POLL_INTERVAL
+    slept = 0.0
+    while True:
+        running = [batchid for batchid in p_batches if not isdone(p_batches[batchid])]
+        if len(running) == 0 or time.time() >= deadline:
+            return slept
+        time.sleep(interval)
+        slept += interval
+        interval = min(interval * 1.5, MAX_POLL_INTERVAL)
+        for batchid in running:
+            status, batch = getbatch(p_apikey, p_shardurl, p_orgid, batchid)
+            if status == requests.codes.ok:
+                p_batches[batchid] = batch
+
+
+def isdone(p_batch):
+    status = p_batch.get('status', {})
+    return status.get('completed', False) or status.get('failed', False)
+
+
+def runactions(p_apikey, p_shardurl, p_orgid, p_actions):
+    #submits the actions in batches and waits for them
+    #returns a list with, for every chunk, {'actions': count, 'id': batch ID or 'null',
+    #'status': 'completed', 'failed', 'running' or 'rejected', 'errors': [...]}
+    results = []
+    pending = chunks(p_actions)
+    while len(pending) > 0:
+        running = {}
+        order = []
+        for chunk in pending[:MAX_RUNNING]:
+            status, batch = submitbatch(p_apikey, p_shardurl, p_orgid, chunk)
+            if status not in (requests.codes.ok, requests.codes.created) or 'id' not in batch:
+                results.append({'actions': len(chunk), 'id': 'null', 'status': 'rejected', 'errors': batch.get('errors', [str(status)])})
+                continue
+            running[batch['id']] = batch
+            order.append((batch['id'], len(chunk)))
+        pending = pending[MAX_RUNNING:]
+
+        waitbatches(p_apikey, p_shardurl, p_orgid, running)
+        for batchid, count in order:
+            status = running[batchid].get('status', {})
+            if status.get('completed', False):
+                state = 'completed'
+            elif status.get('failed', False):
+                state = 'failed'
+            else:
+                state = 'running'
+            results.append({'actions': count, 'id': batchid, 'status': state, 'errors': status.get('errors', [])})
+    return results
@@ -0,0 +1,92 @@
+# Small on-disk JSON cache shared by the deploy scripts.
+#
+# Entries live under ~/.cache/meraki_deploy (or $MERAKI_CACHE_DIR), in one folder per API key and
+#  Dashboard base URL. The folder name is a hash, the API key itself is never written to disk.
+#  Every entry records when it was written and is ignored once it is older than the TTL the
+#  caller asks for. The cache is best effort: a missing, expired or unreadable entry is reported
+#  as a miss, and failures to write are ignored.
+#
+# lookupid() caches name -> id lookups that rarely change (organizations, config templates) for a
+#  day. A name missing from a cached entry triggers a fresh listing, so new objects are always
+#  found. setrefresh(True) (the --refresh-cache option of the scripts) turns every read into a
+#  miss for the run, fresh values are still written back.
+
+import os, json, time, hashlib, threading, requests
+import merakiclient
+
+LOOKUP_TTL = 24 * 3600
+
+_refresh = False
+
+
+def setrefresh(p_refresh):
+    #when True, cached entries are ignored and rewritten with fresh data
+    global _refresh
+    _refresh = p_refresh
+
+
+def cachedir():
+    #returns the root folder of the cache
+    return os.environ.get('MERAKI_CACHE_DIR') or os.path.join(os.path.expanduser('~'), '.cache', 'meraki_deploy')
+
+
+def fingerprint(p_apikey, p_shardurl):
+    #returns a short hash identifying an API key on a shard
+    key = '%s|%s' % (p_apikey, merakiclient.baseurl(p_shardurl))
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]
+
+
+def cachepath(p_apikey, p_shardurl, p_name):
+    #returns the file used to cache entry p_name for an API key on a shard
+    return os.path.join(cachedir(), fingerprint(p_apikey, p_shardurl), '%s.json' % p_name)
+
+
+def load(p_path, p_ttl):
+    #returns the cached data, or None if the entry is missing, unreadable or older than p_ttl seconds
+    if _refresh:
+        return None
+    try:
+        with open(p_path) as cachefile:
+            entry = json.load(cachefile)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or time.time() - entry.get('savedAt', 0) > p_ttl:
+        return None
+    return entry.get('data')
+
+
+def save(p_path, p_data):
+    #writes an entry atomically, so a concurrent reader never sees half a file
+    #the temporary file is private to the process and thread, threads may save the same entry at once
+    try:
+        os.makedirs(os.path.dirname(p_path), exist_ok=True)
+        tmppath = '%s.%d.%d.tmp' % (p_path, os.getpid(), threading.get_ident())
+        with open(tmppath, 'w') as cachefile:
+            json.dump({'savedAt': time.time(), 'data': p_data}, cachefile)
+        os.replace(tmppath, p_path)
+    except OSError:
+        pass
+
+
+def invalidate(p_path):
+    #removes an entry
+    try:
+        os.remove(p_path)
+    except OSError:
+        pass
+
+
+def lookupid(p_apikey, p_shardurl, p_entry, p_name, p_fetch, p_ttl=LOOKUP_TTL):
+    #returns (status code, id of p_name or 'null') using the cached name -> id dict p_entry
+    #on a miss the dict is rebuilt from p_fetch(), which returns (status code, list of records)
+    path = cachepath(p_apikey, p_shardurl, p_entry)
+    names = load(path, p_ttl)
+    if names is not None and p_name in names:
+        return (requests.codes.ok, names[p_name])
+
+    status, records = p_fetch()
+    if status != requests.codes.ok:
+        return (status, 'null')
+    names = dict((record['name'], record['id']) for record in records)
+    save(path, names)
+    return (status, names.get(p_name, 'null'))
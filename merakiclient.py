@@ -0,0 +1,367 @@
+# Shared HTTP layer for the Meraki deploy scripts (Deploy_Site_v42.py, addnewdevices.py and
+#  MigrateNetwork_v1.py).
+#
+# Every Dashboard call goes through one keep-alive requests.Session per shard (api.meraki.com,
+#  api.meraki.cn), so a site deploy re-uses a handful of pooled TLS connections instead of opening
+#  a new one for every request. The API key and JSON headers are set on the session once.
+#
+# To point the scripts to a local mock Dashboard (benchmarks, offline testing) set the environment
+#  variable MERAKI_API_BASE_URL, e.g. MERAKI_API_BASE_URL=http://127.0.0.1:8080/api/v1
+#
+# Calls are paced by a token bucket per shard set to the Dashboard budget of 10 requests per
+#  second per organization. No time is spent waiting while under budget; when the API answers
+#  429 the request is retried after the Retry-After delay plus some jitter, and the whole bucket
+#  is paused for that time so concurrent callers back off too.
+#
+# Transient failures are retried centrally by the RetryPolicy, with exponential backoff and jitter:
+#  dropped connections, timeouts and 500/502/503/504 answers. GET, PUT and DELETE are sent again as
+#  they are. A request that never reached the API (connection refused, connect timeout) is sent
+#  again whatever its method. A POST that may have been applied (the connection dropped before the
+#  answer, a 5xx) is only sent again when the caller gives a guard: a function that checks with a
+#  read whether the POST took effect (network created, serials claimed, network bound) and then
+#  returns the body the POST would have answered, or None to send it again. Without a guard the
+#  failure is returned to the caller as before. Each helper still raises, or returns the failing
+#  response, once the attempts are used up.
+#
+# parallelmap() runs independent calls (per-device or per-VLAN updates) on a small thread pool. The
+#  session pool and the token bucket are shared by the threads, so the calls overlap their network
+#  latency while staying within the API budget.
+#
+# The helpers return the requests.Response object untouched, callers keep checking status codes
+#  and handling exceptions exactly as they did with bare requests.get/post/put.
+#
+# Functions registered with addhook() are called after every request with a record of the call:
+#  method, url, status, elapsed (seconds, waits included), waited (seconds spent in the rate
+#  limiter), retries (times the request was sent again after a 429 or a transient failure) and
+#  bytes sent/received. Benchmarks use it to attribute requests and waiting time to the phases of
+#  a deploy.
+
+import os, json, time, random, threading, contextvars, requests, urllib3
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+
+API_PATH = '/api/v1'
+POOL_SIZE = 20
+
+#Dashboard API budget, requests per second per organization
+RATE_LIMIT = 10
+#number of times a request answered with 429 is retried before the 429 is returned to the caller
+MAX_RATELIMIT_RETRIES = 6
+#wait used when a 429 comes without a Retry-After header
+DEFAULT_RETRY_AFTER = 1.0
+#number of calls parallelmap() keeps in flight
+MAX_WORKERS = 10
+#transient failures: attempts per request, first backoff and longest backoff in seconds
+RETRY_ATTEMPTS = 5
+RETRY_BACKOFF = 0.5
+MAX_RETRY_BACKOFF = 8.0
+#answers retried as transient, 429 has its own handling
+RETRY_STATUSES = [500, 502, 503, 504]
+#methods that can be sent again without changing the outcome
+IDEMPOTENT_METHODS = ['GET', 'HEAD', 'PUT', 'DELETE']
+#seconds to connect and to wait for an answer
+REQUEST_TIMEOUT = (10, 120)
+
+_sessions = {}
+_sessionslock = threading.Lock()
+_limiters = {}
+_limiterslock = threading.Lock()
+_hooks = []
+_policy = None
+
+
+class TokenBucket(object):
+    #thread safe token bucket. acquire() blocks only when the bucket is empty or paused
+
+    def __init__(self, p_rate, p_burst=None):
+        self.rate = float(p_rate)
+        self.capacity = float(p_burst if p_burst is not None else p_rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.pauseduntil = 0.0
+        self.lock = threading.Lock()
+        #statistics
+        self.waited = 0.0
+        self.throttled = 0
+
+    def acquire(self):
+        #takes one token, sleeping as long as needed. Returns the time spent waiting
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                if now >= self.pauseduntil:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        self.waited += waited
+                        return waited
+                    delay = (1 - self.tokens) / self.rate
+                else:
+                    delay = self.pauseduntil - now
+            time.sleep(delay)
+            waited += delay
+
+    def pause(self, p_seconds):
+        #stops handing out tokens for p_seconds (API answered 429)
+        with self.lock:
+            now = time.monotonic()
+            self.pauseduntil = max(self.pauseduntil, now + p_seconds)
+            self.tokens = 0
+            self.updated = self.pauseduntil
+            self.throttled += 1
+
+
+def getlimiter(p_shardurl):
+    #returns the rate limiter shared by all calls to a shard
+    with _limiterslock:
+        limiter = _limiters.get(p_shardurl)
+        if limiter is None:
+            limiter = TokenBucket(RATE_LIMIT)
+            _limiters[p_shardurl] = limiter
+    return limiter
+
+
+def resetlimiters():
+    #forgets the rate limiters and their statistics (benchmarks start every run with a full budget)
+    with _limiterslock:
+        _limiters.clear()
+
+
+class RetryPolicy(object):
+    #decides which failed requests are sent again and how long to wait before that
+
+    def __init__(self, p_attempts=RETRY_ATTEMPTS, p_backoff=RETRY_BACKOFF, p_maxbackoff=MAX_RETRY_BACKOFF, p_statuses=RETRY_STATUSES, p_timeout=REQUEST_TIMEOUT):
+        self.attempts = p_attempts
+        self.backoff = p_backoff
+        self.maxbackoff = p_maxbackoff
+        self.statuses = list(p_statuses)
+        self.timeout = p_timeout
+
+    def delay(self, p_retry):
+        #backoff before retry number p_retry (0 for the first one), with up to 50% random jitter
+        delay = min(self.maxbackoff, self.backoff * (2 ** p_retry))
+        return delay + random.uniform(0, delay / 2)
+
+    def action(self, p_method, p_error=None, p_response=None):
+        #returns 'retry' when the request can be sent again, 'guard' when it can only be sent again
+        #after its guard checked that it was not applied, None when the outcome is final
+        if p_error is not None:
+            if notsent(p_error):
+                return 'retry'
+            if not isinstance(p_error, (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError)):
+                return None
+        elif p_response.status_code not in self.statuses:
+            return None
+        if p_method in IDEMPOTENT_METHODS:
+            return 'retry'
+        return 'guard'
+
+
+def notsent(p_error):
+    #True when a request failed before reaching the API, so sending it again cannot apply it twice
+    if isinstance(p_error, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(p_error, requests.ConnectionError) and len(p_error.args) > 0:
+        reason = getattr(p_error.args[0], 'reason', None)
+        return isinstance(reason, urllib3.exceptions.NewConnectionError)
+    return False
+
+
+def getpolicy():
+    #returns the retry policy used by all calls
+    global _policy
+    if _policy is None:
+        _policy = RetryPolicy()
+    return _policy
+
+
+def setpolicy(p_policy):
+    #replaces the retry policy, None restores the default one
+    global _policy
+    _policy = p_policy
+
+
+def guardedresponse(p_url, p_body):
+    #returns the answer of a POST found applied by its guard, as if the POST had been answered
+    r = requests.Response()
+    r.status_code = requests.codes.ok
+    r.url = p_url
+    r.encoding = 'utf-8'
+    r.headers['Content-Type'] = 'application/json'
+    r._content = json.dumps(p_body).encode('utf-8')
+    return r
+
+
+def retryafter(p_response):
+    #returns the number of seconds the API asks us to wait, with up to 50% random jitter added
+    try:
+        delay = float(p_response.headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        delay = DEFAULT_RETRY_AFTER
+    return delay + random.uniform(0, delay / 2)
+
+
+def baseurl(p_shardurl):
+    #returns the base URL of the API for a shard
+    #MERAKI_API_BASE_URL overrides all shards (used to redirect the scripts to a mock API)
+    override = os.environ.get('MERAKI_API_BASE_URL')
+    if override:
+        return override.rstrip('/')
+    return 'https://%s%s' % (p_shardurl, API_PATH)
+
+
+def getsession(p_apikey, p_shardurl):
+    #returns the pooled session for a shard/API key pair, creating it on first use
+    key = (p_shardurl, p_apikey)
+    with _sessionslock:
+        session = _sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update({'X-Cisco-Meraki-API-Key': p_apikey, 'Content-Type': 'application/json', 'Accept': 'application/json'})
+            _sessions[key] = session
+    return session
+
+
+def closesessions():
+    #closes all pooled sessions
+    with _sessionslock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+def addhook(p_hook):
+    #registers a function called with the record of every request sent
+    _hooks.append(p_hook)
+
+
+def removehook(p_hook):
+    if p_hook in _hooks:
+        _hooks.remove(p_hook)
+
+
+def _report(p_method, p_url, p_response, p_start, p_waited, p_retries, p_sent):
+    record = {'method': p_method, 'url': p_url, 'status': p_response.status_code, 'elapsed': time.monotonic() - p_start,
+              'waited': p_waited, 'retries': p_retries, 'bytessent': p_sent, 'bytesreceived': len(p_response.content)}
+    for hook in list(_hooks):
+        hook(record)
+
+
+def send(p_apikey, p_shardurl, p_method, p_url, p_data=None, p_params=None, p_guard=None):
+    #sends a request on the pooled session of the shard within the rate limit budget
+    #429 answers are retried after Retry-After (+ jitter) up to MAX_RATELIMIT_RETRIES times,
+    #transient failures as decided by the retry policy, see RetryPolicy and the guards above
+    session = getsession(p_apikey, p_shardurl)
+    limiter = getlimiter(p_shardurl)
+    policy = getpolicy()
+    throttled = 0
+    failures = 0
+    start = time.monotonic()
+    waited = 0.0
+    while True:
+        waited += limiter.acquire()
+        error = None
+        r = None
+        try:
+            r = session.request(p_method, p_url, data=p_data, params=p_params, timeout=policy.timeout)
+        except requests.RequestException as e:
+            error = e
+        if r is not None and r.status_code == 429 and throttled < MAX_RATELIMIT_RETRIES:
+            throttled += 1
+            limiter.pause(retryafter(r))
+            continue
+
+        action = policy.action(p_method, error, r)
+        if action == 'guard' and p_guard is not None:
+            #the POST may have been applied, it is only sent again if its guard says it was not
+            try:
+                body = p_guard()
+            except Exception:
+                body = None
+                action = None
+            if body is not None:
+                r = guardedresponse(p_url, body)
+                error = None
+                action = None
+        elif action == 'guard':
+            action = None
+        if action is None or failures + 1 >= policy.attempts:
+            if error is not None:
+                raise error
+            if _hooks:
+                sent = len(p_data.encode('utf-8')) if isinstance(p_data, str) else len(p_data or b'')
+                _report(p_method, r.url, r, start, waited, throttled + failures, sent * (throttled + failures + 1))
+            return r
+        time.sleep(policy.delay(failures))
+        failures += 1
+
+
+def request(p_apikey, p_shardurl, p_method, p_path, p_body=None, p_params=None, p_guard=None):
+    #sends one request to the Dashboard API. p_path is relative to /api/v1, e.g. '/organizations'
+    #p_body is serialized to JSON when given
+    data = None
+    if p_body is not None:
+        data = json.dumps(p_body)
+    return send(p_apikey, p_shardurl, p_method, baseurl(p_shardurl) + p_path, data, p_params, p_guard)
+
+
+def get(p_apikey, p_shardurl, p_path, p_params=None):
+    return request(p_apikey, p_shardurl, 'GET', p_path, p_params=p_params)
+
+
+def post(p_apikey, p_shardurl, p_path, p_body=None, p_guard=None):
+    #p_guard makes the POST safe to retry after a transient failure, see RetryPolicy
+    return request(p_apikey, p_shardurl, 'POST', p_path, p_body, p_guard=p_guard)
+
+
+def put(p_apikey, p_shardurl, p_path, p_body=None):
+    return request(p_apikey, p_shardurl, 'PUT', p_path, p_body)
+
+
+def delete(p_apikey, p_shardurl, p_path):
+    return request(p_apikey, p_shardurl, 'DELETE', p_path)
+
+
+def getlist(p_apikey, p_shardurl, p_path):
+    #GETs a list endpoint that is not paginated
+    #returns (status code, list of records), the list is empty on failure
+    r = get(p_apikey, p_shardurl, p_path)
+    if r.status_code != requests.codes.ok:
+        return (r.status_code, [])
+    return (r.status_code, r.json())
+
+
+def getall(p_apikey, p_shardurl, p_path, p_params=None):
+    #GETs a paginated list endpoint following the Link: rel=next headers
+    #returns (status code of the last page, list of all records)
+    #on failure the records fetched so far are returned with the failing status code
+    url = baseurl(p_shardurl) + p_path
+    params = dict(p_params or {})
+    params.setdefault('perPage', 1000)
+    records = []
+    while url:
+        r = send(p_apikey, p_shardurl, 'GET', url, p_params=params)
+        if r.status_code != requests.codes.ok:
+            return (r.status_code, records)
+        records.extend(r.json())
+        url = r.links.get('next', {}).get('url')
+        #the next link already carries the query string
+        params = None
+    return (requests.codes.ok, records)
+
+
+def parallelmap(p_function, p_items, p_workers=MAX_WORKERS):
+    #calls p_function on every item concurrently, returns the results in the order of p_items
+    #an exception raised by one of the calls (sys.exit included) is raised again here
+    #each call runs in a copy of the caller's context, so context variables follow the work
+    items = list(p_items)
+    if len(items) <= 1:
+        return [p_function(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(p_workers, len(items))) as executor:
+        contexts = [contextvars.copy_context() for item in items]
+        return list(executor.map(lambda context, item: context.run(p_function, item), contexts, items))
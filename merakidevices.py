@@ -0,0 +1,36 @@
+# Device helpers shared by the deploy scripts.
+#
+# All the fields of a device (name, tags, address, map marker, notes, coordinates) are collected
+#  by builddeviceupdate() and written with a single PUT /devices/{serial}, instead of one PUT per
+#  field.
+
+import merakiclient
+
+
+def builddeviceupdate(p_name=None, p_tags=None, p_address=None, p_notes=None, p_lat=None, p_lng=None, p_movemarker=None):
+    #returns the body of a device update. Fields left to None are not sent
+    #unless told otherwise the map marker follows the address when no coordinates are given
+    fields = {}
+    if p_name is not None:
+        fields['name'] = p_name
+    if p_tags is not None:
+        fields['tags'] = list(p_tags)
+    if p_address is not None:
+        fields['address'] = p_address
+    if p_notes is not None:
+        fields['notes'] = p_notes
+    if p_lat is not None and p_lng is not None:
+        fields['lat'] = p_lat
+        fields['lng'] = p_lng
+
+    if p_movemarker is None:
+        p_movemarker = p_address is not None and 'lat' not in fields
+    if p_address is not None or 'lat' in fields:
+        fields['moveMapMarker'] = bool(p_movemarker)
+
+    return(fields)
+
+
+def updatedevice(p_apikey, p_shardurl, p_devserial, p_fields):
+    #writes a device update built by builddeviceupdate() with one call, returns the response
+    return merakiclient.put(p_apikey, p_shardurl, '/devices/%s' % p_devserial, p_fields)
@@ -0,0 +1,171 @@
+# Machine-readable progress of the deploy scripts, as one JSON event per line.
+#
+# With --events <file> (or --events - for stdout) the scripts write, next to their usual text
+#  output, events that orchestrators can read without parsing the '@' lines:
+#   {"event": "step", "phase": "claim", "status": "ok", "duration": 0.41, ...}      one per phase
+#   {"event": "device", "phase": "device config", "serial": ..., "hostname": ..., "status": ...}
+#   {"event": "vlan", "phase": "VLANs", "vlan": 50, "status": "ok", ...}
+#   {"event": "message", "level": "error", "text": "ERROR 16: Unable to create network"}
+#   {"event": "summary", "status": "ok", "exitcode": 0, "duration": 8.1, "steps": {...}, ...}
+#  Every event also carries "time" (seconds since the start of the run) and "site" when known.
+#  With --events - the text output is moved to stderr, so stdout only carries JSON lines.
+#
+# begin() marks the start of a phase: the previous phase is reported as a step event, ok unless
+#  update(status=...) said otherwise, and the phase is also used to label the trace (merakitrace).
+#  end() reports the phase without starting another one. When the run stops early, stop() reports
+#  the phases in progress as failed before the summary.
+#  The event stream is a context variable, like the tracer, so events of calls made through
+#  merakiclient.parallelmap and of the sites of Deploy_Batch_v1.py go to the right stream. The
+#  phase in progress is one too: steps run at the same time by merakisteps each have their own.
+
+import sys, json, time, threading, contextvars
+import merakitrace
+
+_events = contextvars.ContextVar('events', default=None)
+_phase = contextvars.ContextVar('eventphase', default=None)
+
+
+class EventStream(object):
+    #writes the events of one run and keeps what the summary needs
+
+    def __init__(self, p_stream, p_site=None, p_close=False):
+        self.stream = p_stream
+        self.site = p_site
+        self.close = p_close
+        self.lock = threading.Lock()
+        self.start = time.time()
+        #phases in progress -> {'start', 'fields'}
+        self.phases = {}
+        #phase -> {'status', 'duration'}, in the order the phases ran
+        self.steps = {}
+        #event -> status -> count, for the device and VLAN events
+        self.counts = {}
+        self.results = {}
+        self.errors = []
+
+    def emit(self, p_event, p_fields):
+        record = {'time': round(time.time() - self.start, 3), 'event': p_event}
+        if self.site is not None:
+            record['site'] = self.site
+        record.update(p_fields)
+        with self.lock:
+            if p_event not in ('start', 'step', 'message', 'summary'):
+                counts = self.counts.setdefault(p_event, {})
+                counts[record.get('status')] = counts.get(record.get('status'), 0) + 1
+            self.stream.write(json.dumps(record) + '\n')
+            self.stream.flush()
+
+    def endphase(self, p_phase, p_status):
+        #reports a phase in progress as a step event
+        with self.lock:
+            phase = self.phases.pop(p_phase, None)
+            if phase is None:
+                return
+            fields = {'phase': p_phase, 'status': p_status, 'duration': round(time.time() - phase['start'], 3)}
+            fields.update(phase['fields'])
+            self.steps[p_phase] = {'status': fields['status'], 'duration': fields['duration']}
+        self.emit('step', fields)
+
+    def begin(self, p_phase):
+        with self.lock:
+            self.phases[p_phase] = {'start': time.time(), 'fields': {}}
+
+    def summary(self, p_status, p_exitcode):
+        for phase in list(self.phases):
+            self.endphase(phase, 'failed' if p_status != 'ok' else 'ok')
+        fields = {'status': p_status, 'exitcode': p_exitcode, 'duration': round(time.time() - self.start, 3), 'steps': self.steps}
+        fields.update(self.counts)
+        fields.update(self.results)
+        fields['errors'] = self.errors
+        self.emit('summary', fields)
+
+
+def start(p_target, p_site=None):
+    #starts writing the events of the current run to the file p_target, or to stdout for '-'
+    #with '-' the text output of the script is sent to stderr until stop()
+    if p_target == '-':
+        events = EventStream(sys.stdout, p_site)
+        sys.stdout = sys.stderr
+    else:
+        events = EventStream(open(p_target, 'w'), p_site, True)
+    _events.set(events)
+    _phase.set(None)
+    events.emit('start', {})
+    return events
+
+
+def stop(p_status='ok', p_exitcode=0):
+    #reports the phase in progress and the summary, then closes the event stream of the run
+    #does nothing when the run does not write events
+    events = _events.get()
+    if events is None:
+        return
+    _events.set(None)
+    events.summary(p_status, p_exitcode)
+    if events.close:
+        events.stream.close()
+    else:
+        sys.stdout = events.stream
+
+
+def begin(p_phase):
+    #starts a new phase of the run, ending the previous one
+    merakitrace.setphase(p_phase)
+    events = _events.get()
+    if events is not None:
+        end()
+        events.begin(p_phase)
+        _phase.set(p_phase)
+
+
+def end(p_status='ok'):
+    #ends the phase in progress, p_status unless update(status=...) said otherwise
+    events = _events.get()
+    phase = _phase.get()
+    if events is None or phase is None:
+        return
+    _phase.set(None)
+    events.endphase(phase, p_status)
+
+
+def update(**p_fields):
+    #adds fields to the step event of the phase in progress, status included
+    #fields other than status are also reported in the summary (networkId...)
+    events = _events.get()
+    if events is None:
+        return
+    with events.lock:
+        if _phase.get() in events.phases:
+            events.phases[_phase.get()]['fields'].update(p_fields)
+        for field in p_fields:
+            if field != 'status':
+                events.results[field] = p_fields[field]
+
+
+def emit(p_event, p_status, **p_fields):
+    #reports one item of the phase in progress (device, VLAN...)
+    events = _events.get()
+    if events is None:
+        return
+    fields = {'phase': merakitrace.getphase(), 'status': p_status}
+    for field in p_fields:
+        if isinstance(p_fields[field], float):
+            fields[field] = round(p_fields[field], 3)
+        else:
+            fields[field] = p_fields[field]
+    events.emit(p_event, fields)
+
+
+def message(p_text):
+    #reports a line of text meant for the user, ERROR and WARNING lines get their level
+    events = _events.get()
+    if events is None or p_text.strip() == '':
+        return
+    level = 'info'
+    if p_text.upper().startswith('ERROR'):
+        level = 'error'
+        with events.lock:
+            events.errors.append(p_text)
+    elif p_text.upper().startswith('WARNING'):
+        level = 'warning'
+    events.emit('message', {'phase': merakitrace.getphase(), 'level': level, 'text': p_text})
@@ -0,0 +1,92 @@
+# Location of the site addresses with the Google Maps APIs, with a persistent cache.
+#
+# locate() returns the coordinates and time zone of a street address: the geocode API gives its
+#  lat/lng, the zone at that point is resolved offline from the country and the zone boundaries
+#  (merakitz.py). The time zone API is only called for the addresses the boundaries do not cover.
+#
+# Results are kept on disk with the other cached lookups (see merakicache.py) for GEOCODE_TTL,
+#  under the normalized address (case, spaces and commas ignored). They do not depend on the API
+#  keys, so all runs share them: sites deployed at the same mall or city address, by
+#  Deploy_Batch_v1.py or in later runs, cost no Google call.
+#  Failed lookups are not cached, nor the locations whose time zone could not be found (their
+#  timeZone is 'null', the caller falls back to merakitz.py), so the cache only holds the zones
+#  given by Google or by a single-zone country. --refresh-cache looks every address up again.
+#  cached() reads the location of an address without calling Google, for runs without a key.
+#
+# The network creation waits for the lookups, so they have the timeouts of the Dashboard calls
+#  (merakiclient.REQUEST_TIMEOUT): a Google call that hangs cannot hold the deploy.
+#
+# GOOGLE_MAPS_BASE_URL points the calls to another server (mock API for benchmarks).
+
+import os, re, time, hashlib, threading, requests
+import merakiclient, merakicache, merakitz
+
+GEOCODE_TTL = 90 * 24 * 3600
+
+#normalized address -> lock, so concurrent sites at the same address call Google only once
+_locks = {}
+_lockslock = threading.Lock()
+
+
+def normalize(p_address):
+    #returns the address as used for the cache
+    return re.sub(r'[\s,]+', ' ', p_address).strip().lower()
+
+
+def locationpath(p_address):
+    #returns the cache file of an address
+    key = hashlib.sha256(normalize(p_address).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(merakicache.cachedir(), 'geocode', '%s.json' % key)
+
+
+def googleurl():
+    return os.environ.get('GOOGLE_MAPS_BASE_URL', 'https://maps.googleapis.com').rstrip('/')
+
+
+def lookup(p_googlekey, p_address, p_site=''):
+    #asks Google for the location of an address, returns {'lat', 'lng', 'timeZone'} or 'null'
+    #the time zone comes from merakitz, from the time zone API when merakitz only has the default
+    #zone of the country. It is 'null' when the time zone API cannot be used
+    #requests exceptions of the geocode call are raised to the caller
+    r = requests.get('%s/maps/api/geocode/json' % googleurl(), params={'address': p_address, 'key': p_googlekey}, timeout=merakiclient.REQUEST_TIMEOUT)
+    rjson = r.json()
+    if rjson['status'] != 'OK':
+        return('null')
+    glatitude = rjson['results'][0]['geometry']['location']['lat']
+    glongitude = rjson['results'][0]['geometry']['location']['lng']
+
+    timezone, exact = merakitz.resolve(p_site, glatitude, glongitude)
+    if not exact:
+        timezone = 'null'
+        try:
+            s = requests.get('%s/maps/api/timezone/json' % googleurl(), params={'location': '%s,%s' % (glatitude, glongitude), 'timestamp': '%f' % time.time(), 'key': p_googlekey}, timeout=merakiclient.REQUEST_TIMEOUT)
+            sjson = s.json()
+            if sjson['status'] == 'OK':
+                timezone = sjson['timeZoneId']
+        except (requests.RequestException, ValueError):
+            pass
+    return {'lat': glatitude, 'lng': glongitude, 'timeZone': timezone}
+
+
+def cached(p_address):
+    #returns the location of an address found by an earlier run, or 'null'
+    location = merakicache.load(locationpath(p_address), GEOCODE_TTL)
+    if location is None:
+        return('null')
+    return(location)
+
+
+def locate(p_googlekey, p_address, p_site=''):
+    #returns {'lat', 'lng', 'timeZone'} of an address, from the cache when it was located before
+    #on failure returns 'null', requests exceptions are raised to the caller
+    with _lockslock:
+        lock = _locks.setdefault(normalize(p_address), threading.Lock())
+    with lock:
+        location = cached(p_address)
+        if location != 'null':
+            return location
+        location = lookup(p_googlekey, p_address, p_site)
+        #a location without its time zone is not cached, the next run asks Google again
+        if location != 'null' and location['timeZone'] != 'null':
+            merakicache.save(locationpath(p_address), location)
+        return location
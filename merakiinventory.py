@@ -0,0 +1,86 @@
+# Organization inventory helpers shared by the deploy scripts.
+#
+# Claiming uses a single /organizations/{id}/inventory/claim call for all serials of a site. The
+#  endpoint accepts a list of serials; the serials it does not report back as claimed (or all of
+#  them, if the batch call is rejected) are claimed again one at a time, so one bad serial does not
+#  stop the rest of the site from being claimed.
+#
+# Device models, networks and MAC addresses are read for all serials of a site with a single
+#  paginated getOrganizationInventoryDevices call instead of one lookup per serial.
+#
+# The claims are guarded (see merakiclient.RetryPolicy): after a transient failure the inventory or
+#  the network devices are read back, and a claim is only sent again when its serials are missing.
+
+import requests
+import merakiclient
+
+
+def claimdevicesorg(p_apikey, p_shardurl, p_orgid, p_serials):
+    #claims a list of devices into an org without adding them to a network
+    #returns the list of serials that could not be claimed
+    serials = list(p_serials)
+    if len(serials) == 0:
+        return([])
+
+    r = merakiclient.post(p_apikey, p_shardurl, '/organizations/%s/inventory/claim' % p_orgid, {'serials': serials}, orgclaimguard(p_apikey, p_shardurl, p_orgid, serials))
+    if r.status_code == requests.codes.ok:
+        claimed = r.json().get('serials', serials)
+        retry = [serial for serial in serials if serial not in claimed]
+    else:
+        print(r.status_code)
+        print(r.content)
+        retry = serials
+
+    #a single serial rejected by the batch call would be rejected again
+    if len(serials) == 1:
+        return(retry)
+
+    failed = []
+    for serial in retry:
+        print('Claiming device %s on its own' % serial)
+        r = merakiclient.post(p_apikey, p_shardurl, '/organizations/%s/inventory/claim' % p_orgid, {'serials': [serial]}, orgclaimguard(p_apikey, p_shardurl, p_orgid, [serial]))
+        if r.status_code != requests.codes.ok:
+            print(r.status_code)
+            print(r.content)
+            failed.append(serial)
+
+    return(failed)
+
+
+def getinventory(p_apikey, p_shardurl, p_orgid, p_serials=None):
+    #reads the org inventory with one paginated call, filtered on p_serials when given
+    #returns (status code, {serial: {'serial', 'model', 'networkId', 'mac', 'claimedAt'}})
+    params = {}
+    if p_serials:
+        params['serials[]'] = list(p_serials)
+    status, records = merakiclient.getall(p_apikey, p_shardurl, '/organizations/%s/inventory/devices' % p_orgid, params)
+
+    inventory = {}
+    for record in records:
+        inventory[record['serial']] = {'serial': record['serial'], 'model': record.get('model'), 'networkId': record.get('networkId'), 'mac': record.get('mac'), 'claimedAt': record.get('claimedAt')}
+    return(status, inventory)
+
+
+def orgclaimguard(p_apikey, p_shardurl, p_orgid, p_serials):
+    #returns the guard of an org claim POST: the claim answer, if all serials are in the inventory
+    def guard():
+        status, inventory = getinventory(p_apikey, p_shardurl, p_orgid, p_serials)
+        if status != requests.codes.ok:
+            raise IOError('Unable to read the inventory of organization %s' % p_orgid)
+        if all(serial in inventory for serial in p_serials):
+            return {'serials': list(p_serials)}
+        return None
+    return guard
+
+
+def networkclaimguard(p_apikey, p_shardurl, p_nwid, p_serials):
+    #returns the guard of a network claim POST: the claim answer, if all serials are in the network
+    def guard():
+        r = merakiclient.get(p_apikey, p_shardurl, '/networks/%s/devices' % p_nwid)
+        if r.status_code != requests.codes.ok:
+            raise IOError('Unable to read the devices of network %s' % p_nwid)
+        serials = [device['serial'] for device in r.json()]
+        if all(serial in serials for serial in p_serials):
+            return {'serials': list(p_serials)}
+        return None
+    return guard
@@ -0,0 +1,80 @@
+# Checkpoint journal of the site deploys of Deploy_Site_v42.py.
+#
+# Every step of a deploy that completes is recorded, with the IDs it returned, in a small JSON file
+#  per site kept with the lookup cache (see merakicache.py). When a deploy stops half way, on an
+#  ERROR, a dropped connection or Ctrl-C, it can be run again with --resume: the recorded steps are
+#  skipped and their IDs read back from the journal, so the run goes straight to the first
+#  unfinished step without claiming, creating or listing again. Without --resume a deploy starts
+#  from the beginning and replaces the journal once it checked that the network does not exist
+#  yet: until release() its steps are only kept in memory, so a run that stops on ERROR 14 because
+#  the interrupted run already created the network does not lose the journal of that run.
+#
+# A journal only applies to the parameters it was written with: resuming with other serials,
+#  template, subnet, address, tags or guest setting starts from the beginning. Journals are removed
+#  when the deploy completes and ignored once older than JOURNAL_TTL.
+
+import re, json, time, threading
+import merakicache
+
+JOURNAL_TTL = 7 * 24 * 3600
+
+
+def journalpath(p_apikey, p_shardurl, p_site):
+    #returns the journal file of a site
+    return merakicache.cachepath(p_apikey, p_shardurl, 'journal_%s' % re.sub(r'[^A-Za-z0-9_.-]', '_', p_site))
+
+
+class Journal(object):
+    #steps completed by the deploy of one site, step -> dict of the values it returned
+
+    def __init__(self, p_path, p_params):
+        self.path = p_path
+        self.params = p_params
+        self.steps = {}
+        self.lock = threading.Lock()
+        #while held, completed steps are not written
+        self.held = False
+
+    def load(self):
+        #reads the journal written by an earlier run with the same parameters
+        #returns True when there are steps to resume
+        try:
+            with open(self.path) as journalfile:
+                entry = json.load(journalfile)
+        except (OSError, ValueError):
+            return False
+        data = entry.get('data') if isinstance(entry, dict) else None
+        if not isinstance(data, dict) or time.time() - entry.get('savedAt', 0) > JOURNAL_TTL or data.get('params') != self.params:
+            return False
+        self.steps = data.get('steps', {})
+        return len(self.steps) > 0
+
+    def done(self, p_step):
+        return p_step in self.steps
+
+    def get(self, p_step, p_field, p_default='null'):
+        #returns a value recorded with a completed step
+        return self.steps.get(p_step, {}).get(p_field, p_default)
+
+    def record(self, p_step, **p_values):
+        #marks a step as completed and writes the journal, steps may complete at the same time
+        with self.lock:
+            self.steps[p_step] = p_values
+            if not self.held:
+                merakicache.save(self.path, {'params': self.params, 'steps': dict(self.steps)})
+
+    def hold(self):
+        #keeps the steps completed from now on in memory, the journal file is left as it is
+        self.held = True
+
+    def release(self):
+        #writes the steps completed while held and the following ones
+        with self.lock:
+            self.held = False
+            if len(self.steps) > 0:
+                merakicache.save(self.path, {'params': self.params, 'steps': dict(self.steps)})
+
+    def clear(self):
+        #removes the journal once the deploy is complete
+        self.steps = {}
+        merakicache.invalidate(self.path)
@@ -0,0 +1,156 @@
+# Organization network index shared by the deploy scripts.
+#
+# Looking up a network ID by name used to page through the whole organization network list every
+#  time (three full listings per site deploy). NetworkIndex lists the networks once, keeps a
+#  name -> id dict in memory and on disk (merakicache, 15 minutes TTL by default), and is updated
+#  in place with the ID returned when a network is created.
+#
+# A stale index can miss networks created by someone else in the meantime; creating a network
+#  with a taken name is then rejected by the API, and the index is dropped so the next lookup
+#  lists the organization again. It can also still hold networks deleted or renamed since it was
+#  written: a name found in an index read from disk is confirmed with GET /networks/{id} before
+#  it is returned, and the organization is listed again when the network is gone or renamed.
+#
+# createguard(), bindguard() and unbindguard() return the guards that let merakiclient send the
+#  create, bind and unbind POSTs again after a transient failure: they read the network back and
+#  return it when the POST was already applied.
+
+import threading, requests
+import merakiclient, merakicache
+
+NETWORK_INDEX_TTL = 15 * 60
+
+_indexes = {}
+_indexeslock = threading.Lock()
+
+
+class NetworkIndex(object):
+    #name -> network ID for one organization
+
+    def __init__(self, p_apikey, p_shardurl, p_orgid, p_ttl=NETWORK_INDEX_TTL):
+        self.apikey = p_apikey
+        self.shardurl = p_shardurl
+        self.orgid = p_orgid
+        self.ttl = p_ttl
+        self.path = merakicache.cachepath(p_apikey, p_shardurl, 'networks_%s' % p_orgid)
+        self.names = None
+        #names known to be current: listed by this process, created or confirmed since
+        self.confirmed = set()
+        self.lock = threading.RLock()
+
+    def load(self):
+        #fills the index from disk when fresh, from the API otherwise. Returns the API status code
+        with self.lock:
+            if self.names is not None:
+                return requests.codes.ok
+            cached = merakicache.load(self.path, self.ttl)
+            if cached is not None:
+                self.names = cached
+                self.confirmed = set()
+                return requests.codes.ok
+            return self.refresh()
+
+    def refresh(self):
+        #lists all networks of the organization again. Returns the API status code
+        with self.lock:
+            status, records = merakiclient.getall(self.apikey, self.shardurl, '/organizations/%s/networks' % self.orgid)
+            if status != requests.codes.ok:
+                return status
+            self.names = dict((record['name'], record['id']) for record in records)
+            self.confirmed = set(self.names)
+            merakicache.save(self.path, self.names)
+            return status
+
+    def lookup(self, p_name):
+        #returns (status code, network ID or 'null')
+        #a network found in the index read from disk is read back, it may have been deleted since
+        with self.lock:
+            status = self.load()
+            if status != requests.codes.ok:
+                return (status, 'null')
+            nwid = self.names.get(p_name, 'null')
+            if nwid == 'null' or p_name in self.confirmed:
+                return (status, nwid)
+            r = merakiclient.get(self.apikey, self.shardurl, '/networks/%s' % nwid)
+            if r.status_code == requests.codes.ok and r.json().get('name') == p_name:
+                self.confirmed.add(p_name)
+                return (status, nwid)
+            if r.status_code != requests.codes.ok and r.status_code != requests.codes.not_found:
+                return (r.status_code, 'null')
+            #deleted or renamed, list the organization again
+            status = self.refresh()
+            if status != requests.codes.ok:
+                return (status, 'null')
+            return (status, self.names.get(p_name, 'null'))
+
+    def add(self, p_network):
+        #records a network returned by the create network call
+        with self.lock:
+            if self.load() == requests.codes.ok:
+                self.names[p_network['name']] = p_network['id']
+                self.confirmed.add(p_network['name'])
+                merakicache.save(self.path, self.names)
+
+    def invalidate(self):
+        #forgets the index, the next lookup lists the organization again
+        with self.lock:
+            self.names = None
+            merakicache.invalidate(self.path)
+
+
+def getnetworkindex(p_apikey, p_shardurl, p_orgid):
+    #returns the network index of an organization, shared by all callers of the process
+    key = (p_apikey, p_shardurl, p_orgid)
+    with _indexeslock:
+        index = _indexes.get(key)
+        if index is None:
+            index = NetworkIndex(p_apikey, p_shardurl, p_orgid)
+            _indexes[key] = index
+    return index
+
+
+def clearindexes():
+    #forgets the in-memory indexes of all organizations (the disk cache is kept)
+    with _indexeslock:
+        _indexes.clear()
+
+
+def createguard(p_apikey, p_shardurl, p_orgid, p_name):
+    #returns the guard of the create network POST: the network, if it was created in the end
+    def guard():
+        index = getnetworkindex(p_apikey, p_shardurl, p_orgid)
+        if index.refresh() != requests.codes.ok:
+            raise IOError('Unable to list the networks of organization %s' % p_orgid)
+        status, nwid = index.lookup(p_name)
+        if nwid == 'null':
+            return None
+        return getnetwork(p_apikey, p_shardurl, nwid)
+    return guard
+
+
+def bindguard(p_apikey, p_shardurl, p_nwid, p_templateid):
+    #returns the guard of the bind POST: the network, if it is bound to the template
+    def guard():
+        network = getnetwork(p_apikey, p_shardurl, p_nwid)
+        if network.get('configTemplateId') == p_templateid:
+            return network
+        return None
+    return guard
+
+
+def unbindguard(p_apikey, p_shardurl, p_nwid):
+    #returns the guard of the unbind POST: the network, if it is not bound anymore
+    def guard():
+        network = getnetwork(p_apikey, p_shardurl, p_nwid)
+        if not network.get('isBoundToConfigTemplate', False):
+            return network
+        return None
+    return guard
+
+
+def getnetwork(p_apikey, p_shardurl, p_nwid):
+    #reads a network, raises IOError when it cannot be read
+    r = merakiclient.get(p_apikey, p_shardurl, '/networks/%s' % p_nwid)
+    if r.status_code != requests.codes.ok:
+        raise IOError('Unable to read network %s (%s)' % (p_nwid, r.status_code))
+    return r.json()
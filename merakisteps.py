@@ -0,0 +1,81 @@
+# Dependency graph of the steps of a site deploy and the scheduler that runs it.
+#
+# A deploy is declared as steps, each with the steps it needs:
+#   steps = merakisteps.StepGraph()
+#   steps.add('org lookup', lookuporg)
+#   steps.add('template lookup', lookuptemplate, ['org lookup'])
+#   steps.add('claim', claimorg, ['org lookup'])
+#   steps.add('bind', bind, ['template lookup', 'claim'])
+#   steps.run()
+#  run() starts every step as soon as the steps it needs are done, so independent steps (template
+#  lookup, network check, claims, Google lookups) run at the same time on a small thread pool and a
+#  deploy takes the time of its critical path instead of the sum of its steps. Steps share their
+#  results through the variables of the script, a step only reads what the steps it needs set.
+#
+# Every step runs in a copy of the context of run() and is reported as its own phase (see
+#  merakievents.begin/end), so the trace and the events of steps that overlap are not mixed.
+#
+# When a step fails, sys.exit() on an ERROR included, no new step is started: the steps already
+#  running are allowed to finish and run() raises the exception of the first step that failed.
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+import merakievents
+
+MAX_STEP_WORKERS = 8
+
+
+class StepGraph(object):
+    #steps of a deploy and the steps each of them needs
+
+    def __init__(self):
+        #step -> (function, steps it needs), in the order the steps were added
+        self.steps = {}
+
+    def add(self, p_name, p_function, p_needs=[]):
+        #adds a step. The steps it needs must have been added before, so the graph has no cycles
+        for need in p_needs:
+            if need not in self.steps:
+                raise ValueError('Step %s needs unknown step %s' % (p_name, need))
+        self.steps[p_name] = (p_function, list(p_needs))
+
+    def ready(self, p_done, p_running):
+        #returns the steps that are not started yet and have all the steps they need done
+        return [name for name in self.steps if name not in p_done and name not in p_running and all(need in p_done for need in self.steps[name][1])]
+
+    def runstep(self, p_name):
+        merakievents.begin(p_name)
+        try:
+            self.steps[p_name][0]()
+        except BaseException:
+            merakievents.end('failed')
+            raise
+        merakievents.end()
+
+    def run(self, p_workers=MAX_STEP_WORKERS):
+        #runs all the steps, each one as soon as the steps it needs are done
+        done = []
+        #future -> step
+        running = {}
+        error = None
+        with ThreadPoolExecutor(max_workers=p_workers) as executor:
+            while True:
+                if error is None:
+                    for name in self.ready(done, running.values()):
+                        context = contextvars.copy_context()
+                        running[executor.submit(context.run, self.runstep, name)] = name
+                if len(running) == 0:
+                    break
+                finished, pending = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        future.result()
+                    except BaseException as e:
+                        if error is None:
+                            error = e
+                        continue
+                    done.append(name)
+        if error is not None:
+            raise error
+        return done
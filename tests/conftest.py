@@ -0,0 +1,4 @@
+# The scripts and their modules live at the top of the repository, not in a package
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,157 @@
+# Tests of the retries of merakiclient.py: the decision of RetryPolicy.action() and the way send()
+#  follows it, with a stubbed session in place of the Dashboard
+
+import json
+import pytest
+import requests, urllib3
+import merakiclient
+
+URL = 'https://api.example.test/api/v1/organizations/1/networks'
+
+
+def response(p_status, p_body=None, p_headers={}):
+    r = requests.Response()
+    r.status_code = p_status
+    r.url = URL
+    r.headers.update(p_headers)
+    r._content = json.dumps(p_body if p_body is not None else {}).encode('utf-8')
+    return r
+
+
+def refused():
+    #connection refused: the request never reached the API
+    reason = urllib3.exceptions.NewConnectionError(None, 'Connection refused')
+    return requests.ConnectionError(urllib3.exceptions.MaxRetryError(None, URL, reason))
+
+
+def dropped():
+    #connection dropped after the request was sent
+    return requests.ConnectionError(urllib3.exceptions.ProtocolError('Connection aborted.'))
+
+
+class StubSession(object):
+    #answers the requests with the responses or exceptions it is given, in order
+
+    def __init__(self, p_answers):
+        self.answers = list(p_answers)
+        self.calls = []
+
+    def request(self, p_method, p_url, data=None, params=None, timeout=None):
+        self.calls.append(p_method)
+        answer = self.answers.pop(0)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+
+@pytest.fixture
+def session(monkeypatch):
+    #returns a function installing a stub session, retries are sent without backoff
+    def stub(*p_answers):
+        stubsession = StubSession(p_answers)
+        monkeypatch.setattr(merakiclient, 'getsession', lambda p_apikey, p_shardurl: stubsession)
+        return stubsession
+    merakiclient.setpolicy(merakiclient.RetryPolicy(p_attempts=3, p_backoff=0))
+    yield stub
+    merakiclient.setpolicy(None)
+
+
+def send(p_method, p_guard=None):
+    return merakiclient.send('key', 'shard.example.test', p_method, URL, '{}', None, p_guard)
+
+
+@pytest.mark.parametrize('method, error, status, action', [
+    ('GET', None, 200, None),
+    ('GET', None, 404, None),
+    ('GET', None, 503, 'retry'),
+    ('PUT', None, 500, 'retry'),
+    ('DELETE', None, 502, 'retry'),
+    ('POST', None, 503, 'guard'),
+    ('POST', None, 400, None),
+    ('GET', dropped(), None, 'retry'),
+    ('POST', dropped(), None, 'guard'),
+    ('POST', requests.exceptions.ReadTimeout(), None, 'guard'),
+    ('POST', requests.exceptions.ConnectTimeout(), None, 'retry'),
+    ('POST', refused(), None, 'retry'),
+    ('POST', requests.exceptions.InvalidURL(), None, None),
+])
+def test_action(method, error, status, action):
+    r = response(status) if status is not None else None
+    assert merakiclient.RetryPolicy().action(method, error, r) == action
+
+
+def test_get_is_retried(session):
+    stub = session(response(503), dropped(), response(200, {'id': 'N_1'}))
+    assert send('GET').json() == {'id': 'N_1'}
+    assert len(stub.calls) == 3
+
+
+def test_attempts_used_up(session):
+    stub = session(response(503), response(503), response(503), response(200))
+    assert send('PUT').status_code == 503
+    assert len(stub.calls) == 3
+
+
+def test_error_raised_once_attempts_used_up(session):
+    stub = session(dropped(), dropped(), dropped())
+    with pytest.raises(requests.ConnectionError):
+        send('GET')
+    assert len(stub.calls) == 3
+
+
+def test_client_error_not_retried(session):
+    stub = session(response(400), response(200))
+    assert send('GET').status_code == 400
+    assert len(stub.calls) == 1
+
+
+def test_ratelimit_retried(session):
+    stub = session(response(429, p_headers={'Retry-After': '0'}), response(200))
+    assert send('POST').status_code == 200
+    assert len(stub.calls) == 2
+
+
+def test_post_without_guard_not_sent_again(session):
+    stub = session(response(503), response(201))
+    assert send('POST').status_code == 503
+    stub = session(dropped(), response(201))
+    with pytest.raises(requests.ConnectionError):
+        send('POST')
+    assert len(stub.calls) == 1
+
+
+def test_post_not_sent_is_retried(session):
+    stub = session(refused(), requests.exceptions.ConnectTimeout(), response(201, {'id': 'N_1'}))
+    assert send('POST').json() == {'id': 'N_1'}
+    assert len(stub.calls) == 3
+
+
+def test_guard_finds_post_applied(session):
+    stub = session(dropped(), response(201))
+    guards = []
+    r = send('POST', lambda: guards.append(1) or {'id': 'N_1'})
+    assert (r.status_code, r.json()) == (200, {'id': 'N_1'})
+    assert len(stub.calls) == 1
+    assert len(guards) == 1
+
+
+def test_guard_finds_post_not_applied(session):
+    stub = session(response(503), response(201, {'id': 'N_1'}))
+    r = send('POST', lambda: None)
+    assert (r.status_code, r.json()) == (201, {'id': 'N_1'})
+    assert len(stub.calls) == 2
+
+
+def test_guard_failing_stops_the_retries(session):
+    def guard():
+        raise requests.ConnectionError('guard failed')
+    stub = session(response(503), response(201))
+    assert send('POST', guard).status_code == 503
+    assert len(stub.calls) == 1
+
+
+def test_guard_not_called_for_final_answers(session):
+    def guard():
+        raise AssertionError('guard called')
+    session(response(400))
+    assert send('POST', guard).status_code == 400
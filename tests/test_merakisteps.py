@@ -0,0 +1,101 @@
+# Tests of the deploy step scheduler of merakisteps.py, with stub steps
+
+import sys, time, threading, contextvars
+import pytest
+import merakisteps
+
+
+def test_steps_wait_for_their_needs():
+    started = []
+    graph = merakisteps.StepGraph()
+    graph.add('org', lambda: started.append('org'))
+    graph.add('template', lambda: started.append('template'), ['org'])
+    graph.add('claim', lambda: started.append('claim'), ['org'])
+    graph.add('bind', lambda: started.append('bind'), ['template', 'claim'])
+    done = graph.run()
+    assert sorted(done) == ['bind', 'claim', 'org', 'template']
+    assert started[0] == 'org'
+    assert started[-1] == 'bind'
+
+
+def test_independent_steps_overlap():
+    #each step waits for the other one, they only finish if they run at the same time
+    barrier = threading.Barrier(2, timeout=5)
+    graph = merakisteps.StepGraph()
+    graph.add('template', barrier.wait)
+    graph.add('google', barrier.wait)
+    assert sorted(graph.run()) == ['google', 'template']
+
+
+def test_unknown_need():
+    graph = merakisteps.StepGraph()
+    with pytest.raises(ValueError):
+        graph.add('bind', lambda: None, ['claim'])
+
+
+def test_steps_run_in_the_context_of_run():
+    site = contextvars.ContextVar('site')
+    seen = []
+    graph = merakisteps.StepGraph()
+    graph.add('org', lambda: seen.append(site.get()))
+    site.set('CHGVA01_CAR')
+    graph.run()
+    assert seen == ['CHGVA01_CAR']
+
+
+def failinggraph(p_failure):
+    #'fail' fails while 'slow' is running, 'after' needs 'slow'
+    steps = []
+    failing = threading.Event()
+
+    def fail():
+        failing.set()
+        raise p_failure
+
+    def slow():
+        failing.wait(5)
+        time.sleep(0.2)
+        steps.append('slow')
+
+    graph = merakisteps.StepGraph()
+    graph.add('fail', fail)
+    graph.add('slow', slow)
+    graph.add('after', lambda: steps.append('after'), ['slow'])
+    return graph, steps
+
+
+def test_failing_step_stops_new_steps():
+    graph, steps = failinggraph(ValueError('bad subnet'))
+    with pytest.raises(ValueError):
+        graph.run()
+    #the running step was allowed to finish, no step was started after the failure
+    assert steps == ['slow']
+
+
+def test_exit_in_a_step():
+    graph, steps = failinggraph(SystemExit(2))
+    with pytest.raises(SystemExit) as e:
+        graph.run()
+    assert e.value.code == 2
+    assert steps == ['slow']
+
+
+def test_first_failure_is_raised():
+    #'claim' exits first, 'template' was running and fails after it
+    exited = threading.Event()
+
+    def claim():
+        exited.set()
+        sys.exit(3)
+
+    def template():
+        exited.wait(5)
+        time.sleep(0.2)
+        raise ValueError('template')
+
+    graph = merakisteps.StepGraph()
+    graph.add('claim', claim)
+    graph.add('template', template)
+    with pytest.raises(SystemExit) as e:
+        graph.run()
+    assert e.value.code == 3
@@ -0,0 +1,66 @@
+# Tests of the offline time zone resolution of merakitz.py
+
+import pytest
+import merakitz, merakitzdata
+
+
+@pytest.mark.parametrize('site, zone', [
+    ('CHGVA01_CAR', 'Europe/Zurich'),
+    ('UKLON01_CAR', 'Europe/London'),
+    ('ELATH01_CAR', 'Europe/Athens'),
+    ('chgva01_car', 'Europe/Zurich'),
+])
+def test_single_zone_country(site, zone):
+    assert merakitz.resolve(site) == (zone, True)
+    #the coordinates are not needed
+    assert merakitz.resolve(site, 0.0, 0.0) == (zone, True)
+
+
+@pytest.mark.parametrize('site, lat, lng, zone', [
+    ('USSEA01_CAR', 47.61, -122.33, 'America/Los_Angeles'),
+    ('USDAL01_CAR', 32.78, -96.80, 'America/Chicago'),
+    ('USELP01_CAR', 31.76, -106.49, 'America/Denver'),
+    ('USPHX01_CAR', 33.45, -112.07, 'America/Phoenix'),
+    ('USHNL01_CAR', 21.31, -157.86, 'Pacific/Honolulu'),
+    ('USMIA01_CAR', 25.79, -80.13, 'America/New_York'),
+    ('CAVAN01_CAR', 49.28, -123.12, 'America/Vancouver'),
+    ('AUPER01_CAR', -31.95, 115.86, 'Australia/Perth'),
+    ('AUSYD01_CAR', -33.87, 151.21, 'Australia/Sydney'),
+    ('RUVVO01_CAR', 43.12, 131.89, 'Asia/Vladivostok'),
+    ('BRMAO01_CAR', -3.12, -60.02, 'America/Manaus'),
+    ('ESLPA01_CAR', 28.12, -15.43, 'Atlantic/Canary'),
+    ('PTFNC01_CAR', 32.65, -16.91, 'Atlantic/Madeira'),
+    ('CNURC01_CAR', 43.83, 87.62, 'Asia/Urumqi'),
+    ('MXTIJ01_CAR', 32.51, -117.04, 'America/Tijuana'),
+])
+def test_zone_boundaries(site, lat, lng, zone):
+    assert merakitz.resolve(site, lat, lng) == (zone, True)
+
+
+def test_unknown_country_with_coordinates():
+    assert merakitz.resolve('XXSEA01_CAR', 47.61, -122.33) == ('America/Los_Angeles', True)
+    #only the countries with several zones have boundaries
+    assert merakitz.resolve('XXGVA01_CAR', 46.20, 6.14) == ('null', False)
+    assert merakitz.resolve('XXGVA01_CAR') == ('null', False)
+
+
+def test_default_zone():
+    #without coordinates, or outside the boundaries of the country
+    assert merakitz.resolve('USSEA01_CAR') == ('America/New_York', False)
+    assert merakitz.resolve('USSEA01_CAR', 46.20, 6.14) == ('America/New_York', False)
+    assert merakitz.resolve('AUSYD01_CAR') == ('Australia/Sydney', False)
+    assert merakitz.resolve('CATOR01_CAR') == ('America/Toronto', False)
+
+
+def test_every_country_has_zones():
+    multizone = set(merakitzdata.ZONES) - merakitzdata.UNIFORM
+    assert set(merakitz.DEFAULT_ZONES) == multizone
+    for code in multizone:
+        assert merakitz.DEFAULT_ZONES[code] in merakitzdata.ZONES[code]
+        for zone in merakitzdata.ZONES[code]:
+            assert len(merakitz.boundaries(zone)) > 0, zone
+
+
+def test_decodering():
+    #(46.2, 6.14), then the differences (+0.01, -0.04) and (-46.21, -122.33), in hundredths of degree
+    assert merakitz.decodering('w_Hke@AFx_Hp{V') == [(46.2, 6.14), (46.21, 6.1), (0.0, -116.23)]
@@ -0,0 +1,166 @@
+# Tests of the VLAN plans of merakivlans.py, run with: python -m pytest tests
+
+import pytest
+import merakivlans
+
+#VLANs (ID, name, subnet, appliance IP) written by the updatevlan* functions of Deploy_Site_v42.py
+#before the VLAN plans, for the site 10.20.30.
+OLD_VLANS = {
+    'btq': [
+        (10, '10-Voice', '10.20.30.64/27', '10.20.30.65'),
+        (20, '20-POS-HUB', '10.20.30.96/27', '10.20.30.97'),
+        (30, '30-CC_Terms', '10.20.30.128/27', '10.20.30.129'),
+        (50, '50-PCs-Printers', '10.20.30.0/26', '10.20.30.1'),
+        (55, '55-Printers', '10.20.30.208/28', '10.20.30.209'),
+        (60, '60-NonIT', '10.20.30.224/27', '10.20.30.225'),
+        (80, '80-Reserved', '10.20.30.208/28', '10.20.30.209'),
+        (100, '100-Reserved', '10.20.30.160/27', '10.20.30.161'),
+        (400, 'Management', '10.20.30.192/28', '10.20.30.193'),
+    ],
+    'largebtq': [
+        (10, '10-Voice', '10.20.30.0/26', '10.20.30.1'),
+        (20, '20-POS-HUB', '10.20.30.64/26', '10.20.30.65'),
+        (30, '30-CC_Terms', '10.20.30.128/26', '10.20.30.129'),
+        (50, '50-PCs-Printers', '10.20.31.0/25', '10.20.31.1'),
+        (60, '60-NonIT', '10.20.31.128/27', '10.20.31.129'),
+        (100, '100-CCTV', '10.20.31.192/26', '10.20.31.193'),
+        (400, 'Management', '10.20.30.192/26', '10.20.30.193'),
+    ],
+    'office': [
+        (100, '100-PCs-Printers', '10.20.30.0/24', '10.20.30.1'),
+        (300, '300-Voice-VideoConf', '10.20.31.0/26', '10.20.31.1'),
+        (600, '600-Non-IT-CCTV', '10.20.31.128/27', '10.20.31.129'),
+        (999, 'Management', '10.20.31.192/27', '10.20.31.193'),
+    ],
+    'ztnaoffice': [
+        #the old function sent 10.20.31.65, outside the subnet of the VLAN
+        (200, '200-Printers', '10.20.30.64/27', '10.20.30.65'),
+        (300, '300-Voice-VideoConf', '10.20.31.0/26', '10.20.31.1'),
+        (600, '600-Non-IT-CCTV', '10.20.31.128/27', '10.20.31.129'),
+        (999, 'Management', '10.20.31.192/27', '10.20.31.193'),
+    ],
+    'ztnamanuf': [
+        (152, '152-RCCWH', '10.20.31.128/26', '10.20.31.129'),
+        (200, '200-Printers', '10.20.30.0/26', '10.20.30.1'),
+        (300, '300-Voice-VideoConf', '10.20.31.0/26', '10.20.31.1'),
+        (711, '711-TustedManuf', '10.20.30.192/27', '10.20.30.193'),
+        (731, '731-Non-IT', '10.20.30.64/26', '10.20.30.65'),
+        (732, '732-CCTV', '10.20.30.128/26', '10.20.30.129'),
+        (811, '811-UntrustedManuf', '10.20.30.224/27', '10.20.30.225'),
+        (999, 'Management', '10.20.31.192/26', '10.20.31.193'),
+    ],
+    'ricmanuf': [
+        (100, '100-PCs-Printers', '10.20.31.0/25', '10.20.31.1'),
+        (152, '152-RCCWH', '10.20.31.128/26', '10.20.31.129'),
+        (300, '300-Voice-VideoConf', '10.20.30.0/26', '10.20.30.1'),
+        (711, '711-TustedManuf', '10.20.30.192/27', '10.20.30.193'),
+        (731, '731-Non-IT', '10.20.30.64/26', '10.20.30.65'),
+        (732, '732-CCTV', '10.20.30.128/26', '10.20.30.129'),
+        (811, '811-UntrustedManuf', '10.20.30.224/27', '10.20.30.225'),
+        (999, 'Management', '10.20.31.192/26', '10.20.31.193'),
+    ],
+    #the old function stopped on VLAN 152 with an UnboundLocalError, these are the VLANs it wrote
+    #once that is fixed
+    'vcamanuf': [
+        (152, '152-RCCWH', '10.20.30.0/26', '10.20.30.1'),
+        (200, '200-Printers', '10.20.30.192/26', '10.20.30.193'),
+        (300, '300-Voice-VideoConf', '10.20.30.160/27', '10.20.30.161'),
+        (711, '711-TustedManuf', '10.20.31.0/26', '10.20.31.1'),
+        (731, '731-Non-IT', '10.20.30.64/26', '10.20.30.65'),
+        (811, '811-UntrustedManuf', '10.20.31.64/26', '10.20.31.65'),
+        (910, '910-Cybervision', '10.20.30.128/27', '10.20.30.129'),
+        (999, 'Management', '10.20.31.128/25', '10.20.31.129'),
+    ],
+    'vcaoffice': [
+        (200, '200-Printers', '10.20.30.0/26', '10.20.30.1'),
+        (300, '300-Voice-VideoConf', '10.20.30.64/26', '10.20.30.65'),
+        (600, '600-CCTV', '10.20.31.0/26', '10.20.31.1'),
+        (999, 'Management', '10.20.30.128/25', '10.20.30.129'),
+    ],
+    'checkpointoffice': [
+        (100, '100-Reserved', '10.20.30.0/26', '10.20.30.1'),
+        (200, '200-Printers', '10.20.30.64/26', '10.20.30.65'),
+        (300, '300-Voice', '10.20.30.128/26', '10.20.30.129'),
+        (707, '707-Dolce Vista', '10.20.30.192/27', '10.20.30.193'),
+        #the old function sent 224/25, which is not a network
+        (999, 'Management', '10.20.30.224/27', '10.20.30.225'),
+    ],
+}
+
+
+@pytest.mark.parametrize('plan', sorted(OLD_VLANS))
+def test_plan_matches_old_functions(plan):
+    vlans = merakivlans.computeplan(plan, '10.20.30.')
+    assert sorted((vlan['id'], vlan['name'], vlan['subnet'], vlan['applianceIp']) for vlan in vlans) == sorted(OLD_VLANS[plan])
+
+
+def test_every_plan_is_covered():
+    assert sorted(merakivlans.VLAN_PLANS) == sorted(OLD_VLANS)
+
+
+@pytest.mark.parametrize('subnet', ['10.20.30.', '10.20.30.0', '10.20.30.0/23', ' 10.20.30. '])
+def test_site_subnet_forms(subnet):
+    assert merakivlans.computeplan('office', subnet) == merakivlans.computeplan('office', '10.20.30.')
+
+
+@pytest.mark.parametrize('subnet', ['10.20.', '', '10.20.300.', '10.x.30.'])
+def test_malformed_site_subnet(subnet):
+    with pytest.raises(ValueError):
+        merakivlans.computeplan('btq', subnet)
+
+
+@pytest.mark.parametrize('template, plan', [
+    ('EMEA - Template BTQ', 'btq'),
+    ('EMEA - Template Large BTQ', 'largebtq'),
+    ('EMEA - ZTNA Office Template', 'ztnaoffice'),
+    ('EMEA - Simple Office Template', 'office'),
+    ('EMEA - Checkpoint Office', 'checkpointoffice'),
+    ('EMEA - VCA France Manufacture Template', 'vcamanuf'),
+])
+def test_planfortemplate(template, plan):
+    assert merakivlans.planfortemplate(template) == plan
+
+
+def currentvlans(p_plan, p_subnet):
+    #returns the VLANs of a network already set up with a plan, as read from the Dashboard
+    return [dict(vlan, dhcpHandling='Run a DHCP server') for vlan in merakivlans.computeplan(p_plan, p_subnet)]
+
+
+def test_diffvlans_skips_matching_vlans():
+    desired = merakivlans.computeplan('office', '10.20.30.')
+    current = currentvlans('office', '10.20.30.')
+    current[0]['name'] = 'old name'
+    del current[3]
+    changes, unchanged, missing = merakivlans.diffvlans(desired, current)
+    assert changes == [(100, {'name': ('old name', '100-PCs-Printers')})]
+    assert unchanged == [300, 600]
+    assert missing == [999]
+
+
+def test_vlanupdates_on_a_correct_network():
+    desired = merakivlans.computeplan('btq', '10.20.30.')
+    assert merakivlans.vlanupdates(desired, currentvlans('btq', '10.20.30.')) == []
+
+
+def test_vlanupdates_sends_only_changed_fields():
+    desired = merakivlans.computeplan('office', '10.20.30.')
+    current = currentvlans('office', '10.20.30.')
+    current[1]['name'] = 'old name'
+    assert merakivlans.vlanupdates(desired, current) == [(300, {'name': '300-Voice-VideoConf'})]
+
+
+def test_vlanupdates_keeps_relay_servers():
+    desired = merakivlans.computeplan('office', '10.20.30.')
+    current = currentvlans('office', '10.40.50.')
+    current[0].update(dhcpHandling=merakivlans.DHCP_RELAY, dhcpRelayServerIps=['10.0.0.5', '10.0.0.6'])
+    current[1].update(dhcpHandling=merakivlans.DHCP_RELAY, dhcpRelayServerIps=['10.0.0.5'])
+    current[1]['subnet'] = desired[1]['subnet']
+    current[1]['applianceIp'] = desired[1]['applianceIp']
+    current[1]['name'] = 'old name'
+    updates = dict(merakivlans.vlanupdates(desired, current))
+    #the addressing changes, the relay servers are sent with it
+    assert updates[100] == {'subnet': '10.20.30.0/24', 'applianceIp': '10.20.30.1', 'dhcpRelayServerIps': ['10.0.0.5', '10.0.0.6']}
+    #only the name changes, the relay servers are left alone
+    assert updates[300] == {'name': '300-Voice-VideoConf'}
+    #no relay, no relay servers
+    assert 'dhcpRelayServerIps' not in updates[600]